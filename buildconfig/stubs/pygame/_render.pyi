@@ -6,6 +6,7 @@ from pygame.rect import Rect
 from pygame.surface import Surface
 from pygame.typing import ColorLike, IntPoint, Point, RectLike, SequenceLike
 from pygame.window import Window
+from typing_extensions import Buffer  # collections.abc 3.12
 
 class _DrawableClass(Protocol):
     # Object that has the draw method that accepts area and dest arguments
@@ -141,8 +142,87 @@ class Texture:
         p4_mod: ColorLike = (255, 255, 255, 255),
     ) -> None: ...
     def get_rect(self, **kwargs: Any) -> Rect: ...
+    def draw_many(self, quads: Buffer, /) -> None:
+        """Draw many quads of the texture with a single call.
+
+        ``quads`` is any C contiguous buffer of 32 bit floats, like an
+        ``array.array("f")`` or a numpy ``float32`` array of shape ``(n, 13)``.
+        It is read in place, without copying. Every quad takes 13 floats::
+
+            src_x, src_y, src_w, src_h,  # area of the texture, in pixels
+            dst_x, dst_y, dst_w, dst_h,  # where it is drawn on the target
+            angle,                       # clockwise degrees around the dst center
+            r, g, b, a,                  # color modifier, from 0 to 255
+
+        The color of each quad is multiplied with the texture color and alpha,
+        and the texture blend mode is used. All the quads are sent to the GPU
+        with ``SDL_RenderGeometry()``, in as few batches as possible.
+        """
+
     def update(self, surface: Surface, area: RectLike | None = None) -> None: ...
 
 @final
 class Image:
-    pass
+    def __init__(
+        self, texture_or_image: Texture | Image, srcrect: RectLike | None = None
+    ) -> None: ...
+    @property
+    def angle(self) -> float: ...
+    @angle.setter
+    def angle(self, value: float) -> None: ...
+    @property
+    def flip_x(self) -> bool: ...
+    @flip_x.setter
+    def flip_x(self, value: bool) -> None: ...
+    @property
+    def flip_y(self) -> bool: ...
+    @flip_y.setter
+    def flip_y(self, value: bool) -> None: ...
+    @property
+    def color(self) -> Color: ...
+    @color.setter
+    def color(self, value: ColorLike) -> None: ...
+    @property
+    def alpha(self) -> float: ...
+    @alpha.setter
+    def alpha(self, value: float) -> None: ...
+    @property
+    def blend_mode(self) -> int: ...
+    @blend_mode.setter
+    def blend_mode(self, value: int) -> None: ...
+    @property
+    def texture(self) -> Texture: ...
+    @texture.setter
+    def texture(self, value: Texture) -> None: ...
+    @property
+    def srcrect(self) -> Rect: ...
+    @srcrect.setter
+    def srcrect(self, value: RectLike) -> None: ...
+    @property
+    def origin(self) -> tuple[float, float] | None: ...
+    @origin.setter
+    def origin(self, value: Point | None) -> None: ...
+    def get_rect(self, **kwargs: Any) -> Rect: ...
+    def draw(
+        self, srcrect: RectLike | None = None, dstrect: RectLike | Point | None = None
+    ) -> None: ...
+
+@final
+class TextureAtlas:
+    def __init__(
+        self, renderer: Renderer, size: IntPoint = (1024, 1024), padding: int = 1
+    ) -> None: ...
+    def __len__(self) -> int: ...
+    def add(self, surface: Surface, /) -> Image: ...
+    def add_many(self, surfaces: SequenceLike[Surface], /) -> list[Image]: ...
+    def clear(self) -> None: ...
+    @property
+    def renderer(self) -> Renderer: ...
+    @property
+    def size(self) -> tuple[int, int]: ...
+    @property
+    def padding(self) -> int: ...
+    @property
+    def pages(self) -> list[Texture]: ...
+    @property
+    def efficiency(self) -> float: ...
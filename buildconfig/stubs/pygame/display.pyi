@@ -340,9 +340,65 @@ def update(*args):  # type: ignore
     This call cannot be used on ``pygame.OPENGL`` displays and will generate an
     exception.
 
+    If rectangle merging is turned on with
+    :func:`pygame.display.set_update_merging`, overlapping and touching
+    rectangles are combined before they are pushed to the screen.
+
     .. versionchanged:: 2.5.1 Added support for passing an iterable, previously only sequence was allowed
     """
 
+def set_update_merging(enabled: bool, flip_threshold: float = 0.75) -> None:
+    """Merge the rectangles passed to update() before pushing them.
+
+    When ``enabled`` is true, ``pygame.display.update()`` combines the
+    rectangles of an iterable that overlap or touch each other, as long as
+    their union does not cover more pixels than the two rectangles do apart.
+    Fewer rectangles are handed to the video driver, and pixels covered by
+    merged rectangles are pushed only once. Overlapping rectangles that are
+    kept apart still push the pixels they share twice. The rectangles are
+    sorted by their left edge and swept from left to right, so that each one
+    is only compared with the rectangles it reaches horizontally.
+
+    If the merged rectangles still cover more than ``flip_threshold`` of the
+    window area, the whole display is updated at once as with
+    ``pygame.display.flip()``, which is cheaper than many large rectangles.
+    Pass ``0`` to always update the entire display and a value of ``1`` or
+    more to never do so.
+
+    Merging is off by default. Raises ``ValueError`` if ``flip_threshold`` is
+    negative.
+
+    .. versionadded:: 2.5.8
+    """
+
+def get_update_merging() -> float | None:
+    """Get the rectangle merging threshold of update().
+
+    Returns the ``flip_threshold`` set by
+    :func:`pygame.display.set_update_merging`, or ``None`` if rectangle
+    merging is off.
+
+    .. versionadded:: 2.5.8
+    """
+
+def get_update_stats(reset: bool = False) -> dict[str, int]:
+    """Get counters of the screen updates done so far.
+
+    Returns a dictionary describing everything ``pygame.display.update()`` and
+    ``pygame.display.flip()`` pushed to a non-OpenGL display, which helps
+    to tell whether tracking dirty rectangles pays off:
+
+    * ``"calls"``: number of updates that pushed anything to the screen
+    * ``"rects_requested"``: rectangles passed to ``update()``
+    * ``"rects_pushed"``: rectangles actually pushed, after merging
+    * ``"pixels_pushed"``: pixels covered by the pushed rectangles
+    * ``"full_updates"``: updates of the entire display
+
+    If ``reset`` is true, all counters are set back to zero after being read.
+
+    .. versionadded:: 2.5.8
+    """
+
 def get_driver() -> str:
     """Get the name of the pygame display backend.
 
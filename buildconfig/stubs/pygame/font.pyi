@@ -169,5 +169,52 @@ class Font:
         .. versionadded:: 2.1.4
         """
 
+    def set_render_cache(self, max_bytes: int, /) -> None:
+        """
+        Cache the surfaces returned by render.
+
+        Keeps the most recently rendered texts in a cache taking up to
+        ``max_bytes`` bytes of pixel data. Rendering the same text with the same
+        antialias, colors, wraplength and style flags again returns the cached
+        Surface instead of rendering it again, which saves a lot of time for text
+        drawn every frame, like scores and labels. When the cache is full the
+        least recently used texts are dropped. Passing ``0``, the default, turns
+        caching off and empties the cache.
+
+        Changing the point size, outline, alignment, line size, script or
+        direction of the font empties the cache.
+
+        .. note:: A cached Surface is shared by every call rendering the same
+            text. Do not draw on it or change its alpha or colorkey, ``copy()``
+            it first if you need to.
+
+        .. versionadded:: 2.5.8
+        """
+
+    def clear_render_cache(self) -> None:
+        """
+        Empty the render cache.
+
+        Drops every Surface kept by the cache set up with
+        :meth:`set_render_cache`.
+
+        .. versionadded:: 2.5.8
+        """
+
+    def get_render_cache_stats(self, reset: bool = False) -> dict[str, int]:
+        """
+        Get statistics about the render cache.
+
+        Returns a dictionary with the ``"hits"`` and ``"misses"`` of the cache
+        set up with :meth:`set_render_cache`, the number of cached texts as
+        ``"entries"``, the pixel data they take up as ``"bytes"``, and the
+        budget as ``"max_bytes"``.
+
+        If ``reset`` is true the hit and miss counters are set back to zero after
+        being read.
+
+        .. versionadded:: 2.5.8
+        """
+
 @deprecated("Use `Font` instead (FontType is an old alias)")
 class FontType(Font): ...
@@ -4,7 +4,7 @@ from typing import Any
 from pygame.color import Color
 from pygame.rect import Rect
 from pygame.surface import Surface
-from pygame.typing import ColorLike, FileLike, RectLike
+from pygame.typing import ColorLike, FileLike, Point, RectLike
 from typing_extensions import deprecated  # added in 3.13
 
 def get_error() -> str: ...
@@ -150,11 +150,27 @@ class Font:
     def get_metrics(
         self, text: str, size: float = 0
     ) -> list[tuple[int, int, int, int, float, float]]: ...
+    def get_glyph_layout(
+        self,
+        text: str,
+        style: int = STYLE_DEFAULT,
+        rotation: int = 0,
+        size: float = 0,
+    ) -> tuple[Rect, list[tuple[int, int, int, int, int]]]: ...
     def get_sized_ascender(self, size: float, /) -> int: ...
     def get_sized_descender(self, size: float, /) -> int: ...
     def get_sized_height(self, size: float, /) -> int: ...
     def get_sized_glyph_height(self, size: float, /) -> int: ...
     def get_sizes(self) -> list[tuple[int, int, int, float, float]]: ...
+    def get_cache_stats(self, reset: bool = False) -> dict[str, int]: ...
+    def set_cache_size(self, size: int, /) -> None: ...
+    def preload_glyphs(
+        self,
+        text: str,
+        style: int = STYLE_DEFAULT,
+        rotation: int = 0,
+        size: float = 0,
+    ) -> int: ...
     def render(
         self,
         text: str | None,
@@ -194,9 +210,83 @@ class Font:
         invert: bool = False,
     ) -> Rect: ...
 
+class GlyphAtlas:
+    font: Font
+    size: float
+    style: int
+    rotation: int
+    padding: int
+    surface: Surface
+    def __init__(
+        self,
+        font: Font,
+        size: float = 0,
+        style: int = STYLE_DEFAULT,
+        rotation: int = 0,
+        atlas_size: tuple[int, int] = (512, 512),
+        padding: int = 1,
+    ) -> None: ...
+    def __len__(self) -> int: ...
+    @property
+    def occupancy(self) -> float: ...
+    def get_stats(self) -> dict[str, int]: ...
+    def clear(self) -> None: ...
+    def render(
+        self,
+        text: str | bytes,
+        fgcolor: ColorLike | None = None,
+        bgcolor: ColorLike | None = None,
+    ) -> tuple[Surface, Rect]: ...
+    def render_to(
+        self,
+        surf: Surface,
+        dest: Point,
+        text: str | bytes,
+        fgcolor: ColorLike | None = None,
+        bgcolor: ColorLike | None = None,
+    ) -> Rect: ...
+
+class TextLayout:
+    font: Font
+    size: float
+    def __init__(
+        self, font: Font, width: int, text: str | bytes = "", size: float = 0
+    ) -> None: ...
+    def __len__(self) -> int: ...
+    @property
+    def text(self) -> str: ...
+    @text.setter
+    def text(self, text: str | bytes) -> None: ...
+    @property
+    def width(self) -> int: ...
+    @width.setter
+    def width(self, width: int) -> None: ...
+    @property
+    def line_height(self) -> int: ...
+    @property
+    def line_count(self) -> int: ...
+    @property
+    def height(self) -> int: ...
+    def get_line(self, line: int) -> str: ...
+    def append(self, text: str | bytes) -> None: ...
+    def insert(self, index: int, text: str | bytes) -> None: ...
+    def delete(self, start: int, end: int) -> None: ...
+    def get_position(self, index: int) -> tuple[float, int]: ...
+    def index_at(self, pos: Point) -> int: ...
+    def render_to(
+        self,
+        surf: Surface,
+        dest: Point,
+        area: RectLike | None = None,
+        fgcolor: ColorLike | None = None,
+        bgcolor: ColorLike | None = None,
+    ) -> Rect: ...
+
 # keep in sync with freetype.py
 __all__ = [
     "Font",
+    "GlyphAtlas",
+    "TextLayout",
     "STYLE_NORMAL",
     "STYLE_OBLIQUE",
     "STYLE_STRONG",
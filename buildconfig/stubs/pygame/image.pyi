@@ -62,6 +62,7 @@ following formats.
 .. versionaddedold:: 1.8 Saving PNG and JPEG files.
 """
 
+from collections.abc import Sequence
 from typing import Literal, TypeAlias
 
 from pygame.surface import Surface
@@ -158,6 +159,41 @@ def load_animation(file: FileLike, namehint: str = "") -> list[tuple[Surface, fl
     .. versionadded:: 2.5.4
     """
 
+def load_many(
+    files: Sequence[FileLike], convert: bool = False, threads: int = 0
+) -> list[Surface | Exception]:
+    """Load many images at once, decoding them on several threads.
+
+    Loads every file of the ``files`` sequence, which can hold filenames,
+    pathlib.Path objects and file-like objects, like :func:`load()` does. The
+    images are decoded on up to ``threads`` native threads at the same time,
+    without holding the GIL. The default of ``0`` uses one thread per CPU core.
+
+    The returned list holds the surfaces in the same order as ``files``. A file
+    that cannot be opened or decoded does not stop the others from loading:
+    the exception it raised is put in the list in place of its surface.
+
+    ::
+
+        images = pygame.image.load_many(paths)
+        for path, image in zip(paths, images):
+            if isinstance(image, Exception):
+                print(f"could not load {path}: {image}")
+
+    If ``convert`` is ``True``, each image is converted to the display format
+    after loading, with :meth:`pygame.Surface.convert_alpha()` if it has per
+    pixel alpha and with :meth:`pygame.Surface.convert()` otherwise. A display
+    mode must be set to convert images, errors while converting are raised
+    rather than stored in the list.
+
+    File-like objects are read while holding the GIL, so only filenames and
+    paths are loaded fully in parallel. If pygame was built without extended
+    image support, only ``BMP`` files can be loaded and they are loaded one
+    after the other.
+
+    .. versionadded:: 2.5.8
+    """
+
 def save(surface: Surface, file: FileLike, namehint: str = "") -> None:
     """Save an image to file (or file-like object).
 
@@ -12,11 +12,12 @@ to store which parts collide.
 """
 
 import sys
+from collections.abc import Iterable
 from typing import Any
 
 from pygame.rect import Rect
 from pygame.surface import Surface
-from pygame.typing import ColorLike, Point, RectLike
+from pygame.typing import ColorLike, Point, RectLike, SequenceLike
 from typing_extensions import deprecated  # added in 3.13
 
 def from_surface(surface: Surface, threshold: int = 127) -> Mask:
@@ -46,6 +47,10 @@ def from_surface(surface: Surface, threshold: int = 127) -> Mask:
     .. note::
         This function is used to create the masks for
         :func:`pygame.sprite.collide_mask`.
+
+    .. versionchanged:: 2.5.8 Large surfaces are split between the threads set
+        with :func:`pygame.surface.set_blit_threads`, and 32 bit surfaces are
+        processed with SIMD instructions when available.
     """
 
 def from_threshold(
@@ -83,6 +88,10 @@ def from_threshold(
 
     :returns: a newly created :class:`Mask` object from the given surface
     :rtype: Mask
+
+    .. versionchanged:: 2.5.8 Large surfaces are split between the threads set
+        with :func:`pygame.surface.set_blit_threads`, and 32 bit surfaces are
+        processed with SIMD instructions when available.
     """
 
 class Mask:
@@ -269,6 +278,35 @@ class Mask:
         :rtype: int
         """
 
+    def overlap_many(self, masks: Iterable[tuple[Mask, Point]]) -> list[int]:
+        """Returns the indices of the masks that overlap this one.
+
+        Tests this mask against each ``(mask, offset)`` pair of ``masks``, as
+        :meth:`overlap` would, and returns the positions in ``masks`` of the
+        pairs with at least one overlapping set bit. All the tests are done in
+        a single call, which is much faster than calling :meth:`overlap` for
+        each pair, e.g. to test a player against hundreds of bullets.
+
+        ::
+
+            hits = player_mask.overlap_many(
+                (bullet.mask, (bullet.rect.x - x, bullet.rect.y - y))
+                for bullet in bullets
+            )
+
+        :param masks: an iterable of ``(mask, offset)`` pairs, where ``offset``
+            is the offset of ``mask`` from this mask, for more details refer to
+            the :ref:`Mask offset notes <mask-offset-label>`
+
+        :returns: the indices of the overlapping pairs, in increasing order
+        :rtype: list[int]
+
+        :raises TypeError: if an item of ``masks`` is not a pair of a
+            :class:`Mask` and an offset
+
+        .. versionadded:: 2.5.8
+        """
+
     def overlap_mask(self, other: Mask, offset: Point) -> Mask:
         """Returns a mask of the overlapping set bits.
 
@@ -351,6 +389,139 @@ class Mask:
         :rtype: NoneType
         """
 
+    def fill_rect(self, rect: RectLike, value: int = 1) -> None:
+        """Sets or clears the bits of a rectangle.
+
+        Sets all the bits inside ``rect`` to 1, or to 0 if ``value`` is 0. This
+        is much faster than creating a filled mask of the same size and drawing
+        or erasing it with :meth:`draw` or :meth:`erase`.
+
+        :param rect: the area of the mask to set or clear, any part of it
+            outside of the mask is ignored
+        :param int value: any nonzero int will set the bits to 1, 0 will set the
+            bits to 0 (default is 1)
+
+        :returns: ``None``
+        :rtype: NoneType
+
+        .. versionadded:: 2.5.8
+        """
+
+    def fill_circle(self, center: Point, radius: float, value: int = 1) -> None:
+        """Sets or clears the bits of a circle.
+
+        Sets all the bits whose pixel centers are within ``radius`` of
+        ``center`` to 1, or to 0 if ``value`` is 0. Each bit is treated as a
+        pixel covering the area from ``(x, y)`` to ``(x + 1, y + 1)``, so a
+        circle at ``(8, 8)`` with a radius of ``5`` covers about the same area
+        as :func:`pygame.draw.circle` with the same arguments. Only the rows
+        crossed by the circle are touched, which makes this useful to carve
+        craters into large terrain masks.
+
+        :param center: the center of the circle, can be floats
+        :param float radius: the radius of the circle, nothing is changed if it
+            is negative
+        :param int value: any nonzero int will set the bits to 1, 0 will set the
+            bits to 0 (default is 1)
+
+        :returns: ``None``
+        :rtype: NoneType
+
+        .. versionadded:: 2.5.8
+        """
+
+    def fill_polygon(self, points: SequenceLike[Point], value: int = 1) -> None:
+        """Sets or clears the bits of a polygon.
+
+        Sets all the bits whose pixel centers are inside the polygon to 1, or to
+        0 if ``value`` is 0. As with :meth:`fill_circle`, each bit covers the
+        area from ``(x, y)`` to ``(x + 1, y + 1)``, so the polygon
+        ``[(0, 0), (4, 0), (4, 2), (0, 2)]`` sets the same bits as
+        ``fill_rect((0, 0, 4, 2))``. Self-intersecting polygons are filled
+        with the even-odd rule.
+
+        :param points: a sequence of 3 or more (x, y) coordinates, which can be
+            floats, the last point is joined to the first one
+        :param int value: any nonzero int will set the bits to 1, 0 will set the
+            bits to 0 (default is 1)
+
+        :returns: ``None``
+        :rtype: NoneType
+
+        :raises ValueError: if ``len(points) < 3``
+
+        .. versionadded:: 2.5.8
+        """
+
+    def update_from_surface(
+        self, surface: Surface, rect: RectLike | None = None, threshold: int = 127
+    ) -> None:
+        """Updates an area of the mask from a surface.
+
+        Sets the bits inside ``rect`` as :func:`pygame.mask.from_surface` would
+        set them for ``surface``, leaving the rest of the mask unchanged. When
+        only a small part of a large surface changes, like a crater in a level's
+        terrain, this costs time proportional to the size of ``rect`` instead of
+        the whole surface.
+
+        :param Surface surface: the surface to update the mask from, it must be
+            the same size as the mask
+        :param rect: (optional) the area to update, any part of it outside of the
+            mask is ignored, if ``None`` (default) the whole mask is updated
+        :param int threshold: (optional) the alpha threshold (default is 127) to
+            compare with each surface pixel's alpha value, if the ``surface`` is
+            color-keyed this parameter is ignored
+
+        :returns: ``None``
+        :rtype: NoneType
+
+        :raises ValueError: if the surface and the mask have different sizes
+
+        .. versionadded:: 2.5.8
+        """
+
+    def set_overlap_index(self, enabled: bool = True) -> None:
+        """Enables or disables the overlap index.
+
+        The overlap index keeps track of which 8x8 and 64x64 blocks of the mask
+        have set bits. :meth:`overlap` and :meth:`overlap_area` use it to skip
+        the empty parts of this mask, and of ``other`` when it is ``other``
+        that has an index. This can make them orders of magnitude faster for
+        large masks that are mostly empty, such as the terrain of a level, at
+        the cost of about 1/64 more memory.
+
+        The index is kept up to date by the methods that change the mask, such
+        as :meth:`set_at`, :meth:`draw`, :meth:`erase` and :meth:`fill_circle`,
+        each of which also updates the blocks it touched. While the mask's
+        buffer is used through the buffer protocol the index is ignored, and it
+        is rebuilt once the last buffer is released.
+
+        With an index, :meth:`overlap` returns the first point of intersection
+        searched column block by column block, each from top to bottom, which
+        may not be the point found without an index.
+
+        :param bool enabled: ``True`` (default) to build the index, ``False`` to
+            free it
+
+        :returns: ``None``
+        :rtype: NoneType
+
+        .. versionadded:: 2.5.8
+        """
+
+    def get_overlap_index(self) -> bool:
+        """Returns whether the overlap index is enabled.
+
+        :returns: ``True`` if :meth:`set_overlap_index` enabled the overlap
+            index, ``False`` otherwise
+        :rtype: bool
+
+        .. note::
+            Copies of a mask with an overlap index also have one.
+
+        .. versionadded:: 2.5.8
+        """
+
     def count(self) -> int:
         """Returns the number of set bits.
 
@@ -1,5 +1,5 @@
 import sys
-from collections.abc import Callable, Collection, Iterator
+from collections.abc import Callable, Collection, Iterable, Iterator
 from typing import (
     ClassVar,
     Literal,
@@ -294,6 +294,22 @@ class _GenericRect(Collection[_N]):
     def collidedictall(
         self, rect_dict: dict[_K, _RectTypeCompatible_co], values: Literal[True]
     ) -> list[tuple[_K, _RectTypeCompatible_co]]: ...
+    @overload
+    @staticmethod
+    def collide_pairs(
+        rects_a: Iterable[RectLike],
+        rects_b: Iterable[RectLike] | None = None,
+        *,
+        key: None = None,
+    ) -> list[tuple[int, int]]: ...
+    @overload
+    @staticmethod
+    def collide_pairs(
+        rects_a: Iterable[_T],
+        rects_b: Iterable[_T] | None = None,
+        *,
+        key: Callable[[_T], RectLike],
+    ) -> list[tuple[int, int]]: ...
 
 # Rect confirms to the Collection ABC, since it also confirms to
 # Sized, Iterable and Container ABCs
@@ -71,6 +71,35 @@ class DirtySprite(Sprite):
     visible: int
     _layer: int
 
+class CompactSprite(_HasImageAndRect):
+    @property
+    def image(self) -> Surface | None: ...
+    @image.setter
+    def image(self, value: Surface | None) -> None: ...
+    @property
+    def rect(self) -> FRect | Rect | None: ...
+    @rect.setter
+    def rect(self, value: FRect | Rect | None) -> None: ...
+    def __init__(self, *groups: _GroupOrGroups[Any]) -> None: ...
+    def add_internal(self, group: AbstractGroup[Any]) -> None: ...
+    def remove_internal(self, group: AbstractGroup[Any]) -> None: ...
+    def update(self, *args: Any, **kwargs: Any) -> None: ...
+    def add(self, *groups: _GroupOrGroups[Any]) -> None: ...
+    def remove(self, *groups: _GroupOrGroups[Any]) -> None: ...
+    def kill(self) -> None: ...
+    def alive(self) -> bool: ...
+    def groups(self) -> list[AbstractGroup[Any]]: ...
+
+class KinematicSprite(CompactSprite):
+    @property
+    def position(self) -> tuple[float, float]: ...
+    @position.setter
+    def position(self, value: Point) -> None: ...
+    @property
+    def velocity(self) -> tuple[float, float]: ...
+    @velocity.setter
+    def velocity(self, value: Point) -> None: ...
+
 _SpriteT = TypeVar("_SpriteT", bound=Sprite)
 _SpriteT2 = TypeVar("_SpriteT2", bound=Sprite)
 _DirtySpriteT = TypeVar("_DirtySpriteT", bound=DirtySprite)
@@ -78,9 +107,22 @@ _DirtySpriteT = TypeVar("_DirtySpriteT", bound=DirtySprite)
 _GroupOrGroups: TypeAlias = AbstractGroup[_SpriteT] | Iterable[_GroupOrGroups[_SpriteT]]
 _SpriteOrSprites: TypeAlias = _SpriteT | Iterable[_SpriteOrSprites[_SpriteT]]
 
+class SpatialHash(Generic[_SpriteT]):
+    def __init__(self, cell_size: float = 64) -> None: ...
+    @property
+    def cell_size(self) -> float: ...
+    def __len__(self) -> int: ...
+    def __contains__(self, sprite: Any) -> bool: ...
+    def add(self, sprite: _SpriteT) -> None: ...
+    def remove(self, sprite: _SpriteT) -> None: ...
+    def refresh(self, *sprites: _SpriteT) -> None: ...
+    def clear(self) -> None: ...
+    def query(self, rect: RectLike) -> list[_SpriteT]: ...
+
 class AbstractGroup(Generic[_SpriteT]):
     spritedict: dict[_SpriteT, FRect | Rect | None]
     lostsprites: list[FRect | Rect]
+    spatial_index: SpatialHash[_SpriteT] | None
     def __class_getitem__(cls, item: Any, /) -> types.GenericAlias: ...
     def __init__(self) -> None: ...
     def __len__(self) -> int: ...
@@ -97,7 +139,11 @@ class AbstractGroup(Generic[_SpriteT]):
     def has(self, *sprites: _SpriteOrSprites[_SpriteT]) -> bool: ...
     def update(self, *args: Any, **kwargs: Any) -> None: ...
     def draw(
-        self, surface: Surface, bgd: Surface | None = None, special_flags: int = 0
+        self,
+        surface: Surface,
+        bgd: Surface | None = None,
+        special_flags: int = 0,
+        view: RectLike | None = None,
     ) -> list[FRect | Rect]: ...
     def clear(
         self,
@@ -105,10 +151,30 @@ class AbstractGroup(Generic[_SpriteT]):
         bgd: Surface | Callable[[Surface, FRect | Rect], Any],
     ) -> None: ...
     def empty(self) -> None: ...
+    def get_sprites_at(self, pos: Point) -> list[_SpriteT]: ...
+    def get_sprites_in(self, rect: RectLike) -> list[_SpriteT]: ...
 
 class Group(AbstractGroup[_SpriteT]):
     def __init__(self, *sprites: _SpriteOrSprites[_SpriteT]) -> None: ...
 
+class CompactGroup(AbstractGroup[Any]):
+    def __init__(self, *sprites: CompactSprite | Iterable[Any]) -> None: ...
+    def __iter__(self) -> Iterator[CompactSprite]: ...
+    def sprites(self) -> list[CompactSprite]: ...
+
+class KinematicGroup(CompactGroup):
+    def __init__(self, *sprites: KinematicSprite | Iterable[Any]) -> None: ...
+    def __iter__(self) -> Iterator[KinematicSprite]: ...
+    def sprites(self) -> list[KinematicSprite]: ...
+    @property
+    def positions(self) -> memoryview: ...
+    @property
+    def velocities(self) -> memoryview: ...
+    def integrate(
+        self, dt: float, bounds: RectLike | None = None, wrap: bool = False
+    ) -> None: ...
+    def sync_rects(self) -> None: ...
+
 # These deprecated types are just aliases in the code too
 @deprecated("Use `pygame.sprite.Group` instead")
 class RenderPlain(Group[_SpriteT]): ...
@@ -121,6 +187,17 @@ class RenderUpdates(Group[_SpriteT]): ...
 @deprecated("Use `pygame.sprite.RenderUpdates` instead")
 class OrderedUpdates(RenderUpdates[_SpriteT]): ...
 
+class SortedGroup(AbstractGroup[_SpriteT]):
+    def __init__(
+        self,
+        *sprites: _SpriteOrSprites[_SpriteT],
+        key: Callable[[_SpriteT], Any] | None = None,
+    ) -> None: ...
+    @property
+    def key(self) -> Callable[[_SpriteT], Any]: ...
+    @key.setter
+    def key(self, value: Callable[[_SpriteT], Any] | None) -> None: ...
+
 class LayeredUpdates(AbstractGroup[_SpriteT]):
     def __init__(self, *sprites: _SpriteOrSprites[_SpriteT], **kwargs: Any) -> None: ...
     def add(self, *sprites: _SpriteOrSprites[_SpriteT], **kwargs: Any) -> None: ...
@@ -139,7 +216,8 @@ class LayeredUpdates(AbstractGroup[_SpriteT]):
     def switch_layer(self, layer1_nr: int, layer2_nr: int) -> None: ...
 
 class LayeredDirty(LayeredUpdates[_DirtySpriteT]):
-    def draw(
+    # draw takes no view, which breaks Liskov substitution principle
+    def draw(  # type: ignore[override]
         self,
         surface: Surface,
         bgd: Surface | None = None,
@@ -188,6 +266,11 @@ _SupportsCollideMask: TypeAlias = _HasImageAndRect | _HasMaskAndRect
 def collide_mask(
     left: _SupportsCollideMask, right: _SupportsCollideMask
 ) -> tuple[int, int] | None: ...
+def collide_mask_indices(
+    sprite: _SupportsCollideMask,
+    sprites: Iterable[_SupportsCollideMask],
+    fit_rects: bool = False,
+) -> list[int]: ...
 
 _HasRectT = TypeVar("_HasRectT", bound=_HasRect)
 
@@ -10,7 +10,7 @@ from pygame.typing import (
     RectLike,
     SequenceLike,
 )
-from typing_extensions import deprecated  # added in 3.13
+from typing_extensions import Buffer, deprecated  # added in 3.13
 
 _ViewKind: TypeAlias = Literal[
     "0",
@@ -255,7 +255,7 @@ class Surface:
 
     def fblits(
         self,
-        blit_sequence: Iterable[tuple[Surface, Point | RectLike]],
+        blit_sequence: Iterable[tuple[Surface, Point | RectLike]] | BlitBatch,
         special_flags: int = 0,
         /,
     ) -> None:
@@ -267,7 +267,7 @@ class Surface:
         a smaller portion of the source Surface to draw) on this Surface with the same blending
         mode specified by special_flags.
 
-        :param blit_sequence: a sequence of (source, dest)
+        :param blit_sequence: a sequence of (source, dest), or a :class:`BlitBatch`
         :param special_flags: the flag(s) representing the blend mode used for each Surface.
                             See :doc:`special_flags_list` for a list of possible values.
 
@@ -279,7 +279,13 @@ class Surface:
             optimizations are applied if blit_sequence is a list or a tuple (using one
             of them is recommended).
 
+        .. note:: When the same Surfaces are drawn every frame, build a :class:`BlitBatch`
+            once and pass it instead of a sequence. Its items are already validated,
+            so only the drawing itself is left to do.
+
         .. versionadded:: 2.1.4
+
+        .. versionchanged:: 2.5.8 Accepts a :class:`BlitBatch` as blit_sequence.
         """
 
     @overload
@@ -1053,5 +1059,119 @@ class Surface:
         .. versionaddedold:: 1.9.2
         """
 
+class BlitBatch:
+    """Pygame object for drawing the same Surfaces many times with fblits().
+
+    A BlitBatch stores a list of (source, dest) pairs in a compact form. The
+    pairs are checked once, when they are added, so passing the batch to
+    :meth:`Surface.fblits` skips the parsing and validation that a plain
+    sequence goes through on every call. This makes a large difference for
+    scenes made of thousands of small Surfaces, such as tile maps.
+
+    The positions can be changed in place between frames, one at a time with
+    :meth:`set_position`, all at once with :meth:`set_positions` or shifted
+    together with :meth:`move`. The sources can't be replaced, build a new
+    batch instead.
+
+    ::
+
+        batch = pygame.surface.BlitBatch((tile, (x * 16, y * 16)) for x, y, tile in tiles)
+        while running:
+            batch.move(-scroll_x, 0)
+            screen.fblits(batch)
+
+    ``len(batch)`` returns the number of pairs in the batch.
+
+    .. versionadded:: 2.5.8
+    """
+
+    def __init__(
+        self, blit_sequence: Iterable[tuple[Surface, Point | RectLike]] = ()
+    ) -> None: ...
+    def __len__(self) -> int: ...
+    def append(self, source: Surface, dest: Point | RectLike, /) -> None:
+        """Add a (source, dest) pair to the end of the batch.
+
+        :param source: the Surface to draw
+        :param dest: the position to draw it at, as a pair of coordinates or a
+            rect whose top left corner is used
+        """
+
+    def clear(self) -> None:
+        """Remove every pair from the batch."""
+
+    def get_position(self, index: int, /) -> tuple[int, int]:
+        """Get the position of a pair in the batch.
+
+        Negative indices count from the end of the batch.
+        """
+
+    def set_position(self, index: int, dest: Point | RectLike, /) -> None:
+        """Set the position of a pair in the batch.
+
+        Negative indices count from the end of the batch.
+        """
+
+    def set_positions(
+        self, positions: SequenceLike[Point | RectLike] | Buffer, /
+    ) -> None:
+        """Set the positions of every pair in the batch at once.
+
+        ``positions`` is either a sequence with one position per pair, or an object
+        supporting the buffer protocol (such as an ``array.array`` or a numpy array)
+        holding ``2 * len(batch)`` integers laid out as ``x0, y0, x1, y1, ...``. A
+        buffer of C ints is copied directly, which is the fastest way to update
+        the positions of a large batch every frame.
+
+        :raises ValueError: if the number of positions doesn't match the batch
+        """
+
+    @overload
+    def move(self, x: float, y: float, /) -> None: ...
+    @overload
+    def move(self, move_by: Point, /) -> None: ...
+    def move(self, *args):  # type: ignore
+        """Shift the position of every pair in the batch.
+
+        Accepts the offset either as two numbers or as a single pair.
+        """
+
+def set_blit_threads(count: int, /) -> None:
+    """Set the number of threads used for large blits.
+
+    By default every blit runs on the calling thread. With a count above 1,
+    blits covering at least 65536 pixels (256x256) are split into horizontal
+    bands that are drawn at the same time by a pool of ``count - 1`` worker
+    threads and the calling thread. This speeds up blitting large layers,
+    such as full screen backgrounds or lighting overlays, on multi-core
+    machines. Smaller blits and blits between overlapping pixels of the same
+    Surface are not split.
+
+    :func:`pygame.mask.from_surface` and :func:`pygame.mask.from_threshold`
+    use the same threads for large surfaces.
+
+    The GIL is released while the bands are drawn. Other Python threads must
+    not modify the Surfaces involved in a blit at the same time.
+
+    Passing 0 uses one thread per logical CPU core, passing 1 turns threaded
+    blits off again. The count is capped at 64.
+
+    :param count: the total number of threads that draw each large blit
+    :raises ValueError: if count is negative
+    :raises pygame.error: if the worker threads couldn't be started, or on
+        platforms without thread support
+
+    .. versionadded:: 2.5.8
+    """
+
+def get_blit_threads() -> int:
+    """Get the number of threads used for large blits.
+
+    Returns 1 when threaded blits are off, which is the default. See
+    :func:`set_blit_threads`.
+
+    .. versionadded:: 2.5.8
+    """
+
 @deprecated("Use `Surface` instead (SurfaceType is an old alias)")
 class SurfaceType(Surface): ...
@@ -5,6 +5,7 @@ constant frame rate.
 Times in pygame-ce are represented in milliseconds (1/1000 of a second).
 """
 
+from contextlib import AbstractContextManager
 from typing import final
 
 from pygame.event import Event
@@ -72,6 +73,7 @@ def set_timer(event: int | Event, millis: int, loops: int = 0) -> None:
     .. versionchangedold:: 2.0.1 event argument supports ``pygame.event.Event`` object
     .. versionaddedold:: 2.0.1 added loops argument to replace once argument
     """
+
 @final
 class Clock:
     """Create an object to help track time.
@@ -79,11 +81,16 @@ class Clock:
     Creates a new Clock object that can be used to track an amount of time. The
     clock also provides several functions to help control a game's framerate.
 
+    It keeps the last ``history`` frame times, measured with a high
+    resolution timer, to profile the game loop. See
+    :meth:`Clock.get_frame_time_percentile` and :meth:`Clock.section`.
+
     .. versionchanged:: 2.1.4  This class is also available through the ``pygame.Clock``
        alias.
+    .. versionchanged:: 2.5.8 Added the ``history`` argument.
     """
 
-    def __new__(cls) -> Clock: ...
+    def __new__(cls, *, history: int = 256) -> Clock: ...
     def tick(self, framerate: float = 0, /) -> int:
         """Update the clock.
 
@@ -142,3 +149,78 @@ class Clock:
         averaging the last ten calls to ``Clock.tick()``. Returns 0.0 if fewer
         than ten ticks have been made.
         """
+
+    def get_frame_time_percentile(self, percent: float, /) -> float:
+        """Get a percentile of the recent frame times.
+
+        Returns the frame time in milliseconds below which ``percent`` percent
+        of the frames kept in the history fall, interpolating between the two
+        closest frames. ``clock.get_frame_time_percentile(50)`` is the median
+        frame time, while the 95th and 99th percentiles show how bad the
+        occasional stutter is, which an average like ``Clock.get_fps()``
+        hides.
+
+        Frame times are measured between calls to ``Clock.tick()`` with a high
+        resolution timer, so they are not rounded to whole milliseconds.
+        Returns 0.0 if no ticks have been made. Raises ``ValueError`` if
+        ``percent`` is not between 0 and 100.
+
+        .. versionadded:: 2.5.8
+        """
+
+    def get_max_frame_time(self) -> float:
+        """Get the longest of the recent frame times.
+
+        Returns the longest frame time in milliseconds kept in the history, or
+        0.0 if no ticks have been made.
+
+        .. versionadded:: 2.5.8
+        """
+
+    def get_frame_times(self) -> list[float]:
+        """Get the recent frame times.
+
+        Returns the frame times in milliseconds kept in the history, oldest
+        first. At most ``history`` frames, as passed to ``Clock()``, are kept.
+
+        .. versionadded:: 2.5.8
+        """
+
+    def section(self, name: str, /) -> AbstractContextManager[None]:
+        """Time a named part of the frame.
+
+        Returns a context manager that adds the time spent inside its ``with``
+        block to the section called ``name``. Calling it again with the same
+        name returns the same section, so it can be used every frame::
+
+            with clock.section("update"):
+                all_sprites.update(dt)
+            with clock.section("draw"):
+                all_sprites.draw(screen)
+
+        The time is measured in C with a high resolution timer, adding next to
+        no overhead. Nested blocks of the same section are only counted once.
+        Use :meth:`Clock.get_sections` to read the totals.
+
+        .. versionadded:: 2.5.8
+        """
+
+    def get_sections(self) -> dict[str, tuple[float, int, float]]:
+        """Get the times spent in each section.
+
+        Returns a dictionary mapping the name of each section created by
+        :meth:`Clock.section` to a ``(total, count, longest)`` tuple: the time
+        in milliseconds spent in the section, the number of times it was
+        entered and the longest of those times in milliseconds.
+
+        .. versionadded:: 2.5.8
+        """
+
+    def reset_profile(self) -> None:
+        """Clear the frame time history and section times.
+
+        Forgets the kept frame times and sets the times of all sections back to
+        zero, for example after loading a level.
+
+        .. versionadded:: 2.5.8
+        """
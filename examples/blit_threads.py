@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+"""pygame.examples.blit_threads
+
+Measures how much threaded blits speed up drawing large layers.
+
+A full HD layer with per pixel alpha is blitted onto a full HD background
+with BLEND_ALPHA_SDL2 and BLEND_PREMULTIPLIED, first on a single thread and
+then split between 2, 4 and 8 threads with pygame.surface.set_blit_threads().
+
+Run it with an optional number of repetitions per measurement:
+
+    python -m pygame.examples.blit_threads [repeats]
+
+No window is opened, so it also works on headless machines.
+"""
+
+import os
+import sys
+import time
+
+import pygame
+
+os.environ.setdefault("SDL_VIDEODRIVER", pygame.NULL_VIDEODRIVER)
+
+SIZE = (1920, 1080)
+THREAD_COUNTS = (1, 2, 4, 8)
+FLAGS = {
+    "BLEND_ALPHA_SDL2": pygame.BLEND_ALPHA_SDL2,
+    "BLEND_PREMULTIPLIED": pygame.BLEND_PREMULTIPLIED,
+}
+
+
+def make_layers():
+    """Returns an opaque background and a translucent layer to blit on it."""
+    background = pygame.Surface(SIZE, pygame.SRCALPHA)
+    layer = pygame.Surface(SIZE, pygame.SRCALPHA)
+    for y in range(0, SIZE[1], 40):
+        for x in range(0, SIZE[0], 40):
+            background.fill((x % 256, y % 256, 128, 255), (x, y, 40, 40))
+            layer.fill((255 - x % 256, 64, y % 256, (x + y) % 256), (x, y, 40, 40))
+    return background, layer
+
+
+def measure(background, layer, flags, repeats):
+    """Returns the best time in milliseconds of a single full screen blit."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        background.blit(layer, (0, 0), special_flags=flags)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main(repeats=20):
+    pygame.init()
+    background, layer = make_layers()
+    premultiplied = layer.premul_alpha()
+
+    print(f"{SIZE[0]}x{SIZE[1]} blits, best of {repeats}")
+    print(f"{'threads':>8}" + "".join(f"{name:>22}" for name in FLAGS))
+    baseline = {}
+    for count in THREAD_COUNTS:
+        pygame.surface.set_blit_threads(count)
+        row = f"{count:>8}"
+        for name, flags in FLAGS.items():
+            source = premultiplied if flags == pygame.BLEND_PREMULTIPLIED else layer
+            ms = measure(background, source, flags, repeats)
+            baseline.setdefault(name, ms)
+            row += f"{ms:>13.2f} ms {baseline[name] / ms:>4.1f}x"
+        print(row)
+
+    pygame.surface.set_blit_threads(1)
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
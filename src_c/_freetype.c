@@ -83,6 +83,8 @@ _ftfont_getrect(pgFontObject *, PyObject *, PyObject *);
 static PyObject *
 _ftfont_getmetrics(pgFontObject *, PyObject *, PyObject *);
 static PyObject *
+_ftfont_getglyphlayout(pgFontObject *, PyObject *, PyObject *);
+static PyObject *
 _ftfont_render(pgFontObject *, PyObject *, PyObject *);
 static PyObject *
 _ftfont_render_to(pgFontObject *, PyObject *, PyObject *);
@@ -100,6 +102,12 @@ static PyObject *
 _ftfont_getsizedglyphheight(pgFontObject *, PyObject *);
 static PyObject *
 _ftfont_getsizes(pgFontObject *, PyObject *);
+static PyObject *
+_ftfont_getcachestats(pgFontObject *, PyObject *, PyObject *);
+static PyObject *
+_ftfont_setcachesize(pgFontObject *, PyObject *);
+static PyObject *
+_ftfont_preloadglyphs(pgFontObject *, PyObject *, PyObject *);
 
 /* static PyObject *_ftfont_copy(pgFontObject *); */
 
@@ -539,8 +547,16 @@ static PyMethodDef _ftfont_methods[] = {
      DOC_FREETYPE_FONT_GETRECT},
     {"get_metrics", (PyCFunction)_ftfont_getmetrics,
      METH_VARARGS | METH_KEYWORDS, DOC_FREETYPE_FONT_GETMETRICS},
+    {"get_glyph_layout", (PyCFunction)_ftfont_getglyphlayout,
+     METH_VARARGS | METH_KEYWORDS, DOC_FREETYPE_FONT_GETGLYPHLAYOUT},
     {"get_sizes", (PyCFunction)_ftfont_getsizes, METH_NOARGS,
      DOC_FREETYPE_FONT_GETSIZES},
+    {"get_cache_stats", (PyCFunction)_ftfont_getcachestats,
+     METH_VARARGS | METH_KEYWORDS, DOC_FREETYPE_FONT_GETCACHESTATS},
+    {"set_cache_size", (PyCFunction)_ftfont_setcachesize, METH_VARARGS,
+     DOC_FREETYPE_FONT_SETCACHESIZE},
+    {"preload_glyphs", (PyCFunction)_ftfont_preloadglyphs,
+     METH_VARARGS | METH_KEYWORDS, DOC_FREETYPE_FONT_PRELOADGLYPHS},
     {"render", (PyCFunction)_ftfont_render, METH_VARARGS | METH_KEYWORDS,
      DOC_FREETYPE_FONT_RENDER},
     {"render_to", (PyCFunction)_ftfont_render_to, METH_VARARGS | METH_KEYWORDS,
@@ -1340,11 +1356,10 @@ _ftfont_getdebugcachestats(pgFontObject *self, void *closure)
      */
     const FontCache *cache = &PGFT_FONT_CACHE(self);
 
-    return Py_BuildValue("kkkkk", (unsigned long)cache->_debug_count,
-                         (unsigned long)cache->_debug_delete_count,
-                         (unsigned long)cache->_debug_access,
-                         (unsigned long)cache->_debug_hit,
-                         (unsigned long)cache->_debug_miss);
+    return Py_BuildValue(
+        "kkkkk", (unsigned long)cache->count, (unsigned long)cache->evictions,
+        (unsigned long)(cache->hits + cache->misses),
+        (unsigned long)cache->hits, (unsigned long)cache->misses);
 }
 #endif
 
@@ -1407,6 +1422,103 @@ error:
     return 0;
 }
 
+static PyObject *
+_ftfont_getglyphlayout(pgFontObject *self, PyObject *args, PyObject *kwds)
+{
+    if (!FreetypeFont_GenerationCheck(self)) {
+        RAISE_FREETYPE_QUIT_ERROR(NULL);
+    }
+
+    /* keyword list */
+    static char *kwlist[] = {"text", "style", "rotation", "size", 0};
+
+    PyObject *textobj;
+    PGFT_String *text = 0;
+    Scale_t face_size = FACE_SIZE_NONE;
+    SDL_Rect r;
+    PyObject *rectobj = 0;
+    PyObject *list = 0;
+    PyObject *item;
+
+    FontRenderMode render;
+    Angle_t rotation = self->rotation;
+    int style = FT_STYLE_DEFAULT;
+    Layout *font_text;
+    GlyphSlot *slots;
+    FT_Bitmap *bitmap;
+    unsigned width;
+    unsigned height;
+    FT_Vector offset;
+    FT_Pos underline_top;
+    FT_Fixed underline_size;
+    int i;
+
+    if (!PyArg_ParseTupleAndKeywords(
+            args, kwds, "O|iO&O&", kwlist, &textobj, &style, obj_to_rotation,
+            (void *)&rotation, obj_to_scale, (void *)&face_size)) {
+        goto error;
+    }
+
+    /* Encode text */
+    text = _PGFT_EncodePyString(textobj, self->render_flags & FT_RFLAG_UCS4);
+    if (!text) {
+        goto error;
+    }
+
+    ASSERT_SELF_IS_ALIVE(self);
+
+    /* Build rendering mode, always anti-aliased by default */
+    if (_PGFT_BuildRenderMode(self->freetype, self, &render, face_size, style,
+                              rotation)) {
+        goto error;
+    }
+
+    /* Same rect as get_rect() */
+    if (_PGFT_GetTextRect(self->freetype, self, &render, text, &r)) {
+        goto error;
+    }
+    font_text = _PGFT_LoadLayout(self->freetype, self, &render, 0);
+    if (!font_text) {
+        goto error;
+    }
+
+    list = PyList_New(font_text->length);
+    if (!list) {
+        goto error;
+    }
+    if (font_text->length) {
+        /* Place each glyph bitmap the way render() does */
+        _PGFT_GetRenderMetrics(&render, font_text, &width, &height, &offset,
+                               &underline_top, &underline_size);
+        slots = font_text->glyphs;
+        for (i = 0; i < font_text->length; ++i) {
+            bitmap = &slots[i].glyph->image->bitmap;
+            item = Py_BuildValue(
+                "(kiiII)", (unsigned long)slots[i].id,
+                (int)FX6_TRUNC(FX6_CEIL(offset.x + slots[i].posn.x)),
+                (int)FX6_TRUNC(FX6_CEIL(offset.y + slots[i].posn.y)),
+                bitmap->width, bitmap->rows);
+            if (!item) {
+                goto error;
+            }
+            PyList_SET_ITEM(list, i, item);
+        }
+    }
+    free_string(text);
+    text = 0;
+
+    rectobj = pgRect_New(&r);
+    if (!rectobj) {
+        goto error;
+    }
+    return Py_BuildValue("(NN)", rectobj, list);
+
+error:
+    free_string(text);
+    Py_XDECREF(list);
+    return 0;
+}
+
 static PyObject *
 get_metrics(FontRenderMode *render, pgFontObject *font, PGFT_String *text)
 {
@@ -1680,6 +1792,110 @@ error:
     return 0;
 }
 
+static PyObject *
+_ftfont_getcachestats(pgFontObject *self, PyObject *args, PyObject *kwds)
+{
+    if (!FreetypeFont_GenerationCheck(self)) {
+        RAISE_FREETYPE_QUIT_ERROR(NULL);
+    }
+
+    static char *kwlist[] = {"reset", 0};
+
+    int reset = 0;
+    FontCache *cache;
+    PyObject *stats;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "|p", kwlist, &reset)) {
+        return 0;
+    }
+
+    ASSERT_SELF_IS_ALIVE(self);
+
+    cache = &PGFT_FONT_CACHE(self);
+    stats =
+        Py_BuildValue("{sIsnsKsKsKsI}", "glyphs", (unsigned int)cache->count,
+                      "bytes", (Py_ssize_t)cache->bytes, "hits", cache->hits,
+                      "misses", cache->misses, "evictions", cache->evictions,
+                      "size", (unsigned int)(cache->size_mask + 1));
+    if (stats && reset) {
+        cache->hits = 0;
+        cache->misses = 0;
+        cache->evictions = 0;
+    }
+    return stats;
+}
+
+static PyObject *
+_ftfont_setcachesize(pgFontObject *self, PyObject *args)
+{
+    if (!FreetypeFont_GenerationCheck(self)) {
+        RAISE_FREETYPE_QUIT_ERROR(NULL);
+    }
+
+    int size;
+
+    if (!PyArg_ParseTuple(args, "i", &size)) {
+        return 0;
+    }
+    if (size < 1 || size > PGFT_MAX_CACHE_SIZE) {
+        return RAISE(PyExc_ValueError, "cache size out of range");
+    }
+
+    ASSERT_SELF_IS_ALIVE(self);
+
+    if (_PGFT_Cache_Resize(&PGFT_FONT_CACHE(self), size)) {
+        return PyErr_NoMemory();
+    }
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+_ftfont_preloadglyphs(pgFontObject *self, PyObject *args, PyObject *kwds)
+{
+    if (!FreetypeFont_GenerationCheck(self)) {
+        RAISE_FREETYPE_QUIT_ERROR(NULL);
+    }
+
+    /* keyword list */
+    static char *kwlist[] = {"text", "style", "rotation", "size", 0};
+
+    PyObject *textobj;
+    PGFT_String *text = 0;
+    Scale_t face_size = FACE_SIZE_NONE;
+    FontRenderMode render;
+    Angle_t rotation = self->rotation;
+    int style = FT_STYLE_DEFAULT;
+    long loaded;
+
+    if (!PyArg_ParseTupleAndKeywords(
+            args, kwds, "O|iO&O&", kwlist, &textobj, &style, obj_to_rotation,
+            (void *)&rotation, obj_to_scale, (void *)&face_size)) {
+        return 0;
+    }
+
+    ASSERT_SELF_IS_ALIVE(self);
+
+    /* Encode text */
+    text = _PGFT_EncodePyString(textobj, self->render_flags & FT_RFLAG_UCS4);
+    if (!text) {
+        return 0;
+    }
+
+    /* Same render mode as render() */
+    if (_PGFT_BuildRenderMode(self->freetype, self, &render, face_size, style,
+                              rotation)) {
+        free_string(text);
+        return 0;
+    }
+
+    loaded = _PGFT_PreloadGlyphs(self->freetype, self, &render, text);
+    free_string(text);
+    if (loaded < 0) {
+        return 0;
+    }
+    return PyLong_FromLong(loaded);
+}
+
 static PyObject *
 _ftfont_render_raw(pgFontObject *self, PyObject *args, PyObject *kwds)
 {
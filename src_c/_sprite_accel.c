@@ -0,0 +1,654 @@
+/*
+  pygame-ce - Python Game Library
+
+  This library is free software; you can redistribute it and/or
+  modify it under the terms of the GNU Library General Public
+  License as published by the Free Software Foundation; either
+  version 2 of the License, or (at your option) any later version.
+
+  This library is distributed in the hope that it will be useful,
+  but WITHOUT ANY WARRANTY; without even the implied warranty of
+  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the GNU
+  Library General Public License for more details.
+
+  You should have received a copy of the GNU Library General Public
+  License along with this library; if not, write to the Free
+  Foundation, Inc., 59 Temple Place, Suite 330, Boston, MA  02111-1307  USA
+*/
+
+/* Loops over whole sprite groups for pygame.sprite, which falls back to
+ * Python versions of these functions when this module is not available. */
+
+#include "pygame.h"
+
+#include "pgcompat.h"
+
+#include <math.h>
+
+/* Gets a writable buffer of C doubles from obj, returns 0 on error */
+static int
+get_double_buffer(PyObject *obj, Py_buffer *view, const char *name)
+{
+    if (PyObject_GetBuffer(
+            obj, view, PyBUF_WRITABLE | PyBUF_FORMAT | PyBUF_C_CONTIGUOUS) <
+        0) {
+        return 0;
+    }
+    if (view->itemsize != sizeof(double) || !view->format ||
+        strcmp(view->format, "d") != 0) {
+        PyErr_Format(PyExc_TypeError, "%s must be a buffer of C doubles",
+                     name);
+        PyBuffer_Release(view);
+        return 0;
+    }
+    return 1;
+}
+
+/* Converts a coordinate to an int without overflowing */
+static int
+to_int(double value)
+{
+    value = floor(value);
+    if (value != value) {
+        return 0;
+    }
+    if (value < INT_MIN) {
+        return INT_MIN;
+    }
+    if (value > INT_MAX) {
+        return INT_MAX;
+    }
+    return (int)value;
+}
+
+static double
+wrap_coord(double value, double low, double high)
+{
+    double size = high - low;
+
+    if (!(size > 0.0)) {
+        return low;
+    }
+    value = fmod(value - low, size);
+    if (value < 0.0) {
+        value += size;
+    }
+    return low + value;
+}
+
+static double
+clamp_coord(double value, double low, double high)
+{
+    if (value < low) {
+        return low;
+    }
+    if (value > high) {
+        return high;
+    }
+    return value;
+}
+
+static PyObject *
+integrate(PyObject *self, PyObject *args)
+{
+    PyObject *posobj, *velobj, *boundsobj = Py_None;
+    double dt, left = 0, top = 0, right = 0, bottom = 0;
+    int wrap = 0, has_bounds;
+    Py_buffer posview, velview;
+    double *pos, *vel;
+    Py_ssize_t i, count;
+
+    if (!PyArg_ParseTuple(args, "OOd|Op", &posobj, &velobj, &dt, &boundsobj,
+                          &wrap)) {
+        return NULL;
+    }
+    has_bounds = boundsobj != Py_None;
+    if (has_bounds &&
+        !PyArg_ParseTuple(boundsobj, "dddd", &left, &top, &right, &bottom)) {
+        return NULL;
+    }
+
+    if (!get_double_buffer(posobj, &posview, "positions")) {
+        return NULL;
+    }
+    if (!get_double_buffer(velobj, &velview, "velocities")) {
+        PyBuffer_Release(&posview);
+        return NULL;
+    }
+    if (posview.len != velview.len || (posview.len / sizeof(double)) % 2) {
+        PyErr_SetString(PyExc_ValueError,
+                        "positions and velocities must hold the same number "
+                        "of (x, y) pairs");
+        PyBuffer_Release(&posview);
+        PyBuffer_Release(&velview);
+        return NULL;
+    }
+
+    pos = (double *)posview.buf;
+    vel = (double *)velview.buf;
+    count = posview.len / sizeof(double);
+
+    Py_BEGIN_ALLOW_THREADS;
+    for (i = 0; i < count; ++i) {
+        pos[i] += vel[i] * dt;
+    }
+    if (has_bounds && wrap) {
+        for (i = 0; i < count; i += 2) {
+            pos[i] = wrap_coord(pos[i], left, right);
+            pos[i + 1] = wrap_coord(pos[i + 1], top, bottom);
+        }
+    }
+    else if (has_bounds) {
+        for (i = 0; i < count; i += 2) {
+            pos[i] = clamp_coord(pos[i], left, right);
+            pos[i + 1] = clamp_coord(pos[i + 1], top, bottom);
+        }
+    }
+    Py_END_ALLOW_THREADS;
+
+    PyBuffer_Release(&posview);
+    PyBuffer_Release(&velview);
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+sync_rects(PyObject *self, PyObject *args)
+{
+    PyObject *rects, *posobj, *rect;
+    Py_buffer posview;
+    double *pos;
+    Py_ssize_t i, count;
+
+    if (!PyArg_ParseTuple(args, "O!O", &PyList_Type, &rects, &posobj)) {
+        return NULL;
+    }
+    if (!get_double_buffer(posobj, &posview, "positions")) {
+        return NULL;
+    }
+    count = PyList_GET_SIZE(rects);
+    if (posview.len / (Py_ssize_t)sizeof(double) != 2 * count) {
+        PyErr_SetString(PyExc_ValueError,
+                        "positions must hold one (x, y) pair per rect");
+        PyBuffer_Release(&posview);
+        return NULL;
+    }
+    pos = (double *)posview.buf;
+
+    for (i = 0; i < count; ++i) {
+        rect = PyList_GET_ITEM(rects, i);
+        if (PyObject_TypeCheck(rect, &pgRect_Type)) {
+            SDL_Rect *r = &pgRect_AsRect(rect);
+            /* the same as setting Rect.center */
+            r->x = to_int(pos[2 * i]) - r->w / 2;
+            r->y = to_int(pos[2 * i + 1]) - r->h / 2;
+        }
+        else if (PyObject_TypeCheck(rect, &pgFRect_Type)) {
+            SDL_FRect *r = &pgFRect_AsRect(rect);
+            r->x = (float)(pos[2 * i] - r->w / 2.0);
+            r->y = (float)(pos[2 * i + 1] - r->h / 2.0);
+        }
+        else if (rect != Py_None) {
+            PyErr_Format(PyExc_TypeError,
+                         "sprite rect must be a Rect, FRect or None, not %s",
+                         Py_TYPE(rect)->tp_name);
+            PyBuffer_Release(&posview);
+            return NULL;
+        }
+    }
+
+    PyBuffer_Release(&posview);
+    Py_RETURN_NONE;
+}
+
+/* Sprite attribute names, interned when the module is loaded */
+static PyObject *str_dirty, *str_visible, *str_rect, *str_source_rect,
+    *str_image, *str_blendmode;
+
+/* Growable list of the update rects of LayeredDirty */
+typedef struct {
+    SDL_Rect *rects;
+    Py_ssize_t count;
+    Py_ssize_t size;
+} RectList;
+
+static int
+rects_collide(const SDL_Rect *a, const SDL_Rect *b)
+{
+    /* the same as Rect.colliderect() */
+    if (a->w == 0 || a->h == 0 || b->w == 0 || b->h == 0) {
+        return 0;
+    }
+    return MIN(a->x, a->x + a->w) < MAX(b->x, b->x + b->w) &&
+           MIN(a->y, a->y + a->h) < MAX(b->y, b->y + b->h) &&
+           MAX(a->x, a->x + a->w) > MIN(b->x, b->x + b->w) &&
+           MAX(a->y, a->y + a->h) > MIN(b->y, b->y + b->h);
+}
+
+static SDL_Rect
+clip_rect(const SDL_Rect *a, const SDL_Rect *b)
+{
+    /* the same as Rect.clip() */
+    SDL_Rect r;
+
+    r.x = MAX(a->x, b->x);
+    r.y = MAX(a->y, b->y);
+    r.w = MIN(a->x + a->w, b->x + b->w) - r.x;
+    r.h = MIN(a->y + a->h, b->y + b->h) - r.y;
+    if (r.w <= 0 || r.h <= 0) {
+        r.x = a->x;
+        r.y = a->y;
+        r.w = r.h = 0;
+    }
+    return r;
+}
+
+static int
+rect_list_append(RectList *list, SDL_Rect rect)
+{
+    SDL_Rect *rects;
+    Py_ssize_t size;
+
+    if (list->count == list->size) {
+        size = list->size ? 2 * list->size : 16;
+        rects = PyMem_Realloc(list->rects, size * sizeof(SDL_Rect));
+        if (!rects) {
+            PyErr_NoMemory();
+            return 0;
+        }
+        list->rects = rects;
+        list->size = size;
+    }
+    list->rects[list->count++] = rect;
+    return 1;
+}
+
+/* Merges every update rect that collides with rect into it, then appends
+ * it clipped, like LayeredDirty._find_dirty_area() */
+static int
+add_dirty_rect(RectList *list, SDL_Rect rect, const SDL_Rect *clip)
+{
+    Py_ssize_t i = 0;
+    SDL_Rect *other;
+    int x, y;
+
+    while (i < list->count) {
+        other = &list->rects[i];
+        if (!rects_collide(&rect, other)) {
+            ++i;
+            continue;
+        }
+        x = MIN(rect.x, other->x);
+        y = MIN(rect.y, other->y);
+        rect.w = MAX(rect.x + rect.w, other->x + other->w) - x;
+        rect.h = MAX(rect.y + rect.h, other->y + other->h) - y;
+        rect.x = x;
+        rect.y = y;
+        memmove(other, other + 1, (list->count - i - 1) * sizeof(SDL_Rect));
+        --list->count;
+        /* the rect grew, so check the earlier ones again */
+        i = 0;
+    }
+    return rect_list_append(list, clip_rect(&rect, clip));
+}
+
+/* Gets the area of the sprite image drawn on the screen, which is the size
+ * of its source_rect if it has one. Returns 0 on error. */
+static int
+get_sprite_area(PyObject *rectobj, PyObject *source_rect, SDL_Rect *area)
+{
+    SDL_Rect temp, *r;
+
+    if (!(r = pgRect_FromObject(rectobj, &temp))) {
+        PyErr_SetString(PyExc_TypeError, "sprite rect must be a rect");
+        return 0;
+    }
+    *area = *r;
+    if (source_rect) {
+        if (!(r = pgRect_FromObject(source_rect, &temp))) {
+            PyErr_SetString(PyExc_TypeError,
+                            "sprite source_rect must be a rect or None");
+            return 0;
+        }
+        area->w = r->w;
+        area->h = r->h;
+    }
+    return 1;
+}
+
+/* Gets a number attribute of a sprite as a double, returns -1 with an
+ * exception set on error */
+static int
+get_sprite_number(PyObject *sprite, PyObject *name, double *value)
+{
+    PyObject *obj = PyObject_GetAttr(sprite, name);
+
+    if (!obj) {
+        return -1;
+    }
+    *value = PyFloat_AsDouble(obj);
+    Py_DECREF(obj);
+    return (*value == -1.0 && PyErr_Occurred()) ? -1 : 0;
+}
+
+/* Finds the dirty areas of the screen, like
+ * LayeredDirty._find_dirty_area() */
+static int
+find_dirty_area(PyObject *sprites, PyObject *old_rects, RectList *update,
+                const SDL_Rect *clip, PyObject *init_rect)
+{
+    PyObject *sprite, *rectobj, *source_rect, *old_rect;
+    SDL_Rect area, temp, *r;
+    Py_ssize_t i;
+    double dirty;
+    int has_source, ok;
+
+    for (i = 0; i < PyList_GET_SIZE(sprites); ++i) {
+        sprite = PyList_GET_ITEM(sprites, i);
+        if (get_sprite_number(sprite, str_dirty, &dirty)) {
+            return 0;
+        }
+        if (!(dirty > 0)) {
+            continue;
+        }
+
+        if (!(rectobj = PyObject_GetAttr(sprite, str_rect))) {
+            return 0;
+        }
+        if (!(source_rect = PyObject_GetAttr(sprite, str_source_rect))) {
+            Py_DECREF(rectobj);
+            return 0;
+        }
+        has_source = PyObject_IsTrue(source_rect);
+        ok =
+            has_source >= 0 &&
+            get_sprite_area(rectobj, has_source ? source_rect : NULL, &area) &&
+            add_dirty_rect(update, area, clip);
+        Py_DECREF(rectobj);
+        Py_DECREF(source_rect);
+        if (!ok) {
+            return 0;
+        }
+
+        old_rect = PyDict_GetItemWithError(old_rects, sprite);
+        if (!old_rect) {
+            if (!PyErr_Occurred()) {
+                PyErr_SetObject(PyExc_KeyError, sprite);
+            }
+            return 0;
+        }
+        if (old_rect != init_rect) {
+            if (!(r = pgRect_FromObject(old_rect, &temp))) {
+                PyErr_SetString(PyExc_TypeError,
+                                "old sprite rect must be a rect");
+                return 0;
+            }
+            if (!add_dirty_rect(update, *r, clip)) {
+                return 0;
+            }
+        }
+    }
+    return 1;
+}
+
+/* Appends a (image, dest, area, flags) blit to blits and the sprite, or
+ * None for partial blits, to owners, stealing the references to dest and
+ * area. Returns 0 on error. */
+static int
+append_blit(PyObject *blits, PyObject *owners, PyObject *sprite,
+            PyObject *image, PyObject *dest, PyObject *area, PyObject *flags)
+{
+    PyObject *blit;
+    int ret;
+
+    if (!dest || !area) {
+        Py_XDECREF(dest);
+        Py_XDECREF(area);
+        return 0;
+    }
+    blit = PyTuple_Pack(4, image, dest, area, flags);
+    Py_DECREF(dest);
+    Py_DECREF(area);
+    if (!blit) {
+        return 0;
+    }
+    ret = PyList_Append(blits, blit);
+    Py_DECREF(blit);
+    return ret == 0 && PyList_Append(owners, sprite) == 0;
+}
+
+/* Lists the blits of every sprite, like
+ * LayeredDirty._draw_dirty_internal() */
+static int
+draw_dirty(PyObject *sprites, const RectList *update, PyObject *special_flags,
+           PyObject *blits, PyObject *owners)
+{
+    PyObject *sprite, *obj, *image = NULL, *rectobj = NULL,
+                            *source_rect = NULL, *flags = NULL;
+    SDL_Rect area, clip, temp, *r;
+    Py_ssize_t i, j = 0;
+    double dirty;
+    int visible, offset_x, offset_y, err, ok = 0;
+
+    for (i = 0; i < PyList_GET_SIZE(sprites); ++i) {
+        sprite = PyList_GET_ITEM(sprites, i);
+        if (get_sprite_number(sprite, str_dirty, &dirty)) {
+            return 0;
+        }
+        if (dirty < 1 && !update->count) {
+            /* nothing to redraw */
+            continue;
+        }
+
+        if (!(rectobj = PyObject_GetAttr(sprite, str_rect)) ||
+            !(source_rect = PyObject_GetAttr(sprite, str_source_rect))) {
+            goto end;
+        }
+        if (dirty < 1) {
+            if (!get_sprite_area(rectobj,
+                                 source_rect != Py_None ? source_rect : NULL,
+                                 &area)) {
+                goto end;
+            }
+            /* most sprites are not under any update rect, so this is checked
+             * before anything else */
+            for (j = 0; j < update->count; ++j) {
+                if (rects_collide(&area, &update->rects[j])) {
+                    break;
+                }
+            }
+        }
+
+        if (dirty < 1 && j == update->count) {
+            visible = 0;
+        }
+        else if (!(obj = PyObject_GetAttr(sprite, str_visible)) ||
+                 (visible = PyObject_IsTrue(obj)) < 0) {
+            Py_XDECREF(obj);
+            goto end;
+        }
+        else {
+            Py_DECREF(obj);
+        }
+        if (visible) {
+            if (!(image = PyObject_GetAttr(sprite, str_image))) {
+                goto end;
+            }
+            if (special_flags != Py_None) {
+                flags = Py_NewRef(special_flags);
+            }
+            else if (!(flags = PyObject_GetAttr(sprite, str_blendmode))) {
+                goto end;
+            }
+        }
+
+        if (dirty < 1) {
+            if (!visible) {
+                /* also covers sprites under no update rect */
+                Py_CLEAR(rectobj);
+                Py_CLEAR(source_rect);
+                continue;
+            }
+            /* not dirty, blit only the parts under the update rects */
+            offset_x = -area.x;
+            offset_y = -area.y;
+            if (source_rect != Py_None) {
+                /* already checked by get_sprite_area() */
+                r = pgRect_FromObject(source_rect, &temp);
+                offset_x += r->x;
+                offset_y += r->y;
+            }
+            for (; j < update->count; ++j) {
+                if (!rects_collide(&area, &update->rects[j])) {
+                    continue;
+                }
+                clip = clip_rect(&area, &update->rects[j]);
+                if (!append_blit(
+                        blits, owners, Py_None, image, pgRect_New(&clip),
+                        pgRect_New4(clip.x + offset_x, clip.y + offset_y,
+                                    clip.w, clip.h),
+                        flags)) {
+                    goto end;
+                }
+            }
+        }
+        else {
+            if (visible &&
+                !append_blit(blits, owners, sprite, image, Py_NewRef(rectobj),
+                             Py_NewRef(source_rect), flags)) {
+                goto end;
+            }
+            if (dirty == 1) {
+                if (!(obj = PyLong_FromLong(0))) {
+                    goto end;
+                }
+                err = PyObject_SetAttr(sprite, str_dirty, obj);
+                Py_DECREF(obj);
+                if (err < 0) {
+                    goto end;
+                }
+            }
+        }
+        Py_CLEAR(image);
+        Py_CLEAR(rectobj);
+        Py_CLEAR(source_rect);
+        Py_CLEAR(flags);
+    }
+    ok = 1;
+
+end:
+    Py_XDECREF(image);
+    Py_XDECREF(rectobj);
+    Py_XDECREF(source_rect);
+    Py_XDECREF(flags);
+    return ok;
+}
+
+static PyObject *
+dirty_blits(PyObject *self, PyObject *args)
+{
+    PyObject *sprites, *old_rects, *updateobj, *clipobj, *init_rect;
+    PyObject *special_flags, *rects = NULL, *rect, *blits = NULL,
+                             *owners = NULL, *ret = NULL;
+    RectList update = {NULL, 0, 0};
+    SDL_Rect clip, temp, *r;
+    Py_ssize_t i;
+
+    if (!PyArg_ParseTuple(args, "O!O!O!OOO", &PyList_Type, &sprites,
+                          &PyDict_Type, &old_rects, &PyList_Type, &updateobj,
+                          &clipobj, &init_rect, &special_flags)) {
+        return NULL;
+    }
+    if (!(r = pgRect_FromObject(clipobj, &clip))) {
+        return RAISE(PyExc_TypeError, "clip must be a rect");
+    }
+    clip = *r;
+
+    for (i = 0; i < PyList_GET_SIZE(updateobj); ++i) {
+        if (!(r = pgRect_FromObject(PyList_GET_ITEM(updateobj, i), &temp))) {
+            PyErr_SetString(PyExc_TypeError, "update rects must be rects");
+            goto end;
+        }
+        if (!rect_list_append(&update, *r)) {
+            goto end;
+        }
+    }
+
+    if (!find_dirty_area(sprites, old_rects, &update, &clip, init_rect)) {
+        goto end;
+    }
+
+    /* give the merged rects back to the group */
+    if (!(rects = PyList_New(update.count))) {
+        goto end;
+    }
+    for (i = 0; i < update.count; ++i) {
+        if (!(rect = pgRect_New(&update.rects[i]))) {
+            goto end;
+        }
+        PyList_SET_ITEM(rects, i, rect);
+    }
+    if (PyList_SetSlice(updateobj, 0, PyList_GET_SIZE(updateobj), rects)) {
+        goto end;
+    }
+
+    if (!(blits = PyList_New(0)) || !(owners = PyList_New(0))) {
+        goto end;
+    }
+    if (!draw_dirty(sprites, &update, special_flags, blits, owners)) {
+        goto end;
+    }
+    ret = PyTuple_Pack(2, blits, owners);
+
+end:
+    PyMem_Free(update.rects);
+    Py_XDECREF(rects);
+    Py_XDECREF(blits);
+    Py_XDECREF(owners);
+    return ret;
+}
+
+static PyMethodDef _sprite_accel_methods[] = {
+    {"integrate", integrate, METH_VARARGS,
+     "integrate(positions, velocities, dt, bounds=None, wrap=False) -> "
+     "None\nAdds velocities * dt to positions, then clamps or wraps them to "
+     "the (left, top, right, bottom) bounds"},
+    {"sync_rects", sync_rects, METH_VARARGS,
+     "sync_rects(rects, positions) -> None\nCenters each rect of the list "
+     "on its (x, y) pair of positions"},
+    {"dirty_blits", dirty_blits, METH_VARARGS,
+     "dirty_blits(sprites, old_rects, update, clip, init_rect, special_flags) "
+     "-> (blits, owners)\nMerges the dirty areas of the sprites into the "
+     "update list and lists the blits that redraw them, with the sprite of "
+     "each whole sprite blit, or None, in owners"},
+    {NULL, NULL, 0, NULL}};
+
+MODINIT_DEFINE(_sprite_accel)
+{
+    static struct PyModuleDef _module = {
+        .m_base = PyModuleDef_HEAD_INIT,
+        .m_name = "_sprite_accel",
+        .m_doc = "C helpers for pygame.sprite groups\n",
+        .m_size = -1,
+        .m_methods = _sprite_accel_methods,
+    };
+
+    import_pygame_base();
+    if (PyErr_Occurred()) {
+        return NULL;
+    }
+    import_pygame_rect();
+    if (PyErr_Occurred()) {
+        return NULL;
+    }
+
+    if (!(str_dirty = PyUnicode_InternFromString("dirty")) ||
+        !(str_visible = PyUnicode_InternFromString("visible")) ||
+        !(str_rect = PyUnicode_InternFromString("rect")) ||
+        !(str_source_rect = PyUnicode_InternFromString("source_rect")) ||
+        !(str_image = PyUnicode_InternFromString("image")) ||
+        !(str_blendmode = PyUnicode_InternFromString("blendmode"))) {
+        return NULL;
+    }
+
+    return PyModule_Create(&_module);
+}
@@ -62,6 +62,699 @@ static int
 SoftBlitPyGame(SDL_Surface *src, SDL_Rect *srcrect, SDL_Surface *dst,
                SDL_Rect *dstrect, int blend_flags);
 
+/* Runs the blitter matching blend_flags on the pixels described by info.
+ * Returns 0 and sets an SDL error if blend_flags is not a valid blend mode. */
+static int
+pg_blit_dispatch(SDL_BlitInfo *info, SDL_Surface *src, SDL_Surface *dst,
+                 int blend_flags)
+{
+    int okay = 1;
+
+    switch (blend_flags) {
+        case 0: {
+            if (info->src_blend != SDL_BLENDMODE_NONE && info->src->Amask) {
+#if !defined(__EMSCRIPTEN__)
+#if SDL_BYTEORDER == SDL_LIL_ENDIAN
+                if (PG_SURF_BytesPerPixel(src) == 4 &&
+                    PG_SURF_BytesPerPixel(dst) == 4 &&
+                    info->src->Rmask == info->dst->Rmask &&
+                    info->src->Gmask == info->dst->Gmask &&
+                    info->src->Bmask == info->dst->Bmask) {
+                    /* If our source and destination are the same ARGB
+                       32bit format we can use SSE2/NEON/AVX2 to speed
+                       up the blend */
+                    if (pg_has_avx2() && (src != dst)) {
+                        if (info->src_blanket_alpha != 255) {
+                            alphablit_alpha_avx2_argb_surf_alpha(info);
+                        }
+                        else if (SDL_ISPIXELFORMAT_ALPHA(
+                                     PG_SURF_FORMATENUM(dst)) &&
+                                 info->dst_blend != SDL_BLENDMODE_NONE) {
+                            alphablit_alpha_avx2_argb_no_surf_alpha(info);
+                        }
+                        else {
+                            alphablit_alpha_avx2_argb_no_surf_alpha_opaque_dst(
+                                info);
+                        }
+                        break;
+                    }
+#if PG_ENABLE_SSE_NEON
+                    if ((pg_HasSSE_NEON()) && (src != dst)) {
+                        if (info->src_blanket_alpha != 255) {
+                            alphablit_alpha_sse2_argb_surf_alpha(info);
+                        }
+                        else if (SDL_ISPIXELFORMAT_ALPHA(
+                                     PG_SURF_FORMATENUM(dst)) &&
+                                 info->dst_blend != SDL_BLENDMODE_NONE) {
+                            alphablit_alpha_sse2_argb_no_surf_alpha(info);
+                        }
+                        else {
+                            alphablit_alpha_sse2_argb_no_surf_alpha_opaque_dst(
+                                info);
+                        }
+                        break;
+                    }
+#endif /* PG_ENABLE_SSE_NEON */
+                }
+#endif /* SDL_BYTEORDER == SDL_LIL_ENDIAN */
+#endif /* __EMSCRIPTEN__ */
+                alphablit_alpha(info);
+            }
+            else if (info->src_has_colorkey) {
+                alphablit_colorkey(info);
+            }
+            else {
+                alphablit_solid(info);
+            }
+            break;
+        }
+        case PYGAME_BLEND_ADD: {
+#if !defined(__EMSCRIPTEN__)
+#if SDL_BYTEORDER == SDL_LIL_ENDIAN
+            if (PG_SURF_BytesPerPixel(src) == 4 &&
+                PG_SURF_BytesPerPixel(dst) == 4 &&
+                info->src->Rmask == info->dst->Rmask &&
+                info->src->Gmask == info->dst->Gmask &&
+                info->src->Bmask == info->dst->Bmask &&
+                !(info->src->Amask != 0 && info->dst->Amask != 0 &&
+                  info->src->Amask != info->dst->Amask) &&
+                pg_has_avx2() && (src != dst)) {
+                blit_blend_rgb_add_avx2(info);
+                break;
+            }
+#if PG_ENABLE_SSE_NEON
+            if (PG_SURF_BytesPerPixel(src) == 4 &&
+                PG_SURF_BytesPerPixel(dst) == 4 &&
+                info->src->Rmask == info->dst->Rmask &&
+                info->src->Gmask == info->dst->Gmask &&
+                info->src->Bmask == info->dst->Bmask &&
+                !(info->src->Amask != 0 && info->dst->Amask != 0 &&
+                  info->src->Amask != info->dst->Amask) &&
+                pg_HasSSE_NEON() && (src != dst)) {
+                blit_blend_rgb_add_sse2(info);
+                break;
+            }
+#endif /* PG_ENABLE_SSE_NEON */
+#endif /* SDL_BYTEORDER == SDL_LIL_ENDIAN */
+#endif /* __EMSCRIPTEN__ */
+            blit_blend_add(info);
+            break;
+        }
+        case PYGAME_BLEND_SUB: {
+#if !defined(__EMSCRIPTEN__)
+#if SDL_BYTEORDER == SDL_LIL_ENDIAN
+            if (PG_SURF_BytesPerPixel(src) == 4 &&
+                PG_SURF_BytesPerPixel(dst) == 4 &&
+                info->src->Rmask == info->dst->Rmask &&
+                info->src->Gmask == info->dst->Gmask &&
+                info->src->Bmask == info->dst->Bmask &&
+                !(info->src->Amask != 0 && info->dst->Amask != 0 &&
+                  info->src->Amask != info->dst->Amask) &&
+                pg_has_avx2() && (src != dst)) {
+                blit_blend_rgb_sub_avx2(info);
+                break;
+            }
+#if PG_ENABLE_SSE_NEON
+            if (PG_SURF_BytesPerPixel(src) == 4 &&
+                PG_SURF_BytesPerPixel(dst) == 4 &&
+                info->src->Rmask == info->dst->Rmask &&
+                info->src->Gmask == info->dst->Gmask &&
+                info->src->Bmask == info->dst->Bmask &&
+                !(info->src->Amask != 0 && info->dst->Amask != 0 &&
+                  info->src->Amask != info->dst->Amask) &&
+                pg_HasSSE_NEON() && (src != dst)) {
+                blit_blend_rgb_sub_sse2(info);
+                break;
+            }
+#endif /* PG_ENABLE_SSE_NEON */
+#endif /* SDL_BYTEORDER == SDL_LIL_ENDIAN */
+#endif /* __EMSCRIPTEN__ */
+            blit_blend_sub(info);
+            break;
+        }
+        case PYGAME_BLEND_MULT: {
+#if !defined(__EMSCRIPTEN__)
+#if SDL_BYTEORDER == SDL_LIL_ENDIAN
+            if (PG_SURF_BytesPerPixel(src) == 4 &&
+                PG_SURF_BytesPerPixel(dst) == 4 &&
+                info->src->Rmask == info->dst->Rmask &&
+                info->src->Gmask == info->dst->Gmask &&
+                info->src->Bmask == info->dst->Bmask &&
+                !(info->src->Amask != 0 && info->dst->Amask != 0 &&
+                  info->src->Amask != info->dst->Amask) &&
+                pg_has_avx2() && (src != dst)) {
+                blit_blend_rgb_mul_avx2(info);
+                break;
+            }
+#if PG_ENABLE_SSE_NEON
+            if (PG_SURF_BytesPerPixel(src) == 4 &&
+                PG_SURF_BytesPerPixel(dst) == 4 &&
+                info->src->Rmask == info->dst->Rmask &&
+                info->src->Gmask == info->dst->Gmask &&
+                info->src->Bmask == info->dst->Bmask &&
+                !(info->src->Amask != 0 && info->dst->Amask != 0 &&
+                  info->src->Amask != info->dst->Amask) &&
+                pg_HasSSE_NEON() && (src != dst)) {
+                blit_blend_rgb_mul_sse2(info);
+                break;
+            }
+#endif /* PG_ENABLE_SSE_NEON */
+#endif /* SDL_BYTEORDER == SDL_LIL_ENDIAN */
+#endif /* __EMSCRIPTEN__ */
+            blit_blend_mul(info);
+            break;
+        }
+        case PYGAME_BLEND_MIN: {
+#if !defined(__EMSCRIPTEN__)
+#if SDL_BYTEORDER == SDL_LIL_ENDIAN
+            if (PG_SURF_BytesPerPixel(src) == 4 &&
+                PG_SURF_BytesPerPixel(dst) == 4 &&
+                info->src->Rmask == info->dst->Rmask &&
+                info->src->Gmask == info->dst->Gmask &&
+                info->src->Bmask == info->dst->Bmask &&
+                !(info->src->Amask != 0 && info->dst->Amask != 0 &&
+                  info->src->Amask != info->dst->Amask) &&
+                pg_has_avx2() && (src != dst)) {
+                blit_blend_rgb_min_avx2(info);
+                break;
+            }
+#if PG_ENABLE_SSE_NEON
+            if (PG_SURF_BytesPerPixel(src) == 4 &&
+                PG_SURF_BytesPerPixel(dst) == 4 &&
+                info->src->Rmask == info->dst->Rmask &&
+                info->src->Gmask == info->dst->Gmask &&
+                info->src->Bmask == info->dst->Bmask &&
+                !(info->src->Amask != 0 && info->dst->Amask != 0 &&
+                  info->src->Amask != info->dst->Amask) &&
+                pg_HasSSE_NEON() && (src != dst)) {
+                blit_blend_rgb_min_sse2(info);
+                break;
+            }
+#endif /* PG_ENABLE_SSE_NEON */
+#endif /* SDL_BYTEORDER == SDL_LIL_ENDIAN */
+#endif /* __EMSCRIPTEN__ */
+            blit_blend_min(info);
+            break;
+        }
+        case PYGAME_BLEND_MAX: {
+#if !defined(__EMSCRIPTEN__)
+#if SDL_BYTEORDER == SDL_LIL_ENDIAN
+            if (PG_SURF_BytesPerPixel(src) == 4 &&
+                PG_SURF_BytesPerPixel(dst) == 4 &&
+                info->src->Rmask == info->dst->Rmask &&
+                info->src->Gmask == info->dst->Gmask &&
+                info->src->Bmask == info->dst->Bmask &&
+                !(info->src->Amask != 0 && info->dst->Amask != 0 &&
+                  info->src->Amask != info->dst->Amask) &&
+                pg_has_avx2() && (src != dst)) {
+                blit_blend_rgb_max_avx2(info);
+                break;
+            }
+#if PG_ENABLE_SSE_NEON
+            if (PG_SURF_BytesPerPixel(src) == 4 &&
+                PG_SURF_BytesPerPixel(dst) == 4 &&
+                info->src->Rmask == info->dst->Rmask &&
+                info->src->Gmask == info->dst->Gmask &&
+                info->src->Bmask == info->dst->Bmask &&
+                !(info->src->Amask != 0 && info->dst->Amask != 0 &&
+                  info->src->Amask != info->dst->Amask) &&
+                pg_HasSSE_NEON() && (src != dst)) {
+                blit_blend_rgb_max_sse2(info);
+                break;
+            }
+#endif /* PG_ENABLE_SSE_NEON */
+#endif /* SDL_BYTEORDER == SDL_LIL_ENDIAN */
+#endif /* __EMSCRIPTEN__ */
+            blit_blend_max(info);
+            break;
+        }
+
+        case PYGAME_BLEND_RGBA_ADD: {
+#if !defined(__EMSCRIPTEN__)
+#if SDL_BYTEORDER == SDL_LIL_ENDIAN
+            if (PG_SURF_BytesPerPixel(src) == 4 &&
+                PG_SURF_BytesPerPixel(dst) == 4 &&
+                info->src->Rmask == info->dst->Rmask &&
+                info->src->Gmask == info->dst->Gmask &&
+                info->src->Bmask == info->dst->Bmask &&
+                info->src_blend != SDL_BLENDMODE_NONE && pg_has_avx2() &&
+                (src != dst)) {
+                blit_blend_rgba_add_avx2(info);
+                break;
+            }
+#if PG_ENABLE_SSE_NEON
+            if (PG_SURF_BytesPerPixel(src) == 4 &&
+                PG_SURF_BytesPerPixel(dst) == 4 &&
+                info->src->Rmask == info->dst->Rmask &&
+                info->src->Gmask == info->dst->Gmask &&
+                info->src->Bmask == info->dst->Bmask &&
+                info->src_blend != SDL_BLENDMODE_NONE && pg_HasSSE_NEON() &&
+                (src != dst)) {
+                blit_blend_rgba_add_sse2(info);
+                break;
+            }
+#endif /* PG_ENABLE_SSE_NEON */
+#endif /* SDL_BYTEORDER == SDL_LIL_ENDIAN */
+#endif /* __EMSCRIPTEN__ */
+            blit_blend_rgba_add(info);
+            break;
+        }
+        case PYGAME_BLEND_RGBA_SUB: {
+#if !defined(__EMSCRIPTEN__)
+#if SDL_BYTEORDER == SDL_LIL_ENDIAN
+            if (PG_SURF_BytesPerPixel(src) == 4 &&
+                PG_SURF_BytesPerPixel(dst) == 4 &&
+                info->src->Rmask == info->dst->Rmask &&
+                info->src->Gmask == info->dst->Gmask &&
+                info->src->Bmask == info->dst->Bmask &&
+                info->src_blend != SDL_BLENDMODE_NONE && pg_has_avx2() &&
+                (src != dst)) {
+                blit_blend_rgba_sub_avx2(info);
+                break;
+            }
+#if PG_ENABLE_SSE_NEON
+            if (PG_SURF_BytesPerPixel(src) == 4 &&
+                PG_SURF_BytesPerPixel(dst) == 4 &&
+                info->src->Rmask == info->dst->Rmask &&
+                info->src->Gmask == info->dst->Gmask &&
+                info->src->Bmask == info->dst->Bmask &&
+                info->src_blend != SDL_BLENDMODE_NONE && pg_HasSSE_NEON() &&
+                (src != dst)) {
+                blit_blend_rgba_sub_sse2(info);
+                break;
+            }
+#endif /* PG_ENABLE_SSE_NEON */
+#endif /* SDL_BYTEORDER == SDL_LIL_ENDIAN */
+#endif /* __EMSCRIPTEN__ */
+            blit_blend_rgba_sub(info);
+            break;
+        }
+        case PYGAME_BLEND_RGBA_MULT: {
+#if !defined(__EMSCRIPTEN__)
+#if SDL_BYTEORDER == SDL_LIL_ENDIAN
+            if (PG_SURF_BytesPerPixel(src) == 4 &&
+                PG_SURF_BytesPerPixel(dst) == 4 &&
+                info->src->Rmask == info->dst->Rmask &&
+                info->src->Gmask == info->dst->Gmask &&
+                info->src->Bmask == info->dst->Bmask &&
+                info->src_blend != SDL_BLENDMODE_NONE && pg_has_avx2() &&
+                (src != dst)) {
+                blit_blend_rgba_mul_avx2(info);
+                break;
+            }
+#if PG_ENABLE_SSE_NEON
+            if (PG_SURF_BytesPerPixel(src) == 4 &&
+                PG_SURF_BytesPerPixel(dst) == 4 &&
+                info->src->Rmask == info->dst->Rmask &&
+                info->src->Gmask == info->dst->Gmask &&
+                info->src->Bmask == info->dst->Bmask &&
+                info->src_blend != SDL_BLENDMODE_NONE && pg_HasSSE_NEON() &&
+                (src != dst)) {
+                blit_blend_rgba_mul_sse2(info);
+                break;
+            }
+#endif /* PG_ENABLE_SSE_NEON */
+#endif /* SDL_BYTEORDER == SDL_LIL_ENDIAN */
+#endif /* __EMSCRIPTEN__ */
+            blit_blend_rgba_mul(info);
+            break;
+        }
+        case PYGAME_BLEND_RGBA_MIN: {
+#if !defined(__EMSCRIPTEN__)
+#if SDL_BYTEORDER == SDL_LIL_ENDIAN
+            if (PG_SURF_BytesPerPixel(src) == 4 &&
+                PG_SURF_BytesPerPixel(dst) == 4 &&
+                info->src->Rmask == info->dst->Rmask &&
+                info->src->Gmask == info->dst->Gmask &&
+                info->src->Bmask == info->dst->Bmask &&
+                info->src_blend != SDL_BLENDMODE_NONE && pg_has_avx2() &&
+                (src != dst)) {
+                blit_blend_rgba_min_avx2(info);
+                break;
+            }
+#if PG_ENABLE_SSE_NEON
+            if (PG_SURF_BytesPerPixel(src) == 4 &&
+                PG_SURF_BytesPerPixel(dst) == 4 &&
+                info->src->Rmask == info->dst->Rmask &&
+                info->src->Gmask == info->dst->Gmask &&
+                info->src->Bmask == info->dst->Bmask &&
+                info->src_blend != SDL_BLENDMODE_NONE && pg_HasSSE_NEON() &&
+                (src != dst)) {
+                blit_blend_rgba_min_sse2(info);
+                break;
+            }
+#endif /* PG_ENABLE_SSE_NEON */
+#endif /* SDL_BYTEORDER == SDL_LIL_ENDIAN */
+#endif /* __EMSCRIPTEN__ */
+            blit_blend_rgba_min(info);
+            break;
+        }
+        case PYGAME_BLEND_RGBA_MAX: {
+#if !defined(__EMSCRIPTEN__)
+#if SDL_BYTEORDER == SDL_LIL_ENDIAN
+            if (PG_SURF_BytesPerPixel(src) == 4 &&
+                PG_SURF_BytesPerPixel(dst) == 4 &&
+                info->src->Rmask == info->dst->Rmask &&
+                info->src->Gmask == info->dst->Gmask &&
+                info->src->Bmask == info->dst->Bmask &&
+                info->src_blend != SDL_BLENDMODE_NONE && pg_has_avx2() &&
+                (src != dst)) {
+                blit_blend_rgba_max_avx2(info);
+                break;
+            }
+#if PG_ENABLE_SSE_NEON
+            if (PG_SURF_BytesPerPixel(src) == 4 &&
+                PG_SURF_BytesPerPixel(dst) == 4 &&
+                info->src->Rmask == info->dst->Rmask &&
+                info->src->Gmask == info->dst->Gmask &&
+                info->src->Bmask == info->dst->Bmask &&
+                info->src_blend != SDL_BLENDMODE_NONE && pg_HasSSE_NEON() &&
+                (src != dst)) {
+                blit_blend_rgba_max_sse2(info);
+                break;
+            }
+#endif /* PG_ENABLE_SSE_NEON */
+#endif /* SDL_BYTEORDER == SDL_LIL_ENDIAN */
+#endif /* __EMSCRIPTEN__ */
+            blit_blend_rgba_max(info);
+            break;
+        }
+        case PYGAME_BLEND_PREMULTIPLIED: {
+#if !defined(__EMSCRIPTEN__)
+#if SDL_BYTEORDER == SDL_LIL_ENDIAN
+            if (PG_SURF_BytesPerPixel(src) == 4 &&
+                PG_SURF_BytesPerPixel(dst) == 4 &&
+                info->src->Rmask == info->dst->Rmask &&
+                info->src->Gmask == info->dst->Gmask &&
+                info->src->Bmask == info->dst->Bmask &&
+                info->src_blend != SDL_BLENDMODE_NONE && pg_has_avx2() &&
+                (src != dst)) {
+                blit_blend_premultiplied_avx2(info);
+                break;
+            }
+#if PG_ENABLE_SSE_NEON
+            if (PG_SURF_BytesPerPixel(src) == 4 &&
+                PG_SURF_BytesPerPixel(dst) == 4 &&
+                info->src->Rmask == info->dst->Rmask &&
+                info->src->Gmask == info->dst->Gmask &&
+                info->src->Bmask == info->dst->Bmask &&
+                info->src->Amask == 0xFF000000 &&
+                info->src_blend != SDL_BLENDMODE_NONE && pg_HasSSE_NEON() &&
+                (src != dst)) {
+                blit_blend_premultiplied_sse2(info);
+                break;
+            }
+#endif /* PG_ENABLE_SSE_NEON */
+#endif /* SDL_BYTEORDER == SDL_LIL_ENDIAN */
+#endif /* __EMSCRIPTEN__ */
+
+            blit_blend_premultiplied(info);
+            break;
+        }
+        default: {
+            SDL_SetError("Invalid argument passed to blit.");
+            okay = 0;
+            break;
+        }
+    }
+    return okay;
+}
+
+/* --------------------------------------------------------- */
+
+/* Large blits can be split into horizontal bands that are blitted at the
+ * same time by a small pool of worker threads. The pool is off (a single
+ * thread) until pg_SetBlitThreads() is called with a higher count. */
+
+#if !defined(__EMSCRIPTEN__)
+static struct {
+    SDL_mutex *mutex;
+    SDL_cond *work_cond; /* signalled when a new job is posted or on quit */
+    SDL_cond *done_cond; /* signalled when a band completes or pool idles */
+    SDL_Thread *workers[PG_BLIT_MAX_THREADS];
+    int nworkers;
+    int quit;
+    int busy; /* a job is running, or the pool is being reconfigured */
+    pg_BlitBandFunc func;
+    void *data;
+    int nbands;
+    int next_band;
+    int pending;
+} pg_blit_pool;
+
+static int SDLCALL
+pg_blit_worker(void *unused)
+{
+    pg_BlitBandFunc func;
+    void *data;
+    int band, nbands;
+
+    SDL_LockMutex(pg_blit_pool.mutex);
+    while (!pg_blit_pool.quit) {
+        if (pg_blit_pool.next_band >= pg_blit_pool.nbands) {
+            SDL_CondWait(pg_blit_pool.work_cond, pg_blit_pool.mutex);
+            continue;
+        }
+        band = pg_blit_pool.next_band++;
+        func = pg_blit_pool.func;
+        data = pg_blit_pool.data;
+        nbands = pg_blit_pool.nbands;
+        SDL_UnlockMutex(pg_blit_pool.mutex);
+
+        func(data, band, nbands);
+
+        SDL_LockMutex(pg_blit_pool.mutex);
+        if (--pg_blit_pool.pending == 0) {
+            SDL_CondBroadcast(pg_blit_pool.done_cond);
+        }
+    }
+    SDL_UnlockMutex(pg_blit_pool.mutex);
+    return 0;
+}
+
+/* Stops every worker, the pool mutex must be held and busy set */
+static void
+pg_blit_pool_stop_workers(void)
+{
+    int i, nworkers = pg_blit_pool.nworkers;
+
+    pg_blit_pool.quit = 1;
+    SDL_CondBroadcast(pg_blit_pool.work_cond);
+    SDL_UnlockMutex(pg_blit_pool.mutex);
+    for (i = 0; i < nworkers; i++) {
+        SDL_WaitThread(pg_blit_pool.workers[i], NULL);
+        pg_blit_pool.workers[i] = NULL;
+    }
+    SDL_LockMutex(pg_blit_pool.mutex);
+    pg_blit_pool.nworkers = 0;
+    pg_blit_pool.quit = 0;
+}
+#endif /* !__EMSCRIPTEN__ */
+
+int
+pg_SetBlitThreads(int count)
+{
+#if defined(__EMSCRIPTEN__)
+    if (count > 1) {
+        SDL_SetError("threaded blits are not supported on this platform");
+        return -1;
+    }
+    return 0;
+#else
+    int ret = 0;
+
+    if (count < 1) {
+        count = 1;
+    }
+    if (count > PG_BLIT_MAX_THREADS) {
+        count = PG_BLIT_MAX_THREADS;
+    }
+
+    /* The mutex and conditions are created once and never freed, like the
+     * other pygame mutexes that threads may still be waiting on */
+    if (!pg_blit_pool.mutex) {
+        if (count == 1) {
+            return 0;
+        }
+        if (!(pg_blit_pool.mutex = SDL_CreateMutex()) ||
+            !(pg_blit_pool.work_cond = SDL_CreateCond()) ||
+            !(pg_blit_pool.done_cond = SDL_CreateCond())) {
+            return -1;
+        }
+    }
+
+    SDL_LockMutex(pg_blit_pool.mutex);
+    while (pg_blit_pool.busy) {
+        SDL_CondWait(pg_blit_pool.done_cond, pg_blit_pool.mutex);
+    }
+    if (pg_blit_pool.nworkers == count - 1) {
+        SDL_UnlockMutex(pg_blit_pool.mutex);
+        return 0;
+    }
+    pg_blit_pool.busy = 1;
+    if (pg_blit_pool.nworkers) {
+        pg_blit_pool_stop_workers();
+    }
+    while (pg_blit_pool.nworkers < count - 1) {
+        SDL_Thread *thread =
+            SDL_CreateThread(pg_blit_worker, "pygame blit", NULL);
+        if (!thread) {
+            ret = -1;
+            break;
+        }
+        pg_blit_pool.workers[pg_blit_pool.nworkers++] = thread;
+    }
+    pg_blit_pool.busy = 0;
+    SDL_CondBroadcast(pg_blit_pool.done_cond);
+    SDL_UnlockMutex(pg_blit_pool.mutex);
+    return ret;
+#endif /* !__EMSCRIPTEN__ */
+}
+
+int
+pg_GetBlitThreads(void)
+{
+#if defined(__EMSCRIPTEN__)
+    return 1;
+#else
+    int count;
+
+    if (!pg_blit_pool.mutex) {
+        return 1;
+    }
+    SDL_LockMutex(pg_blit_pool.mutex);
+    count = pg_blit_pool.nworkers + 1;
+    SDL_UnlockMutex(pg_blit_pool.mutex);
+    return count;
+#endif /* !__EMSCRIPTEN__ */
+}
+
+int
+pg_BlitBandCount(int width, int height)
+{
+    int nbands = pg_GetBlitThreads();
+
+    if (nbands < 2 || width * height < PG_BLIT_THREAD_MIN_PIXELS) {
+        return 1;
+    }
+    if (nbands > height / PG_BLIT_THREAD_MIN_ROWS) {
+        nbands = height / PG_BLIT_THREAD_MIN_ROWS;
+    }
+    return nbands > 1 ? nbands : 1;
+}
+
+void
+pg_RunBlitBands(pg_BlitBandFunc func, void *data, int nbands)
+{
+    int band;
+
+#if !defined(__EMSCRIPTEN__)
+    if (nbands > 1 && pg_blit_pool.mutex) {
+        SDL_LockMutex(pg_blit_pool.mutex);
+        /* If another thread is already using the pool, blit serially */
+        if (!pg_blit_pool.busy && pg_blit_pool.nworkers) {
+            pg_blit_pool.busy = 1;
+            pg_blit_pool.func = func;
+            pg_blit_pool.data = data;
+            pg_blit_pool.nbands = nbands;
+            pg_blit_pool.next_band = 0;
+            pg_blit_pool.pending = nbands;
+            SDL_CondBroadcast(pg_blit_pool.work_cond);
+            SDL_UnlockMutex(pg_blit_pool.mutex);
+
+            /* Only plain pixel memory is touched from here on, so let other
+             * Python threads run while the bands are blitted. */
+            Py_BEGIN_ALLOW_THREADS;
+            SDL_LockMutex(pg_blit_pool.mutex);
+            /* The calling thread takes bands too instead of just waiting */
+            while (pg_blit_pool.next_band < pg_blit_pool.nbands) {
+                band = pg_blit_pool.next_band++;
+                SDL_UnlockMutex(pg_blit_pool.mutex);
+                func(data, band, nbands);
+                SDL_LockMutex(pg_blit_pool.mutex);
+                pg_blit_pool.pending--;
+            }
+            while (pg_blit_pool.pending) {
+                SDL_CondWait(pg_blit_pool.done_cond, pg_blit_pool.mutex);
+            }
+            pg_blit_pool.func = NULL;
+            pg_blit_pool.data = NULL;
+            pg_blit_pool.nbands = 0;
+            pg_blit_pool.next_band = 0;
+            pg_blit_pool.busy = 0;
+            SDL_CondBroadcast(pg_blit_pool.done_cond);
+            SDL_UnlockMutex(pg_blit_pool.mutex);
+            Py_END_ALLOW_THREADS;
+            return;
+        }
+        SDL_UnlockMutex(pg_blit_pool.mutex);
+    }
+#endif /* !__EMSCRIPTEN__ */
+
+    for (band = 0; band < nbands; band++) {
+        func(data, band, nbands);
+    }
+}
+
+typedef struct {
+    SDL_BlitInfo info;
+    SDL_Surface *src;
+    SDL_Surface *dst;
+    int blend_flags;
+    int okay[PG_BLIT_MAX_THREADS];
+} pg_BlitBandJob;
+
+static void
+pg_blit_band(void *data, int band, int nbands)
+{
+    pg_BlitBandJob *job = (pg_BlitBandJob *)data;
+    SDL_BlitInfo info = job->info;
+    int start = job->info.height * band / nbands;
+    int end = job->info.height * (band + 1) / nbands;
+
+    info.s_pixels += start * job->src->pitch;
+    info.d_pixels += start * job->dst->pitch;
+    info.height = end - start;
+    job->okay[band] =
+        pg_blit_dispatch(&info, job->src, job->dst, job->blend_flags);
+}
+
+/* Blits info in bands if it is large enough and the source and
+ * destination pixels don't overlap, otherwise in one go. */
+static int
+pg_blit_maybe_threaded(SDL_BlitInfo *info, SDL_Surface *src, SDL_Surface *dst,
+                       int blend_flags)
+{
+    pg_BlitBandJob job;
+    Uint8 *s_end, *d_end;
+    int i, nbands = pg_BlitBandCount(info->width, info->height);
+
+    if (nbands < 2 || info->s_pxskip < 0) {
+        return pg_blit_dispatch(info, src, dst, blend_flags);
+    }
+    s_end = info->s_pixels + (info->height - 1) * src->pitch +
+            info->width * info->s_pxskip;
+    d_end = info->d_pixels + (info->height - 1) * dst->pitch +
+            info->width * info->d_pxskip;
+    if (info->s_pixels < d_end && info->d_pixels < s_end) {
+        return pg_blit_dispatch(info, src, dst, blend_flags);
+    }
+
+    job.info = *info;
+    job.src = src;
+    job.dst = dst;
+    job.blend_flags = blend_flags;
+    pg_RunBlitBands(pg_blit_band, &job, nbands);
+    for (i = 0; i < nbands; i++) {
+        if (!job.okay[i]) {
+            /* errors set in a worker thread are not visible here */
+            SDL_SetError("Invalid argument passed to blit.");
+            return 0;
+        }
+    }
+    return 1;
+}
+
 static int
 SoftBlitPyGame(SDL_Surface *src, SDL_Rect *srcrect, SDL_Surface *dst,
                SDL_Rect *dstrect, int blend_flags)
@@ -160,420 +853,7 @@ SoftBlitPyGame(SDL_Surface *src, SDL_Rect *srcrect, SDL_Surface *dst,
                 blend_flags = PYGAME_BLEND_MULT;
             }
 
-            switch (blend_flags) {
-                case 0: {
-                    if (info.src_blend != SDL_BLENDMODE_NONE &&
-                        info.src->Amask) {
-#if !defined(__EMSCRIPTEN__)
-#if SDL_BYTEORDER == SDL_LIL_ENDIAN
-                        if (PG_SURF_BytesPerPixel(src) == 4 &&
-                            PG_SURF_BytesPerPixel(dst) == 4 &&
-                            info.src->Rmask == info.dst->Rmask &&
-                            info.src->Gmask == info.dst->Gmask &&
-                            info.src->Bmask == info.dst->Bmask) {
-                            /* If our source and destination are the same ARGB
-                               32bit format we can use SSE2/NEON/AVX2 to speed
-                               up the blend */
-                            if (pg_has_avx2() && (src != dst)) {
-                                if (info.src_blanket_alpha != 255) {
-                                    alphablit_alpha_avx2_argb_surf_alpha(
-                                        &info);
-                                }
-                                else if (SDL_ISPIXELFORMAT_ALPHA(
-                                             PG_SURF_FORMATENUM(dst)) &&
-                                         info.dst_blend !=
-                                             SDL_BLENDMODE_NONE) {
-                                    alphablit_alpha_avx2_argb_no_surf_alpha(
-                                        &info);
-                                }
-                                else {
-                                    alphablit_alpha_avx2_argb_no_surf_alpha_opaque_dst(
-                                        &info);
-                                }
-                                break;
-                            }
-#if PG_ENABLE_SSE_NEON
-                            if ((pg_HasSSE_NEON()) && (src != dst)) {
-                                if (info.src_blanket_alpha != 255) {
-                                    alphablit_alpha_sse2_argb_surf_alpha(
-                                        &info);
-                                }
-                                else if (SDL_ISPIXELFORMAT_ALPHA(
-                                             PG_SURF_FORMATENUM(dst)) &&
-                                         info.dst_blend !=
-                                             SDL_BLENDMODE_NONE) {
-                                    alphablit_alpha_sse2_argb_no_surf_alpha(
-                                        &info);
-                                }
-                                else {
-                                    alphablit_alpha_sse2_argb_no_surf_alpha_opaque_dst(
-                                        &info);
-                                }
-                                break;
-                            }
-#endif /* PG_ENABLE_SSE_NEON */
-                        }
-#endif /* SDL_BYTEORDER == SDL_LIL_ENDIAN */
-#endif /* __EMSCRIPTEN__ */
-                        alphablit_alpha(&info);
-                    }
-                    else if (info.src_has_colorkey) {
-                        alphablit_colorkey(&info);
-                    }
-                    else {
-                        alphablit_solid(&info);
-                    }
-                    break;
-                }
-                case PYGAME_BLEND_ADD: {
-#if !defined(__EMSCRIPTEN__)
-#if SDL_BYTEORDER == SDL_LIL_ENDIAN
-                    if (PG_SURF_BytesPerPixel(src) == 4 &&
-                        PG_SURF_BytesPerPixel(dst) == 4 &&
-                        info.src->Rmask == info.dst->Rmask &&
-                        info.src->Gmask == info.dst->Gmask &&
-                        info.src->Bmask == info.dst->Bmask &&
-                        !(info.src->Amask != 0 && info.dst->Amask != 0 &&
-                          info.src->Amask != info.dst->Amask) &&
-                        pg_has_avx2() && (src != dst)) {
-                        blit_blend_rgb_add_avx2(&info);
-                        break;
-                    }
-#if PG_ENABLE_SSE_NEON
-                    if (PG_SURF_BytesPerPixel(src) == 4 &&
-                        PG_SURF_BytesPerPixel(dst) == 4 &&
-                        info.src->Rmask == info.dst->Rmask &&
-                        info.src->Gmask == info.dst->Gmask &&
-                        info.src->Bmask == info.dst->Bmask &&
-                        !(info.src->Amask != 0 && info.dst->Amask != 0 &&
-                          info.src->Amask != info.dst->Amask) &&
-                        pg_HasSSE_NEON() && (src != dst)) {
-                        blit_blend_rgb_add_sse2(&info);
-                        break;
-                    }
-#endif /* PG_ENABLE_SSE_NEON */
-#endif /* SDL_BYTEORDER == SDL_LIL_ENDIAN */
-#endif /* __EMSCRIPTEN__ */
-                    blit_blend_add(&info);
-                    break;
-                }
-                case PYGAME_BLEND_SUB: {
-#if !defined(__EMSCRIPTEN__)
-#if SDL_BYTEORDER == SDL_LIL_ENDIAN
-                    if (PG_SURF_BytesPerPixel(src) == 4 &&
-                        PG_SURF_BytesPerPixel(dst) == 4 &&
-                        info.src->Rmask == info.dst->Rmask &&
-                        info.src->Gmask == info.dst->Gmask &&
-                        info.src->Bmask == info.dst->Bmask &&
-                        !(info.src->Amask != 0 && info.dst->Amask != 0 &&
-                          info.src->Amask != info.dst->Amask) &&
-                        pg_has_avx2() && (src != dst)) {
-                        blit_blend_rgb_sub_avx2(&info);
-                        break;
-                    }
-#if PG_ENABLE_SSE_NEON
-                    if (PG_SURF_BytesPerPixel(src) == 4 &&
-                        PG_SURF_BytesPerPixel(dst) == 4 &&
-                        info.src->Rmask == info.dst->Rmask &&
-                        info.src->Gmask == info.dst->Gmask &&
-                        info.src->Bmask == info.dst->Bmask &&
-                        !(info.src->Amask != 0 && info.dst->Amask != 0 &&
-                          info.src->Amask != info.dst->Amask) &&
-                        pg_HasSSE_NEON() && (src != dst)) {
-                        blit_blend_rgb_sub_sse2(&info);
-                        break;
-                    }
-#endif /* PG_ENABLE_SSE_NEON */
-#endif /* SDL_BYTEORDER == SDL_LIL_ENDIAN */
-#endif /* __EMSCRIPTEN__ */
-                    blit_blend_sub(&info);
-                    break;
-                }
-                case PYGAME_BLEND_MULT: {
-#if !defined(__EMSCRIPTEN__)
-#if SDL_BYTEORDER == SDL_LIL_ENDIAN
-                    if (PG_SURF_BytesPerPixel(src) == 4 &&
-                        PG_SURF_BytesPerPixel(dst) == 4 &&
-                        info.src->Rmask == info.dst->Rmask &&
-                        info.src->Gmask == info.dst->Gmask &&
-                        info.src->Bmask == info.dst->Bmask &&
-                        !(info.src->Amask != 0 && info.dst->Amask != 0 &&
-                          info.src->Amask != info.dst->Amask) &&
-                        pg_has_avx2() && (src != dst)) {
-                        blit_blend_rgb_mul_avx2(&info);
-                        break;
-                    }
-#if PG_ENABLE_SSE_NEON
-                    if (PG_SURF_BytesPerPixel(src) == 4 &&
-                        PG_SURF_BytesPerPixel(dst) == 4 &&
-                        info.src->Rmask == info.dst->Rmask &&
-                        info.src->Gmask == info.dst->Gmask &&
-                        info.src->Bmask == info.dst->Bmask &&
-                        !(info.src->Amask != 0 && info.dst->Amask != 0 &&
-                          info.src->Amask != info.dst->Amask) &&
-                        pg_HasSSE_NEON() && (src != dst)) {
-                        blit_blend_rgb_mul_sse2(&info);
-                        break;
-                    }
-#endif /* PG_ENABLE_SSE_NEON */
-#endif /* SDL_BYTEORDER == SDL_LIL_ENDIAN */
-#endif /* __EMSCRIPTEN__ */
-                    blit_blend_mul(&info);
-                    break;
-                }
-                case PYGAME_BLEND_MIN: {
-#if !defined(__EMSCRIPTEN__)
-#if SDL_BYTEORDER == SDL_LIL_ENDIAN
-                    if (PG_SURF_BytesPerPixel(src) == 4 &&
-                        PG_SURF_BytesPerPixel(dst) == 4 &&
-                        info.src->Rmask == info.dst->Rmask &&
-                        info.src->Gmask == info.dst->Gmask &&
-                        info.src->Bmask == info.dst->Bmask &&
-                        !(info.src->Amask != 0 && info.dst->Amask != 0 &&
-                          info.src->Amask != info.dst->Amask) &&
-                        pg_has_avx2() && (src != dst)) {
-                        blit_blend_rgb_min_avx2(&info);
-                        break;
-                    }
-#if PG_ENABLE_SSE_NEON
-                    if (PG_SURF_BytesPerPixel(src) == 4 &&
-                        PG_SURF_BytesPerPixel(dst) == 4 &&
-                        info.src->Rmask == info.dst->Rmask &&
-                        info.src->Gmask == info.dst->Gmask &&
-                        info.src->Bmask == info.dst->Bmask &&
-                        !(info.src->Amask != 0 && info.dst->Amask != 0 &&
-                          info.src->Amask != info.dst->Amask) &&
-                        pg_HasSSE_NEON() && (src != dst)) {
-                        blit_blend_rgb_min_sse2(&info);
-                        break;
-                    }
-#endif /* PG_ENABLE_SSE_NEON */
-#endif /* SDL_BYTEORDER == SDL_LIL_ENDIAN */
-#endif /* __EMSCRIPTEN__ */
-                    blit_blend_min(&info);
-                    break;
-                }
-                case PYGAME_BLEND_MAX: {
-#if !defined(__EMSCRIPTEN__)
-#if SDL_BYTEORDER == SDL_LIL_ENDIAN
-                    if (PG_SURF_BytesPerPixel(src) == 4 &&
-                        PG_SURF_BytesPerPixel(dst) == 4 &&
-                        info.src->Rmask == info.dst->Rmask &&
-                        info.src->Gmask == info.dst->Gmask &&
-                        info.src->Bmask == info.dst->Bmask &&
-                        !(info.src->Amask != 0 && info.dst->Amask != 0 &&
-                          info.src->Amask != info.dst->Amask) &&
-                        pg_has_avx2() && (src != dst)) {
-                        blit_blend_rgb_max_avx2(&info);
-                        break;
-                    }
-#if PG_ENABLE_SSE_NEON
-                    if (PG_SURF_BytesPerPixel(src) == 4 &&
-                        PG_SURF_BytesPerPixel(dst) == 4 &&
-                        info.src->Rmask == info.dst->Rmask &&
-                        info.src->Gmask == info.dst->Gmask &&
-                        info.src->Bmask == info.dst->Bmask &&
-                        !(info.src->Amask != 0 && info.dst->Amask != 0 &&
-                          info.src->Amask != info.dst->Amask) &&
-                        pg_HasSSE_NEON() && (src != dst)) {
-                        blit_blend_rgb_max_sse2(&info);
-                        break;
-                    }
-#endif /* PG_ENABLE_SSE_NEON */
-#endif /* SDL_BYTEORDER == SDL_LIL_ENDIAN */
-#endif /* __EMSCRIPTEN__ */
-                    blit_blend_max(&info);
-                    break;
-                }
-
-                case PYGAME_BLEND_RGBA_ADD: {
-#if !defined(__EMSCRIPTEN__)
-#if SDL_BYTEORDER == SDL_LIL_ENDIAN
-                    if (PG_SURF_BytesPerPixel(src) == 4 &&
-                        PG_SURF_BytesPerPixel(dst) == 4 &&
-                        info.src->Rmask == info.dst->Rmask &&
-                        info.src->Gmask == info.dst->Gmask &&
-                        info.src->Bmask == info.dst->Bmask &&
-                        info.src_blend != SDL_BLENDMODE_NONE &&
-                        pg_has_avx2() && (src != dst)) {
-                        blit_blend_rgba_add_avx2(&info);
-                        break;
-                    }
-#if PG_ENABLE_SSE_NEON
-                    if (PG_SURF_BytesPerPixel(src) == 4 &&
-                        PG_SURF_BytesPerPixel(dst) == 4 &&
-                        info.src->Rmask == info.dst->Rmask &&
-                        info.src->Gmask == info.dst->Gmask &&
-                        info.src->Bmask == info.dst->Bmask &&
-                        info.src_blend != SDL_BLENDMODE_NONE &&
-                        pg_HasSSE_NEON() && (src != dst)) {
-                        blit_blend_rgba_add_sse2(&info);
-                        break;
-                    }
-#endif /* PG_ENABLE_SSE_NEON */
-#endif /* SDL_BYTEORDER == SDL_LIL_ENDIAN */
-#endif /* __EMSCRIPTEN__ */
-                    blit_blend_rgba_add(&info);
-                    break;
-                }
-                case PYGAME_BLEND_RGBA_SUB: {
-#if !defined(__EMSCRIPTEN__)
-#if SDL_BYTEORDER == SDL_LIL_ENDIAN
-                    if (PG_SURF_BytesPerPixel(src) == 4 &&
-                        PG_SURF_BytesPerPixel(dst) == 4 &&
-                        info.src->Rmask == info.dst->Rmask &&
-                        info.src->Gmask == info.dst->Gmask &&
-                        info.src->Bmask == info.dst->Bmask &&
-                        info.src_blend != SDL_BLENDMODE_NONE &&
-                        pg_has_avx2() && (src != dst)) {
-                        blit_blend_rgba_sub_avx2(&info);
-                        break;
-                    }
-#if PG_ENABLE_SSE_NEON
-                    if (PG_SURF_BytesPerPixel(src) == 4 &&
-                        PG_SURF_BytesPerPixel(dst) == 4 &&
-                        info.src->Rmask == info.dst->Rmask &&
-                        info.src->Gmask == info.dst->Gmask &&
-                        info.src->Bmask == info.dst->Bmask &&
-                        info.src_blend != SDL_BLENDMODE_NONE &&
-                        pg_HasSSE_NEON() && (src != dst)) {
-                        blit_blend_rgba_sub_sse2(&info);
-                        break;
-                    }
-#endif /* PG_ENABLE_SSE_NEON */
-#endif /* SDL_BYTEORDER == SDL_LIL_ENDIAN */
-#endif /* __EMSCRIPTEN__ */
-                    blit_blend_rgba_sub(&info);
-                    break;
-                }
-                case PYGAME_BLEND_RGBA_MULT: {
-#if !defined(__EMSCRIPTEN__)
-#if SDL_BYTEORDER == SDL_LIL_ENDIAN
-                    if (PG_SURF_BytesPerPixel(src) == 4 &&
-                        PG_SURF_BytesPerPixel(dst) == 4 &&
-                        info.src->Rmask == info.dst->Rmask &&
-                        info.src->Gmask == info.dst->Gmask &&
-                        info.src->Bmask == info.dst->Bmask &&
-                        info.src_blend != SDL_BLENDMODE_NONE &&
-                        pg_has_avx2() && (src != dst)) {
-                        blit_blend_rgba_mul_avx2(&info);
-                        break;
-                    }
-#if PG_ENABLE_SSE_NEON
-                    if (PG_SURF_BytesPerPixel(src) == 4 &&
-                        PG_SURF_BytesPerPixel(dst) == 4 &&
-                        info.src->Rmask == info.dst->Rmask &&
-                        info.src->Gmask == info.dst->Gmask &&
-                        info.src->Bmask == info.dst->Bmask &&
-                        info.src_blend != SDL_BLENDMODE_NONE &&
-                        pg_HasSSE_NEON() && (src != dst)) {
-                        blit_blend_rgba_mul_sse2(&info);
-                        break;
-                    }
-#endif /* PG_ENABLE_SSE_NEON */
-#endif /* SDL_BYTEORDER == SDL_LIL_ENDIAN */
-#endif /* __EMSCRIPTEN__ */
-                    blit_blend_rgba_mul(&info);
-                    break;
-                }
-                case PYGAME_BLEND_RGBA_MIN: {
-#if !defined(__EMSCRIPTEN__)
-#if SDL_BYTEORDER == SDL_LIL_ENDIAN
-                    if (PG_SURF_BytesPerPixel(src) == 4 &&
-                        PG_SURF_BytesPerPixel(dst) == 4 &&
-                        info.src->Rmask == info.dst->Rmask &&
-                        info.src->Gmask == info.dst->Gmask &&
-                        info.src->Bmask == info.dst->Bmask &&
-                        info.src_blend != SDL_BLENDMODE_NONE &&
-                        pg_has_avx2() && (src != dst)) {
-                        blit_blend_rgba_min_avx2(&info);
-                        break;
-                    }
-#if PG_ENABLE_SSE_NEON
-                    if (PG_SURF_BytesPerPixel(src) == 4 &&
-                        PG_SURF_BytesPerPixel(dst) == 4 &&
-                        info.src->Rmask == info.dst->Rmask &&
-                        info.src->Gmask == info.dst->Gmask &&
-                        info.src->Bmask == info.dst->Bmask &&
-                        info.src_blend != SDL_BLENDMODE_NONE &&
-                        pg_HasSSE_NEON() && (src != dst)) {
-                        blit_blend_rgba_min_sse2(&info);
-                        break;
-                    }
-#endif /* PG_ENABLE_SSE_NEON */
-#endif /* SDL_BYTEORDER == SDL_LIL_ENDIAN */
-#endif /* __EMSCRIPTEN__ */
-                    blit_blend_rgba_min(&info);
-                    break;
-                }
-                case PYGAME_BLEND_RGBA_MAX: {
-#if !defined(__EMSCRIPTEN__)
-#if SDL_BYTEORDER == SDL_LIL_ENDIAN
-                    if (PG_SURF_BytesPerPixel(src) == 4 &&
-                        PG_SURF_BytesPerPixel(dst) == 4 &&
-                        info.src->Rmask == info.dst->Rmask &&
-                        info.src->Gmask == info.dst->Gmask &&
-                        info.src->Bmask == info.dst->Bmask &&
-                        info.src_blend != SDL_BLENDMODE_NONE &&
-                        pg_has_avx2() && (src != dst)) {
-                        blit_blend_rgba_max_avx2(&info);
-                        break;
-                    }
-#if PG_ENABLE_SSE_NEON
-                    if (PG_SURF_BytesPerPixel(src) == 4 &&
-                        PG_SURF_BytesPerPixel(dst) == 4 &&
-                        info.src->Rmask == info.dst->Rmask &&
-                        info.src->Gmask == info.dst->Gmask &&
-                        info.src->Bmask == info.dst->Bmask &&
-                        info.src_blend != SDL_BLENDMODE_NONE &&
-                        pg_HasSSE_NEON() && (src != dst)) {
-                        blit_blend_rgba_max_sse2(&info);
-                        break;
-                    }
-#endif /* PG_ENABLE_SSE_NEON */
-#endif /* SDL_BYTEORDER == SDL_LIL_ENDIAN */
-#endif /* __EMSCRIPTEN__ */
-                    blit_blend_rgba_max(&info);
-                    break;
-                }
-                case PYGAME_BLEND_PREMULTIPLIED: {
-#if !defined(__EMSCRIPTEN__)
-#if SDL_BYTEORDER == SDL_LIL_ENDIAN
-                    if (PG_SURF_BytesPerPixel(src) == 4 &&
-                        PG_SURF_BytesPerPixel(dst) == 4 &&
-                        info.src->Rmask == info.dst->Rmask &&
-                        info.src->Gmask == info.dst->Gmask &&
-                        info.src->Bmask == info.dst->Bmask &&
-                        info.src_blend != SDL_BLENDMODE_NONE &&
-                        pg_has_avx2() && (src != dst)) {
-                        blit_blend_premultiplied_avx2(&info);
-                        break;
-                    }
-#if PG_ENABLE_SSE_NEON
-                    if (PG_SURF_BytesPerPixel(src) == 4 &&
-                        PG_SURF_BytesPerPixel(dst) == 4 &&
-                        info.src->Rmask == info.dst->Rmask &&
-                        info.src->Gmask == info.dst->Gmask &&
-                        info.src->Bmask == info.dst->Bmask &&
-                        info.src->Amask == 0xFF000000 &&
-                        info.src_blend != SDL_BLENDMODE_NONE &&
-                        pg_HasSSE_NEON() && (src != dst)) {
-                        blit_blend_premultiplied_sse2(&info);
-                        break;
-                    }
-#endif /* PG_ENABLE_SSE_NEON */
-#endif /* SDL_BYTEORDER == SDL_LIL_ENDIAN */
-#endif /* __EMSCRIPTEN__ */
-
-                    blit_blend_premultiplied(&info);
-                    break;
-                }
-                default: {
-                    SDL_SetError("Invalid argument passed to blit.");
-                    okay = 0;
-                    break;
-                }
-            }
+            okay = pg_blit_maybe_threaded(&info, src, dst, blend_flags);
         }
     }
 
@@ -21,6 +21,7 @@
  */
 
 #include "include/bitmask.h"
+#include <math.h>
 #include <stddef.h>
 #include <stdlib.h>
 #include <string.h>
@@ -1078,6 +1079,370 @@ bitmask_erase(bitmask_t *a, const bitmask_t *b, int xoffset, int yoffset)
     }
 }
 
+/* Sets (value nonzero) or clears the bits x1 <= x < x2 of row y, a word at a
+ * time. The span is clipped to the mask. */
+static INLINE void
+fill_span(bitmask_t *m, int x1, int x2, int y, int value)
+{
+    BITMASK_W *entry, word;
+    int end_word;
+
+    x1 = MAX(x1, 0);
+    x2 = MIN(x2, m->w);
+    if (x1 >= x2 || y < 0 || y >= m->h) {
+        return;
+    }
+
+    entry = m->bits + x1 / BITMASK_W_LEN * m->h + y;
+    end_word = (x2 - 1) / BITMASK_W_LEN - x1 / BITMASK_W_LEN;
+
+    /* bits from x1 to the end of its word, or up to x2 if in the same word */
+    word = (~(BITMASK_W)0) << (x1 & BITMASK_W_MASK);
+    for (; end_word > 0; --end_word) {
+        if (value) {
+            *entry |= word;
+        }
+        else {
+            *entry &= ~word;
+        }
+        entry += m->h;
+        word = ~(BITMASK_W)0;
+    }
+    word &= (~(BITMASK_W)0) >> (BITMASK_W_MASK - ((x2 - 1) & BITMASK_W_MASK));
+    if (value) {
+        *entry |= word;
+    }
+    else {
+        *entry &= ~word;
+    }
+}
+
+void
+bitmask_fill_rect(bitmask_t *m, int x, int y, int w, int h, int value)
+{
+    /* 64 bits so x + w and y + h can't overflow */
+    int x2 = (int)MIN((long long)x + w, (long long)m->w);
+    int y2 = (int)MIN((long long)y + h, (long long)m->h);
+
+    for (y = MAX(y, 0); y < y2; ++y) {
+        fill_span(m, x, x2, y, value);
+    }
+}
+
+/* Converts a rounded coordinate to an int, limited to -1 to limit + 1 so it
+ * can't overflow. NaN becomes -1. */
+static INLINE int
+to_coord(double v, int limit)
+{
+    if (!(v >= -1.0)) {
+        return -1;
+    }
+    return v > limit + 1.0 ? limit + 1 : (int)v;
+}
+
+void
+bitmask_fill_circle(bitmask_t *m, double cx, double cy, double radius,
+                    int value)
+{
+    int y, y2;
+    double dy, half;
+
+    if (!(radius >= 0)) {
+        return;
+    }
+
+    /* rows whose center, at y + 0.5, is within radius of cy */
+    y = MAX(to_coord(ceil(cy - radius - 0.5), m->h), 0);
+    y2 = MIN(to_coord(floor(cy + radius - 0.5), m->h) + 1, m->h);
+
+    for (; y < y2; ++y) {
+        dy = y + 0.5 - cy;
+        half = radius * radius - dy * dy;
+        if (half < 0) {
+            continue;
+        }
+        half = sqrt(half);
+        fill_span(m, to_coord(ceil(cx - half - 0.5), m->w),
+                  to_coord(floor(cx + half - 0.5), m->w) + 1, y, value);
+    }
+}
+
+int
+bitmask_fill_polygon(bitmask_t *m, const double *points, int n, int value)
+{
+    double *crossings, ymin, ymax, yc, x0, y0, x1, y1, tmp;
+    int i, j, k, count, y, y2;
+
+    if (n < 3) {
+        return 0;
+    }
+
+    crossings = malloc(n * sizeof(double));
+    if (!crossings) {
+        return -1;
+    }
+
+    ymin = ymax = points[1];
+    for (i = 1; i < n; ++i) {
+        ymin = MIN(ymin, points[2 * i + 1]);
+        ymax = MAX(ymax, points[2 * i + 1]);
+    }
+
+    /* rows whose center, at y + 0.5, is in [ymin, ymax) */
+    y = MAX(to_coord(ceil(ymin - 0.5), m->h), 0);
+    y2 = MIN(to_coord(ceil(ymax - 0.5), m->h), m->h);
+
+    for (; y < y2; ++y) {
+        yc = y + 0.5;
+        count = 0;
+        for (i = 0, j = n - 1; i < n; j = i++) {
+            x0 = points[2 * j];
+            y0 = points[2 * j + 1];
+            x1 = points[2 * i];
+            y1 = points[2 * i + 1];
+            if ((y0 <= yc) == (y1 <= yc)) {
+                continue;
+            }
+            tmp = x0 + (yc - y0) * (x1 - x0) / (y1 - y0);
+            /* insertion sort, polygons rarely cross a row many times */
+            for (k = count++; k > 0 && crossings[k - 1] > tmp; --k) {
+                crossings[k] = crossings[k - 1];
+            }
+            crossings[k] = tmp;
+        }
+        /* even-odd rule, pixels whose center is in [left, right) */
+        for (k = 0; k + 1 < count; k += 2) {
+            fill_span(m, to_coord(ceil(crossings[k] - 0.5), m->w),
+                      to_coord(ceil(crossings[k + 1] - 0.5), m->w), y, value);
+        }
+    }
+
+    free(crossings);
+    return 0;
+}
+
+/* Sets each bit of dst to whether the BITMASK_INDEX_BLOCK sized block of
+ * src at the same position has set bits, for the blocks touching the
+ * rectangle of src from (x, y) to (x + w - 1, y + h - 1), which must be
+ * inside of src. */
+static void
+index_level_update(const bitmask_t *src, bitmask_t *dst, int x, int y, int w,
+                   int h)
+{
+    /* BITMASK_W_LEN is a multiple of the block size, so each stripe of src
+     * holds whole blocks */
+    const int stripe_blocks = BITMASK_W_LEN / BITMASK_INDEX_BLOCK;
+    const BITMASK_W block_mask = (BITMASK_N(BITMASK_INDEX_BLOCK) - 1);
+    const int bx0 = x / BITMASK_INDEX_BLOCK;
+    const int bx1 = (x + w - 1) / BITMASK_INDEX_BLOCK;
+    const int by1 = (y + h - 1) / BITMASK_INDEX_BLOCK;
+    const BITMASK_W *entry, *end;
+    BITMASK_W acc;
+    int bx, by, stripe;
+
+    for (by = y / BITMASK_INDEX_BLOCK; by <= by1; ++by) {
+        for (stripe = bx0 / stripe_blocks; stripe <= bx1 / stripe_blocks;
+             ++stripe) {
+            /* OR the rows of the blocks together */
+            acc = 0;
+            entry = src->bits + stripe * src->h + by * BITMASK_INDEX_BLOCK;
+            end = src->bits + stripe * src->h +
+                  MIN((by + 1) * BITMASK_INDEX_BLOCK, src->h);
+            for (; entry < end; ++entry) {
+                acc |= *entry;
+            }
+
+            bx = MAX(bx0, stripe * stripe_blocks);
+            for (; bx <= bx1 && bx < (stripe + 1) * stripe_blocks; ++bx) {
+                if ((acc >> (bx * BITMASK_INDEX_BLOCK & BITMASK_W_MASK)) &
+                    block_mask) {
+                    bitmask_setbit(dst, bx, by);
+                }
+                else {
+                    bitmask_clearbit(dst, bx, by);
+                }
+            }
+        }
+    }
+}
+
+bitmask_index_t *
+bitmask_index_create(const bitmask_t *m)
+{
+    bitmask_index_t *index = malloc(sizeof(bitmask_index_t));
+
+    if (!index) {
+        return NULL;
+    }
+
+    index->level1 =
+        bitmask_create((m->w + BITMASK_INDEX_BLOCK - 1) / BITMASK_INDEX_BLOCK,
+                       (m->h + BITMASK_INDEX_BLOCK - 1) / BITMASK_INDEX_BLOCK);
+    index->level2 =
+        index->level1
+            ? bitmask_create((index->level1->w + BITMASK_INDEX_BLOCK - 1) /
+                                 BITMASK_INDEX_BLOCK,
+                             (index->level1->h + BITMASK_INDEX_BLOCK - 1) /
+                                 BITMASK_INDEX_BLOCK)
+            : NULL;
+
+    if (!index->level2) {
+        bitmask_index_free(index);
+        return NULL;
+    }
+
+    bitmask_index_update(index, m, 0, 0, m->w, m->h);
+    return index;
+}
+
+void
+bitmask_index_free(bitmask_index_t *index)
+{
+    if (index->level1) {
+        bitmask_free(index->level1);
+    }
+    if (index->level2) {
+        bitmask_free(index->level2);
+    }
+    free(index);
+}
+
+void
+bitmask_index_update(bitmask_index_t *index, const bitmask_t *m, int x, int y,
+                     int w, int h)
+{
+    /* 64 bits so x + w and y + h can't overflow */
+    int x2 = (int)MIN((long long)x + w, (long long)m->w);
+    int y2 = (int)MIN((long long)y + h, (long long)m->h);
+
+    x = MAX(x, 0);
+    y = MAX(y, 0);
+    if (x >= x2 || y >= y2) {
+        return;
+    }
+
+    index_level_update(m, index->level1, x, y, x2 - x, y2 - y);
+
+    x /= BITMASK_INDEX_BLOCK;
+    y /= BITMASK_INDEX_BLOCK;
+    x2 = (x2 - 1) / BITMASK_INDEX_BLOCK + 1;
+    y2 = (y2 - 1) / BITMASK_INDEX_BLOCK + 1;
+    index_level_update(index->level1, index->level2, x, y, x2 - x, y2 - y);
+}
+
+/* Returns the bits of row y of m from x to x + BITMASK_W_LEN - 1, with
+ * zeros for the ones outside of m. x can be negative. */
+static INLINE BITMASK_W
+get_row_bits(const bitmask_t *m, int x, int y)
+{
+    const int stripes = (m->w - 1) / BITMASK_W_LEN + 1;
+    const int stripe = x >= 0 ? x / BITMASK_W_LEN
+                              : -((BITMASK_W_LEN - 1 - x) / BITMASK_W_LEN);
+    const int shift = x - stripe * BITMASK_W_LEN;
+    BITMASK_W bits = 0;
+
+    if (stripe >= 0 && stripe < stripes) {
+        bits = m->bits[stripe * m->h + y] >> shift;
+    }
+    if (shift && stripe + 1 >= 0 && stripe + 1 < stripes) {
+        bits |= m->bits[(stripe + 1) * m->h + y] << (BITMASK_W_LEN - shift);
+    }
+    return bits;
+}
+
+/* Walks the overlapping area of a and b, skipping the blocks of a that the
+ * index marks as empty. If x is NULL, the overlapping bits are counted,
+ * otherwise the walk stops at the first one, storing its position. */
+static int
+overlap_indexed(const bitmask_t *a, const bitmask_index_t *index,
+                const bitmask_t *b, int xoffset, int yoffset, int *x, int *y)
+{
+    const int big_block = BITMASK_INDEX_BLOCK * BITMASK_INDEX_BLOCK;
+    const bitmask_t *level1 = index->level1;
+    int x0, x1, y0, y1, stripe, sx0, sx1, bx0, nblocks, by, by_end, row,
+        row_end;
+    BITMASK_W lmask, bits;
+    int count = 0;
+
+    /* Return if no overlap or one mask has a width/height of 0. */
+    if ((xoffset >= a->w) || (yoffset >= a->h) || (yoffset <= -b->h) ||
+        (xoffset <= -b->w) || (!a->h) || (!a->w) || (!b->h) || (!b->w)) {
+        return 0;
+    }
+
+    x0 = MAX(xoffset, 0);
+    x1 = MIN(xoffset + b->w, a->w);
+    y0 = MAX(yoffset, 0);
+    y1 = MIN(yoffset + b->h, a->h);
+
+    for (stripe = x0 / BITMASK_W_LEN; stripe <= (x1 - 1) / BITMASK_W_LEN;
+         ++stripe) {
+        sx0 = MAX(stripe * BITMASK_W_LEN, x0);
+        sx1 = MIN((stripe + 1) * BITMASK_W_LEN, x1);
+        lmask = ((~(BITMASK_W)0) << (sx0 & BITMASK_W_MASK)) &
+                ((~(BITMASK_W)0) >>
+                 (BITMASK_W_MASK - ((sx1 - 1) & BITMASK_W_MASK)));
+        /* the level1 bits of the stripe's blocks, all in one level1 word */
+        bx0 = sx0 / BITMASK_INDEX_BLOCK;
+        nblocks = (sx1 - 1) / BITMASK_INDEX_BLOCK - bx0 + 1;
+
+        for (by = y0; by < y1; by = by_end) {
+            /* a stripe is never wider than a level2 block */
+            by_end = MIN((by / big_block + 1) * big_block, y1);
+            if (!bitmask_getbit(index->level2, sx0 / big_block,
+                                by / big_block)) {
+                continue;
+            }
+
+            for (row = by; row < by_end; row = row_end) {
+                row_end =
+                    MIN((row / BITMASK_INDEX_BLOCK + 1) * BITMASK_INDEX_BLOCK,
+                        by_end);
+                bits = level1->bits[bx0 / BITMASK_W_LEN * level1->h +
+                                    row / BITMASK_INDEX_BLOCK] >>
+                       (bx0 & BITMASK_W_MASK);
+                if (!(bits & ((~(BITMASK_W)0) >> (BITMASK_W_LEN - nblocks)))) {
+                    continue;
+                }
+
+                for (; row < row_end; ++row) {
+                    bits = a->bits[stripe * a->h + row] & lmask;
+                    if (!bits) {
+                        continue;
+                    }
+                    bits &= get_row_bits(b, stripe * BITMASK_W_LEN - xoffset,
+                                         row - yoffset);
+                    if (!bits) {
+                        continue;
+                    }
+                    if (x) {
+                        *x = stripe * BITMASK_W_LEN + firstsetbit(bits);
+                        *y = row;
+                        return 1;
+                    }
+                    count += bitcount(bits);
+                }
+            }
+        }
+    }
+    return count;
+}
+
+int
+bitmask_overlap_pos_indexed(const bitmask_t *a, const bitmask_index_t *index,
+                            const bitmask_t *b, int xoffset, int yoffset,
+                            int *x, int *y)
+{
+    return overlap_indexed(a, index, b, xoffset, yoffset, x, y);
+}
+
+int
+bitmask_overlap_area_indexed(const bitmask_t *a, const bitmask_index_t *index,
+                             const bitmask_t *b, int xoffset, int yoffset)
+{
+    return overlap_indexed(a, index, b, xoffset, yoffset, NULL, NULL);
+}
+
 bitmask_t *
 bitmask_scale(const bitmask_t *m, int w, int h)
 {
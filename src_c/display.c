@@ -60,6 +60,14 @@ typedef struct _display_state_s {
     int fullscreen_backup_y;
     SDL_bool auto_resize;
     SDL_bool unscaled_render;
+    SDL_bool merge_updates; /* merge the rects given to update() */
+    float merge_flip_threshold;
+    /* counters of what update() and flip() pushed to the screen */
+    unsigned long long stat_calls;
+    unsigned long long stat_rects_requested;
+    unsigned long long stat_rects_pushed;
+    unsigned long long stat_pixels_pushed;
+    unsigned long long stat_full_updates;
 } _DisplayState;
 
 static int
@@ -2202,6 +2210,13 @@ pg_flip_internal(_DisplayState *state)
         return -1;
     }
 
+    if (!state->using_gl && pg_GetDefaultWindowSurface()) {
+        SDL_Surface *surf = pgSurface_AsSurface(pg_GetDefaultWindowSurface());
+        state->stat_calls++;
+        state->stat_rects_pushed++;
+        state->stat_pixels_pushed += (unsigned long long)surf->w * surf->h;
+        state->stat_full_updates++;
+    }
     return 0;
 }
 
@@ -2247,6 +2262,75 @@ pg_screencroprect(SDL_Rect *r, int w, int h, SDL_Rect *cur)
     return cur;
 }
 
+static int
+pg_update_rect_compare(const void *a, const void *b)
+{
+    const SDL_Rect *ra = (const SDL_Rect *)a;
+    const SDL_Rect *rb = (const SDL_Rect *)b;
+
+    if (ra->x != rb->x) {
+        return ra->x < rb->x ? -1 : 1;
+    }
+    return (ra->y > rb->y) - (ra->y < rb->y);
+}
+
+/* Merges two rects that overlap or touch when the area of their union is no
+ * bigger than the sum of their areas. Rects that overlap but fail that test
+ * are kept apart, so the pixels they share are still pushed twice. Returns
+ * the new count.
+ *
+ * The rects are sorted by their left edge and swept from left to right, so
+ * each rect is only compared with the ones starting before its right edge.
+ * A merged rect keeps the left edge of the first one, so the order stays
+ * sorted, and passes repeat until nothing merges as a grown rect may now
+ * reach rects to its left. */
+static int
+pg_merge_update_rects(SDL_Rect *rects, int count)
+{
+    int i, j, k, merged, x, y, right, bottom;
+    long long union_area;
+
+    do {
+        merged = 0;
+        qsort(rects, count, sizeof(SDL_Rect), pg_update_rect_compare);
+        for (i = 0; i < count; i++) {
+            if (rects[i].w < 0) {
+                continue; /* merged into another rect */
+            }
+            for (j = i + 1; j < count && rects[j].x <= rects[i].x + rects[i].w;
+                 j++) {
+                if (rects[j].w < 0 || rects[j].y > rects[i].y + rects[i].h ||
+                    rects[i].y > rects[j].y + rects[j].h) {
+                    continue;
+                }
+                y = MIN(rects[i].y, rects[j].y);
+                right = MAX(rects[i].x + rects[i].w, rects[j].x + rects[j].w);
+                bottom = MAX(rects[i].y + rects[i].h, rects[j].y + rects[j].h);
+                x = rects[i].x;
+                union_area = (long long)(right - x) * (bottom - y);
+                if (union_area > (long long)rects[i].w * rects[i].h +
+                                     (long long)rects[j].w * rects[j].h) {
+                    continue;
+                }
+                rects[i].y = y;
+                rects[i].w = right - x;
+                rects[i].h = bottom - y;
+                rects[j].w = -1;
+                /* the grown rect may reach rects already checked */
+                j = i;
+                merged = 1;
+            }
+        }
+        for (i = k = 0; i < count; i++) {
+            if (rects[i].w >= 0) {
+                rects[k++] = rects[i];
+            }
+        }
+        count = k;
+    } while (merged);
+    return count;
+}
+
 static PyObject *
 pg_update(PyObject *self, PyObject *arg)
 {
@@ -2287,6 +2371,10 @@ pg_update(PyObject *self, PyObject *arg)
 
         if (pg_screencroprect(gr, wide, high, &sdlr)) {
             SDL_UpdateWindowSurfaceRects(win, &sdlr, 1);
+            state->stat_calls++;
+            state->stat_rects_requested++;
+            state->stat_rects_pushed++;
+            state->stat_pixels_pushed += (unsigned long long)sdlr.w * sdlr.h;
         }
     }
     else {
@@ -2371,18 +2459,102 @@ pg_update(PyObject *self, PyObject *arg)
             ++count;
         }
 
+        Py_DECREF(iterable);
+
         if (count) {
+            unsigned long long pixels = 0;
+            int i, requested = count;
+
+            if (state->merge_updates) {
+                count = pg_merge_update_rects(rects, count);
+            }
+            for (i = 0; i < count; i++) {
+                pixels += (unsigned long long)rects[i].w * rects[i].h;
+            }
+
+            if (state->merge_updates &&
+                pixels > state->merge_flip_threshold * wide * high) {
+                /* one full update is cheaper than many big rects */
+                PyMem_Free((void *)rects);
+                state->stat_rects_requested += requested;
+                if (pg_flip_internal(state) < 0) {
+                    return NULL;
+                }
+                Py_RETURN_NONE;
+            }
+
             Py_BEGIN_ALLOW_THREADS;
             SDL_UpdateWindowSurfaceRects(win, rects, count);
             Py_END_ALLOW_THREADS;
+
+            state->stat_calls++;
+            state->stat_rects_requested += requested;
+            state->stat_rects_pushed += count;
+            state->stat_pixels_pushed += pixels;
         }
 
-        Py_DECREF(iterable);
         PyMem_Free((void *)rects);
     }
     Py_RETURN_NONE;
 }
 
+static PyObject *
+pg_set_update_merging(PyObject *self, PyObject *args, PyObject *kwargs)
+{
+    _DisplayState *state = DISPLAY_MOD_STATE(self);
+    int enabled;
+    float flip_threshold = 0.75f;
+    static char *keywords[] = {"enabled", "flip_threshold", NULL};
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "p|f", keywords, &enabled,
+                                     &flip_threshold)) {
+        return NULL;
+    }
+    if (!(flip_threshold >= 0)) {
+        return RAISE(PyExc_ValueError, "flip_threshold must not be negative");
+    }
+    state->merge_updates = enabled ? SDL_TRUE : SDL_FALSE;
+    state->merge_flip_threshold = flip_threshold;
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+pg_get_update_merging(PyObject *self, PyObject *_null)
+{
+    _DisplayState *state = DISPLAY_MOD_STATE(self);
+
+    if (!state->merge_updates) {
+        Py_RETURN_NONE;
+    }
+    return PyFloat_FromDouble(state->merge_flip_threshold);
+}
+
+static PyObject *
+pg_get_update_stats(PyObject *self, PyObject *args, PyObject *kwargs)
+{
+    _DisplayState *state = DISPLAY_MOD_STATE(self);
+    PyObject *stats;
+    int reset = 0;
+    static char *keywords[] = {"reset", NULL};
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "|p", keywords, &reset)) {
+        return NULL;
+    }
+    stats = Py_BuildValue("{sKsKsKsKsK}", "calls", state->stat_calls,
+                          "rects_requested", state->stat_rects_requested,
+                          "rects_pushed", state->stat_rects_pushed,
+                          "pixels_pushed", state->stat_pixels_pushed,
+                          "full_updates", state->stat_full_updates);
+    if (stats && reset) {
+        state->stat_calls = 0;
+        state->stat_rects_requested = 0;
+        state->stat_rects_pushed = 0;
+        state->stat_pixels_pushed = 0;
+        state->stat_full_updates = 0;
+    }
+    return stats;
+}
+
 static PyObject *
 pg_set_palette(PyObject *self, PyObject *args)
 {
@@ -3807,6 +3979,12 @@ static PyMethodDef _pg_display_methods[] = {
 
     {"flip", (PyCFunction)pg_flip, METH_NOARGS, DOC_DISPLAY_FLIP},
     {"update", (PyCFunction)pg_update, METH_VARARGS, DOC_DISPLAY_UPDATE},
+    {"set_update_merging", (PyCFunction)pg_set_update_merging,
+     METH_VARARGS | METH_KEYWORDS, DOC_DISPLAY_SETUPDATEMERGING},
+    {"get_update_merging", (PyCFunction)pg_get_update_merging, METH_NOARGS,
+     DOC_DISPLAY_GETUPDATEMERGING},
+    {"get_update_stats", (PyCFunction)pg_get_update_stats,
+     METH_VARARGS | METH_KEYWORDS, DOC_DISPLAY_GETUPDATESTATS},
 
     {"set_palette", pg_set_palette, METH_VARARGS, DOC_DISPLAY_SETPALETTE},
     {"set_gamma", pg_set_gamma, METH_VARARGS, DOC_DISPLAY_SETGAMMA},
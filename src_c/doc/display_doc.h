@@ -7,6 +7,9 @@
 #define DOC_DISPLAY_GETSURFACE "get_surface() -> Surface | None\nGet a reference to the currently set display surface."
 #define DOC_DISPLAY_FLIP "flip() -> None\nUpdate the full display Surface to the screen."
 #define DOC_DISPLAY_UPDATE "update() -> None\nupdate(rectangle, /) -> None\nupdate(rectangles, /) -> None\nupdate(x, y, w, h, /) -> None\nupdate(xy, wh, /) -> None\nUpdate all, or a portion, of the display. For non-OpenGL displays."
+#define DOC_DISPLAY_SETUPDATEMERGING "set_update_merging(enabled, flip_threshold=0.75) -> None\nMerge the rectangles passed to update() before pushing them."
+#define DOC_DISPLAY_GETUPDATEMERGING "get_update_merging() -> float | None\nGet the rectangle merging threshold of update()."
+#define DOC_DISPLAY_GETUPDATESTATS "get_update_stats(reset=False) -> dict[str, int]\nGet counters of the screen updates done so far."
 #define DOC_DISPLAY_GETDRIVER "get_driver() -> str\nGet the name of the pygame display backend."
 #define DOC_DISPLAY_INFO "Info() -> _VidInfo\nCreate a video display information object."
 #define DOC_DISPLAY_GETWMINFO "get_wm_info() -> dict[str, int]\nGet information about the current windowing system."
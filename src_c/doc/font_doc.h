@@ -38,3 +38,6 @@
 #define DOC_FONT_FONT_GETDESCENT "get_descent() -> int\nGet the descent of the font."
 #define DOC_FONT_FONT_SETSCRIPT "set_script(script_code, /) -> None\nSet the script code for text shaping."
 #define DOC_FONT_FONT_SETDIRECTION "set_direction(direction) -> None\nSet the script direction for text shaping."
+#define DOC_FONT_FONT_SETRENDERCACHE "set_render_cache(max_bytes, /) -> None\nCache the surfaces returned by render."
+#define DOC_FONT_FONT_CLEARRENDERCACHE "clear_render_cache() -> None\nEmpty the render cache."
+#define DOC_FONT_FONT_GETRENDERCACHESTATS "get_render_cache_stats(reset=False) -> dict[str, int]\nGet statistics about the render cache."
@@ -18,6 +18,7 @@
 #define DOC_FREETYPE_FONT_SIZE "size -> float\nsize -> (float, float)\nThe default point size used in rendering"
 #define DOC_FREETYPE_FONT_GETRECT "get_rect(text, style=STYLE_DEFAULT, rotation=0, size=0) -> rect\nReturn the size and offset of rendered text"
 #define DOC_FREETYPE_FONT_GETMETRICS "get_metrics(text, size=0) -> [(...), ...]\nReturn the glyph metrics for the given text"
+#define DOC_FREETYPE_FONT_GETGLYPHLAYOUT "get_glyph_layout(text, style=STYLE_DEFAULT, rotation=0, size=0) -> (rect, [(...), ...])\nReturn where each glyph of the given text is drawn"
 #define DOC_FREETYPE_FONT_HEIGHT "height -> int\nThe unscaled height of the font in font units"
 #define DOC_FREETYPE_FONT_ASCENDER "ascender -> int\nThe unscaled ascent of the font in font units"
 #define DOC_FREETYPE_FONT_DESCENDER "descender -> int\nThe unscaled descent of the font in font units"
@@ -26,6 +27,9 @@
 #define DOC_FREETYPE_FONT_GETSIZEDHEIGHT "get_sized_height(size=0, /) -> int\nThe scaled height of the font in pixels"
 #define DOC_FREETYPE_FONT_GETSIZEDGLYPHHEIGHT "get_sized_glyph_height(size=0, /) -> int\nThe scaled bounding box height of the font in pixels"
 #define DOC_FREETYPE_FONT_GETSIZES "get_sizes() -> [(int, int, int, float, float), ...]\nget_sizes() -> []\nreturn the available sizes of embedded bitmaps"
+#define DOC_FREETYPE_FONT_GETCACHESTATS "get_cache_stats(reset=False) -> dict\nReturn statistics of the glyph cache of this font"
+#define DOC_FREETYPE_FONT_SETCACHESIZE "set_cache_size(size) -> None\nResize the glyph cache of this font"
+#define DOC_FREETYPE_FONT_PRELOADGLYPHS "preload_glyphs(text, style=STYLE_DEFAULT, rotation=0, size=0) -> int\nLoad the glyphs of the given text into the glyph cache"
 #define DOC_FREETYPE_FONT_RENDER "render(text, fgcolor=None, bgcolor=None, style=STYLE_DEFAULT, rotation=0, size=0) -> (Surface, Rect)\nReturn rendered text as a surface"
 #define DOC_FREETYPE_FONT_RENDERTO "render_to(surf, dest, text, fgcolor=None, bgcolor=None, style=STYLE_DEFAULT, rotation=0, size=0) -> Rect\nRender text onto an existing surface"
 #define DOC_FREETYPE_FONT_RENDERRAW "render_raw(text, style=STYLE_DEFAULT, rotation=0, size=0, invert=False) -> (bytes, (int, int))\nReturn rendered text as a string of bytes"
@@ -51,3 +55,23 @@
 #define DOC_FREETYPE_FONT_PAD "pad -> bool\npadded boundary mode"
 #define DOC_FREETYPE_FONT_UCS4 "ucs4 -> bool\nEnable UCS-4 mode"
 #define DOC_FREETYPE_FONT_RESOLUTION "resolution -> int\nPixel resolution in dots per inch"
+#define DOC_FREETYPE_GLYPHATLAS "GlyphAtlas(font, size=0, style=STYLE_DEFAULT, rotation=0, atlas_size=(512, 512), padding=1) -> GlyphAtlas\nRender text from glyphs kept on a shared atlas Surface"
+#define DOC_FREETYPE_GLYPHATLAS_RENDER "render(text, fgcolor=None, bgcolor=None) -> (Surface, Rect)\nReturn rendered text as a Surface"
+#define DOC_FREETYPE_GLYPHATLAS_RENDERTO "render_to(surf, dest, text, fgcolor=None, bgcolor=None) -> Rect\nRender text onto a Surface"
+#define DOC_FREETYPE_GLYPHATLAS_CLEAR "clear() -> None\nEvict every glyph from the atlas"
+#define DOC_FREETYPE_GLYPHATLAS_GETSTATS "get_stats() -> dict\nReturn atlas usage statistics"
+#define DOC_FREETYPE_GLYPHATLAS_OCCUPANCY "occupancy -> float\nFraction of the atlas covered by glyphs"
+#define DOC_FREETYPE_GLYPHATLAS_SURFACE "surface -> Surface\nThe atlas Surface holding the glyphs"
+#define DOC_FREETYPE_TEXTLAYOUT "TextLayout(font, width, text="", size=0) -> TextLayout\nWord wrapped multi-line text that can be edited incrementally"
+#define DOC_FREETYPE_TEXTLAYOUT_TEXT "text -> str\nThe whole text"
+#define DOC_FREETYPE_TEXTLAYOUT_WIDTH "width -> int\nThe width lines are wrapped to"
+#define DOC_FREETYPE_TEXTLAYOUT_LINEHEIGHT "line_height -> int\nThe distance in pixels between consecutive lines"
+#define DOC_FREETYPE_TEXTLAYOUT_LINECOUNT "line_count -> int\nThe number of lines after wrapping"
+#define DOC_FREETYPE_TEXTLAYOUT_HEIGHT "height -> int\nThe height in pixels of all the lines"
+#define DOC_FREETYPE_TEXTLAYOUT_GETLINE "get_line(line) -> str\nReturn the text of a line"
+#define DOC_FREETYPE_TEXTLAYOUT_APPEND "append(text) -> None\nAdd text at the end"
+#define DOC_FREETYPE_TEXTLAYOUT_INSERT "insert(index, text) -> None\nInsert text before a character"
+#define DOC_FREETYPE_TEXTLAYOUT_DELETE "delete(start, end) -> None\nRemove a range of characters"
+#define DOC_FREETYPE_TEXTLAYOUT_GETPOSITION "get_position(index) -> (x, y)\nReturn the position of a character"
+#define DOC_FREETYPE_TEXTLAYOUT_INDEXAT "index_at(pos) -> int\nReturn the character boundary nearest to a position"
+#define DOC_FREETYPE_TEXTLAYOUT_RENDERTO "render_to(surf, dest, area=None, fgcolor=None, bgcolor=None) -> Rect\nDraw the visible lines onto a Surface"
@@ -10,6 +10,7 @@
 #define DOC_MASK_MASK_SETAT "set_at(pos, value=1) -> None\nSets the bit at the given position."
 #define DOC_MASK_MASK_OVERLAP "overlap(other, offset) -> tuple[int, int] | None\nReturns the point of intersection."
 #define DOC_MASK_MASK_OVERLAPAREA "overlap_area(other, offset) -> int\nReturns the number of overlapping set bits."
+#define DOC_MASK_MASK_OVERLAPMANY "overlap_many(masks) -> list[int]\nReturns the indices of the masks that overlap this one."
 #define DOC_MASK_MASK_OVERLAPMASK "overlap_mask(other, offset) -> Mask\nReturns a mask of the overlapping set bits."
 #define DOC_MASK_MASK_FILL "fill() -> None\nSets all bits to 1."
 #define DOC_MASK_MASK_CLEAR "clear() -> None\nSets all bits to 0."
@@ -17,6 +18,12 @@
 #define DOC_MASK_MASK_SCALE "scale(scale) -> Mask\nResizes a mask."
 #define DOC_MASK_MASK_DRAW "draw(other, offset) -> None\nDraws a mask onto another."
 #define DOC_MASK_MASK_ERASE "erase(other, offset) -> None\nErases a mask from another."
+#define DOC_MASK_MASK_FILLRECT "fill_rect(rect, value=1) -> None\nSets or clears the bits of a rectangle."
+#define DOC_MASK_MASK_FILLCIRCLE "fill_circle(center, radius, value=1) -> None\nSets or clears the bits of a circle."
+#define DOC_MASK_MASK_FILLPOLYGON "fill_polygon(points, value=1) -> None\nSets or clears the bits of a polygon."
+#define DOC_MASK_MASK_UPDATEFROMSURFACE "update_from_surface(surface, rect=None, threshold=127) -> None\nUpdates an area of the mask from a surface."
+#define DOC_MASK_MASK_SETOVERLAPINDEX "set_overlap_index(enabled=True) -> None\nEnables or disables the overlap index."
+#define DOC_MASK_MASK_GETOVERLAPINDEX "get_overlap_index() -> bool\nReturns whether the overlap index is enabled."
 #define DOC_MASK_MASK_COUNT "count() -> int\nReturns the number of set bits."
 #define DOC_MASK_MASK_CENTROID "centroid() -> tuple[int, int]\nReturns the centroid of the set bits."
 #define DOC_MASK_MASK_ANGLE "angle() -> float\nReturns the orientation of the set bits."
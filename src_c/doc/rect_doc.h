@@ -28,3 +28,4 @@
 #define DOC_RECT_COLLIDEOBJECTSALL "collideobjectsall(rect_list) -> objects\ncollideobjectsall(obj_list, key=func) -> objects\ntest if all objects in a list intersect"
 #define DOC_RECT_COLLIDEDICT "collidedict(rect_dict) -> (key, value)\ncollidedict(rect_dict) -> None\ncollidedict(rect_dict, values=False) -> (key, value)\ncollidedict(rect_dict, values=False) -> None\ntest if one rectangle in a dictionary intersects"
 #define DOC_RECT_COLLIDEDICTALL "collidedictall(rect_dict) -> [(key, value), ...]\ncollidedictall(rect_dict, values=False) -> [(key, value), ...]\ntest if all rectangles in a dictionary intersect"
+#define DOC_RECT_COLLIDEPAIRS "collide_pairs(rects_a, rects_b, *, key=None) -> [(index_a, index_b), ...]\ncollide_pairs(rects_a, *, key=None) -> [(index_a, index_b), ...]\nfind all intersecting pairs between two lists of rectangles"
@@ -8,6 +8,10 @@
 #define DOC_SPRITE_SPRITE_ALIVE "alive() -> bool\ndoes the sprite belong to any groups"
 #define DOC_SPRITE_SPRITE_GROUPS "groups() -> group_list\nlist of Groups that contain this Sprite"
 #define DOC_SPRITE_DIRTYSPRITE "DirtySprite(*groups) -> DirtySprite\nA subclass of Sprite with more attributes and features."
+#define DOC_SPRITE_COMPACTSPRITE "CompactSprite(*groups) -> CompactSprite\nA Sprite without an instance dictionary, for very large groups."
+#define DOC_SPRITE_KINEMATICSPRITE "KinematicSprite(*groups) -> KinematicSprite\nA CompactSprite with a position and a velocity."
+#define DOC_SPRITE_KINEMATICSPRITE_POSITION "position -> (float, float)\nthe point the sprite rect is centered on"
+#define DOC_SPRITE_KINEMATICSPRITE_VELOCITY "velocity -> (float, float)\nthe distance the sprite moves per unit of time"
 #define DOC_SPRITE_GROUP "Group(*sprites) -> Group\nA container class to hold and manage multiple Sprite objects."
 #define DOC_SPRITE_GROUP_SPRITES "sprites() -> sprite_list\nlist of the Sprites this Group contains"
 #define DOC_SPRITE_GROUP_COPY "copy() -> Group\nduplicate the Group"
@@ -15,15 +19,26 @@
 #define DOC_SPRITE_GROUP_REMOVE "remove(*sprites) -> None\nremove Sprites from the Group"
 #define DOC_SPRITE_GROUP_HAS "has(*sprites) -> bool\ntest if a Group contains Sprites"
 #define DOC_SPRITE_GROUP_UPDATE "update(*args, **kwargs) -> None\ncall the update method on contained Sprites"
-#define DOC_SPRITE_GROUP_DRAW "draw(Surface, bgd=None, special_flags=0) -> list[Rect]\nblit the Sprite images"
+#define DOC_SPRITE_GROUP_DRAW "draw(Surface, bgd=None, special_flags=0, view=None) -> list[Rect]\nblit the Sprite images"
 #define DOC_SPRITE_GROUP_CLEAR "clear(Surface_dest, background) -> None\ndraw a background over the Sprites"
 #define DOC_SPRITE_GROUP_EMPTY "empty() -> None\nremove all Sprites"
+#define DOC_SPRITE_GROUP_GETSPRITESAT "get_sprites_at(pos) -> colliding_sprites\nreturns a list with all sprites at that position."
+#define DOC_SPRITE_GROUP_GETSPRITESIN "get_sprites_in(rect) -> colliding_sprites\nreturns a list with all sprites overlapping a rect."
+#define DOC_SPRITE_GROUP_SPATIALINDEX "spatial_index -> SpatialHash\nspatial_index -> None\noptional spatial index used by the collision functions"
+#define DOC_SPRITE_COMPACTGROUP "CompactGroup(*sprites) -> CompactGroup\nA container class for many CompactSprite objects."
+#define DOC_SPRITE_KINEMATICGROUP "KinematicGroup(*sprites) -> KinematicGroup\nA CompactGroup that moves all of its sprites at once."
+#define DOC_SPRITE_KINEMATICGROUP_POSITIONS "positions -> memoryview\nthe positions of all the sprites"
+#define DOC_SPRITE_KINEMATICGROUP_VELOCITIES "velocities -> memoryview\nthe velocities of all the sprites"
+#define DOC_SPRITE_KINEMATICGROUP_INTEGRATE "integrate(dt, bounds=None, wrap=False) -> None\nmove every sprite by its velocity"
+#define DOC_SPRITE_KINEMATICGROUP_SYNCRECTS "sync_rects() -> None\ncenter the sprite rects on the sprite positions"
 #define DOC_SPRITE_RENDERUPDATES "RenderUpdates(*sprites) -> RenderUpdates\nGroup sub-class that tracks dirty updates."
-#define DOC_SPRITE_RENDERUPDATES_DRAW "draw(surface, bgd=None, special_flags=0) -> Rect_list\nblit the Sprite images and track changed areas"
+#define DOC_SPRITE_RENDERUPDATES_DRAW "draw(surface, bgd=None, special_flags=0, view=None) -> Rect_list\nblit the Sprite images and track changed areas"
+#define DOC_SPRITE_SORTEDGROUP "SortedGroup(*sprites, key=None) -> SortedGroup\nGroup sub-class that draws its sprites sorted by a key."
+#define DOC_SPRITE_SORTEDGROUP_KEY "key -> callable\nthe function giving the sort key of a sprite"
 #define DOC_SPRITE_LAYEREDUPDATES "LayeredUpdates(*sprites, **kwargs) -> LayeredUpdates\nLayeredUpdates is a sprite group that handles layers and draws like RenderUpdates."
 #define DOC_SPRITE_LAYEREDUPDATES_ADD "add(*sprites, **kwargs) -> None\nadd a sprite or sequence of sprites to a group"
 #define DOC_SPRITE_LAYEREDUPDATES_SPRITES "sprites() -> sprites\nreturns an ordered list of sprites (first back, last top)."
-#define DOC_SPRITE_LAYEREDUPDATES_DRAW "draw(surface, bgd=None, special_flags=0) -> Rect_list\ndraw all sprites in the right order onto the passed surface."
+#define DOC_SPRITE_LAYEREDUPDATES_DRAW "draw(surface, bgd=None, special_flags=0, view=None) -> Rect_list\ndraw all sprites in the right order onto the passed surface."
 #define DOC_SPRITE_LAYEREDUPDATES_GETSPRITESAT "get_sprites_at(pos) -> colliding_sprites\nreturns a list with all sprites at that position."
 #define DOC_SPRITE_LAYEREDUPDATES_GETSPRITE "get_sprite(idx) -> sprite\nreturns the sprite at the index idx from the groups sprites"
 #define DOC_SPRITE_LAYEREDUPDATES_REMOVESPRITESOFLAYER "remove_sprites_of_layer(layer_nr) -> sprites\nremoves all sprites from a layer and returns them as a list."
@@ -46,6 +61,13 @@
 #define DOC_SPRITE_LAYEREDDIRTY_CHANGELAYER "change_layer(sprite, new_layer) -> None\nchanges the layer of the sprite"
 #define DOC_SPRITE_LAYEREDDIRTY_SETTIMINGTRESHOLD "set_timing_treshold(time_ms) -> None\nsets the threshold in milliseconds"
 #define DOC_SPRITE_LAYEREDDIRTY_SETTIMINGTHRESHOLD "set_timing_threshold(time_ms) -> None\nsets the threshold in milliseconds"
+#define DOC_SPRITE_SPATIALHASH "SpatialHash(cell_size=64) -> SpatialHash\nUniform grid index of sprite rects for fast collision queries."
+#define DOC_SPRITE_SPATIALHASH_CELLSIZE "cell_size -> int\nthe width and height of a grid cell"
+#define DOC_SPRITE_SPATIALHASH_ADD "add(sprite) -> None\nadd a Sprite to the index"
+#define DOC_SPRITE_SPATIALHASH_REMOVE "remove(sprite) -> None\nremove a Sprite from the index"
+#define DOC_SPRITE_SPATIALHASH_REFRESH "refresh(*sprites) -> None\nmove Sprites to the cells of their current rect"
+#define DOC_SPRITE_SPATIALHASH_CLEAR "clear() -> None\nremove all Sprites from the index"
+#define DOC_SPRITE_SPATIALHASH_QUERY "query(rect) -> Sprite_list\nfind the Sprites near an area"
 #define DOC_SPRITE_GROUPSINGLE "GroupSingle(sprite=None) -> GroupSingle\nGroup container that holds a single sprite."
 #define DOC_SPRITE_SPRITECOLLIDE "spritecollide(sprite, group, dokill, collided = None) -> Sprite_list\nFind sprites in a group that intersect another sprite."
 #define DOC_SPRITE_COLLIDERECT "collide_rect(left, right) -> bool\nCollision detection between two sprites, using rects."
@@ -53,5 +75,6 @@
 #define DOC_SPRITE_COLLIDECIRCLE "collide_circle(left, right) -> bool\nCollision detection between two sprites, using circles."
 #define DOC_SPRITE_COLLIDECIRCLERATIO "collide_circle_ratio(ratio) -> collided_callable\nCollision detection between two sprites, using circles scaled to a ratio."
 #define DOC_SPRITE_COLLIDEMASK "collide_mask(sprite1, sprite2) -> (int, int)\ncollide_mask(sprite1, sprite2) -> None\nCollision detection between two sprites, using masks."
+#define DOC_SPRITE_COLLIDEMASKINDICES "collide_mask_indices(sprite, sprites, fit_rects=False) -> list\nFind the sprites colliding with a sprite, using masks."
 #define DOC_SPRITE_GROUPCOLLIDE "groupcollide(group1, group2, dokill1, dokill2, collided = None) -> Sprite_dict\nFind all sprites that collide between two groups."
 #define DOC_SPRITE_SPRITECOLLIDEANY "spritecollideany(sprite, group, collided = None) -> Sprite\nspritecollideany(sprite, group, collided = None) -> None\nSimple test if a sprite intersects anything in a group."
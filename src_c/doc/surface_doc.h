@@ -56,3 +56,12 @@
 #define DOC_SURFACE_HEIGHT "height -> int\nSurface height in pixels (read-only)."
 #define DOC_SURFACE_SIZE "size -> tuple[int, int]\nSurface size in pixels (read-only)."
 #define DOC_SURFACE_PIXELSADDRESS "_pixels_address -> int\nPixel buffer address."
+#define DOC_SURFACE_BLITBATCH "BlitBatch(blit_sequence=()) -> BlitBatch\nPygame object for drawing the same Surfaces many times with fblits()."
+#define DOC_SURFACE_BLITBATCH_APPEND "append(source, dest, /) -> None\nAdd a (source, dest) pair to the end of the batch."
+#define DOC_SURFACE_BLITBATCH_CLEAR "clear() -> None\nRemove every pair from the batch."
+#define DOC_SURFACE_BLITBATCH_GETPOSITION "get_position(index, /) -> tuple[int, int]\nGet the position of a pair in the batch."
+#define DOC_SURFACE_BLITBATCH_SETPOSITION "set_position(index, dest, /) -> None\nSet the position of a pair in the batch."
+#define DOC_SURFACE_BLITBATCH_SETPOSITIONS "set_positions(positions, /) -> None\nSet the positions of every pair in the batch at once."
+#define DOC_SURFACE_BLITBATCH_MOVE "move(x, y, /) -> None\nmove(move_by, /) -> None\nShift the position of every pair in the batch."
+#define DOC_SURFACE_SETBLITTHREADS "set_blit_threads(count, /) -> None\nSet the number of threads used for large blits."
+#define DOC_SURFACE_GETBLITTHREADS "get_blit_threads() -> int\nGet the number of threads used for large blits."
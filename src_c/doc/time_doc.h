@@ -4,9 +4,15 @@
 #define DOC_TIME_WAIT "wait(milliseconds, /) -> int\nPause the program for an amount of time."
 #define DOC_TIME_DELAY "delay(milliseconds, /) -> int\nPause the program for an amount of time."
 #define DOC_TIME_SETTIMER "set_timer(event, millis, loops=0) -> None\nRepeatedly create an event on the event queue."
-#define DOC_TIME_CLOCK "Clock() -> Clock\nCreate an object to help track time."
+#define DOC_TIME_CLOCK "Clock(*, history=256) -> Clock\nCreate an object to help track time."
 #define DOC_TIME_CLOCK_TICK "tick(framerate=0, /) -> int\nUpdate the clock."
 #define DOC_TIME_CLOCK_TICKBUSYLOOP "tick_busy_loop(framerate=0, /) -> int\nUpdate the clock."
 #define DOC_TIME_CLOCK_GETTIME "get_time() -> int\nTime used in the previous tick."
 #define DOC_TIME_CLOCK_GETRAWTIME "get_rawtime() -> int\nActual time used in the previous tick."
 #define DOC_TIME_CLOCK_GETFPS "get_fps() -> float\nCompute the clock framerate."
+#define DOC_TIME_CLOCK_GETFRAMETIMEPERCENTILE "get_frame_time_percentile(percent, /) -> float\nGet a percentile of the recent frame times."
+#define DOC_TIME_CLOCK_GETMAXFRAMETIME "get_max_frame_time() -> float\nGet the longest of the recent frame times."
+#define DOC_TIME_CLOCK_GETFRAMETIMES "get_frame_times() -> list[float]\nGet the recent frame times."
+#define DOC_TIME_CLOCK_SECTION "section(name, /) -> contextlib.AbstractContextManager[None]\nTime a named part of the frame."
+#define DOC_TIME_CLOCK_GETSECTIONS "get_sections() -> dict[str, tuple[float, int, float]]\nGet the times spent in each section."
+#define DOC_TIME_CLOCK_RESETPROFILE "reset_profile() -> None\nClear the frame time history and section times."
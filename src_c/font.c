@@ -166,6 +166,85 @@ pg_font_get_init(PyObject *self, PyObject *_null)
 }
 
 /* font object methods */
+static Py_ssize_t
+_font_cached_surface_bytes(PyObject *surfobj)
+{
+    SDL_Surface *surf = pgSurface_AsSurface(surfobj);
+    return surf ? (Py_ssize_t)surf->pitch * surf->h : 0;
+}
+
+/* Drops every rendered text from the cache, for changes to the font that
+ * are not part of the cache key */
+static void
+_font_clear_render_cache(PyFontObject *self)
+{
+    if (self->render_cache) {
+        PyDict_Clear(self->render_cache);
+    }
+    self->cache_bytes = 0;
+}
+
+/* Evicts the least recently used surfaces until there is room for
+ * size bytes */
+static int
+_font_cache_make_room(PyFontObject *self, Py_ssize_t size)
+{
+    PyObject *key, *value;
+    Py_ssize_t pos;
+
+    while (self->cache_bytes + size > self->cache_max_bytes &&
+           PyDict_GET_SIZE(self->render_cache)) {
+        pos = 0;
+        PyDict_Next(self->render_cache, &pos, &key, &value);
+        self->cache_bytes -= _font_cached_surface_bytes(value);
+        Py_INCREF(key);
+        if (PyDict_DelItem(self->render_cache, key)) {
+            Py_DECREF(key);
+            return -1;
+        }
+        Py_DECREF(key);
+    }
+    return 0;
+}
+
+static PyObject *
+_font_cache_lookup(PyFontObject *self, PyObject *key)
+{
+    PyObject *surfobj = PyDict_GetItemWithError(self->render_cache, key);
+
+    if (!surfobj) {
+        if (!PyErr_Occurred()) {
+            self->cache_misses++;
+        }
+        return NULL;
+    }
+    self->cache_hits++;
+    /* move it to the most recently used end */
+    Py_INCREF(surfobj);
+    if (PyDict_DelItem(self->render_cache, key) ||
+        PyDict_SetItem(self->render_cache, key, surfobj)) {
+        Py_DECREF(surfobj);
+        return NULL;
+    }
+    return surfobj;
+}
+
+static int
+_font_cache_insert(PyFontObject *self, PyObject *key, PyObject *surfobj)
+{
+    Py_ssize_t size = _font_cached_surface_bytes(surfobj);
+
+    if (size > self->cache_max_bytes) {
+        return 0;
+    }
+    if (_font_cache_make_room(self, size) ||
+        PyDict_SetItem(self->render_cache, key, surfobj)) {
+        return -1;
+    }
+    self->cache_bytes += size;
+    return 0;
+}
+
 static PyObject *
 font_get_height(PyObject *self, PyObject *_null)
 {
@@ -249,6 +328,7 @@ font_set_linesize(PyObject *self, PyObject *arg)
     }
 
     TTF_SetFontLineSkip(font, linesize);
+    _font_clear_render_cache((PyFontObject *)self);
 
     Py_RETURN_NONE;
 #else
@@ -555,6 +635,7 @@ font_setter_align(PyObject *self, PyObject *value, void *closure)
 #else
     TTF_SetFontWrappedAlign(font, val);
 #endif
+    _font_clear_render_cache((PyFontObject *)self);
     return 0;
 #else
     PyErr_SetString(pgExc_SDLError,
@@ -603,7 +684,7 @@ font_render(PyObject *self, PyObject *args, PyObject *kwds)
 
     TTF_Font *font = PyFont_AsFont(self);
     int antialias;
-    PyObject *text, *final;
+    PyObject *text, *final, *cache_key = NULL;
     PyObject *fg_rgba_obj, *bg_rgba_obj = Py_None;
     Uint8 rgba[] = {0, 0, 0, 0};
     SDL_Surface *surf;
@@ -672,6 +753,24 @@ font_render(PyObject *self, PyObject *args, PyObject *kwds)
     /* if text is Py_None, leave astring as a null byte to represent 0
        length string */
 
+    if (((PyFontObject *)self)->render_cache) {
+        cache_key = Py_BuildValue(
+            "(OikLii)", text, antialias,
+            (unsigned long)foreg.r << 16 | foreg.g << 8 | foreg.b,
+            bg_rgba_obj == Py_None
+                ? -1LL
+                : (long long)(backg.r << 16 | backg.g << 8 | backg.b),
+            wraplength, TTF_GetFontStyle(font));
+        if (!cache_key) {
+            return NULL;
+        }
+        final = _font_cache_lookup((PyFontObject *)self, cache_key);
+        if (final || PyErr_Occurred()) {
+            Py_DECREF(cache_key);
+            return final;
+        }
+    }
+
     if (strlen(astring) == 0) { /* special 0 string case */
 #if SDL_TTF_VERSION_ATLEAST(3, 0, 0)
         int height = TTF_GetFontHeight(font);
@@ -728,6 +827,7 @@ font_render(PyObject *self, PyObject *args, PyObject *kwds)
     }
 
     if (surf == NULL) {
+        Py_XDECREF(cache_key);
         return RAISE(pgExc_SDLError, TTF_GetError());
     }
 
@@ -735,6 +835,11 @@ font_render(PyObject *self, PyObject *args, PyObject *kwds)
     if (final == NULL) {
         SDL_FreeSurface(surf);
     }
+    else if (cache_key &&
+             _font_cache_insert((PyFontObject *)self, cache_key, final)) {
+        Py_CLEAR(final);
+    }
+    Py_XDECREF(cache_key);
     return final;
 }
 
@@ -835,6 +940,7 @@ font_setter_point_size(PyFontObject *self, PyObject *value, void *closure)
         return -1;
     }
     self->ptsize = val;
+    _font_clear_render_cache(self);
 
     return 0;
 #else
@@ -889,6 +995,7 @@ font_set_ptsize(PyObject *self, PyObject *arg)
         return RAISE(pgExc_SDLError, SDL_GetError());
     }
     ((PyFontObject *)self)->ptsize = val;
+    _font_clear_render_cache((PyFontObject *)self);
 
     Py_RETURN_NONE;
 #else
@@ -935,6 +1042,7 @@ font_setter_outline(PyObject *self, PyObject *value, void *closure)
 #else
     TTF_SetFontOutline(font, (int)val);
 #endif
+    _font_clear_render_cache((PyFontObject *)self);
     return 0;
 }
 
@@ -1097,6 +1205,7 @@ font_set_script(PyObject *self, PyObject *arg)
     {
         return RAISE(pgExc_SDLError, SDL_GetError());
     }
+    _font_clear_render_cache((PyFontObject *)self);
 #else
     return RAISE(pgExc_SDLError,
                  "pygame.font not compiled with a new enough SDL_ttf version. "
@@ -1180,6 +1289,7 @@ font_set_direction(PyObject *self, PyObject *arg, PyObject *kwarg)
     {
         return RAISE(pgExc_SDLError, SDL_GetError());
     }
+    _font_clear_render_cache((PyFontObject *)self);
 
 #else
     return RAISE(pgExc_SDLError,
@@ -1189,6 +1299,78 @@ font_set_direction(PyObject *self, PyObject *arg, PyObject *kwarg)
     Py_RETURN_NONE;
 }
 
+static PyObject *
+font_set_render_cache(PyFontObject *self, PyObject *arg)
+{
+    if (!PgFont_GenerationCheck(self)) {
+        return RAISE_FONT_QUIT_ERROR();
+    }
+
+    Py_ssize_t max_bytes = PyLong_AsSsize_t(arg);
+
+    if (max_bytes == -1 && PyErr_Occurred()) {
+        return NULL;
+    }
+    if (max_bytes < 0) {
+        return RAISE(PyExc_ValueError, "max_bytes must be >= 0");
+    }
+
+    self->cache_max_bytes = max_bytes;
+    if (!max_bytes) {
+        _font_clear_render_cache(self);
+        Py_CLEAR(self->render_cache);
+        Py_RETURN_NONE;
+    }
+    if (!self->render_cache) {
+        self->render_cache = PyDict_New();
+        if (!self->render_cache) {
+            return NULL;
+        }
+    }
+    if (_font_cache_make_room(self, 0)) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+font_clear_render_cache(PyFontObject *self, PyObject *_null)
+{
+    if (!PgFont_GenerationCheck(self)) {
+        return RAISE_FONT_QUIT_ERROR();
+    }
+
+    _font_clear_render_cache(self);
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+font_get_render_cache_stats(PyFontObject *self, PyObject *args,
+                            PyObject *kwargs)
+{
+    PyObject *stats;
+    int reset = 0;
+    static char *keywords[] = {"reset", NULL};
+
+    if (!PgFont_GenerationCheck(self)) {
+        return RAISE_FONT_QUIT_ERROR();
+    }
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "|p", keywords, &reset)) {
+        return NULL;
+    }
+    stats = Py_BuildValue(
+        "{sKsKsnsnsn}", "hits", self->cache_hits, "misses", self->cache_misses,
+        "entries",
+        self->render_cache ? PyDict_GET_SIZE(self->render_cache) : 0, "bytes",
+        self->cache_bytes, "max_bytes", self->cache_max_bytes);
+    if (stats && reset) {
+        self->cache_hits = 0;
+        self->cache_misses = 0;
+    }
+    return stats;
+}
+
 /**
  * Getters and setters for the pgFontObject.
  */
@@ -1240,6 +1422,12 @@ static PyMethodDef font_methods[] = {
     {"set_script", font_set_script, METH_O, DOC_FONT_FONT_SETSCRIPT},
     {"set_direction", (PyCFunction)font_set_direction,
      METH_VARARGS | METH_KEYWORDS, DOC_FONT_FONT_SETDIRECTION},
+    {"set_render_cache", (PyCFunction)font_set_render_cache, METH_O,
+     DOC_FONT_FONT_SETRENDERCACHE},
+    {"clear_render_cache", (PyCFunction)font_clear_render_cache, METH_NOARGS,
+     DOC_FONT_FONT_CLEARRENDERCACHE},
+    {"get_render_cache_stats", (PyCFunction)font_get_render_cache_stats,
+     METH_VARARGS | METH_KEYWORDS, DOC_FONT_FONT_GETRENDERCACHESTATS},
     {NULL, NULL, 0, NULL}};
 
 /*font object internals*/
@@ -1270,6 +1458,7 @@ font_dealloc(PyFontObject *self)
 #endif
     }
 
+    Py_XDECREF(self->render_cache);
     if (self->weakreflist) {
         PyObject_ClearWeakRefs((PyObject *)self);
     }
@@ -55,6 +55,10 @@ static void
 free_node(FontCache *, CacheNode *);
 static void
 set_node_key(NodeKey *, GlyphIndex_t, const FontRenderMode *);
+static size_t
+node_bytes(const CacheNode *);
+static int
+table_size(int);
 static int
 equal_node_keys(const NodeKey *, const NodeKey *);
 
@@ -129,10 +133,10 @@ get_hash(const NodeKey *key)
     return h1;
 }
 
-int
-_PGFT_Cache_Init(FreeTypeInstance *ft, FontCache *cache)
+static int
+table_size(int size)
 {
-    int cache_size = MAX(ft->cache_size - 1, PGFT_MIN_CACHE_SIZE - 1);
+    int cache_size = MAX(size - 1, PGFT_MIN_CACHE_SIZE - 1);
 
     /*
      * Make sure this is a power of 2.
@@ -143,7 +147,22 @@ _PGFT_Cache_Init(FreeTypeInstance *ft, FontCache *cache)
     cache_size = cache_size | (cache_size >> 8);
     cache_size = cache_size | (cache_size >> 16);
 
-    cache_size = cache_size + 1;
+    return cache_size + 1;
+}
+
+static size_t
+node_bytes(const CacheNode *node)
+{
+    const FT_Bitmap *bitmap = &node->glyph.image->bitmap;
+    int pitch = bitmap->pitch < 0 ? -bitmap->pitch : bitmap->pitch;
+
+    return sizeof(CacheNode) + (size_t)bitmap->rows * (size_t)pitch;
+}
+
+int
+_PGFT_Cache_Init(FreeTypeInstance *ft, FontCache *cache)
+{
+    int cache_size = table_size(ft->cache_size);
 
     cache->nodes = _PGFT_calloc((size_t)cache_size, sizeof(FontGlyph *));
     if (!cache->nodes) {
@@ -158,13 +177,60 @@ _PGFT_Cache_Init(FreeTypeInstance *ft, FontCache *cache)
     cache->free_nodes = 0;
     cache->size_mask = (FT_UInt32)(cache_size - 1);
 
-#ifdef PGFT_DEBUG_CACHE
-    cache->_debug_count = 0;
-    cache->_debug_delete_count = 0;
-    cache->_debug_access = 0;
-    cache->_debug_hit = 0;
-    cache->_debug_miss = 0;
-#endif
+    cache->count = 0;
+    cache->bytes = 0;
+    cache->hits = 0;
+    cache->misses = 0;
+    cache->evictions = 0;
+    return 0;
+}
+
+int
+_PGFT_Cache_Resize(FontCache *cache, int size)
+{
+    int cache_size = table_size(size);
+    CacheNode **nodes;
+    FT_Byte *depths;
+    CacheNode *node, *next;
+    FT_UInt32 size_mask = (FT_UInt32)(cache_size - 1);
+    FT_UInt32 bucket;
+    FT_UInt32 i;
+
+    if (size_mask == cache->size_mask) {
+        return 0;
+    }
+
+    nodes = _PGFT_calloc((size_t)cache_size, sizeof(CacheNode *));
+    if (!nodes) {
+        return -1;
+    }
+    depths = _PGFT_calloc((size_t)cache_size, sizeof(FT_Byte));
+    if (!depths) {
+        _PGFT_free(nodes);
+        return -1;
+    }
+
+    /* Rehash the nodes in place, so the glyphs in use by a layout
+     * stay valid. Any bucket left too deep is trimmed by the next
+     * _PGFT_Cache_Cleanup.
+     */
+    for (i = 0; i <= cache->size_mask; ++i) {
+        for (node = cache->nodes[i]; node; node = next) {
+            next = node->next;
+            bucket = node->hash & size_mask;
+            node->next = nodes[bucket];
+            nodes[bucket] = node;
+            if (depths[bucket] < 0xFF) {
+                depths[bucket]++;
+            }
+        }
+    }
+
+    _PGFT_free(cache->nodes);
+    _PGFT_free(cache->depths);
+    cache->nodes = nodes;
+    cache->depths = depths;
+    cache->size_mask = size_mask;
     return 0;
 }
 
@@ -214,9 +280,7 @@ _PGFT_Cache_Cleanup(FontCache *cache)
 
             for (;;) {
                 if (!node->next) {
-#ifdef PGFT_DEBUG_CACHE
-                    cache->_debug_delete_count++;
-#endif
+                    cache->evictions++;
 
                     if (prev) {
                         prev->next = 0;
@@ -250,10 +314,6 @@ _PGFT_Cache_FindGlyph(GlyphIndex_t id, const FontRenderMode *render,
     node = nodes[bucket];
     prev = 0;
 
-#ifdef PGFT_DEBUG_CACHE
-    cache->_debug_access++;
-#endif
-
     while (node) {
         if (equal_node_keys(&node->key, &key)) {
             if (prev) {
@@ -262,10 +322,7 @@ _PGFT_Cache_FindGlyph(GlyphIndex_t id, const FontRenderMode *render,
                 nodes[bucket] = node;
             }
 
-#ifdef PGFT_DEBUG_CACHE
-            cache->_debug_hit++;
-#endif
-
+            cache->hits++;
             return &node->glyph;
         }
 
@@ -274,10 +331,7 @@ _PGFT_Cache_FindGlyph(GlyphIndex_t id, const FontRenderMode *render,
     }
 
     node = allocate_node(cache, render, id, internal);
-
-#ifdef PGFT_DEBUG_CACHE
-    cache->_debug_miss++;
-#endif
+    cache->misses++;
 
     return node ? &node->glyph : 0;
 }
@@ -289,10 +343,8 @@ free_node(FontCache *cache, CacheNode *node)
         return;
     }
 
-#ifdef PGFT_DEBUG_CACHE
-    cache->_debug_count--;
-#endif
-
+    cache->count--;
+    cache->bytes -= node_bytes(node);
     cache->depths[node->hash & cache->size_mask]--;
 
     FT_Done_Glyph((FT_Glyph)(node->glyph.image));
@@ -322,9 +374,8 @@ allocate_node(FontCache *cache, const FontRenderMode *render, GlyphIndex_t id,
 
     cache->depths[bucket]++;
 
-#ifdef PGFT_DEBUG_CACHE
-    cache->_debug_count++;
-#endif
+    cache->count++;
+    cache->bytes += node_bytes(node);
 
     return node;
 
@@ -490,6 +490,50 @@ _PGFT_GetMetrics(FreeTypeInstance *ft, pgFontObject *fontobj,
     return 0;
 }
 
+long
+_PGFT_PreloadGlyphs(FreeTypeInstance *ft, pgFontObject *fontobj,
+                    const FontRenderMode *mode, const PGFT_String *text)
+{
+    FontCache *cache = &(fontobj->_internals->glyph_cache);
+    Py_ssize_t length = PGFT_String_GET_LENGTH(text);
+    const PGFT_char *chars = PGFT_String_GET_DATA(text);
+    unsigned long long misses = cache->misses;
+    size_t needed;
+    GlyphIndex_t id;
+    TextContext context;
+    FT_Face font;
+    Py_ssize_t i;
+
+    /* load our sized font */
+    font = _PGFT_GetFontSized(ft, fontobj, mode->face_size);
+    if (!font) {
+        PyErr_SetString(pgExc_SDLError, _PGFT_GetError(ft));
+        return -1;
+    }
+
+    /* grow the cache so the new glyphs are not evicted on the next cleanup */
+    needed = (size_t)cache->count + (size_t)length;
+    if (needed > (size_t)cache->size_mask + 1) {
+        if (_PGFT_Cache_Resize(cache, (int)MIN(needed, PGFT_MAX_CACHE_SIZE))) {
+            PyErr_NoMemory();
+            return -1;
+        }
+    }
+    _PGFT_Cache_Cleanup(cache);
+
+    fill_context(&context, ft, fontobj, mode, font);
+    for (i = 0; i < length; ++i) {
+        id = FTC_CMapCache_Lookup(context.charmap, context.id, -1,
+                                  (FT_UInt32)chars[i]);
+        if (!_PGFT_Cache_FindGlyph(id, mode, cache, &context)) {
+            PyErr_Format(pgExc_SDLError, "Unable to load glyph for id %lu",
+                         (unsigned long)id);
+            return -1;
+        }
+    }
+    return (long)(cache->misses - misses);
+}
+
 int
 _PGFT_LoadGlyph(FontGlyph *glyph, GlyphIndex_t id, const FontRenderMode *mode,
                 void *internal)
@@ -51,6 +51,7 @@
 /* Internal configuration variables */
 #define PGFT_DEFAULT_CACHE_SIZE 64
 #define PGFT_MIN_CACHE_SIZE 32
+#define PGFT_MAX_CACHE_SIZE (1 << 24)
 #if defined(PGFT_DEBUG_CACHE)
 #undef PGFT_DEBUG_CACHE
 #endif
@@ -125,13 +126,12 @@ typedef struct fontcache_ {
 
     FT_Byte *depths;
 
-#ifdef PGFT_DEBUG_CACHE
-    FT_UInt32 _debug_count;
-    FT_UInt32 _debug_delete_count;
-    FT_UInt32 _debug_access;
-    FT_UInt32 _debug_hit;
-    FT_UInt32 _debug_miss;
-#endif
+    /* Statistics, always kept */
+    FT_UInt32 count;
+    size_t bytes;
+    unsigned long long hits;
+    unsigned long long misses;
+    unsigned long long evictions;
 
     FT_UInt32 size_mask;
 } FontCache;
@@ -219,9 +219,7 @@ typedef struct PGFT_String_ {
     PGFT_char data[];
 } PGFT_String;
 
-#if defined(PGFT_DEBUG_CACHE)
 #define PGFT_FONT_CACHE(f) ((f)->_internals->glyph_cache)
-#endif
 
 /**********************************************************
  * Module state
@@ -403,6 +401,9 @@ _PGFT_LayoutFree(pgFontObject *);
 Layout *
 _PGFT_LoadLayout(FreeTypeInstance *, pgFontObject *, const FontRenderMode *,
                  PGFT_String *);
+long
+_PGFT_PreloadGlyphs(FreeTypeInstance *, pgFontObject *, const FontRenderMode *,
+                    const PGFT_String *);
 int
 _PGFT_LoadGlyph(FontGlyph *, GlyphIndex_t, const FontRenderMode *, void *);
 
@@ -413,6 +414,8 @@ void
 _PGFT_Cache_Destroy(FontCache *);
 void
 _PGFT_Cache_Cleanup(FontCache *);
+int
+_PGFT_Cache_Resize(FontCache *, int);
 FontGlyph *
 _PGFT_Cache_FindGlyph(FT_UInt32, const FontRenderMode *, FontCache *, void *);
 
@@ -50,6 +50,7 @@ static PyObject *extsaveobj = NULL;
 static PyObject *extverobj = NULL;
 static PyObject *ext_load_sized_svg = NULL;
 static PyObject *ext_load_animation = NULL;
+static PyObject *ext_load_many = NULL;
 
 static inline void
 pad(char **data, int padding)
@@ -132,6 +133,82 @@ image_load(PyObject *self, PyObject *arg, PyObject *kwarg)
     }
 }
 
+static PyObject *
+image_load_many(PyObject *self, PyObject *arg, PyObject *kwarg)
+{
+    PyObject *files, *seq, *ret;
+    PyObject *exc_type, *exc_value, *exc_trace;
+    Py_ssize_t i, count;
+    int convert = 0, threads = 0;
+    static char *kwds[] = {"files", "convert", "threads", NULL};
+
+    if (ext_load_many) {
+        return PyObject_Call(ext_load_many, arg, kwarg);
+    }
+
+    /* Without SDL_image only BMP files can be loaded, they are cheap to
+     * decode so they are loaded one after the other */
+    if (!PyArg_ParseTupleAndKeywords(arg, kwarg, "O|pi", kwds, &files,
+                                     &convert, &threads)) {
+        return NULL;
+    }
+    if (threads < 0) {
+        return RAISE(PyExc_ValueError, "threads must not be negative");
+    }
+
+    seq = PySequence_Fast(files, "files must be a sequence");
+    if (seq == NULL) {
+        return NULL;
+    }
+    count = PySequence_Fast_GET_SIZE(seq);
+    ret = PyList_New(count);
+    if (ret == NULL) {
+        Py_DECREF(seq);
+        return NULL;
+    }
+
+    for (i = 0; i < count; i++) {
+        PyObject *item =
+            image_load_basic(self, PySequence_Fast_GET_ITEM(seq, i));
+
+        if (item == NULL) {
+            if (PyErr_ExceptionMatches(PyExc_MemoryError)) {
+                goto error;
+            }
+            PyErr_Fetch(&exc_type, &exc_value, &exc_trace);
+            PyErr_NormalizeException(&exc_type, &exc_value, &exc_trace);
+            if (exc_trace) {
+                PyException_SetTraceback(exc_value, exc_trace);
+            }
+            item = exc_value;
+            Py_XDECREF(exc_type);
+            Py_XDECREF(exc_trace);
+        }
+        else if (convert) {
+            PyObject *converted = PyObject_CallMethod(
+                item,
+                SDL_ISPIXELFORMAT_ALPHA(
+                    PG_SURF_FORMATENUM(pgSurface_AsSurface(item)))
+                    ? "convert_alpha"
+                    : "convert",
+                NULL);
+            Py_DECREF(item);
+            if (converted == NULL) {
+                goto error;
+            }
+            item = converted;
+        }
+        PyList_SET_ITEM(ret, i, item);
+    }
+    Py_DECREF(seq);
+    return ret;
+
+error:
+    Py_DECREF(ret);
+    Py_DECREF(seq);
+    return NULL;
+}
+
 #ifdef WIN32
 #define strcasecmp _stricmp
 #else
@@ -1900,6 +1977,8 @@ static PyMethodDef _image_methods[] = {
      METH_VARARGS | METH_KEYWORDS, DOC_IMAGE_LOADSIZEDSVG},
     {"load_animation", (PyCFunction)image_load_animation,
      METH_VARARGS | METH_KEYWORDS, DOC_IMAGE_LOADANIMATION},
+    {"load_many", (PyCFunction)image_load_many, METH_VARARGS | METH_KEYWORDS,
+     DOC_IMAGE_LOADMANY},
 
     {"save_extended", (PyCFunction)image_save_extended,
      METH_VARARGS | METH_KEYWORDS, DOC_IMAGE_SAVEEXTENDED},
@@ -1985,6 +2064,10 @@ MODINIT_DEFINE(image)
         if (!ext_load_animation) {
             goto error;
         }
+        ext_load_many = PyObject_GetAttrString(extmodule, "_load_many");
+        if (!ext_load_many) {
+            goto error;
+        }
         Py_DECREF(extmodule);
     }
     else {
@@ -1999,6 +2082,7 @@ error:
     Py_XDECREF(extverobj);
     Py_XDECREF(ext_load_sized_svg);
     Py_XDECREF(ext_load_animation);
+    Py_XDECREF(ext_load_many);
     Py_DECREF(extmodule);
     Py_DECREF(module);
     return NULL;
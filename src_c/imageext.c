@@ -86,6 +86,42 @@ iext_find_extension(char *fullname)
     return dot + 1;
 }
 
+/* Loads an image and closes rw, it does not need the GIL */
+static SDL_Surface *
+iext_load_typed(SDL_RWops *rw, const char *type)
+{
+    SDL_Surface *surf;
+
+#if SDL_VERSION_ATLEAST(3, 0, 0)
+    surf = IMG_LoadTyped_IO(rw, 1, type);
+#else
+    surf = IMG_LoadTyped_RW(rw, 1, type);
+#endif
+    if (surf == NULL) {
+        return NULL;
+    }
+
+    /* Vendor in fix from https://github.com/libsdl-org/SDL_image/pull/559.
+     * When that PR is merged this block can be removed. */
+    if (SDL_ISPIXELFORMAT_INDEXED(PG_SURF_FORMATENUM(surf))) {
+        Uint32 colorkey;
+#if SDL_VERSION_ATLEAST(3, 0, 0)
+        if (SDL_GetSurfaceColorKey(surf, &colorkey))
+#else
+        if (SDL_GetColorKey(surf, &colorkey) == 0)
+#endif
+        {
+            SDL_Palette *pal = PG_GetSurfacePalette(surf);
+            if (pal && colorkey < (Uint32)pal->ncolors) {
+                SDL_Color c = pal->colors[colorkey];
+                c.a = SDL_ALPHA_OPAQUE;
+                SDL_SetPaletteColors(pal, &c, (int)colorkey, 1);
+            }
+        }
+    }
+    return surf;
+}
+
 static PyObject *
 image_load_ext(PyObject *self, PyObject *arg, PyObject *kwarg)
 {
@@ -126,18 +162,10 @@ image_load_ext(PyObject *self, PyObject *arg, PyObject *kwarg)
     SDL_UnlockMutex(_pg_img_mutex);
     */
 
-#if SDL_VERSION_ATLEAST(3, 0, 0)
-    surf = IMG_LoadTyped_IO(rw, 1, type);
-#else
-    surf = IMG_LoadTyped_RW(rw, 1, type);
-#endif
+    surf = iext_load_typed(rw, type);
     Py_END_ALLOW_THREADS;
 #else /* ~WITH_THREAD */
-#if SDL_VERSION_ATLEAST(3, 0, 0)
-    surf = IMG_LoadTyped_IO(rw, 1, type);
-#else
-    surf = IMG_LoadTyped_RW(rw, 1, type);
-#endif
+    surf = iext_load_typed(rw, type);
 #endif /* ~WITH_THREAD */
 
     if (ext) {
@@ -148,25 +176,6 @@ image_load_ext(PyObject *self, PyObject *arg, PyObject *kwarg)
         return RAISE(pgExc_SDLError, IMG_GetError());
     }
 
-    /* Vendor in fix from https://github.com/libsdl-org/SDL_image/pull/559.
-     * When that PR is merged this block can be removed. */
-    if (SDL_ISPIXELFORMAT_INDEXED(PG_SURF_FORMATENUM(surf))) {
-        Uint32 colorkey;
-#if SDL_VERSION_ATLEAST(3, 0, 0)
-        if (SDL_GetSurfaceColorKey(surf, &colorkey))
-#else
-        if (SDL_GetColorKey(surf, &colorkey) == 0)
-#endif
-        {
-            SDL_Palette *pal = PG_GetSurfacePalette(surf);
-            if (pal && colorkey < (Uint32)pal->ncolors) {
-                SDL_Color c = pal->colors[colorkey];
-                c.a = SDL_ALPHA_OPAQUE;
-                SDL_SetPaletteColors(pal, &c, (int)colorkey, 1);
-            }
-        }
-    }
-
     final = (PyObject *)pgSurface_New(surf);
     if (final == NULL) {
         SDL_FreeSurface(surf);
@@ -304,6 +313,225 @@ error:
 #endif /* ~SDL_IMAGE_VERSION_ATLEAST(2, 6, 0) */
 }
 
+/* Largest number of threads load_many will decode with */
+#define IEXT_LOAD_MAX_THREADS 64
+
+typedef struct {
+    SDL_RWops *rw;
+    char *ext;         /* from pgRWops_FromObject, may be NULL */
+    PyObject *error;   /* exception raised while opening the file */
+    SDL_Surface *surf; /* decoded image, NULL if decoding failed */
+    char *load_error;  /* copy of the SDL_image error if decoding failed */
+} iext_LoadJob;
+
+typedef struct {
+    iext_LoadJob *jobs;
+    Py_ssize_t count;
+    Py_ssize_t next;
+    SDL_mutex *mutex; /* guards next, NULL when decoding on one thread */
+} iext_LoadBatch;
+
+static int SDLCALL
+iext_load_worker(void *data)
+{
+    iext_LoadBatch *batch = (iext_LoadBatch *)data;
+    iext_LoadJob *job;
+    Py_ssize_t i;
+
+    for (;;) {
+        if (batch->mutex) {
+            SDL_LockMutex(batch->mutex);
+        }
+        i = batch->next++;
+        if (batch->mutex) {
+            SDL_UnlockMutex(batch->mutex);
+        }
+        if (i >= batch->count) {
+            break;
+        }
+
+        job = batch->jobs + i;
+        if (job->rw == NULL) {
+            continue;
+        }
+        /* SDL errors are per thread, so the message is read on this thread
+         * and kept until the Python error can be made */
+        job->surf = iext_load_typed(job->rw, job->ext);
+        job->rw = NULL;
+        if (job->surf == NULL) {
+            job->load_error = SDL_strdup(IMG_GetError());
+        }
+    }
+    return 0;
+}
+
+/* Decodes every job, on nthreads threads including the calling one */
+static void
+iext_load_jobs(iext_LoadBatch *batch, int nthreads)
+{
+    SDL_Thread *workers[IEXT_LOAD_MAX_THREADS - 1];
+    int i, nworkers = 0;
+
+#if defined(__EMSCRIPTEN__)
+    nthreads = 1;
+#endif
+    if (nthreads > 1) {
+        batch->mutex = SDL_CreateMutex();
+    }
+    /* if threads cannot be made, whatever is left is decoded here */
+    while (batch->mutex && nworkers < nthreads - 1) {
+        workers[nworkers] =
+            SDL_CreateThread(iext_load_worker, "pygame image", batch);
+        if (!workers[nworkers]) {
+            break;
+        }
+        nworkers++;
+    }
+
+    iext_load_worker(batch);
+
+    for (i = 0; i < nworkers; i++) {
+        SDL_WaitThread(workers[i], NULL);
+    }
+    if (batch->mutex) {
+        SDL_DestroyMutex(batch->mutex);
+        batch->mutex = NULL;
+    }
+}
+
+static PyObject *
+imageext_load_many(PyObject *self, PyObject *arg, PyObject *kwargs)
+{
+    PyObject *files, *seq, *ret = NULL;
+    PyObject *exc_type, *exc_value, *exc_trace;
+    iext_LoadJob *jobs;
+    iext_LoadBatch batch;
+    Py_ssize_t i, count;
+    int convert = 0, threads = 0;
+    static char *kwds[] = {"files", "convert", "threads", NULL};
+
+    if (!PyArg_ParseTupleAndKeywords(arg, kwargs, "O|pi", kwds, &files,
+                                     &convert, &threads)) {
+        return NULL;
+    }
+    if (threads < 0) {
+        return RAISE(PyExc_ValueError, "threads must not be negative");
+    }
+
+    seq = PySequence_Fast(files, "files must be a sequence");
+    if (seq == NULL) {
+        return NULL;
+    }
+    count = PySequence_Fast_GET_SIZE(seq);
+    jobs = PyMem_Calloc(count ? count : 1, sizeof(iext_LoadJob));
+    if (jobs == NULL) {
+        Py_DECREF(seq);
+        return PyErr_NoMemory();
+    }
+
+    /* Files are opened here with the GIL, a file object that is read from
+     * another thread takes the GIL for each read */
+    for (i = 0; i < count; i++) {
+        jobs[i].rw =
+            pgRWops_FromObject(PySequence_Fast_GET_ITEM(seq, i), &jobs[i].ext);
+        if (jobs[i].rw != NULL) {
+            continue;
+        }
+        if (PyErr_ExceptionMatches(PyExc_MemoryError)) {
+            goto cleanup;
+        }
+        PyErr_Fetch(&exc_type, &exc_value, &exc_trace);
+        PyErr_NormalizeException(&exc_type, &exc_value, &exc_trace);
+        if (exc_trace) {
+            PyException_SetTraceback(exc_value, exc_trace);
+        }
+        jobs[i].error = exc_value;
+        Py_XDECREF(exc_type);
+        Py_XDECREF(exc_trace);
+    }
+
+    if (threads == 0) {
+        threads = SDL_GetCPUCount();
+    }
+    if (threads > IEXT_LOAD_MAX_THREADS) {
+        threads = IEXT_LOAD_MAX_THREADS;
+    }
+    if (threads > count) {
+        threads = (int)count;
+    }
+
+    batch.jobs = jobs;
+    batch.count = count;
+    batch.next = 0;
+    batch.mutex = NULL;
+    Py_BEGIN_ALLOW_THREADS;
+    iext_load_jobs(&batch, threads);
+    Py_END_ALLOW_THREADS;
+
+    ret = PyList_New(count);
+    if (ret == NULL) {
+        goto cleanup;
+    }
+    for (i = 0; i < count; i++) {
+        PyObject *item;
+
+        if (jobs[i].error) {
+            item = jobs[i].error;
+            jobs[i].error = NULL;
+        }
+        else if (jobs[i].surf == NULL) {
+            item = PyObject_CallFunction(
+                pgExc_SDLError, "s",
+                jobs[i].load_error ? jobs[i].load_error : "Unknown error");
+        }
+        else {
+            item = (PyObject *)pgSurface_New(jobs[i].surf);
+            if (item == NULL) {
+                goto error;
+            }
+            jobs[i].surf = NULL;
+            if (convert) {
+                PyObject *converted = PyObject_CallMethod(
+                    item,
+                    SDL_ISPIXELFORMAT_ALPHA(
+                        PG_SURF_FORMATENUM(pgSurface_AsSurface(item)))
+                        ? "convert_alpha"
+                        : "convert",
+                    NULL);
+                Py_DECREF(item);
+                item = converted;
+            }
+        }
+        if (item == NULL) {
+            goto error;
+        }
+        PyList_SET_ITEM(ret, i, item);
+    }
+    goto cleanup;
+
+error:
+    Py_CLEAR(ret);
+cleanup:
+    for (i = 0; i < count; i++) {
+        if (jobs[i].rw) {
+            SDL_RWclose(jobs[i].rw);
+        }
+        if (jobs[i].ext) {
+            free(jobs[i].ext);
+        }
+        if (jobs[i].surf) {
+            SDL_FreeSurface(jobs[i].surf);
+        }
+        if (jobs[i].load_error) {
+            SDL_free(jobs[i].load_error);
+        }
+        Py_XDECREF(jobs[i].error);
+    }
+    PyMem_Free(jobs);
+    Py_DECREF(seq);
+    return ret;
+}
+
 static PyObject *
 image_save_ext(PyObject *self, PyObject *arg, PyObject *kwarg)
 {
@@ -460,6 +688,8 @@ static PyMethodDef _imageext_methods[] = {
      METH_VARARGS | METH_KEYWORDS, "Note: Should not be used directly."},
     {"_load_animation", (PyCFunction)imageext_load_animation,
      METH_VARARGS | METH_KEYWORDS, "Note: Should not be used directly."},
+    {"_load_many", (PyCFunction)imageext_load_many,
+     METH_VARARGS | METH_KEYWORDS, "Note: Should not be used directly."},
     {NULL, NULL, 0, NULL}};
 
 /*DOC*/ static char _imageext_doc[] =
@@ -347,6 +347,13 @@ typedef struct {
     (*(int (*)(pgSurfaceObject *, pgSurfaceObject *, SDL_Rect *, SDL_Rect *, \
                int))PYGAMEAPI_GET_SLOT(surface, 2))
 
+#define pgSurface_BlitBandCount \
+    (*(int (*)(int, int))PYGAMEAPI_GET_SLOT(surface, 4))
+
+#define pgSurface_RunBlitBands                                               \
+    (*(void (*)(void (*)(void *, int, int), void *, int))PYGAMEAPI_GET_SLOT( \
+        surface, 5))
+
 #define import_pygame_surface()         \
     do {                                \
         IMPORT_PYGAME_MODULE(surface);  \
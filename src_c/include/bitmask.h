@@ -154,6 +154,64 @@ bitmask_draw(bitmask_t *a, const bitmask_t *b, int xoffset, int yoffset);
 void
 bitmask_erase(bitmask_t *a, const bitmask_t *b, int xoffset, int yoffset);
 
+/* The functions below set the bits of a shape if value is nonzero and clear
+   them otherwise. A bit is part of a shape if the center of its pixel, at
+   (x + 0.5, y + 0.5), is inside the shape. Shapes are clipped to the mask. */
+
+/* Sets or clears the rectangle of bits from (x, y) to (x + w - 1, y + h - 1)
+ */
+void
+bitmask_fill_rect(bitmask_t *m, int x, int y, int w, int h, int value);
+
+/* Sets or clears the bits within radius of the point (cx, cy) */
+void
+bitmask_fill_circle(bitmask_t *m, double cx, double cy, double radius,
+                    int value);
+
+/* Sets or clears the bits inside the polygon of n vertices, given as x, y
+   pairs in points, using the even-odd rule. Returns -1 if memory could not
+   be allocated and 0 otherwise. */
+int
+bitmask_fill_polygon(bitmask_t *m, const double *points, int n, int value);
+
+/* Coarse occupancy levels of a bitmask, used to skip its empty areas. A bit
+   of level1 is set if and only if the BITMASK_INDEX_BLOCK sized square block
+   of the bitmask at the same position has set bits, and the bits of level2
+   are set the same way from the blocks of level1. */
+#define BITMASK_INDEX_BLOCK 8
+
+typedef struct bitmask_index {
+    bitmask_t *level1;
+    bitmask_t *level2;
+} bitmask_index_t;
+
+/* Creates the index of m, or returns NULL if out of memory. */
+bitmask_index_t *
+bitmask_index_create(const bitmask_t *m);
+
+void
+bitmask_index_free(bitmask_index_t *index);
+
+/* Updates the index of m after the bits in the rectangle from (x, y) to
+   (x + w - 1, y + h - 1) changed. The rectangle is clipped to m. */
+void
+bitmask_index_update(bitmask_index_t *index, const bitmask_t *m, int x, int y,
+                     int w, int h);
+
+/* Same as bitmask_overlap_pos() and bitmask_overlap_area(), skipping the
+   empty blocks of a with its index. The point found by
+   bitmask_overlap_pos_indexed() is the first one in the bit columns of a,
+   each searched from top to bottom, which may not be the one found by
+   bitmask_overlap_pos(). */
+int
+bitmask_overlap_pos_indexed(const bitmask_t *a, const bitmask_index_t *index,
+                            const bitmask_t *b, int xoffset, int yoffset,
+                            int *x, int *y);
+
+int
+bitmask_overlap_area_indexed(const bitmask_t *a, const bitmask_index_t *index,
+                             const bitmask_t *b, int xoffset, int yoffset);
+
 /* Return a new scaled bitmask, with dimensions w*h. The quality of the
    scaling may not be perfect for all circumstances, but it should
    be reasonable. If either w or h is 0 a clear 1x1 mask is returned. */
@@ -29,6 +29,11 @@ typedef struct {
     PyObject *weakreflist;
     int ptsize;
     unsigned int ttf_init_generation;
+    /* LRU cache of rendered text, a dict ordered from least to most
+     * recently used. NULL while caching is off. */
+    PyObject *render_cache;
+    Py_ssize_t cache_bytes, cache_max_bytes;
+    unsigned long long cache_hits, cache_misses;
 } PyFontObject;
 #define PyFont_AsFont(x) (((PyFontObject *)x)->font)
 
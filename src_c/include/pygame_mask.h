@@ -25,6 +25,7 @@
 typedef struct {
     PyObject_HEAD bitmask_t *mask;
     void *bufdata;
+    bitmask_index_t *index; /* NULL unless set_overlap_index() enabled it */
 } pgMaskObject;
 
 #define pgMask_AsBitmap(x) (((pgMaskObject *)x)->mask)
@@ -35,6 +35,9 @@
 
 #include "doc/mask_doc.h"
 
+#include "simd_shared.h"
+#include "simd_mask.h"
+
 #include "structmember.h"
 
 #include <math.h>
@@ -70,6 +73,58 @@ abs_diff_uint32(Uint32 a, Uint32 b)
     return (a > b) ? a - b : b - a;
 }
 
+/* Updates the overlap index of a mask, if it has one, after the bits in the
+ * given area changed. */
+static void
+mask_index_update(PyObject *self, int x, int y, int w, int h)
+{
+    pgMaskObject *maskobj = (pgMaskObject *)self;
+
+    if (maskobj->index) {
+        bitmask_index_update(maskobj->index, maskobj->mask, x, y, w, h);
+    }
+}
+
+/* Same as mask_index_update() for the whole mask. */
+static void
+mask_index_update_all(PyObject *self)
+{
+    bitmask_t *mask = pgMask_AsBitmap(self);
+
+    mask_index_update(self, 0, 0, mask->w, mask->h);
+}
+
+/* Same as mask_index_update() for an area with float bounds, which can be
+ * anywhere. */
+static void
+mask_index_update_bounds(PyObject *self, double left, double top, double right,
+                         double bottom)
+{
+    bitmask_t *mask = pgMask_AsBitmap(self);
+
+    /* Limited to the mask first so they fit in an int */
+    left = MAX(floor(left), 0.0);
+    top = MAX(floor(top), 0.0);
+    right = MIN(ceil(right), (double)mask->w);
+    bottom = MIN(ceil(bottom), (double)mask->h);
+
+    if (left < right && top < bottom) {
+        mask_index_update(self, (int)left, (int)top, (int)(right - left),
+                          (int)(bottom - top));
+    }
+}
+
+/* Returns the overlap index of a mask if it has one that can be used. */
+static bitmask_index_t *
+mask_get_index(PyObject *self)
+{
+    pgMaskObject *maskobj = (pgMaskObject *)self;
+
+    /* The bits can be changed through an exported buffer without updating
+     * the index, it is brought up to date when the last one is released */
+    return maskobj->bufdata ? NULL : maskobj->index;
+}
+
 /********** mask object methods **********/
 
 /* Copies the given mask. */
@@ -77,13 +132,25 @@ static PyObject *
 mask_copy(PyObject *self, PyObject *_null)
 {
     bitmask_t *new_bitmask = bitmask_copy(pgMask_AsBitmap(self));
+    pgMaskObject *maskobj;
 
     if (NULL == new_bitmask) {
         return RAISE(PyExc_MemoryError, "cannot allocate memory for bitmask");
     }
 
-    return (PyObject *)create_mask_using_bitmask_and_type(new_bitmask,
-                                                          Py_TYPE(self));
+    maskobj = create_mask_using_bitmask_and_type(new_bitmask, Py_TYPE(self));
+
+    if (NULL != maskobj && NULL != ((pgMaskObject *)self)->index) {
+        maskobj->index = bitmask_index_create(new_bitmask);
+
+        if (NULL == maskobj->index) {
+            Py_DECREF(maskobj);
+            return RAISE(PyExc_MemoryError,
+                         "cannot allocate memory for overlap index");
+        }
+    }
+
+    return (PyObject *)maskobj;
 }
 
 /* Redirects mask.copy() to mask.__copy__(). This is done to allow
@@ -194,6 +261,7 @@ mask_set_at(PyObject *self, PyObject *args, PyObject *kwargs)
         else {
             bitmask_clearbit(mask, x, y);
         }
+        mask_index_update(self, x, y, 1, 1);
     }
     else {
         PyErr_Format(PyExc_IndexError, "%d, %d is out of bounds", x, y);
@@ -208,6 +276,7 @@ mask_overlap(PyObject *self, PyObject *args, PyObject *kwargs)
     bitmask_t *mask = pgMask_AsBitmap(self);
     bitmask_t *othermask;
     PyObject *maskobj;
+    bitmask_index_t *index;
     int x, y, val;
     int xp, yp;
     PyObject *offset = NULL;
@@ -224,7 +293,20 @@ mask_overlap(PyObject *self, PyObject *args, PyObject *kwargs)
         return RAISE(PyExc_TypeError, "offset must be two numbers");
     }
 
-    val = bitmask_overlap_pos(mask, othermask, x, y, &xp, &yp);
+    if ((index = mask_get_index(self))) {
+        val = bitmask_overlap_pos_indexed(mask, index, othermask, x, y, &xp,
+                                          &yp);
+    }
+    else if ((index = mask_get_index(maskobj))) {
+        val = bitmask_overlap_pos_indexed(othermask, index, mask, -x, -y, &xp,
+                                          &yp);
+        xp += x;
+        yp += y;
+    }
+    else {
+        val = bitmask_overlap_pos(mask, othermask, x, y, &xp, &yp);
+    }
+
     if (val) {
         return pg_tuple_couple_from_values_int(xp, yp);
     }
@@ -239,6 +321,7 @@ mask_overlap_area(PyObject *self, PyObject *args, PyObject *kwargs)
     bitmask_t *mask = pgMask_AsBitmap(self);
     bitmask_t *othermask;
     PyObject *maskobj;
+    bitmask_index_t *index;
     int x, y, val;
     PyObject *offset = NULL;
     static char *keywords[] = {"other", "offset", NULL};
@@ -254,10 +337,108 @@ mask_overlap_area(PyObject *self, PyObject *args, PyObject *kwargs)
         return RAISE(PyExc_TypeError, "offset must be two numbers");
     }
 
-    val = bitmask_overlap_area(mask, othermask, x, y);
+    if ((index = mask_get_index(self))) {
+        val = bitmask_overlap_area_indexed(mask, index, othermask, x, y);
+    }
+    else if ((index = mask_get_index(maskobj))) {
+        val = bitmask_overlap_area_indexed(othermask, index, mask, -x, -y);
+    }
+    else {
+        val = bitmask_overlap_area(mask, othermask, x, y);
+    }
+
     return PyLong_FromLong(val);
 }
 
+static PyObject *
+mask_overlap_many(PyObject *self, PyObject *args, PyObject *kwargs)
+{
+    bitmask_t *mask = pgMask_AsBitmap(self);
+    bitmask_t *othermask;
+    bitmask_index_t *index;
+    PyObject *masks, *iter, *item, *maskobj, *offset, *hits, *pos;
+    Py_ssize_t i;
+    int x, y, xp, yp, val, failed = 0;
+    static char *keywords[] = {"masks", NULL};
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O", keywords, &masks)) {
+        return NULL;
+    }
+
+    if (!(iter = PyObject_GetIter(masks))) {
+        return NULL;
+    }
+
+    if (!(hits = PyList_New(0))) {
+        Py_DECREF(iter);
+        return NULL;
+    }
+
+    index = mask_get_index(self);
+
+    for (i = 0; !failed && (item = PyIter_Next(iter)); ++i) {
+        maskobj = offset = NULL;
+        if (PySequence_Check(item) && PySequence_Size(item) == 2) {
+            maskobj = PySequence_GetItem(item, 0);
+            offset = maskobj ? PySequence_GetItem(item, 1) : NULL;
+        }
+
+        if (PyErr_Occurred() && !PyErr_ExceptionMatches(PyExc_TypeError)) {
+            /* not a bad item but a failure, like a MemoryError or an error
+             * raised by the item's __getitem__ */
+            failed = 1;
+        }
+        else if (!maskobj || !offset ||
+                 !PyObject_TypeCheck(maskobj, &pgMask_Type)) {
+            /* replaces the TypeError of an item without a length, if any */
+            PyErr_Clear();
+            PyErr_SetString(PyExc_TypeError,
+                            "masks must contain (mask, offset) pairs");
+            failed = 1;
+        }
+        else if (!pg_TwoIntsFromObj(offset, &x, &y)) {
+            PyErr_SetString(PyExc_TypeError, "offset must be two numbers");
+            failed = 1;
+        }
+        else {
+            othermask = pgMask_AsBitmap(maskobj);
+            if (index) {
+                val = bitmask_overlap_pos_indexed(mask, index, othermask, x, y,
+                                                  &xp, &yp);
+            }
+            else if (mask_get_index(maskobj)) {
+                val = bitmask_overlap_pos_indexed(othermask,
+                                                  mask_get_index(maskobj),
+                                                  mask, -x, -y, &xp, &yp);
+            }
+            else {
+                val = bitmask_overlap(mask, othermask, x, y);
+            }
+
+            if (val) {
+                pos = PyLong_FromSsize_t(i);
+                if (!pos || PyList_Append(hits, pos)) {
+                    failed = 1;
+                }
+                Py_XDECREF(pos);
+            }
+        }
+
+        Py_XDECREF(maskobj);
+        Py_XDECREF(offset);
+        Py_DECREF(item);
+    }
+
+    Py_DECREF(iter);
+
+    if (failed || PyErr_Occurred()) {
+        Py_DECREF(hits);
+        return NULL;
+    }
+
+    return hits;
+}
+
 static PyObject *
 mask_overlap_mask(PyObject *self, PyObject *args, PyObject *kwargs)
 {
@@ -295,6 +476,7 @@ mask_fill(PyObject *self, PyObject *_null)
     bitmask_t *mask = pgMask_AsBitmap(self);
 
     bitmask_fill(mask);
+    mask_index_update_all(self);
 
     Py_RETURN_NONE;
 }
@@ -305,6 +487,7 @@ mask_clear(PyObject *self, PyObject *_null)
     bitmask_t *mask = pgMask_AsBitmap(self);
 
     bitmask_clear(mask);
+    mask_index_update_all(self);
 
     Py_RETURN_NONE;
 }
@@ -315,6 +498,7 @@ mask_invert(PyObject *self, PyObject *_null)
     bitmask_t *mask = pgMask_AsBitmap(self);
 
     bitmask_invert(mask);
+    mask_index_update_all(self);
 
     Py_RETURN_NONE;
 }
@@ -370,6 +554,7 @@ mask_draw(PyObject *self, PyObject *args, PyObject *kwargs)
     othermask = pgMask_AsBitmap(maskobj);
 
     bitmask_draw(mask, othermask, x, y);
+    mask_index_update(self, x, y, othermask->w, othermask->h);
 
     Py_RETURN_NONE;
 }
@@ -396,10 +581,160 @@ mask_erase(PyObject *self, PyObject *args, PyObject *kwargs)
     othermask = pgMask_AsBitmap(maskobj);
 
     bitmask_erase(mask, othermask, x, y);
+    mask_index_update(self, x, y, othermask->w, othermask->h);
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+mask_fill_rect(PyObject *self, PyObject *args, PyObject *kwargs)
+{
+    bitmask_t *mask = pgMask_AsBitmap(self);
+    SDL_Rect temp_rect, *rect;
+    PyObject *rectobj;
+    int value = 1;
+    static char *keywords[] = {"rect", "value", NULL};
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O|i", keywords, &rectobj,
+                                     &value)) {
+        return NULL;
+    }
+
+    if (!(rect = pgRect_FromObject(rectobj, &temp_rect))) {
+        return RAISE(PyExc_TypeError, "rect must be a rectstyle object");
+    }
+
+    bitmask_fill_rect(mask, rect->x, rect->y, rect->w, rect->h, value);
+    mask_index_update(self, rect->x, rect->y, rect->w, rect->h);
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+mask_fill_circle(PyObject *self, PyObject *args, PyObject *kwargs)
+{
+    bitmask_t *mask = pgMask_AsBitmap(self);
+    PyObject *center;
+    double x, y, radius;
+    int value = 1;
+    static char *keywords[] = {"center", "radius", "value", NULL};
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "Od|i", keywords, &center,
+                                     &radius, &value)) {
+        return NULL;
+    }
+
+    if (!pg_TwoDoublesFromObj(center, &x, &y)) {
+        return RAISE(PyExc_TypeError, "center must be two numbers");
+    }
+
+    bitmask_fill_circle(mask, x, y, radius, value);
+    mask_index_update_bounds(self, x - radius, y - radius, x + radius,
+                             y + radius);
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+mask_fill_polygon(PyObject *self, PyObject *args, PyObject *kwargs)
+{
+    bitmask_t *mask = pgMask_AsBitmap(self);
+    PyObject *points, *item;
+    double *coords, left, top, right, bottom;
+    Py_ssize_t length, loop;
+    int result, value = 1;
+    static char *keywords[] = {"points", "value", NULL};
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O|i", keywords, &points,
+                                     &value)) {
+        return NULL;
+    }
+
+    if (!PySequence_Check(points)) {
+        return RAISE(PyExc_TypeError,
+                     "points argument must be a sequence of number pairs");
+    }
+
+    length = PySequence_Length(points);
+
+    if (length < 3) {
+        return RAISE(PyExc_ValueError,
+                     "points argument must contain more than 2 points");
+    }
+
+    if (length > INT_MAX / 2 || !(coords = PyMem_New(double, 2 * length))) {
+        return RAISE(PyExc_MemoryError,
+                     "cannot allocate memory to fill polygon");
+    }
+
+    for (loop = 0; loop < length; ++loop) {
+        item = PySequence_GetItem(points, loop);
+        result = item && pg_TwoDoublesFromObj(item, &coords[2 * loop],
+                                              &coords[2 * loop + 1]);
+        Py_XDECREF(item);
+
+        if (!result) {
+            PyMem_Free(coords);
+            return RAISE(PyExc_TypeError, "points must be number pairs");
+        }
+    }
+
+    result = bitmask_fill_polygon(mask, coords, (int)length, value);
+
+    if (!result) {
+        left = right = coords[0];
+        top = bottom = coords[1];
+        for (loop = 1; loop < length; ++loop) {
+            left = MIN(left, coords[2 * loop]);
+            right = MAX(right, coords[2 * loop]);
+            top = MIN(top, coords[2 * loop + 1]);
+            bottom = MAX(bottom, coords[2 * loop + 1]);
+        }
+        mask_index_update_bounds(self, left, top, right, bottom);
+    }
+    PyMem_Free(coords);
+
+    if (result) {
+        return RAISE(PyExc_MemoryError,
+                     "cannot allocate memory to fill polygon");
+    }
+
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+mask_set_overlap_index(PyObject *self, PyObject *args, PyObject *kwargs)
+{
+    pgMaskObject *maskobj = (pgMaskObject *)self;
+    int enabled = 1;
+    static char *keywords[] = {"enabled", NULL};
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "|p", keywords, &enabled)) {
+        return NULL;
+    }
+
+    if (enabled && NULL == maskobj->index) {
+        maskobj->index = bitmask_index_create(maskobj->mask);
+
+        if (NULL == maskobj->index) {
+            return RAISE(PyExc_MemoryError,
+                         "cannot allocate memory for overlap index");
+        }
+    }
+    else if (!enabled && NULL != maskobj->index) {
+        bitmask_index_free(maskobj->index);
+        maskobj->index = NULL;
+    }
 
     Py_RETURN_NONE;
 }
 
+static PyObject *
+mask_get_overlap_index(PyObject *self, PyObject *_null)
+{
+    return PyBool_FromLong(NULL != ((pgMaskObject *)self)->index);
+}
+
 static PyObject *
 mask_count(PyObject *self, PyObject *_null)
 {
@@ -685,6 +1020,7 @@ mask_convolve(PyObject *aobj, PyObject *args, PyObject *kwargs)
     }
 
     bitmask_convolve(a, b, pgMask_AsBitmap(oobj), xoffset, yoffset);
+    mask_index_update_all(oobj);
 
     return oobj;
 }
@@ -760,12 +1096,14 @@ set_pixel_color(Uint8 *pixel, Uint8 bpp, Uint32 color)
 }
 
 /* For each surface pixel's alpha that is greater than the threshold,
- * the corresponding bitmask bit is set.
+ * the corresponding bitmask bit is set, for the rows y0 to y1 - 1.
  *
  * Params:
- *     surf: surface
+ *     surf: surface with an alpha channel
  *     bitmask: bitmask to alter
- *     threshold: threshold used check surface pixels (alpha) against
+ *     threshold: threshold used check surface pixels (alpha) against,
+ *         from 0 to 254
+ *     y0, y1: range of rows to set
  *
  * Returns:
  *     void
@@ -773,7 +1111,7 @@ set_pixel_color(Uint8 *pixel, Uint8 bpp, Uint32 color)
 static void
 set_from_threshold(SDL_Surface *surf, PG_PixelFormat *surf_format,
                    SDL_Palette *surf_palette, bitmask_t *bitmask,
-                   int threshold)
+                   int threshold, int y0, int y1)
 {
     /* This function expects surf to be non-zero sized. */
     const Uint8 bpp = PG_FORMAT_BytesPerPixel(surf_format);
@@ -781,21 +1119,12 @@ set_from_threshold(SDL_Surface *surf, PG_PixelFormat *surf_format,
     Uint8 *srcp;
     const int src_skip = surf->pitch - surf->w * bpp;
 
-    if (threshold >= 255) {
-        return;
-    }
-
-    if (threshold < 0 || !SDL_ISPIXELFORMAT_ALPHA(surf_format->format)) {
-        bitmask_fill(bitmask);
-        return;
-    }
-
     const Uint8 u_threshold = (Uint8)threshold;
 
     if (bpp < 3) {
         Uint8 r, g, b, a;
-        srcp = (Uint8 *)surf->pixels;
-        for (y = 0; y < surf->h; ++y) {
+        srcp = (Uint8 *)surf->pixels + y0 * surf->pitch;
+        for (y = y0; y < y1; ++y) {
             for (x = 0; x < surf->w; ++x, srcp += bpp) {
                 PG_GetRGBA(bpp == 1 ? *srcp : *((Uint16 *)srcp), surf_format,
                            surf_palette, &r, &g, &b, &a);
@@ -837,7 +1166,7 @@ set_from_threshold(SDL_Surface *surf, PG_PixelFormat *surf_format,
 
     BITMASK_W *bits = bitmask->bits;
 
-    for (y = 0; y < surf->h; y++) {
+    for (y = y0; y < y1; y++) {
         srcp = (Uint8 *)surf->pixels + y * surf->pitch + a_off;
         int block_idx = y;
         x = 0;
@@ -887,24 +1216,26 @@ set_from_threshold(SDL_Surface *surf, PG_PixelFormat *surf_format,
 }
 
 /* For each surface pixel's color that is not equal to the colorkey, the
- * corresponding bitmask bit is set.
+ * corresponding bitmask bit is set, for the rows y0 to y1 - 1.
  *
  * Params:
  *     surf: surface
  *     bitmask: bitmask to alter
  *     colorkey: color used to check surface pixels against
+ *     y0, y1: range of rows to set
  *
  * Returns:
  *     void
  */
 static void
-set_from_colorkey(SDL_Surface *surf, bitmask_t *bitmask, Uint32 colorkey)
+set_from_colorkey(SDL_Surface *surf, bitmask_t *bitmask, Uint32 colorkey,
+                  int y0, int y1)
 {
     Uint8 bpp = PG_SURF_BytesPerPixel(surf);
     Uint8 *pixel = NULL;
     int x, y;
 
-    for (y = 0; y < surf->h; ++y) {
+    for (y = y0; y < y1; ++y) {
         pixel = (Uint8 *)surf->pixels + y * surf->pitch;
 
         for (x = 0; x < surf->w; ++x, pixel += bpp) {
@@ -915,6 +1246,75 @@ set_from_colorkey(SDL_Surface *surf, bitmask_t *bitmask, Uint32 colorkey)
     }
 }
 
+/* Arguments shared by the bands of a mask filled from a surface */
+typedef struct {
+    bitmask_t *mask;
+    SDL_Surface *surf;
+    PG_PixelFormat *format;
+    SDL_Palette *palette;
+    SDL_Surface *surf2;
+    PG_PixelFormat *format2;
+    Uint32 color;
+    Uint32 threshold;
+    int palette_colors;
+} MaskFillJob;
+
+/* Band functions, each filling the rows of band number `band` out of
+ * `nbands` equal horizontal bands of the mask */
+
+static void
+threshold_band(void *data, int band, int nbands)
+{
+    MaskFillJob *job = (MaskFillJob *)data;
+    int y0 = job->surf->h * band / nbands;
+    int y1 = job->surf->h * (band + 1) / nbands;
+
+#if defined(__SSE2__) || defined(PG_ENABLE_ARM_NEON)
+    if (PG_FORMAT_BytesPerPixel(job->format) == 4 && pg_HasSSE_NEON()) {
+        mask_from_alpha_sse2(job->mask, job->surf, job->format->Ashift,
+                             (Uint8)job->threshold, y0, y1);
+        return;
+    }
+#endif /* defined(__SSE2__) || defined(PG_ENABLE_ARM_NEON) */
+    set_from_threshold(job->surf, job->format, job->palette, job->mask,
+                       (int)job->threshold, y0, y1);
+}
+
+static void
+colorkey_band(void *data, int band, int nbands)
+{
+    MaskFillJob *job = (MaskFillJob *)data;
+    int y0 = job->surf->h * band / nbands;
+    int y1 = job->surf->h * (band + 1) / nbands;
+
+#if defined(__SSE2__) || defined(PG_ENABLE_ARM_NEON)
+    if (PG_FORMAT_BytesPerPixel(job->format) == 4 && pg_HasSSE_NEON()) {
+        mask_from_colorkey_sse2(job->mask, job->surf, job->color, y0, y1);
+        return;
+    }
+#endif /* defined(__SSE2__) || defined(PG_ENABLE_ARM_NEON) */
+    set_from_colorkey(job->surf, job->mask, job->color, y0, y1);
+}
+
+/* Fills the mask of job with func, split between the threads set by
+ * pygame.surface.set_blit_threads() if it is large enough. The GIL is
+ * released while filling. */
+static void
+run_mask_fill(pg_BlitBandFunc func, MaskFillJob *job)
+{
+    int nbands = pgSurface_BlitBandCount(job->surf->w, job->surf->h);
+
+    if (nbands > 1) {
+        /* Releases the GIL itself */
+        pgSurface_RunBlitBands(func, job, nbands);
+        return;
+    }
+
+    Py_BEGIN_ALLOW_THREADS; /* Release the GIL. */
+    func(job, 0, 1);
+    Py_END_ALLOW_THREADS; /* Obtain the GIL. */
+}
+
 /* Creates a mask from a given surface.
  *
  * Returns:
@@ -965,19 +1365,24 @@ mask_from_surface(PyObject *self, PyObject *args, PyObject *kwargs)
         return RAISE(PyExc_RuntimeError, "cannot lock surface");
     }
 
-    Py_BEGIN_ALLOW_THREADS; /* Release the GIL. */
+    MaskFillJob job = {maskobj->mask, surf, surf_format, surf_palette};
 
     if (SDL_HasColorKey(surf)) {
         SDL_GetColorKey(surf, &colorkey);
-        set_from_colorkey(surf, maskobj->mask, colorkey);
+        job.color = colorkey;
+        run_mask_fill(colorkey_band, &job);
+    }
+    else if (threshold >= 255) {
+        /* No alpha is greater than the threshold */
+    }
+    else if (threshold < 0 || !SDL_ISPIXELFORMAT_ALPHA(surf_format->format)) {
+        bitmask_fill(maskobj->mask);
     }
     else {  // use threshold
-        set_from_threshold(surf, surf_format, surf_palette, maskobj->mask,
-                           threshold);
+        job.threshold = (Uint32)threshold;
+        run_mask_fill(threshold_band, &job);
     }
 
-    Py_END_ALLOW_THREADS; /* Obtain the GIL. */
-
     if (!pgSurface_Unlock(surfobj)) {
         Py_DECREF((PyObject *)maskobj);
         return RAISE(PyExc_RuntimeError, "cannot unlock surface");
@@ -986,6 +1391,152 @@ mask_from_surface(PyObject *self, PyObject *args, PyObject *kwargs)
     return (PyObject *)maskobj;
 }
 
+/* For each pixel in rect of surf that is not equal to the colorkey, or that
+ * has an alpha greater than the threshold if use_colorkey is 0, the
+ * corresponding bitmask bit is set.
+ *
+ * Params:
+ *     surf: surface
+ *     bitmask: bitmask to alter, the same size as surf
+ *     rect: area of surf, inside of it
+ *     use_colorkey: whether to compare pixels against colorkey or threshold
+ *     colorkey: color used to check surface pixels against
+ *     threshold: threshold used to check surface pixels (alpha) against
+ *
+ * Returns:
+ *     void
+ */
+static void
+set_from_surface_rect(SDL_Surface *surf, PG_PixelFormat *surf_format,
+                      SDL_Palette *surf_palette, bitmask_t *bitmask,
+                      const SDL_Rect *rect, int use_colorkey, Uint32 colorkey,
+                      Uint8 threshold)
+{
+    Uint8 bpp = PG_FORMAT_BytesPerPixel(surf_format);
+    Uint8 *pixel = NULL;
+    Uint8 r, g, b, a;
+    Uint32 color;
+    int x, y;
+
+    for (y = rect->y; y < rect->y + rect->h; ++y) {
+        pixel = (Uint8 *)surf->pixels + y * surf->pitch + rect->x * bpp;
+
+        for (x = rect->x; x < rect->x + rect->w; ++x, pixel += bpp) {
+            color = get_pixel_color(pixel, bpp);
+
+            if (use_colorkey) {
+                if (color != colorkey) {
+                    bitmask_setbit(bitmask, x, y);
+                }
+                continue;
+            }
+
+            PG_GetRGBA(color, surf_format, surf_palette, &r, &g, &b, &a);
+            if (a > threshold) {
+                bitmask_setbit(bitmask, x, y);
+            }
+        }
+    }
+}
+
+/* Updates an area of a mask from the same area of a surface, as
+ * from_surface() would set it. */
+static PyObject *
+mask_update_from_surface(PyObject *self, PyObject *args, PyObject *kwargs)
+{
+    bitmask_t *mask = pgMask_AsBitmap(self);
+    SDL_Surface *surf = NULL;
+    pgSurfaceObject *surfobj;
+    PyObject *rectobj = Py_None;
+    SDL_Rect temp_rect, area, *rect;
+    Uint32 colorkey = 0;
+    int use_colorkey;
+    int threshold = 127; /* default value */
+    static char *keywords[] = {"surface", "rect", "threshold", NULL};
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O!|Oi", keywords,
+                                     &pgSurface_Type, &surfobj, &rectobj,
+                                     &threshold)) {
+        return NULL; /* Exception already set. */
+    }
+
+    surf = pgSurface_AsSurface(surfobj);
+    SURF_INIT_CHECK(surf)
+
+    if (surf->w != mask->w || surf->h != mask->h) {
+        return RAISE(PyExc_ValueError,
+                     "surface must be the same size as the mask");
+    }
+
+    if (rectobj == Py_None) {
+        area.x = area.y = 0;
+        area.w = mask->w;
+        area.h = mask->h;
+    }
+    else {
+        if (!(rect = pgRect_FromObject(rectobj, &temp_rect))) {
+            return RAISE(PyExc_TypeError, "rect must be a rectstyle object");
+        }
+
+        area = *rect;
+        pgRect_Normalize(&area);
+
+        if (area.x < 0) {
+            area.w += area.x;
+            area.x = 0;
+        }
+        if (area.y < 0) {
+            area.h += area.y;
+            area.y = 0;
+        }
+
+        // clamp rect width and height to not stick out of the mask
+        area.w = MAX(MIN(area.w, mask->w - area.x), 0);
+        area.h = MAX(MIN(area.h, mask->h - area.y), 0);
+    }
+
+    if (area.w == 0 || area.h == 0) {
+        Py_RETURN_NONE;
+    }
+
+    PG_PixelFormat *surf_format;
+    SDL_Palette *surf_palette;
+
+    if (!PG_GetSurfaceDetails(surf, &surf_format, &surf_palette)) {
+        return RAISE(pgExc_SDLError, SDL_GetError());
+    }
+
+    use_colorkey = SDL_HasColorKey(surf);
+    if (use_colorkey) {
+        SDL_GetColorKey(surf, &colorkey);
+    }
+
+    bitmask_fill_rect(mask, area.x, area.y, area.w, area.h, 0);
+
+    if (use_colorkey || (threshold >= 0 && threshold < 255 &&
+                         SDL_ISPIXELFORMAT_ALPHA(surf_format->format))) {
+        if (!pgSurface_Lock(surfobj)) {
+            mask_index_update(self, area.x, area.y, area.w, area.h);
+            return RAISE(PyExc_RuntimeError, "cannot lock surface");
+        }
+
+        set_from_surface_rect(surf, surf_format, surf_palette, mask, &area,
+                              use_colorkey, colorkey, (Uint8)threshold);
+
+        if (!pgSurface_Unlock(surfobj)) {
+            mask_index_update(self, area.x, area.y, area.w, area.h);
+            return RAISE(PyExc_RuntimeError, "cannot unlock surface");
+        }
+    }
+    else if (threshold < 255) {
+        /* Every pixel's alpha is greater than the threshold */
+        bitmask_fill_rect(mask, area.x, area.y, area.w, area.h, 1);
+    }
+
+    mask_index_update(self, area.x, area.y, area.w, area.h);
+    Py_RETURN_NONE;
+}
+
 /*
 
 palette_colors - this only affects surfaces with a palette
@@ -999,7 +1550,7 @@ void
 bitmask_threshold(bitmask_t *m, SDL_Surface *surf, PG_PixelFormat *format,
                   SDL_Palette *palette, SDL_Surface *surf2,
                   PG_PixelFormat *format2, Uint32 color, Uint32 threshold,
-                  int palette_colors)
+                  int palette_colors, int y0, int y1)
 {
     int x, y, rshift, gshift, bshift, rshift2, gshift2, bshift2;
     int rloss, gloss, bloss, rloss2, gloss2, bloss2;
@@ -1045,7 +1596,7 @@ bitmask_threshold(bitmask_t *m, SDL_Surface *surf, PG_PixelFormat *format,
     PG_GetRGBA(color, format, palette, &r, &g, &b, &a);
     PG_GetRGBA(threshold, format, palette, &tr, &tg, &tb, &ta);
 
-    for (y = 0; y < surf->h; y++) {
+    for (y = y0; y < y1; y++) {
         pixels = (Uint8 *)surf->pixels + y * surf->pitch;
         if (surf2) {
             pixels2 = (Uint8 *)surf2->pixels + y * surf2->pitch;
@@ -1149,6 +1700,57 @@ bitmask_threshold(bitmask_t *m, SDL_Surface *surf, PG_PixelFormat *format,
     }
 }
 
+#if defined(__SSE2__) || defined(PG_ENABLE_ARM_NEON)
+/* Returns 1 if each of the R, G and B channels of a 32 bit format is a whole
+ * byte, so colors can be compared byte by byte */
+static int
+has_byte_channels(PG_PixelFormat *format)
+{
+    return PG_FORMAT_BytesPerPixel(format) == 4 &&
+           format->Rmask == (Uint32)0xFF << format->Rshift &&
+           format->Gmask == (Uint32)0xFF << format->Gshift &&
+           format->Bmask == (Uint32)0xFF << format->Bshift &&
+           !(format->Rshift & 7) && !(format->Gshift & 7) &&
+           !(format->Bshift & 7);
+}
+#endif /* defined(__SSE2__) || defined(PG_ENABLE_ARM_NEON) */
+
+static void
+color_threshold_band(void *data, int band, int nbands)
+{
+    MaskFillJob *job = (MaskFillJob *)data;
+    int y0 = job->surf->h * band / nbands;
+    int y1 = job->surf->h * (band + 1) / nbands;
+
+#if defined(__SSE2__) || defined(PG_ENABLE_ARM_NEON)
+    PG_PixelFormat *format = job->format;
+    Uint8 r, g, b, a, tr, tg, tb, ta;
+
+    if (has_byte_channels(format) &&
+        (!job->surf2 ||
+         (has_byte_channels(job->format2) &&
+          job->format2->Rmask == format->Rmask &&
+          job->format2->Gmask == format->Gmask &&
+          job->format2->Bmask == format->Bmask &&
+          job->surf2->w >= job->surf->w && job->surf2->h >= job->surf->h)) &&
+        pg_HasSSE_NEON()) {
+        PG_GetRGBA(job->color, format, job->palette, &r, &g, &b, &a);
+        PG_GetRGBA(job->threshold, format, job->palette, &tr, &tg, &tb, &ta);
+        mask_from_color_sse2(
+            job->mask, job->surf, job->surf2,
+            ((Uint32)r << format->Rshift) | ((Uint32)g << format->Gshift) |
+                ((Uint32)b << format->Bshift),
+            ((Uint32)tr << format->Rshift) | ((Uint32)tg << format->Gshift) |
+                ((Uint32)tb << format->Bshift),
+            format->Rmask | format->Gmask | format->Bmask, y0, y1);
+        return;
+    }
+#endif /* defined(__SSE2__) || defined(PG_ENABLE_ARM_NEON) */
+    bitmask_threshold(job->mask, job->surf, job->format, job->palette,
+                      job->surf2, job->format2, job->color, job->threshold,
+                      job->palette_colors, y0, y1);
+}
+
 static PyObject *
 mask_from_threshold(PyObject *self, PyObject *args, PyObject *kwargs)
 {
@@ -1217,10 +1819,10 @@ mask_from_threshold(PyObject *self, PyObject *args, PyObject *kwargs)
         pgSurface_Lock(surfobj2);
     }
 
-    Py_BEGIN_ALLOW_THREADS;
-    bitmask_threshold(maskobj->mask, surf, surf_format, surf_palette, surf2,
-                      surf2_format, color, color_threshold, palette_colors);
-    Py_END_ALLOW_THREADS;
+    MaskFillJob job = {
+        maskobj->mask, surf,  surf_format,     surf_palette,  surf2,
+        surf2_format,  color, color_threshold, palette_colors};
+    run_mask_fill(color_threshold_band, &job);
 
     pgSurface_Unlock(surfobj);
     if (surfobj2) {
@@ -2459,6 +3061,8 @@ static PyMethodDef mask_methods[] = {
      DOC_MASK_MASK_OVERLAP},
     {"overlap_area", (PyCFunction)mask_overlap_area,
      METH_VARARGS | METH_KEYWORDS, DOC_MASK_MASK_OVERLAPAREA},
+    {"overlap_many", (PyCFunction)mask_overlap_many,
+     METH_VARARGS | METH_KEYWORDS, DOC_MASK_MASK_OVERLAPMANY},
     {"overlap_mask", (PyCFunction)mask_overlap_mask,
      METH_VARARGS | METH_KEYWORDS, DOC_MASK_MASK_OVERLAPMASK},
     {"fill", mask_fill, METH_NOARGS, DOC_MASK_MASK_FILL},
@@ -2470,6 +3074,18 @@ static PyMethodDef mask_methods[] = {
      DOC_MASK_MASK_DRAW},
     {"erase", (PyCFunction)mask_erase, METH_VARARGS | METH_KEYWORDS,
      DOC_MASK_MASK_ERASE},
+    {"fill_rect", (PyCFunction)mask_fill_rect, METH_VARARGS | METH_KEYWORDS,
+     DOC_MASK_MASK_FILLRECT},
+    {"fill_circle", (PyCFunction)mask_fill_circle,
+     METH_VARARGS | METH_KEYWORDS, DOC_MASK_MASK_FILLCIRCLE},
+    {"fill_polygon", (PyCFunction)mask_fill_polygon,
+     METH_VARARGS | METH_KEYWORDS, DOC_MASK_MASK_FILLPOLYGON},
+    {"update_from_surface", (PyCFunction)mask_update_from_surface,
+     METH_VARARGS | METH_KEYWORDS, DOC_MASK_MASK_UPDATEFROMSURFACE},
+    {"set_overlap_index", (PyCFunction)mask_set_overlap_index,
+     METH_VARARGS | METH_KEYWORDS, DOC_MASK_MASK_SETOVERLAPINDEX},
+    {"get_overlap_index", mask_get_overlap_index, METH_NOARGS,
+     DOC_MASK_MASK_GETOVERLAPINDEX},
     {"count", mask_count, METH_NOARGS, DOC_MASK_MASK_COUNT},
     {"centroid", mask_centroid, METH_NOARGS, DOC_MASK_MASK_CENTROID},
     {"angle", mask_angle, METH_NOARGS, DOC_MASK_MASK_ANGLE},
@@ -2541,6 +3157,10 @@ mask_dealloc(PyObject *self)
         bitmask_free(bitmask);
     }
 
+    if (NULL != ((pgMaskObject *)self)->index) {
+        bitmask_index_free(((pgMaskObject *)self)->index);
+    }
+
     /* Free up the mask. */
     Py_TYPE(self)->tp_free(self);
 }
@@ -2562,6 +3182,7 @@ mask_new(PyTypeObject *subtype, PyObject *args, PyObject *kwargs)
     }
 
     maskobj->mask = NULL;
+    maskobj->index = NULL;
     return (PyObject *)maskobj;
 }
 
@@ -2603,6 +3224,12 @@ mask_init(PyObject *self, PyObject *args, PyObject *kwargs)
         bitmask_fill(bitmask);
     }
 
+    /* An index of a previous bitmask would no longer match */
+    if (NULL != ((pgMaskObject *)self)->index) {
+        bitmask_index_free(((pgMaskObject *)self)->index);
+        ((pgMaskObject *)self)->index = NULL;
+    }
+
     ((pgMaskObject *)self)->mask = bitmask;
     return 0;
 }
@@ -2668,6 +3295,8 @@ pgMask_ReleaseBuffer(pgMaskObject *self, Py_buffer *view)
     if (bufinfo->numbufs == 0) {
         PyMem_RawFree(bufinfo);
         self->bufdata = NULL;
+        /* The bits may have been changed through the buffer */
+        mask_index_update_all((PyObject *)self);
     }
 }
 
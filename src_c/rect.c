@@ -74,6 +74,7 @@ four_floats_from_obj(PyObject *obj, float *val1, float *val2, float *val3,
 #define RectExport_RectFromObjectAndKeyFunc pgRect_FromObjectAndKeyFunc
 #define RectExport_collideobjectsall pg_rect_collideobjectsall
 #define RectExport_collideobjects pg_rect_collideobjects
+#define RectExport_collidePairs pg_rect_collide_pairs
 #define RectExport_collidedict pg_rect_collidedict
 #define RectExport_collidedictall pg_rect_collidedictall
 #define RectExport_clip pg_rect_clip
@@ -194,6 +195,7 @@ four_floats_from_obj(PyObject *obj, float *val1, float *val2, float *val3,
 #define RectExport_RectFromObjectAndKeyFunc pgFRect_FromObjectAndKeyFunc
 #define RectExport_collideobjectsall pg_frect_collideobjectsall
 #define RectExport_collideobjects pg_frect_collideobjects
+#define RectExport_collidePairs pg_frect_collide_pairs
 #define RectExport_collidedict pg_frect_collidedict
 #define RectExport_collidedictall pg_frect_collidedictall
 #define RectExport_clip pg_frect_clip
@@ -509,6 +511,8 @@ static struct PyMethodDef pg_rect_methods[] = {
      METH_VARARGS | METH_KEYWORDS, DOC_RECT_COLLIDEOBJECTSALL},
     {"collideobjects", (PyCFunction)pg_rect_collideobjects,
      METH_VARARGS | METH_KEYWORDS, DOC_RECT_COLLIDEOBJECTS},
+    {"collide_pairs", (PyCFunction)pg_rect_collide_pairs,
+     METH_VARARGS | METH_KEYWORDS | METH_STATIC, DOC_RECT_COLLIDEPAIRS},
     {"contains", (PyCFunction)pg_rect_contains, METH_FASTCALL,
      DOC_RECT_CONTAINS},
     {"__reduce__", (PyCFunction)pg_rect_reduce, METH_NOARGS, NULL},
@@ -561,6 +565,8 @@ static struct PyMethodDef pg_frect_methods[] = {
      METH_VARARGS | METH_KEYWORDS, DOC_RECT_COLLIDEOBJECTSALL},
     {"collideobjects", (PyCFunction)pg_frect_collideobjects,
      METH_VARARGS | METH_KEYWORDS, DOC_RECT_COLLIDEOBJECTS},
+    {"collide_pairs", (PyCFunction)pg_frect_collide_pairs,
+     METH_VARARGS | METH_KEYWORDS | METH_STATIC, DOC_RECT_COLLIDEPAIRS},
     {"contains", (PyCFunction)pg_frect_contains, METH_FASTCALL,
      DOC_RECT_CONTAINS},
     {"__reduce__", (PyCFunction)pg_frect_reduce, METH_NOARGS, NULL},
@@ -107,6 +107,9 @@
 #ifndef RectExport_collideobjects
 #error RectExport_collideobjects needs to be defined
 #endif
+#ifndef RectExport_collidePairs
+#error RectExport_collidePairs needs to be defined
+#endif
 #ifndef RectExport_RectFromObjectAndKeyFunc
 #error RectExport_RectFromObjectAndKeyFunc needs to ne defined
 #endif
@@ -511,6 +514,8 @@ RectExport_collideobjectsall(RectObject *self, PyObject *args,
 static PyObject *
 RectExport_collideobjects(RectObject *self, PyObject *args, PyObject *kwargs);
 static PyObject *
+RectExport_collidePairs(PyObject *null, PyObject *args, PyObject *kwargs);
+static PyObject *
 RectExport_collidedict(RectObject *self, PyObject *args, PyObject *kwargs);
 static PyObject *
 RectExport_collidedictall(RectObject *self, PyObject *args, PyObject *kwargs);
@@ -1724,6 +1729,231 @@ RectExport_collideobjects(RectObject *self, PyObject *args, PyObject *kwargs)
     Py_RETURN_NONE;
 }
 
+#ifndef PG_RECT_SWEEP_HELPERS
+#define PG_RECT_SWEEP_HELPERS
+/* Shared by the Rect and FRect versions of collide_pairs(). Coordinates are
+ * stored as doubles, which represent both ints and floats exactly. */
+typedef struct {
+    double left, top, right, bottom;
+    Py_ssize_t index;
+    int set;
+} pg_SweepEntry;
+
+typedef struct {
+    Py_ssize_t a, b;
+} pg_SweepPair;
+
+static int
+_pg_sweep_entry_compare(const void *p1, const void *p2)
+{
+    const pg_SweepEntry *e1 = (const pg_SweepEntry *)p1;
+    const pg_SweepEntry *e2 = (const pg_SweepEntry *)p2;
+
+    if (e1->left != e2->left) {
+        return e1->left < e2->left ? -1 : 1;
+    }
+    /* keep the sort stable so the sweep is deterministic */
+    if (e1->set != e2->set) {
+        return e1->set - e2->set;
+    }
+    return (e1->index > e2->index) - (e1->index < e2->index);
+}
+
+static int
+_pg_sweep_pair_compare(const void *p1, const void *p2)
+{
+    const pg_SweepPair *a = (const pg_SweepPair *)p1;
+    const pg_SweepPair *b = (const pg_SweepPair *)p2;
+
+    if (a->a != b->a) {
+        return (a->a > b->a) - (a->a < b->a);
+    }
+    return (a->b > b->b) - (a->b < b->b);
+}
+
+/* Sweeps entries (sorted by left edge) and stores every overlapping pair of
+ * entries from different sets, or from the same set if single_set is true.
+ * Returns 0 and sets a MemoryError on failure. */
+static int
+_pg_sweep_pairs(pg_SweepEntry *entries, Py_ssize_t count, int single_set,
+                pg_SweepPair **pairs_out, Py_ssize_t *npairs_out)
+{
+    /* active[0] and active[1] hold the entries of each set that may still
+     * overlap entries further right. */
+    pg_SweepEntry **active[2] = {NULL, NULL};
+    Py_ssize_t nactive[2] = {0, 0};
+    pg_SweepPair *pairs = NULL, *newpairs;
+    Py_ssize_t npairs = 0, capacity = 0;
+    Py_ssize_t i, j, kept;
+    int own;
+
+    active[0] = PyMem_New(pg_SweepEntry *, count);
+    active[1] = single_set ? active[0] : PyMem_New(pg_SweepEntry *, count);
+    if (!active[0] || !active[1]) {
+        goto error;
+    }
+
+    for (i = 0; i < count; i++) {
+        pg_SweepEntry *cur = &entries[i];
+        int other = single_set ? 0 : !cur->set;
+        pg_SweepEntry **others = active[other];
+
+        kept = 0;
+        for (j = 0; j < nactive[other]; j++) {
+            pg_SweepEntry *cand = others[j];
+            if (cand->right <= cur->left) {
+                /* entries are sorted by left, so it is done for good */
+                continue;
+            }
+            others[kept++] = cand;
+            if (cand->top < cur->bottom && cand->bottom > cur->top) {
+                if (npairs == capacity) {
+                    capacity = capacity ? capacity * 2 : 64;
+                    newpairs = PyMem_Resize(pairs, pg_SweepPair, capacity);
+                    if (!newpairs) {
+                        goto error;
+                    }
+                    pairs = newpairs;
+                }
+                if (single_set) {
+                    pairs[npairs].a = MIN(cand->index, cur->index);
+                    pairs[npairs].b = MAX(cand->index, cur->index);
+                }
+                else if (cur->set == 0) {
+                    pairs[npairs].a = cur->index;
+                    pairs[npairs].b = cand->index;
+                }
+                else {
+                    pairs[npairs].a = cand->index;
+                    pairs[npairs].b = cur->index;
+                }
+                npairs++;
+            }
+        }
+        nactive[other] = kept;
+        own = single_set ? 0 : cur->set;
+        active[own][nactive[own]++] = cur;
+    }
+
+    if (!single_set) {
+        PyMem_Free(active[1]);
+    }
+    PyMem_Free(active[0]);
+
+    if (npairs > 1) {
+        qsort(pairs, npairs, sizeof(pg_SweepPair), _pg_sweep_pair_compare);
+    }
+    *pairs_out = pairs;
+    *npairs_out = npairs;
+    return 1;
+
+error:
+    if (active[1] != active[0]) {
+        PyMem_Free(active[1]);
+    }
+    PyMem_Free(active[0]);
+    PyMem_Free(pairs);
+    PyErr_NoMemory();
+    return 0;
+}
+#endif /* PG_RECT_SWEEP_HELPERS */
+
+static PyObject *
+RectExport_collidePairs(PyObject *null, PyObject *args, PyObject *kwargs)
+{
+    PyObject *first, *second = Py_None, *keyfunc = NULL;
+    PyObject *seqs[2] = {NULL, NULL}, *ret = NULL;
+    PyObject **items;
+    InnerRect *argrect, temp;
+    pg_SweepEntry *entries = NULL;
+    pg_SweepPair *pairs = NULL;
+    Py_ssize_t size, count = 0, npairs = 0, loop;
+    int single_set, set;
+    static char *keywords[] = {"rects_a", "rects_b", "key", NULL};
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O|O$O:collide_pairs",
+                                     keywords, &first, &second, &keyfunc)) {
+        return NULL;
+    }
+
+    if (keyfunc == Py_None) {
+        keyfunc = NULL;
+    }
+
+    if (keyfunc && !PyCallable_Check(keyfunc)) {
+        return RAISE(PyExc_TypeError,
+                     "Key function must be callable with one argument.");
+    }
+
+    single_set = second == Py_None;
+
+    if (!(seqs[0] = PySequence_Fast(
+              first, "Argument must be a sequence of rectstyle objects."))) {
+        return NULL;
+    }
+    size = PySequence_Fast_GET_SIZE(seqs[0]);
+    if (!single_set) {
+        if (!(seqs[1] = PySequence_Fast(
+                  second,
+                  "Argument must be a sequence of rectstyle objects."))) {
+            goto end;
+        }
+        size += PySequence_Fast_GET_SIZE(seqs[1]);
+    }
+
+    if (!(entries = PyMem_New(pg_SweepEntry, size ? size : 1))) {
+        PyErr_NoMemory();
+        goto end;
+    }
+
+    for (set = 0; set < 2 && seqs[set]; set++) {
+        items = PySequence_Fast_ITEMS(seqs[set]);
+        size = PySequence_Fast_GET_SIZE(seqs[set]);
+        for (loop = 0; loop < size; loop++) {
+            if (!(argrect = RectExport_RectFromObjectAndKeyFunc(
+                      items[loop], keyfunc, &temp))) {
+                goto end;
+            }
+            /* zero sized rects never collide, leave them out */
+            if (argrect->w == 0 || argrect->h == 0) {
+                continue;
+            }
+            entries[count].left = MIN(argrect->x, argrect->x + argrect->w);
+            entries[count].right = MAX(argrect->x, argrect->x + argrect->w);
+            entries[count].top = MIN(argrect->y, argrect->y + argrect->h);
+            entries[count].bottom = MAX(argrect->y, argrect->y + argrect->h);
+            entries[count].index = loop;
+            entries[count].set = set;
+            count++;
+        }
+    }
+
+    qsort(entries, count, sizeof(pg_SweepEntry), _pg_sweep_entry_compare);
+
+    if (!_pg_sweep_pairs(entries, count, single_set, &pairs, &npairs)) {
+        goto end;
+    }
+
+    if (!(ret = PyList_New(npairs))) {
+        goto end;
+    }
+    for (loop = 0; loop < npairs; loop++) {
+        PyObject *pair = Py_BuildValue("(nn)", pairs[loop].a, pairs[loop].b);
+        if (!pair) {
+            Py_CLEAR(ret);
+            goto end;
+        }
+        PyList_SET_ITEM(ret, loop, pair);
+    }
+
+end:
+    PyMem_Free(pairs);
+    PyMem_Free(entries);
+    Py_XDECREF(seqs[0]);
+    Py_XDECREF(seqs[1]);
+    return ret;
+}
+
 static PyObject *
 RectExport_collidedict(RectObject *self, PyObject *args, PyObject *kwargs)
 {
@@ -2962,6 +3192,7 @@ RectExport_iterator(RectObject *self)
 #undef RectExport_collidedictall
 #undef RectExport_collideobjectsall
 #undef RectExport_collideobjects
+#undef RectExport_collidePairs
 #undef RectExport_RectFromObjectAndKeyFunc
 #undef RectExport_pgTwoValuesFromFastcallArgs
 #undef RectExport_clip
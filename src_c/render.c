@@ -6,6 +6,31 @@
 
 #include "doc/sdl2_video_doc.h"
 
+/* Docs of what pygame._sdl2.video does not have */
+#define DOC_TEXTURE_DRAWMANY                                                  \
+    "draw_many(quads) -> None\ndraw many quads of the texture with a single " \
+    "call"
+#define DOC_TEXTUREATLAS                                       \
+    "TextureAtlas(renderer, size=(1024, 1024), padding=1) -> " \
+    "TextureAtlas\npack many Surfaces into a few Textures"
+#define DOC_TEXTUREATLAS_ADD \
+    "add(surface) -> Image\npack a Surface into the atlas"
+#define DOC_TEXTUREATLAS_ADDMANY                                            \
+    "add_many(surfaces) -> list[Image]\npack many Surfaces into the atlas " \
+    "at once"
+#define DOC_TEXTUREATLAS_CLEAR \
+    "clear() -> None\nforget every page and start packing again"
+#define DOC_TEXTUREATLAS_RENDERER \
+    "renderer -> Renderer\nthe Renderer the pages are made for"
+#define DOC_TEXTUREATLAS_SIZE "size -> (int, int)\nthe size of every page"
+#define DOC_TEXTUREATLAS_PADDING \
+    "padding -> int\nempty pixels kept between packed Surfaces"
+#define DOC_TEXTUREATLAS_PAGES \
+    "pages -> list[Texture]\nthe Textures the Surfaces are packed into"
+#define DOC_TEXTUREATLAS_EFFICIENCY                                     \
+    "efficiency -> float\nfraction of the page area covered by packed " \
+    "Surfaces"
+
 static PyTypeObject pgRenderer_Type;
 
 static PyTypeObject pgTexture_Type;
@@ -643,6 +668,7 @@ texture_renderer_draw(pgTextureObject *self, PyObject *area, PyObject *dest)
             }
             dstrect.w = (float)self->width;
             dstrect.h = (float)self->height;
+            dstrectptr = &dstrect;
         }
     }
     if (SDL_RenderCopyExF(self->renderer->renderer, self->texture, srcrectptr,
@@ -723,6 +749,7 @@ texture_draw(pgTextureObject *self, PyObject *args, PyObject *kwargs)
             }
             dstrect.w = (float)self->width;
             dstrect.h = (float)self->height;
+            dstrectptr = &dstrect;
         }
     }
     if (!Py_IsNone(originobj)) {
@@ -913,6 +940,155 @@ texture_draw_quad(pgTextureObject *self, PyObject *args, PyObject *kwargs)
 #endif
 }
 
+/* Each quad of a draw_many() buffer is 13 floats: the source rect, the
+ * destination rect, the angle and an RGBA color */
+#define TEXTURE_QUAD_FLOATS 13
+
+/* Quads are turned into vertices this many at a time */
+#define TEXTURE_QUAD_CHUNK 1024
+
+static PyObject *
+texture_draw_many(pgTextureObject *self, PyObject *arg)
+{
+#if SDL_VERSION_ATLEAST(2, 0, 18)
+    Py_buffer view;
+    const char *format;
+    const float *quad;
+    SDL_Vertex *vertices = NULL, *vertex;
+    int *indices = NULL;
+    Uint8 texture_mods[4];
+    float mods[4], color[4];
+    float hw, hh, cx, cy, c, s, u0, v0, u1, v1;
+    float corners[4][2];
+    Py_ssize_t count, start, i;
+    int j, chunk, res = 0;
+
+    if (PyObject_GetBuffer(arg, &view, PyBUF_FORMAT | PyBUF_C_CONTIGUOUS)) {
+        return NULL;
+    }
+    format = view.format ? view.format : "B";
+    if (*format == '@' || *format == '=' ||
+#if SDL_BYTEORDER == SDL_LIL_ENDIAN
+        *format == '<'
+#else
+        *format == '>' || *format == '!'
+#endif
+    ) {
+        format++;
+    }
+    if (strcmp(format, "f") != 0) {
+        PyErr_Format(PyExc_TypeError,
+                     "quads buffer must hold 32 bit floats, not format '%s'",
+                     view.format);
+        goto end;
+    }
+    if (view.len % (TEXTURE_QUAD_FLOATS * sizeof(float))) {
+        PyErr_SetString(PyExc_ValueError,
+                        "quads buffer must hold 13 floats per quad");
+        goto end;
+    }
+    count = view.len / (TEXTURE_QUAD_FLOATS * sizeof(float));
+    if (!count) {
+        goto end;
+    }
+
+    if (SDL_GetTextureColorMod(self->texture, &texture_mods[0],
+                               &texture_mods[1], &texture_mods[2]) < 0 ||
+        SDL_GetTextureAlphaMod(self->texture, &texture_mods[3]) < 0) {
+        PyErr_SetString(pgExc_SDLError, SDL_GetError());
+        goto end;
+    }
+    for (j = 0; j < 4; j++) {
+        mods[j] = texture_mods[j] / (float)255.0;
+    }
+
+    chunk = (int)MIN(count, TEXTURE_QUAD_CHUNK);
+    vertices = PyMem_New(SDL_Vertex, 4 * chunk);
+    indices = PyMem_New(int, 6 * chunk);
+    if (!vertices || !indices) {
+        PyErr_NoMemory();
+        goto end;
+    }
+    for (j = 0; j < chunk; j++) {
+        indices[6 * j] = 4 * j;
+        indices[6 * j + 1] = 4 * j + 1;
+        indices[6 * j + 2] = 4 * j + 2;
+        indices[6 * j + 3] = 4 * j + 2;
+        indices[6 * j + 4] = 4 * j + 3;
+        indices[6 * j + 5] = 4 * j;
+    }
+
+    quad = (const float *)view.buf;
+    for (start = 0; start < count; start += chunk) {
+        chunk = (int)MIN(count - start, TEXTURE_QUAD_CHUNK);
+        vertex = vertices;
+        for (i = 0; i < chunk; i++, quad += TEXTURE_QUAD_FLOATS) {
+            u0 = quad[0] / self->width;
+            v0 = quad[1] / self->height;
+            u1 = (quad[0] + quad[2]) / self->width;
+            v1 = (quad[1] + quad[3]) / self->height;
+
+            /* corners around the destination center, clockwise from the
+             * top left, turned clockwise by the angle like draw() does */
+            hw = quad[6] / 2;
+            hh = quad[7] / 2;
+            cx = quad[4] + hw;
+            cy = quad[5] + hh;
+            corners[0][0] = corners[3][0] = -hw;
+            corners[1][0] = corners[2][0] = hw;
+            corners[0][1] = corners[1][1] = -hh;
+            corners[2][1] = corners[3][1] = hh;
+            if (quad[8] != 0) {
+                c = SDL_cosf(quad[8] * (float)(M_PI / 180.0));
+                s = SDL_sinf(quad[8] * (float)(M_PI / 180.0));
+            }
+            else {
+                c = 1;
+                s = 0;
+            }
+            for (j = 0; j < 4; j++) {
+                vertex[j].position.x =
+                    cx + corners[j][0] * c - corners[j][1] * s;
+                vertex[j].position.y =
+                    cy + corners[j][0] * s + corners[j][1] * c;
+            }
+            vertex[0].tex_coord.x = vertex[3].tex_coord.x = u0;
+            vertex[1].tex_coord.x = vertex[2].tex_coord.x = u1;
+            vertex[0].tex_coord.y = vertex[1].tex_coord.y = v0;
+            vertex[2].tex_coord.y = vertex[3].tex_coord.y = v1;
+
+            for (j = 0; j < 4; j++) {
+                color[j] = MIN(MAX(quad[9 + j], 0), 255) * mods[j];
+            }
+            vertex[0].color.r = (Uint8)color[0];
+            vertex[0].color.g = (Uint8)color[1];
+            vertex[0].color.b = (Uint8)color[2];
+            vertex[0].color.a = (Uint8)color[3];
+            vertex[1].color = vertex[2].color = vertex[3].color =
+                vertex[0].color;
+            vertex += 4;
+        }
+        res = SDL_RenderGeometry(self->renderer->renderer, self->texture,
+                                 vertices, 4 * chunk, indices, 6 * chunk);
+        if (res < 0) {
+            PyErr_SetString(pgExc_SDLError, SDL_GetError());
+            break;
+        }
+    }
+
+end:
+    PyMem_Free(vertices);
+    PyMem_Free(indices);
+    PyBuffer_Release(&view);
+    if (PyErr_Occurred()) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+#else
+    return RAISE(PyExc_TypeError, "draw_many() requires SDL 2.0.18 or newer");
+#endif
+}
+
 static PyObject *
 texture_update(pgTextureObject *self, PyObject *args, PyObject *kwargs)
 {
@@ -1173,10 +1349,841 @@ texture_dealloc(pgTextureObject *self, PyObject *_null)
 }
 
 /* Image implementation */
+static pgImageObject *
+image_new(pgTextureObject *texture, SDL_Rect *srcrect,
+          SDL_BlendMode blend_mode)
+{
+    Uint8 white[4] = {255, 255, 255, 255};
+    pgImageObject *image =
+        (pgImageObject *)pgImage_Type.tp_alloc(&pgImage_Type, 0);
+    if (!image) {
+        return NULL;
+    }
+    image->srcrect = (pgRectObject *)pgRect_New(srcrect);
+    image->color = (pgColorObject *)pgColor_NewLength(white, 4);
+    if (!image->srcrect || !image->color) {
+        Py_DECREF(image);
+        return NULL;
+    }
+    image->texture = (pgTextureObject *)Py_NewRef(texture);
+    image->alpha = 255;
+    image->blend_mode = blend_mode;
+    return image;
+}
+
+static int
+image_init(pgImageObject *self, PyObject *args, PyObject *kwargs)
+{
+    PyObject *sourceobj, *srcrectobj = Py_None;
+    pgTextureObject *texture;
+    SDL_Rect base, temp, *rectptr;
+    SDL_BlendMode blend_mode;
+    Uint8 white[4] = {255, 255, 255, 255};
+    static char *keywords[] = {"texture_or_image", "srcrect", NULL};
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O|O", keywords, &sourceobj,
+                                     &srcrectobj)) {
+        return -1;
+    }
+    if (pgImage_Check(sourceobj)) {
+        pgImageObject *image = (pgImageObject *)sourceobj;
+        texture = image->texture;
+        base = image->srcrect->r;
+        blend_mode = image->blend_mode;
+    }
+    else if (pgTexture_Check(sourceobj)) {
+        texture = (pgTextureObject *)sourceobj;
+        base.x = base.y = 0;
+        base.w = texture->width;
+        base.h = texture->height;
+        if (SDL_GetTextureBlendMode(texture->texture, &blend_mode) < 0) {
+            RAISERETURN(pgExc_SDLError, SDL_GetError(), -1)
+        }
+    }
+    else {
+        RAISERETURN(PyExc_TypeError,
+                    "texture_or_image must be a Texture or an Image", -1)
+    }
+
+    if (!Py_IsNone(srcrectobj)) {
+        if (!(rectptr = pgRect_FromObject(srcrectobj, &temp))) {
+            RAISERETURN(PyExc_TypeError, "srcrect must be None or a rectangle",
+                        -1)
+        }
+        if (rectptr->x < 0 || rectptr->y < 0 || rectptr->w < 0 ||
+            rectptr->h < 0 || rectptr->x + rectptr->w > base.w ||
+            rectptr->y + rectptr->h > base.h) {
+            RAISERETURN(PyExc_ValueError, "rect values are out of range", -1)
+        }
+        temp.x = base.x + rectptr->x;
+        temp.y = base.y + rectptr->y;
+        temp.w = rectptr->w;
+        temp.h = rectptr->h;
+        base = temp;
+    }
+
+    Py_XSETREF(self->srcrect, (pgRectObject *)pgRect_New(&base));
+    Py_XSETREF(self->color, (pgColorObject *)pgColor_NewLength(white, 4));
+    if (!self->srcrect || !self->color) {
+        return -1;
+    }
+    Py_XSETREF(self->texture, (pgTextureObject *)Py_NewRef(texture));
+    self->angle = 0;
+    self->alpha = 255;
+    self->has_origin = SDL_FALSE;
+    self->flip_x = SDL_FALSE;
+    self->flip_y = SDL_FALSE;
+    self->blend_mode = blend_mode;
+    return 0;
+}
+
+static void
+image_dealloc(pgImageObject *self, PyObject *_null)
+{
+    Py_XDECREF(self->texture);
+    Py_XDECREF(self->srcrect);
+    Py_XDECREF(self->color);
+    Py_TYPE(self)->tp_free(self);
+}
+
+/* Draws the Image, area is relative to the Image's srcrect */
 static int
 image_renderer_draw(pgImageObject *self, PyObject *area, PyObject *dest)
 {
-    return 1;
+    SDL_Rect srcrect, temp, *rectptr;
+    SDL_FRect dstrect, *dstrectptr = NULL;
+    SDL_RendererFlip flip = SDL_FLIP_NONE;
+    SDL_Texture *texture;
+    SDL_BlendMode old_blend_mode;
+    Uint8 *rgba, old_r, old_g, old_b, old_alpha;
+    int ok;
+
+    if (!self->texture) {
+        PyErr_SetString(pgExc_SDLError, "Image is not initialized");
+        return 0;
+    }
+    texture = self->texture->texture;
+    rgba = pgColor_AsArray(self->color);
+    srcrect = self->srcrect->r;
+    if (!Py_IsNone(area)) {
+        if (!(rectptr = pgRect_FromObject(area, &temp))) {
+            PyErr_SetString(PyExc_ValueError,
+                            "srcrect must be a Rect or None");
+            return 0;
+        }
+        temp.x = srcrect.x + rectptr->x;
+        temp.y = srcrect.y + rectptr->y;
+        temp.w = rectptr->w;
+        temp.h = rectptr->h;
+        /* keep to the Image's region, which may be part of an atlas, as SDL
+         * keeps to the texture */
+        if (!SDL_IntersectRect(&self->srcrect->r, &temp, &srcrect)) {
+            return 1;
+        }
+    }
+    if (!Py_IsNone(dest)) {
+        if (!(dstrectptr = pgFRect_FromObject(dest, &dstrect))) {
+            if (!pg_TwoFloatsFromObj(dest, &dstrect.x, &dstrect.y)) {
+                PyErr_SetString(PyExc_ValueError,
+                                "dstrect must be a point, Rect, or None");
+                return 0;
+            }
+            dstrect.w = (float)srcrect.w;
+            dstrect.h = (float)srcrect.h;
+            dstrectptr = &dstrect;
+        }
+    }
+    if (self->flip_x) {
+        flip |= SDL_FLIP_HORIZONTAL;
+    }
+    if (self->flip_y) {
+        flip |= SDL_FLIP_VERTICAL;
+    }
+
+    /* the texture is shared by every Image made from it and by its own
+     * Texture, so its modifiers are set for this draw only */
+    if (SDL_GetTextureColorMod(texture, &old_r, &old_g, &old_b) < 0 ||
+        SDL_GetTextureAlphaMod(texture, &old_alpha) < 0 ||
+        SDL_GetTextureBlendMode(texture, &old_blend_mode) < 0) {
+        PyErr_SetString(pgExc_SDLError, SDL_GetError());
+        return 0;
+    }
+    ok = SDL_SetTextureColorMod(texture, rgba[0], rgba[1], rgba[2]) == 0 &&
+         SDL_SetTextureAlphaMod(texture, (Uint8)self->alpha) == 0 &&
+         SDL_SetTextureBlendMode(texture, self->blend_mode) == 0 &&
+         SDL_RenderCopyExF(self->texture->renderer->renderer, texture,
+                           &srcrect, dstrectptr, self->angle,
+                           self->has_origin ? &self->origin : NULL, flip) == 0;
+    if (!ok) {
+        PyErr_SetString(pgExc_SDLError, SDL_GetError());
+    }
+    SDL_SetTextureColorMod(texture, old_r, old_g, old_b);
+    SDL_SetTextureAlphaMod(texture, old_alpha);
+    SDL_SetTextureBlendMode(texture, old_blend_mode);
+    return ok;
+}
+
+static PyObject *
+image_draw(pgImageObject *self, PyObject *args, PyObject *kwargs)
+{
+    PyObject *srcrectobj = Py_None, *dstrectobj = Py_None;
+    static char *keywords[] = {"srcrect", "dstrect", NULL};
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "|OO", keywords,
+                                     &srcrectobj, &dstrectobj)) {
+        return NULL;
+    }
+    if (!image_renderer_draw(self, srcrectobj, dstrectobj)) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+image_get_rect(pgImageObject *self, PyObject *const *args, Py_ssize_t nargs,
+               PyObject *kwargs)
+{
+    PyObject *rect = pgRect_New(&self->srcrect->r);
+    return pgObject_getRectHelper(rect, args, nargs, kwargs, "rect");
+}
+
+static PyObject *
+image_get_angle(pgImageObject *self, void *closure)
+{
+    return PyFloat_FromDouble(self->angle);
+}
+
+static int
+image_set_angle(pgImageObject *self, PyObject *arg, void *closure)
+{
+    double angle = PyFloat_AsDouble(arg);
+    if (angle == -1.0 && PyErr_Occurred()) {
+        return -1;
+    }
+    self->angle = (float)angle;
+    return 0;
+}
+
+static PyObject *
+image_get_flip_x(pgImageObject *self, void *closure)
+{
+    return PyBool_FromLong(self->flip_x);
+}
+
+static int
+image_set_flip_x(pgImageObject *self, PyObject *arg, void *closure)
+{
+    int flip = PyObject_IsTrue(arg);
+    if (flip == -1) {
+        return -1;
+    }
+    self->flip_x = flip ? SDL_TRUE : SDL_FALSE;
+    return 0;
+}
+
+static PyObject *
+image_get_flip_y(pgImageObject *self, void *closure)
+{
+    return PyBool_FromLong(self->flip_y);
+}
+
+static int
+image_set_flip_y(pgImageObject *self, PyObject *arg, void *closure)
+{
+    int flip = PyObject_IsTrue(arg);
+    if (flip == -1) {
+        return -1;
+    }
+    self->flip_y = flip ? SDL_TRUE : SDL_FALSE;
+    return 0;
+}
+
+static PyObject *
+image_get_color(pgImageObject *self, void *closure)
+{
+    return Py_NewRef(self->color);
+}
+
+static int
+image_set_color(pgImageObject *self, PyObject *arg, void *closure)
+{
+    Uint8 rgba[4];
+    if (!pg_RGBAFromObjEx(arg, rgba, PG_COLOR_HANDLE_ALL)) {
+        return -1;
+    }
+    memcpy(pgColor_AsArray(self->color), rgba, 3);
+    return 0;
+}
+
+static PyObject *
+image_get_alpha(pgImageObject *self, void *closure)
+{
+    return PyFloat_FromDouble(self->alpha);
+}
+
+static int
+image_set_alpha(pgImageObject *self, PyObject *arg, void *closure)
+{
+    double alpha = PyFloat_AsDouble(arg);
+    if (alpha == -1.0 && PyErr_Occurred()) {
+        return -1;
+    }
+    self->alpha = (float)alpha;
+    return 0;
+}
+
+static PyObject *
+image_get_blend_mode(pgImageObject *self, void *closure)
+{
+    return PyLong_FromLong((long)self->blend_mode);
+}
+
+static int
+image_set_blend_mode(pgImageObject *self, PyObject *arg, void *closure)
+{
+    long longval = PyLong_AsLong(arg);
+    if (longval == -1 && PyErr_Occurred()) {
+        return -1;
+    }
+    self->blend_mode = (SDL_BlendMode)longval;
+    return 0;
+}
+
+static PyObject *
+image_get_texture(pgImageObject *self, void *closure)
+{
+    return Py_NewRef(self->texture);
+}
+
+static int
+image_set_texture(pgImageObject *self, PyObject *arg, void *closure)
+{
+    if (!pgTexture_Check(arg)) {
+        RAISERETURN(PyExc_TypeError, "texture must be a Texture", -1)
+    }
+    Py_XSETREF(self->texture, (pgTextureObject *)Py_NewRef(arg));
+    return 0;
+}
+
+static PyObject *
+image_get_srcrect(pgImageObject *self, void *closure)
+{
+    return Py_NewRef(self->srcrect);
+}
+
+static int
+image_set_srcrect(pgImageObject *self, PyObject *arg, void *closure)
+{
+    SDL_Rect temp, *rectptr;
+    PyObject *rect;
+    if (!(rectptr = pgRect_FromObject(arg, &temp))) {
+        RAISERETURN(PyExc_TypeError, "srcrect must be a rectangle", -1)
+    }
+    if (!(rect = pgRect_New(rectptr))) {
+        return -1;
+    }
+    Py_XSETREF(self->srcrect, (pgRectObject *)rect);
+    return 0;
+}
+
+static PyObject *
+image_get_origin(pgImageObject *self, void *closure)
+{
+    if (!self->has_origin) {
+        Py_RETURN_NONE;
+    }
+    return Py_BuildValue("(ff)", self->origin.x, self->origin.y);
+}
+
+static int
+image_set_origin(pgImageObject *self, PyObject *arg, void *closure)
+{
+    if (Py_IsNone(arg)) {
+        self->has_origin = SDL_FALSE;
+        return 0;
+    }
+    if (!pg_TwoFloatsFromObj(arg, &self->origin.x, &self->origin.y)) {
+        RAISERETURN(PyExc_TypeError, "origin must be a point or None", -1)
+    }
+    self->has_origin = SDL_TRUE;
+    return 0;
+}
+
+/* TextureAtlas implementation */
+
+/* Every page keeps a skyline: the top edge of the area packed so far, as
+ * horizontal segments ordered by x that cover the whole page width. A new
+ * rect is put at the lowest place on the skyline where it fits. */
+typedef struct {
+    int x, y, w;
+} pgSkylineNode;
+
+typedef struct {
+    pgSkylineNode *nodes;
+    int count;
+    int capacity;
+} pgAtlasPage;
+
+typedef struct {
+    PyObject_HEAD pgRendererObject *renderer;
+    PyObject *pages; /* list of the Texture of each page */
+    pgAtlasPage *skylines;
+    int npages;
+    int width;
+    int height;
+    int padding;
+    Py_ssize_t nregions;
+    long long used_area;
+} pgTextureAtlasObject;
+
+static PyTypeObject pgTextureAtlas_Type;
+
+/* Returns the y where a rect of the given size fits when its left edge is
+ * at the node at index, or -1 if it does not fit there */
+static int
+atlas_skyline_fit(pgTextureAtlasObject *self, pgAtlasPage *page, int index,
+                  int w, int h)
+{
+    pgSkylineNode *nodes = page->nodes;
+    int x = nodes[index].x, y = 0, remaining;
+
+    if (x + w > self->width) {
+        return -1;
+    }
+    /* the padding after the rect is only kept if there is room for it */
+    remaining = MIN(w + self->padding, self->width - x);
+    while (remaining > 0) {
+        y = MAX(y, nodes[index].y);
+        if (y + h > self->height) {
+            return -1;
+        }
+        remaining -= nodes[index].w;
+        index++;
+    }
+    return y;
+}
+
+/* Finds the lowest place for a rect on a page, returns the node index or -1
+ * when the page is full */
+static int
+atlas_skyline_find(pgTextureAtlasObject *self, pgAtlasPage *page, int w, int h,
+                   SDL_Rect *rect)
+{
+    int i, y, best = -1, best_bottom = INT_MAX, best_width = INT_MAX;
+
+    for (i = 0; i < page->count; i++) {
+        y = atlas_skyline_fit(self, page, i, w, h);
+        if (y < 0) {
+            continue;
+        }
+        if (y + h < best_bottom ||
+            (y + h == best_bottom && page->nodes[i].w < best_width)) {
+            best = i;
+            best_bottom = y + h;
+            best_width = page->nodes[i].w;
+            rect->x = page->nodes[i].x;
+            rect->y = y;
+        }
+    }
+    rect->w = w;
+    rect->h = h;
+    return best;
+}
+
+/* Raises the skyline over a rect placed at the node at index */
+static int
+atlas_skyline_add(pgTextureAtlasObject *self, pgAtlasPage *page, int index,
+                  SDL_Rect *rect)
+{
+    pgSkylineNode *nodes;
+    int i, shrink;
+
+    if (page->count == page->capacity) {
+        int capacity = page->capacity * 2;
+        nodes = PyMem_Realloc(page->nodes, capacity * sizeof(pgSkylineNode));
+        if (!nodes) {
+            PyErr_NoMemory();
+            return -1;
+        }
+        page->nodes = nodes;
+        page->capacity = capacity;
+    }
+    nodes = page->nodes;
+
+    memmove(nodes + index + 1, nodes + index,
+            (page->count - index) * sizeof(pgSkylineNode));
+    page->count++;
+    nodes[index].x = rect->x;
+    nodes[index].y = MIN(rect->y + rect->h + self->padding, self->height);
+    nodes[index].w = MIN(rect->w + self->padding, self->width - rect->x);
+
+    /* cut the nodes that are now under the new one */
+    i = index + 1;
+    while (i < page->count) {
+        shrink = nodes[i - 1].x + nodes[i - 1].w - nodes[i].x;
+        if (shrink <= 0) {
+            break;
+        }
+        nodes[i].x += shrink;
+        nodes[i].w -= shrink;
+        if (nodes[i].w > 0) {
+            break;
+        }
+        memmove(nodes + i, nodes + i + 1,
+                (page->count - i - 1) * sizeof(pgSkylineNode));
+        page->count--;
+    }
+
+    /* merge neighbours at the same height */
+    for (i = 0; i + 1 < page->count;) {
+        if (nodes[i].y == nodes[i + 1].y) {
+            nodes[i].w += nodes[i + 1].w;
+            memmove(nodes + i + 1, nodes + i + 2,
+                    (page->count - i - 2) * sizeof(pgSkylineNode));
+            page->count--;
+        }
+        else {
+            i++;
+        }
+    }
+    return 0;
+}
+
+static int
+atlas_add_page(pgTextureAtlasObject *self)
+{
+    pgAtlasPage *skylines, *page;
+    pgTextureObject *texture;
+    SDL_Texture *sdl_texture;
+    void *pixels;
+    int res;
+
+    skylines = PyMem_Realloc(self->skylines,
+                             (self->npages + 1) * sizeof(pgAtlasPage));
+    if (!skylines) {
+        PyErr_NoMemory();
+        return -1;
+    }
+    self->skylines = skylines;
+    page = skylines + self->npages;
+    page->capacity = 16;
+    page->count = 1;
+    page->nodes = PyMem_New(pgSkylineNode, page->capacity);
+    if (!page->nodes) {
+        PyErr_NoMemory();
+        return -1;
+    }
+    page->nodes[0].x = 0;
+    page->nodes[0].y = 0;
+    page->nodes[0].w = self->width;
+
+    sdl_texture =
+        SDL_CreateTexture(self->renderer->renderer, SDL_PIXELFORMAT_ARGB8888,
+                          SDL_TEXTUREACCESS_STATIC, self->width, self->height);
+    if (!sdl_texture) {
+        PyMem_Free(page->nodes);
+        RAISERETURN(pgExc_SDLError, SDL_GetError(), -1)
+    }
+    /* start fully transparent, so the padding never shows anything */
+    pixels = PyMem_Calloc((size_t)self->width * self->height, 4);
+    if (!pixels) {
+        SDL_DestroyTexture(sdl_texture);
+        PyMem_Free(page->nodes);
+        PyErr_NoMemory();
+        return -1;
+    }
+    res = SDL_UpdateTexture(sdl_texture, NULL, pixels, self->width * 4);
+    PyMem_Free(pixels);
+    if (res < 0 ||
+        SDL_SetTextureBlendMode(sdl_texture, SDL_BLENDMODE_BLEND) < 0) {
+        SDL_DestroyTexture(sdl_texture);
+        PyMem_Free(page->nodes);
+        RAISERETURN(pgExc_SDLError, SDL_GetError(), -1)
+    }
+
+    texture = (pgTextureObject *)pgTexture_Type.tp_alloc(&pgTexture_Type, 0);
+    if (!texture) {
+        SDL_DestroyTexture(sdl_texture);
+        PyMem_Free(page->nodes);
+        return -1;
+    }
+    texture->texture = sdl_texture;
+    texture->renderer = (pgRendererObject *)Py_NewRef(self->renderer);
+    texture->width = self->width;
+    texture->height = self->height;
+    texture->weakreflist = NULL;
+
+    res = PyList_Append(self->pages, (PyObject *)texture);
+    Py_DECREF(texture);
+    if (res < 0) {
+        PyMem_Free(page->nodes);
+        return -1;
+    }
+    self->npages++;
+    return 0;
+}
+
+/* Packs a surface into the atlas and uploads it to its page */
+static PyObject *
+atlas_insert(pgTextureAtlasObject *self, SDL_Surface *surf)
+{
+    SDL_Surface *converted;
+    SDL_Rect rect;
+    pgAtlasPage *page = NULL;
+    int i, index = -1, res;
+
+    if (surf->w > self->width || surf->h > self->height) {
+        return RAISE(PyExc_ValueError,
+                     "surface does not fit in the atlas pages");
+    }
+
+    for (i = 0; i < self->npages; i++) {
+        page = self->skylines + i;
+        index = atlas_skyline_find(self, page, surf->w, surf->h, &rect);
+        if (index >= 0) {
+            break;
+        }
+    }
+    if (index < 0) {
+        if (atlas_add_page(self) < 0) {
+            return NULL;
+        }
+        i = self->npages - 1;
+        page = self->skylines + i;
+        index = atlas_skyline_find(self, page, surf->w, surf->h, &rect);
+    }
+
+    if (surf->w && surf->h) {
+        converted =
+            SDL_ConvertSurfaceFormat(surf, SDL_PIXELFORMAT_ARGB8888, 0);
+        if (!converted) {
+            return RAISE(pgExc_SDLError, SDL_GetError());
+        }
+        res = SDL_UpdateTexture(
+            ((pgTextureObject *)PyList_GET_ITEM(self->pages, i))->texture,
+            &rect, converted->pixels, converted->pitch);
+        SDL_FreeSurface(converted);
+        if (res < 0) {
+            return RAISE(pgExc_SDLError, SDL_GetError());
+        }
+        if (atlas_skyline_add(self, page, index, &rect) < 0) {
+            return NULL;
+        }
+    }
+
+    self->nregions++;
+    self->used_area += (long long)surf->w * surf->h;
+    return (PyObject *)image_new(
+        (pgTextureObject *)PyList_GET_ITEM(self->pages, i), &rect,
+        SDL_BLENDMODE_BLEND);
+}
+
+static PyObject *
+atlas_add(pgTextureAtlasObject *self, PyObject *arg)
+{
+    SDL_Surface *surf;
+
+    if (!pgSurface_Check(arg)) {
+        return RAISE(PyExc_TypeError, "surface must be a Surface");
+    }
+    surf = pgSurface_AsSurface(arg);
+    SURF_INIT_CHECK(surf)
+    return atlas_insert(self, surf);
+}
+
+typedef struct {
+    Py_ssize_t index;
+    int w, h;
+} pgAtlasItem;
+
+/* taller surfaces first, then wider ones */
+static int
+atlas_item_compare(const void *a, const void *b)
+{
+    const pgAtlasItem *item_a = (const pgAtlasItem *)a;
+    const pgAtlasItem *item_b = (const pgAtlasItem *)b;
+    if (item_a->h != item_b->h) {
+        return item_b->h - item_a->h;
+    }
+    if (item_a->w != item_b->w) {
+        return item_b->w - item_a->w;
+    }
+    return (item_a->index > item_b->index) - (item_a->index < item_b->index);
+}
+
+static PyObject *
+atlas_add_many(pgTextureAtlasObject *self, PyObject *arg)
+{
+    PyObject *seq, *ret = NULL, *image;
+    PyObject **items;
+    pgAtlasItem *order;
+    SDL_Surface *surf;
+    Py_ssize_t i, count;
+
+    seq = PySequence_Fast(arg, "surfaces must be a sequence of Surface");
+    if (!seq) {
+        return NULL;
+    }
+    count = PySequence_Fast_GET_SIZE(seq);
+    items = PySequence_Fast_ITEMS(seq);
+    order = PyMem_New(pgAtlasItem, count ? count : 1);
+    if (!order) {
+        Py_DECREF(seq);
+        return PyErr_NoMemory();
+    }
+
+    /* check every surface before packing any of them */
+    for (i = 0; i < count; i++) {
+        if (!pgSurface_Check(items[i])) {
+            PyErr_SetString(PyExc_TypeError,
+                            "surfaces must be a sequence of Surface");
+            goto end;
+        }
+        surf = pgSurface_AsSurface(items[i]);
+        if (!surf) {
+            PyErr_SetString(pgExc_SDLError, "display Surface quit");
+            goto end;
+        }
+        if (surf->w > self->width || surf->h > self->height) {
+            PyErr_SetString(PyExc_ValueError,
+                            "surface does not fit in the atlas pages");
+            goto end;
+        }
+        order[i].index = i;
+        order[i].w = surf->w;
+        order[i].h = surf->h;
+    }
+
+    /* packing the biggest surfaces first wastes less space */
+    qsort(order, count, sizeof(pgAtlasItem), atlas_item_compare);
+
+    ret = PyList_New(count);
+    if (!ret) {
+        goto end;
+    }
+    for (i = 0; i < count; i++) {
+        image = atlas_insert(self, pgSurface_AsSurface(items[order[i].index]));
+        if (!image) {
+            Py_CLEAR(ret);
+            goto end;
+        }
+        PyList_SET_ITEM(ret, order[i].index, image);
+    }
+
+end:
+    PyMem_Free(order);
+    Py_DECREF(seq);
+    return ret;
+}
+
+static void
+atlas_free_pages(pgTextureAtlasObject *self)
+{
+    int i;
+    for (i = 0; i < self->npages; i++) {
+        PyMem_Free(self->skylines[i].nodes);
+    }
+    PyMem_Free(self->skylines);
+    self->skylines = NULL;
+    self->npages = 0;
+    self->nregions = 0;
+    self->used_area = 0;
+}
+
+static PyObject *
+atlas_clear(pgTextureAtlasObject *self, PyObject *_null)
+{
+    PyObject *pages = PyList_New(0);
+    if (!pages) {
+        return NULL;
+    }
+    Py_XSETREF(self->pages, pages);
+    atlas_free_pages(self);
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+atlas_get_pages(pgTextureAtlasObject *self, void *closure)
+{
+    return PyList_GetSlice(self->pages, 0, self->npages);
+}
+
+static PyObject *
+atlas_get_renderer(pgTextureAtlasObject *self, void *closure)
+{
+    return Py_NewRef(self->renderer);
+}
+
+static PyObject *
+atlas_get_size(pgTextureAtlasObject *self, void *closure)
+{
+    return Py_BuildValue("(ii)", self->width, self->height);
+}
+
+static PyObject *
+atlas_get_padding(pgTextureAtlasObject *self, void *closure)
+{
+    return PyLong_FromLong(self->padding);
+}
+
+static PyObject *
+atlas_get_efficiency(pgTextureAtlasObject *self, void *closure)
+{
+    if (!self->npages) {
+        return PyFloat_FromDouble(0.0);
+    }
+    return PyFloat_FromDouble(
+        (double)self->used_area /
+        ((double)self->width * self->height * self->npages));
+}
+
+static Py_ssize_t
+atlas_len(pgTextureAtlasObject *self)
+{
+    return self->nregions;
+}
+
+static int
+atlas_init(pgTextureAtlasObject *self, PyObject *args, PyObject *kwargs)
+{
+    PyObject *renderer, *sizeobj = NULL, *pages;
+    int width = 1024, height = 1024, padding = 1;
+    static char *keywords[] = {"renderer", "size", "padding", NULL};
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "O!|Oi", keywords,
+                                     &pgRenderer_Type, &renderer, &sizeobj,
+                                     &padding)) {
+        return -1;
+    }
+    if (sizeobj && !pg_TwoIntsFromObj(sizeobj, &width, &height)) {
+        RAISERETURN(PyExc_TypeError, "invalid size argument", -1)
+    }
+    if (width <= 0 || height <= 0) {
+        RAISERETURN(PyExc_ValueError, "size must contain two positive values",
+                    -1)
+    }
+    if (padding < 0) {
+        RAISERETURN(PyExc_ValueError, "padding must not be negative", -1)
+    }
+    if (!(pages = PyList_New(0))) {
+        return -1;
+    }
+
+    atlas_free_pages(self);
+    Py_XSETREF(self->pages, pages);
+    Py_XSETREF(self->renderer, (pgRendererObject *)Py_NewRef(renderer));
+    self->width = width;
+    self->height = height;
+    self->padding = padding;
+    return 0;
+}
+
+static void
+atlas_dealloc(pgTextureAtlasObject *self, PyObject *_null)
+{
+    atlas_free_pages(self);
+    Py_XDECREF(self->pages);
+    Py_XDECREF(self->renderer);
+    Py_TYPE(self)->tp_free(self);
 }
 
 /* Module definition */
@@ -1248,6 +2255,8 @@ static PyMethodDef texture_methods[] = {
      METH_VARARGS | METH_KEYWORDS, DOC_SDL2_VIDEO_TEXTURE_DRAWTRIANGLE},
     {"draw_quad", (PyCFunction)texture_draw_quad, METH_VARARGS | METH_KEYWORDS,
      DOC_SDL2_VIDEO_TEXTURE_DRAWQUAD},
+    {"draw_many", (PyCFunction)texture_draw_many, METH_O,
+     DOC_TEXTURE_DRAWMANY},
     {"update", (PyCFunction)texture_update, METH_VARARGS | METH_KEYWORDS,
      DOC_SDL2_VIDEO_TEXTURE_UPDATE},
     {"from_surface", (PyCFunction)texture_from_surface,
@@ -1270,9 +2279,57 @@ static PyGetSetDef texture_getset[] = {
      DOC_SDL2_VIDEO_TEXTURE_COLOR, NULL},
     {NULL, 0, NULL, NULL, NULL}};
 
-static PyMethodDef image_methods[] = {{NULL, NULL, 0, NULL}};
+static PyMethodDef image_methods[] = {
+    {"get_rect", (PyCFunction)image_get_rect, METH_FASTCALL | METH_KEYWORDS,
+     DOC_SDL2_VIDEO_IMAGE_GETRECT},
+    {"draw", (PyCFunction)image_draw, METH_VARARGS | METH_KEYWORDS,
+     DOC_SDL2_VIDEO_IMAGE_DRAW},
+    {NULL, NULL, 0, NULL}};
+
+static PyGetSetDef image_getset[] = {
+    {"angle", (getter)image_get_angle, (setter)image_set_angle,
+     DOC_SDL2_VIDEO_IMAGE_ANGLE, NULL},
+    {"flip_x", (getter)image_get_flip_x, (setter)image_set_flip_x,
+     DOC_SDL2_VIDEO_IMAGE_FLIPX, NULL},
+    {"flip_y", (getter)image_get_flip_y, (setter)image_set_flip_y,
+     DOC_SDL2_VIDEO_IMAGE_FLIPY, NULL},
+    {"color", (getter)image_get_color, (setter)image_set_color,
+     DOC_SDL2_VIDEO_IMAGE_COLOR, NULL},
+    {"alpha", (getter)image_get_alpha, (setter)image_set_alpha,
+     DOC_SDL2_VIDEO_IMAGE_ALPHA, NULL},
+    {"blend_mode", (getter)image_get_blend_mode, (setter)image_set_blend_mode,
+     DOC_SDL2_VIDEO_IMAGE_BLENDMODE, NULL},
+    {"texture", (getter)image_get_texture, (setter)image_set_texture,
+     DOC_SDL2_VIDEO_IMAGE_TEXTURE, NULL},
+    {"srcrect", (getter)image_get_srcrect, (setter)image_set_srcrect,
+     DOC_SDL2_VIDEO_IMAGE_SRCRECT, NULL},
+    {"origin", (getter)image_get_origin, (setter)image_set_origin,
+     DOC_SDL2_VIDEO_IMAGE_ORIGIN, NULL},
+    {NULL, 0, NULL, NULL, NULL}};
+
+static PyMethodDef atlas_methods[] = {
+    {"add", (PyCFunction)atlas_add, METH_O, DOC_TEXTUREATLAS_ADD},
+    {"add_many", (PyCFunction)atlas_add_many, METH_O,
+     DOC_TEXTUREATLAS_ADDMANY},
+    {"clear", (PyCFunction)atlas_clear, METH_NOARGS, DOC_TEXTUREATLAS_CLEAR},
+    {NULL, NULL, 0, NULL}};
+
+static PyGetSetDef atlas_getset[] = {
+    {"renderer", (getter)atlas_get_renderer, (setter)NULL,
+     DOC_TEXTUREATLAS_RENDERER, NULL},
+    {"size", (getter)atlas_get_size, (setter)NULL, DOC_TEXTUREATLAS_SIZE,
+     NULL},
+    {"padding", (getter)atlas_get_padding, (setter)NULL,
+     DOC_TEXTUREATLAS_PADDING, NULL},
+    {"pages", (getter)atlas_get_pages, (setter)NULL, DOC_TEXTUREATLAS_PAGES,
+     NULL},
+    {"efficiency", (getter)atlas_get_efficiency, (setter)NULL,
+     DOC_TEXTUREATLAS_EFFICIENCY, NULL},
+    {NULL, 0, NULL, NULL, NULL}};
 
-static PyGetSetDef image_getset[] = {{NULL, 0, NULL, NULL, NULL}};
+static PySequenceMethods atlas_as_sequence = {
+    .sq_length = (lenfunc)atlas_len,
+};
 
 static PyTypeObject pgRenderer_Type = {
     PyVarObject_HEAD_INIT(NULL, 0).tp_name = "pygame._render.Renderer",
@@ -1298,10 +2355,23 @@ static PyTypeObject pgTexture_Type = {
 static PyTypeObject pgImage_Type = {
     PyVarObject_HEAD_INIT(NULL, 0).tp_name = "pygame._render.Image",
     .tp_basicsize = sizeof(pgImageObject),
-    //.tp_dealloc = (destructor)image_dealloc,
-    .tp_doc = DOC_SDL2_VIDEO_IMAGE, .tp_methods = image_methods,
-    //.tp_init = (initproc)image_init,
-    .tp_new = PyType_GenericNew, .tp_getset = image_getset};
+    .tp_dealloc = (destructor)image_dealloc,
+    .tp_doc = DOC_SDL2_VIDEO_IMAGE,
+    .tp_methods = image_methods,
+    .tp_init = (initproc)image_init,
+    .tp_new = PyType_GenericNew,
+    .tp_getset = image_getset};
+
+static PyTypeObject pgTextureAtlas_Type = {
+    PyVarObject_HEAD_INIT(NULL, 0).tp_name = "pygame._render.TextureAtlas",
+    .tp_basicsize = sizeof(pgTextureAtlasObject),
+    .tp_dealloc = (destructor)atlas_dealloc,
+    .tp_doc = DOC_TEXTUREATLAS,
+    .tp_as_sequence = &atlas_as_sequence,
+    .tp_methods = atlas_methods,
+    .tp_init = (initproc)atlas_init,
+    .tp_new = PyType_GenericNew,
+    .tp_getset = atlas_getset};
 
 static PyMethodDef _render_methods[] = {{NULL, NULL, 0, NULL}};
 
@@ -1360,6 +2430,10 @@ MODINIT_DEFINE(_render)
         return NULL;
     }
 
+    if (PyType_Ready(&pgTextureAtlas_Type) < 0) {
+        return NULL;
+    }
+
     /* create the module */
     module = PyModule_Create(&_module);
     if (module == 0) {
@@ -1383,6 +2457,12 @@ MODINIT_DEFINE(_render)
         return NULL;
     }
 
+    if (PyModule_AddObjectRef(module, "TextureAtlas",
+                              (PyObject *)&pgTextureAtlas_Type)) {
+        Py_DECREF(module);
+        return NULL;
+    }
+
     c_api[0] = &pgRenderer_Type;
     c_api[1] = &pgTexture_Type;
     c_api[2] = &pgImage_Type;
@@ -0,0 +1,33 @@
+#define NO_PYGAME_C_API
+#include "_surface.h"
+#include "include/bitmask.h"
+
+#if !defined(PG_ENABLE_ARM_NEON) && defined(__aarch64__)
+// arm64 has neon optimisations enabled by default, even when fpu=neon is not
+// passed
+#define PG_ENABLE_ARM_NEON 1
+#endif
+
+// SSE2 functions
+#if defined(__SSE2__) || defined(PG_ENABLE_ARM_NEON)
+
+/* These fill the rows y0 to y1 - 1 of a cleared mask from a 32 bit surface
+ * of the same size. */
+
+/* Sets the bits of pixels with an alpha, at bit ashift, over threshold */
+void
+mask_from_alpha_sse2(bitmask_t *mask, SDL_Surface *surf, int ashift,
+                     Uint8 threshold, int y0, int y1);
+/* Sets the bits of pixels other than colorkey */
+void
+mask_from_colorkey_sse2(bitmask_t *mask, SDL_Surface *surf, Uint32 colorkey,
+                        int y0, int y1);
+/* Sets the bits of pixels where each byte of channels differs from the same
+ * byte of color, or of the pixel of surf2 if not NULL, by less than the same
+ * byte of threshold */
+void
+mask_from_color_sse2(bitmask_t *mask, SDL_Surface *surf, SDL_Surface *surf2,
+                     Uint32 color, Uint32 threshold, Uint32 channels, int y0,
+                     int y1);
+
+#endif /* (defined(__SSE2__) || defined(PG_ENABLE_ARM_NEON)) */
@@ -0,0 +1,199 @@
+#include "simd_mask.h"
+
+#if PG_ENABLE_ARM_NEON
+// sse2neon.h is from here: https://github.com/DLTcollab/sse2neon
+#include "include/sse2neon.h"
+#endif /* PG_ENABLE_ARM_NEON */
+
+#if (defined(__SSE2__) || defined(PG_ENABLE_ARM_NEON))
+
+enum mask_test { MASK_ALPHA, MASK_COLORKEY, MASK_COLOR };
+
+/* Parameters of a test, scalar and broadcast to 4 pixels */
+typedef struct {
+    int ashift;
+    Uint32 color;
+    Uint32 threshold;
+    Uint32 channels;
+    __m128i mm_ashift;
+    __m128i mm_color;
+    __m128i mm_threshold;
+    __m128i mm_channels;
+} MaskTest;
+
+/* Returns 1 if the pixel passes the test, with other the pixel of the
+ * second surface when comparing colors to it */
+static PG_INLINE int
+test_pixel(const MaskTest *t, enum mask_test kind, Uint32 pixel, Uint32 other)
+{
+    int i;
+    Uint8 a, b;
+
+    switch (kind) {
+        case MASK_ALPHA:
+            return ((pixel >> t->ashift) & 0xFF) > t->threshold;
+        case MASK_COLORKEY:
+            return pixel != t->color;
+        default: /* MASK_COLOR */
+            for (i = 0; i < 32; i += 8) {
+                if (!((t->channels >> i) & 0xFF)) {
+                    continue;
+                }
+                a = (Uint8)(pixel >> i);
+                b = (Uint8)(other >> i);
+                if ((a > b ? a - b : b - a) >= ((t->threshold >> i) & 0xFF)) {
+                    return 0;
+                }
+            }
+            return 1;
+    }
+}
+
+/* Returns all ones in each 32 bit lane whose pixel passes the test */
+static PG_INLINE __m128i
+test_pixels(const MaskTest *t, enum mask_test kind, __m128i pixels,
+            __m128i others)
+{
+    __m128i diff, failed;
+
+    switch (kind) {
+        case MASK_ALPHA:
+            pixels = _mm_srl_epi32(pixels, t->mm_ashift);
+            pixels = _mm_and_si128(pixels, _mm_set1_epi32(0xFF));
+            return _mm_cmpgt_epi32(pixels, t->mm_threshold);
+        case MASK_COLORKEY:
+            /* Inverted when the bits are gathered */
+            return _mm_cmpeq_epi32(pixels, t->mm_color);
+        default: /* MASK_COLOR */
+            diff = _mm_or_si128(_mm_subs_epu8(pixels, others),
+                                _mm_subs_epu8(others, pixels));
+            /* A byte fails where threshold - diff saturates to 0 */
+            failed = _mm_cmpeq_epi8(_mm_subs_epu8(t->mm_threshold, diff),
+                                    _mm_setzero_si128());
+            failed = _mm_and_si128(failed, t->mm_channels);
+            return _mm_cmpeq_epi32(failed, _mm_setzero_si128());
+    }
+}
+
+static PG_INLINE void
+mask_rows(bitmask_t *mask, SDL_Surface *surf, SDL_Surface *surf2,
+          const MaskTest *t, enum mask_test kind, int y0, int y1)
+{
+    /* The bitmask is stored column-group-major, see set_from_threshold() in
+     * mask.c. Each BITMASK_W word of a row is filled 16 pixels at a time. */
+    const int width = surf->w;
+    const int height = surf->h;
+    const int invert = kind == MASK_COLORKEY;
+    BITMASK_W *bits = mask->bits;
+    const Uint32 *srcp, *srcp2;
+    __m128i c0, c1, c2, c3, others[4];
+    BITMASK_W block, group;
+    int x, y, i, block_idx, chunk_end;
+    Uint32 other = t->color;
+
+    for (i = 0; i < 4; ++i) {
+        others[i] = t->mm_color;
+    }
+
+    for (y = y0; y < y1; ++y) {
+        srcp = (const Uint32 *)((const Uint8 *)surf->pixels + y * surf->pitch);
+        srcp2 = surf2 ? (const Uint32 *)((const Uint8 *)surf2->pixels +
+                                         y * surf2->pitch)
+                      : NULL;
+        block_idx = y;
+
+        for (x = 0; x < width; block_idx += height) {
+            chunk_end = x + BITMASK_W_LEN;
+            if (chunk_end > width) {
+                chunk_end = width;
+            }
+            block = 0;
+
+            while (x <= chunk_end - 16) {
+                if (srcp2) {
+                    for (i = 0; i < 4; ++i) {
+                        others[i] = _mm_loadu_si128(
+                            (const __m128i *)(srcp2 + x + 4 * i));
+                    }
+                }
+                c0 = test_pixels(t, kind,
+                                 _mm_loadu_si128((const __m128i *)(srcp + x)),
+                                 others[0]);
+                c1 = test_pixels(
+                    t, kind, _mm_loadu_si128((const __m128i *)(srcp + x + 4)),
+                    others[1]);
+                c2 = test_pixels(
+                    t, kind, _mm_loadu_si128((const __m128i *)(srcp + x + 8)),
+                    others[2]);
+                c3 = test_pixels(
+                    t, kind, _mm_loadu_si128((const __m128i *)(srcp + x + 12)),
+                    others[3]);
+                /* Narrow the lanes to one byte per pixel, in pixel order */
+                c0 = _mm_packs_epi16(_mm_packs_epi32(c0, c1),
+                                     _mm_packs_epi32(c2, c3));
+                group = (BITMASK_W)(unsigned int)_mm_movemask_epi8(c0);
+                if (invert) {
+                    group ^= 0xFFFF;
+                }
+                block |= group << (x & BITMASK_W_MASK);
+                x += 16;
+            }
+
+            /* remaining 1-15 pixels */
+            for (; x < chunk_end; ++x) {
+                if (srcp2) {
+                    other = srcp2[x];
+                }
+                if (test_pixel(t, kind, srcp[x], other)) {
+                    block |= BITMASK_N(x & BITMASK_W_MASK);
+                }
+            }
+
+            if (block) {
+                bits[block_idx] = block;
+            }
+        }
+    }
+}
+
+void
+mask_from_alpha_sse2(bitmask_t *mask, SDL_Surface *surf, int ashift,
+                     Uint8 threshold, int y0, int y1)
+{
+    MaskTest t = {0};
+
+    t.ashift = ashift;
+    t.threshold = threshold;
+    t.mm_ashift = _mm_cvtsi32_si128(ashift);
+    t.mm_threshold = _mm_set1_epi32(threshold);
+    mask_rows(mask, surf, NULL, &t, MASK_ALPHA, y0, y1);
+}
+
+void
+mask_from_colorkey_sse2(bitmask_t *mask, SDL_Surface *surf, Uint32 colorkey,
+                        int y0, int y1)
+{
+    MaskTest t = {0};
+
+    t.color = colorkey;
+    t.mm_color = _mm_set1_epi32((int)colorkey);
+    mask_rows(mask, surf, NULL, &t, MASK_COLORKEY, y0, y1);
+}
+
+void
+mask_from_color_sse2(bitmask_t *mask, SDL_Surface *surf, SDL_Surface *surf2,
+                     Uint32 color, Uint32 threshold, Uint32 channels, int y0,
+                     int y1)
+{
+    MaskTest t = {0};
+
+    t.color = color;
+    t.threshold = threshold;
+    t.channels = channels;
+    t.mm_color = _mm_set1_epi32((int)color);
+    t.mm_threshold = _mm_set1_epi32((int)threshold);
+    t.mm_channels = _mm_set1_epi32((int)channels);
+    mask_rows(mask, surf, surf2, &t, MASK_COLOR, y0, y1);
+}
+
+#endif /* (defined(__SSE2__) || defined(PG_ENABLE_ARM_NEON)) */
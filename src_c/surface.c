@@ -2515,6 +2515,485 @@ bliterror:
     return RAISE(PyExc_TypeError, "Unknown error");
 }
 
+/* BlitBatch: a prebuilt list of (Surface, dest) pairs for fblits() that keeps
+ * its sources and positions in plain C arrays, so that submitting it again
+ * every frame skips all the per item parsing and validation. */
+typedef struct {
+    PyObject_HEAD PyObject *
+        *sources;   /* strong references to the source Surfaces */
+    int *positions; /* x, y pairs, one per source */
+    Py_ssize_t size;
+    Py_ssize_t capacity;
+} pgBlitBatchObject;
+
+#define pgBlitBatch_Check(x) (Py_TYPE(x) == &pgBlitBatch_Type)
+
+/* Extracts the blit position from a dest argument the same way fblits()
+ * does, returns 0 if it is not a valid position. */
+static int
+_blitbatch_dest_from_obj(PyObject *obj, int *x, int *y)
+{
+    SDL_Rect *rect, temp;
+
+    if (pg_TwoIntsFromObj(obj, x, y)) {
+        return 1;
+    }
+    if ((rect = pgRect_FromObject(obj, &temp))) {
+        *x = rect->x;
+        *y = rect->y;
+        return 1;
+    }
+    return 0;
+}
+
+static int
+_blitbatch_reserve(pgBlitBatchObject *self, Py_ssize_t needed)
+{
+    Py_ssize_t capacity = self->capacity ? self->capacity : 16;
+    PyObject **sources;
+    int *positions;
+
+    if (needed <= self->capacity) {
+        return 0;
+    }
+    while (capacity < needed) {
+        capacity *= 2;
+    }
+    if (!(sources = PyMem_Resize(self->sources, PyObject *, capacity))) {
+        PyErr_NoMemory();
+        return -1;
+    }
+    self->sources = sources;
+    if (!(positions = PyMem_Resize(self->positions, int, capacity * 2))) {
+        PyErr_NoMemory();
+        return -1;
+    }
+    self->positions = positions;
+    self->capacity = capacity;
+    return 0;
+}
+
+static int
+_blitbatch_append(pgBlitBatchObject *self, PyObject *source, PyObject *dest)
+{
+    int x, y;
+
+    if (!pgSurface_Check(source)) {
+        PyErr_SetString(PyExc_TypeError, "Source objects must be a Surface");
+        return -1;
+    }
+    if (!_blitbatch_dest_from_obj(dest, &x, &y)) {
+        PyErr_SetString(PyExc_TypeError,
+                        "invalid destination position for blit");
+        return -1;
+    }
+    if (_blitbatch_reserve(self, self->size + 1)) {
+        return -1;
+    }
+    self->sources[self->size] = Py_NewRef(source);
+    self->positions[self->size * 2] = x;
+    self->positions[self->size * 2 + 1] = y;
+    self->size++;
+    return 0;
+}
+
+static int
+blitbatch_clear_internal(pgBlitBatchObject *self)
+{
+    Py_ssize_t size = self->size;
+    Py_ssize_t i;
+
+    /* Decrefs may run arbitrary code, so empty the batch first */
+    self->size = 0;
+    for (i = 0; i < size; i++) {
+        Py_CLEAR(self->sources[i]);
+    }
+    return 0;
+}
+
+static void
+blitbatch_dealloc(pgBlitBatchObject *self)
+{
+    PyObject_GC_UnTrack(self);
+    blitbatch_clear_internal(self);
+    PyMem_Free(self->sources);
+    PyMem_Free(self->positions);
+    Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+static int
+blitbatch_traverse(pgBlitBatchObject *self, visitproc visit, void *arg)
+{
+    Py_ssize_t i;
+
+    for (i = 0; i < self->size; i++) {
+        Py_VISIT(self->sources[i]);
+    }
+    return 0;
+}
+
+static int
+blitbatch_init(pgBlitBatchObject *self, PyObject *args, PyObject *kwds)
+{
+    PyObject *blit_sequence = NULL, *seq, *item;
+    Py_ssize_t i, size;
+    static char *kwids[] = {"blit_sequence", NULL};
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "|O", kwids,
+                                     &blit_sequence)) {
+        return -1;
+    }
+
+    blitbatch_clear_internal(self);
+    if (!blit_sequence) {
+        return 0;
+    }
+
+    if (!(seq = PySequence_Fast(
+              blit_sequence,
+              "blit_sequence should be iterator of (Surface, dest)"))) {
+        return -1;
+    }
+    size = PySequence_Fast_GET_SIZE(seq);
+    if (_blitbatch_reserve(self, size)) {
+        Py_DECREF(seq);
+        return -1;
+    }
+    for (i = 0; i < size; i++) {
+        item = PySequence_Fast_GET_ITEM(seq, i);
+        if (!PyTuple_Check(item) || PyTuple_GET_SIZE(item) != 2) {
+            PyErr_SetString(
+                PyExc_ValueError,
+                "Blit_sequence item should be a tuple of (Surface, dest)");
+            goto error;
+        }
+        if (_blitbatch_append(self, PyTuple_GET_ITEM(item, 0),
+                              PyTuple_GET_ITEM(item, 1))) {
+            goto error;
+        }
+    }
+    Py_DECREF(seq);
+    return 0;
+
+error:
+    Py_DECREF(seq);
+    blitbatch_clear_internal(self);
+    return -1;
+}
+
+static PyObject *
+blitbatch_repr(pgBlitBatchObject *self)
+{
+    return PyUnicode_FromFormat("<BlitBatch(%zd blits)>", self->size);
+}
+
+static Py_ssize_t
+blitbatch_length(pgBlitBatchObject *self)
+{
+    return self->size;
+}
+
+static PyObject *
+blitbatch_append(pgBlitBatchObject *self, PyObject *const *args,
+                 Py_ssize_t nargs)
+{
+    if (nargs != 2) {
+        return RAISE(PyExc_TypeError,
+                     "append() takes exactly 2 arguments (source, dest)");
+    }
+    if (_blitbatch_append(self, args[0], args[1])) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+blitbatch_clear(pgBlitBatchObject *self, PyObject *_null)
+{
+    blitbatch_clear_internal(self);
+    Py_RETURN_NONE;
+}
+
+static int
+_blitbatch_index(pgBlitBatchObject *self, PyObject *obj, Py_ssize_t *index)
+{
+    Py_ssize_t i = PyNumber_AsSsize_t(obj, PyExc_IndexError);
+
+    if (i == -1 && PyErr_Occurred()) {
+        return -1;
+    }
+    if (i < 0) {
+        i += self->size;
+    }
+    if (i < 0 || i >= self->size) {
+        PyErr_SetString(PyExc_IndexError, "BlitBatch index out of range");
+        return -1;
+    }
+    *index = i;
+    return 0;
+}
+
+static PyObject *
+blitbatch_get_position(pgBlitBatchObject *self, PyObject *arg)
+{
+    Py_ssize_t i;
+
+    if (_blitbatch_index(self, arg, &i)) {
+        return NULL;
+    }
+    return pg_tuple_couple_from_values_int(self->positions[i * 2],
+                                           self->positions[i * 2 + 1]);
+}
+
+static PyObject *
+blitbatch_set_position(pgBlitBatchObject *self, PyObject *const *args,
+                       Py_ssize_t nargs)
+{
+    Py_ssize_t i;
+    int x, y;
+
+    if (nargs != 2) {
+        return RAISE(PyExc_TypeError,
+                     "set_position() takes exactly 2 arguments (index, dest)");
+    }
+    if (_blitbatch_index(self, args[0], &i)) {
+        return NULL;
+    }
+    if (!_blitbatch_dest_from_obj(args[1], &x, &y)) {
+        return RAISE(PyExc_TypeError, "invalid destination position for blit");
+    }
+    self->positions[i * 2] = x;
+    self->positions[i * 2 + 1] = y;
+    Py_RETURN_NONE;
+}
+
+/* Copies the integers of a buffer into the positions array, the buffer
+ * must hold exactly 2 * len(batch) native integers. Returns 1 if obj was
+ * a usable buffer, 0 if it doesn't export one and -1 on error. */
+static int
+_blitbatch_positions_from_buffer(pgBlitBatchObject *self, PyObject *obj)
+{
+    Py_buffer view;
+    const char *format;
+    Py_ssize_t i, count;
+    int is_signed;
+
+    if (!PyObject_CheckBuffer(obj)) {
+        return 0;
+    }
+    if (PyObject_GetBuffer(obj, &view, PyBUF_FORMAT | PyBUF_C_CONTIGUOUS)) {
+        return -1;
+    }
+
+    format = view.format ? view.format : "B";
+    if (*format == '@' || *format == '=' ||
+#if SDL_BYTEORDER == SDL_LIL_ENDIAN
+        *format == '<'
+#else
+        *format == '>' || *format == '!'
+#endif
+    ) {
+        format++;
+    }
+    if (format[0] == '\0' || format[1] != '\0' ||
+        !strchr("bBhHiIlLqQnN", format[0])) {
+        PyErr_Format(PyExc_TypeError,
+                     "positions buffer must hold native integers, "
+                     "not format '%s'",
+                     view.format);
+        goto error;
+    }
+    is_signed = strchr("bhilqn", format[0]) != NULL;
+
+    count = view.len / view.itemsize;
+    if (count != self->size * 2) {
+        PyErr_Format(PyExc_ValueError,
+                     "positions buffer must hold %zd integers (2 per blit), "
+                     "got %zd",
+                     self->size * 2, count);
+        goto error;
+    }
+
+    if (view.itemsize == sizeof(int) && is_signed) {
+        memcpy(self->positions, view.buf, count * sizeof(int));
+    }
+    else {
+        for (i = 0; i < count; i++) {
+            switch (view.itemsize) {
+                case 1:
+                    self->positions[i] = is_signed
+                                             ? (int)((Sint8 *)view.buf)[i]
+                                             : (int)((Uint8 *)view.buf)[i];
+                    break;
+                case 2:
+                    self->positions[i] = is_signed
+                                             ? (int)((Sint16 *)view.buf)[i]
+                                             : (int)((Uint16 *)view.buf)[i];
+                    break;
+                case 4:
+                    self->positions[i] = (int)((Uint32 *)view.buf)[i];
+                    break;
+                case 8:
+                    self->positions[i] = is_signed
+                                             ? (int)((Sint64 *)view.buf)[i]
+                                             : (int)((Uint64 *)view.buf)[i];
+                    break;
+                default:
+                    PyErr_SetString(PyExc_TypeError,
+                                    "unsupported positions buffer item size");
+                    goto error;
+            }
+        }
+    }
+    PyBuffer_Release(&view);
+    return 1;
+
+error:
+    PyBuffer_Release(&view);
+    return -1;
+}
+
+static PyObject *
+blitbatch_set_positions(pgBlitBatchObject *self, PyObject *arg)
+{
+    PyObject *seq;
+    Py_ssize_t i;
+    int x, y;
+
+    switch (_blitbatch_positions_from_buffer(self, arg)) {
+        case 1:
+            Py_RETURN_NONE;
+        case -1:
+            return NULL;
+    }
+
+    if (!(seq = PySequence_Fast(
+              arg,
+              "positions must be a sequence of positions or a buffer "
+              "of integers"))) {
+        return NULL;
+    }
+    if (PySequence_Fast_GET_SIZE(seq) != self->size) {
+        PyErr_Format(PyExc_ValueError, "expected %zd positions, got %zd",
+                     self->size, PySequence_Fast_GET_SIZE(seq));
+        Py_DECREF(seq);
+        return NULL;
+    }
+    /* Validate everything first so that a bad item leaves the batch as is */
+    for (i = 0; i < self->size; i++) {
+        if (!_blitbatch_dest_from_obj(PySequence_Fast_GET_ITEM(seq, i), &x,
+                                      &y)) {
+            Py_DECREF(seq);
+            return RAISE(PyExc_TypeError,
+                         "invalid destination position for blit");
+        }
+    }
+    for (i = 0; i < self->size; i++) {
+        _blitbatch_dest_from_obj(PySequence_Fast_GET_ITEM(seq, i),
+                                 &self->positions[i * 2],
+                                 &self->positions[i * 2 + 1]);
+    }
+    Py_DECREF(seq);
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+blitbatch_move(pgBlitBatchObject *self, PyObject *const *args,
+               Py_ssize_t nargs)
+{
+    Py_ssize_t i;
+    int dx, dy;
+
+    if (nargs == 1) {
+        if (!pg_TwoIntsFromObj(args[0], &dx, &dy)) {
+            return RAISE(PyExc_TypeError, "offset must be two numbers");
+        }
+    }
+    else if (nargs == 2) {
+        if (!pg_IntFromObj(args[0], &dx) || !pg_IntFromObj(args[1], &dy)) {
+            return RAISE(PyExc_TypeError, "offset must be two numbers");
+        }
+    }
+    else {
+        return RAISE(PyExc_TypeError, "move() takes an offset (dx, dy)");
+    }
+
+    for (i = 0; i < self->size; i++) {
+        self->positions[i * 2] += dx;
+        self->positions[i * 2 + 1] += dy;
+    }
+    Py_RETURN_NONE;
+}
+
+/* Blits every item of the batch onto dest, returns a BLITS_ERR_* code */
+static int
+_blitbatch_blit(pgBlitBatchObject *self, pgSurfaceObject *dest,
+                int blend_flags)
+{
+    PyObject *source;
+    SDL_Surface *src;
+    SDL_Rect dest_rect;
+    Py_ssize_t i;
+    int result;
+
+    for (i = 0; i < self->size; i++) {
+        if (!(src = pgSurface_AsSurface(self->sources[i]))) {
+            return BLITS_ERR_SEQUENCE_SURF;
+        }
+        dest_rect.x = self->positions[i * 2];
+        dest_rect.y = self->positions[i * 2 + 1];
+        dest_rect.w = src->w;
+        dest_rect.h = src->h;
+        /* Large blits release the GIL, hold the source in case another
+         * thread clears the batch meanwhile */
+        source = self->sources[i];
+        Py_INCREF(source);
+        result = pgSurface_Blit(dest, (pgSurfaceObject *)source, &dest_rect,
+                                NULL, blend_flags);
+        Py_DECREF(source);
+        if (result) {
+            return BLITS_ERR_BLIT_FAIL;
+        }
+    }
+    return 0;
+}
+
+static PyMethodDef blitbatch_methods[] = {
+    {"append", (PyCFunction)blitbatch_append, METH_FASTCALL,
+     DOC_SURFACE_BLITBATCH_APPEND},
+    {"clear", (PyCFunction)blitbatch_clear, METH_NOARGS,
+     DOC_SURFACE_BLITBATCH_CLEAR},
+    {"get_position", (PyCFunction)blitbatch_get_position, METH_O,
+     DOC_SURFACE_BLITBATCH_GETPOSITION},
+    {"set_position", (PyCFunction)blitbatch_set_position, METH_FASTCALL,
+     DOC_SURFACE_BLITBATCH_SETPOSITION},
+    {"set_positions", (PyCFunction)blitbatch_set_positions, METH_O,
+     DOC_SURFACE_BLITBATCH_SETPOSITIONS},
+    {"move", (PyCFunction)blitbatch_move, METH_FASTCALL,
+     DOC_SURFACE_BLITBATCH_MOVE},
+    {NULL, NULL, 0, NULL}};
+
+static PySequenceMethods blitbatch_as_sequence = {
+    .sq_length = (lenfunc)blitbatch_length,
+};
+
+static PyTypeObject pgBlitBatch_Type = {
+    PyVarObject_HEAD_INIT(NULL, 0).tp_name = "pygame.surface.BlitBatch",
+    .tp_basicsize = sizeof(pgBlitBatchObject),
+    .tp_dealloc = (destructor)blitbatch_dealloc,
+    .tp_repr = (reprfunc)blitbatch_repr,
+    .tp_as_sequence = &blitbatch_as_sequence,
+    .tp_flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC,
+    .tp_doc = DOC_SURFACE_BLITBATCH,
+    .tp_traverse = (traverseproc)blitbatch_traverse,
+    .tp_clear = (inquiry)blitbatch_clear_internal,
+    .tp_methods = blitbatch_methods,
+    .tp_init = (initproc)blitbatch_init,
+    .tp_alloc = PyType_GenericAlloc,
+    .tp_new = PyType_GenericNew,
+    .tp_free = PyObject_GC_Del,
+};
+
 #define FBLITS_ERR_TUPLE_REQUIRED 11
 #define FBLITS_ERR_INCORRECT_ARGS_NUM 12
 #define FBLITS_ERR_FLAG_NOT_NUMERIC 13
@@ -2597,13 +3076,25 @@ surf_fblits(pgSurfaceObject *self, PyObject *const *args, Py_ssize_t nargs)
 
     blit_sequence = args[0];
 
+    /* Fastest path for prebuilt BlitBatch objects */
+    if (pgBlitBatch_Check(blit_sequence)) {
+        error = _blitbatch_blit((pgBlitBatchObject *)blit_sequence, self,
+                                blend_flags);
+        if (error) {
+            goto on_error;
+        }
+    }
     /* Fast path for Lists or Tuples */
-    if (pgSequenceFast_Check(blit_sequence)) {
+    else if (pgSequenceFast_Check(blit_sequence)) {
         Py_ssize_t i;
-        PyObject **sequence_items = PySequence_Fast_ITEMS(blit_sequence);
         for (i = 0; i < PySequence_Fast_GET_SIZE(blit_sequence); i++) {
-            item = sequence_items[i];
+            /* Large blits release the GIL, so another thread may change the
+             * list meanwhile: hold the item, and get it from the list
+             * again every time */
+            item = PySequence_Fast_GET_ITEM(blit_sequence, i);
+            Py_INCREF(item);
             error = _surf_fblits_item_check_and_blit(self, item, blend_flags);
+            Py_DECREF(item);
             if (error) {
                 goto on_error;
             }
@@ -4497,6 +4988,133 @@ end:
 #endif
 }
 
+typedef struct {
+    SDL_Surface *src[PG_BLIT_MAX_THREADS];
+    SDL_Surface *dst[PG_BLIT_MAX_THREADS];
+    int result[PG_BLIT_MAX_THREADS];
+} pg_SDLBlitBandJob;
+
+static void
+_pg_sdl_blit_band(void *data, int band, int nbands)
+{
+    pg_SDLBlitBandJob *job = (pg_SDLBlitBandJob *)data;
+
+    job->result[band] =
+        PG_BlitSurface(job->src[band], NULL, job->dst[band], NULL);
+}
+
+/* Same as PG_BlitSurface, but large blits are split into horizontal bands
+ * that the blit threads do at the same time. Each band gets its own
+ * SDL_Surface headers over the shared pixels, so that SDL never sees the
+ * same surface from two threads. */
+static int
+pg_BlitSurfaceThreaded(SDL_Surface *src, const SDL_Rect *srcrect,
+                       SDL_Surface *dst, SDL_Rect *dstrect)
+{
+    pg_SDLBlitBandJob job;
+    SDL_Rect r_src, r_dst, clip, tmp;
+    SDL_BlendMode blend_mode;
+    Uint8 alpha, r = 255, g = 255, b = 255;
+    Uint8 *s_start, *s_end, *d_start, *d_end;
+    int i, nbands, start, end, result = 0;
+    int src_bpp = PG_SURF_BytesPerPixel(src);
+    int dst_bpp = PG_SURF_BytesPerPixel(dst);
+
+    /* Palettes, color keys and RLE need more per surface state than is worth
+     * copying around, those blits take the regular path */
+    if (pg_GetBlitThreads() < 2 || src_bpp == 1 || dst_bpp == 1 ||
+        SDL_HasColorKey(src) || PG_SurfaceHasRLE(src) ||
+        PG_SurfaceHasRLE(dst) || SDL_MUSTLOCK(src) || SDL_MUSTLOCK(dst) ||
+        !PG_GetSurfaceBlendMode(src, &blend_mode) ||
+        !PG_GetSurfaceAlphaMod(src, &alpha)) {
+        return PG_BlitSurface(src, srcrect, dst, dstrect);
+    }
+    SDL_GetSurfaceColorMod(src, &r, &g, &b);
+
+    /* Clip like SDL_BlitSurface does */
+    r_src.x = r_src.y = 0;
+    r_src.w = src->w;
+    r_src.h = src->h;
+    r_dst.x = dstrect ? dstrect->x : 0;
+    r_dst.y = dstrect ? dstrect->y : 0;
+    if (srcrect) {
+        if (!SDL_IntersectRect(srcrect, &r_src, &tmp)) {
+            return PG_BlitSurface(src, srcrect, dst, dstrect);
+        }
+        r_dst.x += tmp.x - srcrect->x;
+        r_dst.y += tmp.y - srcrect->y;
+        r_src = tmp;
+    }
+    r_dst.w = r_src.w;
+    r_dst.h = r_src.h;
+    if (!PG_GetSurfaceClipRect(dst, &clip) ||
+        !SDL_IntersectRect(&r_dst, &clip, &tmp)) {
+        return PG_BlitSurface(src, srcrect, dst, dstrect);
+    }
+    r_src.x += tmp.x - r_dst.x;
+    r_src.y += tmp.y - r_dst.y;
+    r_src.w = tmp.w;
+    r_src.h = tmp.h;
+    r_dst = tmp;
+
+    nbands = pg_BlitBandCount(r_dst.w, r_dst.h);
+    if (nbands < 2) {
+        return PG_BlitSurface(src, srcrect, dst, dstrect);
+    }
+
+    s_start = (Uint8 *)src->pixels + r_src.y * src->pitch + r_src.x * src_bpp;
+    d_start = (Uint8 *)dst->pixels + r_dst.y * dst->pitch + r_dst.x * dst_bpp;
+    s_end = s_start + (r_src.h - 1) * src->pitch + r_src.w * src_bpp;
+    d_end = d_start + (r_dst.h - 1) * dst->pitch + r_dst.w * dst_bpp;
+    if (s_start < d_end && d_start < s_end) {
+        /* Overlapping pixels, the result would depend on the band order */
+        return PG_BlitSurface(src, srcrect, dst, dstrect);
+    }
+
+    memset(&job, 0, sizeof(job));
+    for (i = 0; i < nbands; i++) {
+        start = r_dst.h * i / nbands;
+        end = r_dst.h * (i + 1) / nbands;
+        job.src[i] =
+            PG_CreateSurfaceFrom(r_src.w, end - start, PG_SURF_FORMATENUM(src),
+                                 s_start + start * src->pitch, src->pitch);
+        job.dst[i] =
+            PG_CreateSurfaceFrom(r_dst.w, end - start, PG_SURF_FORMATENUM(dst),
+                                 d_start + start * dst->pitch, dst->pitch);
+        if (!job.src[i] || !job.dst[i] ||
+            !PG_SetSurfaceBlendMode(job.src[i], blend_mode) ||
+            !PG_SetSurfaceAlphaMod(job.src[i], alpha)) {
+            result = -1;
+            goto end;
+        }
+        SDL_SetSurfaceColorMod(job.src[i], r, g, b);
+    }
+
+    pg_RunBlitBands(_pg_sdl_blit_band, &job, nbands);
+    for (i = 0; i < nbands; i++) {
+        if (job.result[i]) {
+            /* errors set in a worker thread are not visible here */
+            SDL_SetError("Blit failed");
+            result = -1;
+            break;
+        }
+    }
+    if (dstrect) {
+        *dstrect = r_dst;
+    }
+
+end:
+    for (i = 0; i < nbands; i++) {
+        if (job.src[i]) {
+            SDL_FreeSurface(job.src[i]);
+        }
+        if (job.dst[i]) {
+            SDL_FreeSurface(job.dst[i]);
+        }
+    }
+    return result;
+}
+
 /*this internal blit function is accessible through the C api*/
 int
 pgSurface_Blit(pgSurfaceObject *dstobj, pgSurfaceObject *srcobj,
@@ -4616,9 +5234,7 @@ pgSurface_Blit(pgSurfaceObject *dstobj, pgSurfaceObject *srcobj,
         result = pygame_Blit(src, srcrect, dst, dstrect, blend_flags);
     }
     else {
-        /* Py_BEGIN_ALLOW_THREADS */
-        result = PG_BlitSurface(src, srcrect, dst, dstrect);
-        /* Py_END_ALLOW_THREADS */
+        result = pg_BlitSurfaceThreaded(src, srcrect, dst, dstrect);
     }
 
     if (subsurface) {
@@ -4641,7 +5257,41 @@ pgSurface_Blit(pgSurfaceObject *dstobj, pgSurfaceObject *srcobj,
     return result != 0;
 }
 
-static PyMethodDef _surface_methods[] = {{NULL, NULL, 0, NULL}};
+static PyObject *
+surface_set_blit_threads(PyObject *self, PyObject *arg)
+{
+    long count = PyLong_AsLong(arg);
+
+    if (count == -1 && PyErr_Occurred()) {
+        return NULL;
+    }
+    if (count < 0) {
+        return RAISE(PyExc_ValueError, "thread count can't be negative");
+    }
+    if (count == 0) {
+        count = SDL_GetCPUCount();
+    }
+    if (count > PG_BLIT_MAX_THREADS) {
+        count = PG_BLIT_MAX_THREADS;
+    }
+    if (pg_SetBlitThreads((int)count)) {
+        return RAISE(pgExc_SDLError, SDL_GetError());
+    }
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+surface_get_blit_threads(PyObject *self, PyObject *_null)
+{
+    return PyLong_FromLong(pg_GetBlitThreads());
+}
+
+static PyMethodDef _surface_methods[] = {
+    {"set_blit_threads", surface_set_blit_threads, METH_O,
+     DOC_SURFACE_SETBLITTHREADS},
+    {"get_blit_threads", surface_get_blit_threads, METH_NOARGS,
+     DOC_SURFACE_GETBLITTHREADS},
+    {NULL, NULL, 0, NULL}};
 
 int
 exec_surface(PyObject *module)
@@ -4674,6 +5324,9 @@ exec_surface(PyObject *module)
     if (PyType_Ready(&pgSurface_Type) < 0) {
         return -1;
     }
+    if (PyType_Ready(&pgBlitBatch_Type) < 0) {
+        return -1;
+    }
 
     PyObject *apiobj;
     static void *c_api[PYGAMEAPI_SURFACE_NUMSLOTS];
@@ -4692,11 +5345,18 @@ exec_surface(PyObject *module)
         return -1;
     }
 
+    if (PyModule_AddObjectRef(module, "BlitBatch",
+                              (PyObject *)&pgBlitBatch_Type)) {
+        return -1;
+    }
+
     /* export the c api */
     c_api[0] = &pgSurface_Type;
     c_api[1] = pgSurface_New2;
     c_api[2] = pgSurface_Blit;
     c_api[3] = pgSurface_SetSurface;
+    c_api[4] = pg_BlitBandCount;
+    c_api[5] = pg_RunBlitBands;
     apiobj = encapsulate_api(c_api, "surface");
     if (PyModule_Add(module, PYGAMEAPI_LOCAL_ENTRY, apiobj) < 0) {
         return -1;
@@ -356,6 +356,28 @@ pygame_Blit(SDL_Surface *src, SDL_Rect *srcrect, SDL_Surface *dst,
 int
 premul_surf_color_by_alpha(SDL_Surface *src, SDL_Surface *dst);
 
+/* Upper bound for pg_SetBlitThreads() */
+#define PG_BLIT_MAX_THREADS 64
+/* Blits covering fewer pixels than this are never split between threads */
+#define PG_BLIT_THREAD_MIN_PIXELS (256 * 256)
+/* Minimum number of rows in each band of a threaded blit */
+#define PG_BLIT_THREAD_MIN_ROWS 16
+
+/* Blits band number `band` out of `nbands` equal horizontal bands */
+typedef void (*pg_BlitBandFunc)(void *data, int band, int nbands);
+
+int
+pg_SetBlitThreads(int count);
+
+int
+pg_GetBlitThreads(void);
+
+int
+pg_BlitBandCount(int width, int height);
+
+void
+pg_RunBlitBands(pg_BlitBandFunc func, void *data, int nbands);
+
 int
 pg_warn_simd_at_runtime_but_uncompiled();
 
@@ -524,18 +524,91 @@ end_no_mutex:
 }
 
 /*clock object interface*/
+#define CLOCK_DEFAULT_HISTORY 256
+
 typedef struct {
     PyObject_HEAD Uint64 last_tick, fps_count, fps_tick;
     float fps;
     Uint64 timepassed, rawpassed;
+    /* frame profiler: a ring buffer of the last frame times in ms, measured
+     * with the high resolution performance counter */
+    Uint64 last_counter;
+    double *frame_times;
+    Py_ssize_t history, frame_count, frame_next;
+    PyObject *sections; /* dict of name -> pgClockSectionObject */
 } pgClockObject;
 
+/* a named part of a frame timed by Clock.section() */
+typedef struct {
+    PyObject_HEAD PyObject *name;
+    Uint64 start, total, longest, count;
+    int depth; /* only the outermost of nested enters is timed */
+} pgClockSectionObject;
+
+static double
+clock_counter_to_ms(Uint64 counter)
+{
+    return counter * 1000.0 / (double)SDL_GetPerformanceFrequency();
+}
+
+static PyObject *
+clock_section_enter(pgClockSectionObject *self, PyObject *_null)
+{
+    if (!self->depth++) {
+        self->start = SDL_GetPerformanceCounter();
+    }
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+clock_section_exit(pgClockSectionObject *self, PyObject *args)
+{
+    Uint64 elapsed;
+
+    if (self->depth && !--self->depth) {
+        elapsed = SDL_GetPerformanceCounter() - self->start;
+        self->total += elapsed;
+        self->count++;
+        if (elapsed > self->longest) {
+            self->longest = elapsed;
+        }
+    }
+    Py_RETURN_FALSE;
+}
+
+static struct PyMethodDef clock_section_methods[] = {
+    {"__enter__", (PyCFunction)clock_section_enter, METH_NOARGS, NULL},
+    {"__exit__", (PyCFunction)clock_section_exit, METH_VARARGS, NULL},
+    {NULL, NULL, 0, NULL}};
+
+static void
+clock_section_dealloc(pgClockSectionObject *self)
+{
+    Py_XDECREF(self->name);
+    Py_TYPE(self)->tp_free((PyObject *)self);
+}
+
+static PyObject *
+clock_section_repr(pgClockSectionObject *self)
+{
+    return PyUnicode_FromFormat("<ClockSection(%R)>", self->name);
+}
+
+static PyTypeObject pgClockSection_Type = {
+    PyVarObject_HEAD_INIT(NULL, 0).tp_name = "pygame.time.ClockSection",
+    .tp_basicsize = sizeof(pgClockSectionObject),
+    .tp_dealloc = (destructor)clock_section_dealloc,
+    .tp_repr = (reprfunc)clock_section_repr,
+    .tp_flags = Py_TPFLAGS_DEFAULT,
+    .tp_methods = clock_section_methods,
+};
+
 // to be called by the other tick functions.
 static PyObject *
 clock_tick_base(pgClockObject *self, PyObject *arg, int use_accurate_delay)
 {
     float framerate = 0.0f;
-    Uint64 nowtime;
+    Uint64 nowtime, counter;
 
     if (!PyArg_ParseTuple(arg, "|f", &framerate)) {
         return NULL;
@@ -574,6 +647,15 @@ clock_tick_base(pgClockObject *self, PyObject *arg, int use_accurate_delay)
         }
     }
 
+    counter = SDL_GetPerformanceCounter();
+    self->frame_times[self->frame_next] =
+        clock_counter_to_ms(counter - self->last_counter);
+    self->frame_next = (self->frame_next + 1) % self->history;
+    if (self->frame_count < self->history) {
+        self->frame_count++;
+    }
+    self->last_counter = counter;
+
     nowtime = PG_GetTicks();
     self->timepassed = nowtime - self->last_tick;
     self->fps_count += 1;
@@ -624,6 +706,163 @@ clock_get_rawtime(pgClockObject *self, PyObject *_null)
     return PyLong_FromUnsignedLongLong(self->rawpassed);
 }
 
+static int
+compare_double(const void *a, const void *b)
+{
+    double x = *(const double *)a, y = *(const double *)b;
+    return (x > y) - (x < y);
+}
+
+static PyObject *
+clock_get_frame_time_percentile(pgClockObject *self, PyObject *arg)
+{
+    double percent, rank, result;
+    double *sorted;
+    Py_ssize_t low;
+
+    percent = PyFloat_AsDouble(arg);
+    if (percent == -1.0 && PyErr_Occurred()) {
+        return NULL;
+    }
+    if (!(percent >= 0.0 && percent <= 100.0)) {
+        return RAISE(PyExc_ValueError, "percent must be between 0 and 100");
+    }
+    if (!self->frame_count) {
+        return PyFloat_FromDouble(0.0);
+    }
+
+    sorted = PyMem_New(double, self->frame_count);
+    if (!sorted) {
+        return PyErr_NoMemory();
+    }
+    /* while the ring is filling up the times start at index 0 */
+    memcpy(sorted, self->frame_times, self->frame_count * sizeof(double));
+    qsort(sorted, self->frame_count, sizeof(double), compare_double);
+
+    /* linear interpolation between the two closest ranks */
+    rank = percent / 100.0 * (self->frame_count - 1);
+    low = (Py_ssize_t)rank;
+    result = sorted[low];
+    if (low + 1 < self->frame_count) {
+        result += (sorted[low + 1] - sorted[low]) * (rank - low);
+    }
+    PyMem_Free(sorted);
+    return PyFloat_FromDouble(result);
+}
+
+static PyObject *
+clock_get_max_frame_time(pgClockObject *self, PyObject *_null)
+{
+    double longest = 0.0;
+    Py_ssize_t i;
+
+    for (i = 0; i < self->frame_count; i++) {
+        if (self->frame_times[i] > longest) {
+            longest = self->frame_times[i];
+        }
+    }
+    return PyFloat_FromDouble(longest);
+}
+
+static PyObject *
+clock_get_frame_times(pgClockObject *self, PyObject *_null)
+{
+    Py_ssize_t i, start;
+    PyObject *list, *item;
+
+    list = PyList_New(self->frame_count);
+    if (!list) {
+        return NULL;
+    }
+    /* oldest first, the ring only wraps around once it is full */
+    start = self->frame_count < self->history ? 0 : self->frame_next;
+    for (i = 0; i < self->frame_count; i++) {
+        item =
+            PyFloat_FromDouble(self->frame_times[(start + i) % self->history]);
+        if (!item) {
+            Py_DECREF(list);
+            return NULL;
+        }
+        PyList_SET_ITEM(list, i, item);
+    }
+    return list;
+}
+
+static PyObject *
+clock_section(pgClockObject *self, PyObject *name)
+{
+    pgClockSectionObject *section;
+
+    if (!PyUnicode_Check(name)) {
+        return RAISE(PyExc_TypeError, "section name must be a string");
+    }
+    section =
+        (pgClockSectionObject *)PyDict_GetItemWithError(self->sections, name);
+    if (section) {
+        Py_INCREF(section);
+        return (PyObject *)section;
+    }
+    if (PyErr_Occurred()) {
+        return NULL;
+    }
+
+    section = PyObject_New(pgClockSectionObject, &pgClockSection_Type);
+    if (!section) {
+        return NULL;
+    }
+    Py_INCREF(name);
+    section->name = name;
+    section->start = section->total = section->longest = section->count = 0;
+    section->depth = 0;
+    if (PyDict_SetItem(self->sections, name, (PyObject *)section)) {
+        Py_DECREF(section);
+        return NULL;
+    }
+    return (PyObject *)section;
+}
+
+static PyObject *
+clock_get_sections(pgClockObject *self, PyObject *_null)
+{
+    PyObject *result, *key, *value, *times;
+    pgClockSectionObject *section;
+    Py_ssize_t pos = 0;
+
+    result = PyDict_New();
+    if (!result) {
+        return NULL;
+    }
+    while (PyDict_Next(self->sections, &pos, &key, &value)) {
+        section = (pgClockSectionObject *)value;
+        times = Py_BuildValue("(dKd)", clock_counter_to_ms(section->total),
+                              section->count,
+                              clock_counter_to_ms(section->longest));
+        if (!times || PyDict_SetItem(result, key, times)) {
+            Py_XDECREF(times);
+            Py_DECREF(result);
+            return NULL;
+        }
+        Py_DECREF(times);
+    }
+    return result;
+}
+
+static PyObject *
+clock_reset_profile(pgClockObject *self, PyObject *_null)
+{
+    PyObject *key, *value;
+    pgClockSectionObject *section;
+    Py_ssize_t pos = 0;
+
+    self->frame_count = 0;
+    self->frame_next = 0;
+    while (PyDict_Next(self->sections, &pos, &key, &value)) {
+        section = (pgClockSectionObject *)value;
+        section->total = section->longest = section->count = 0;
+    }
+    Py_RETURN_NONE;
+}
+
 /* clock object internals */
 
 static struct PyMethodDef clock_methods[] = {
@@ -636,12 +875,25 @@ static struct PyMethodDef clock_methods[] = {
      DOC_TIME_CLOCK_GETRAWTIME},
     {"tick_busy_loop", (PyCFunction)clock_tick_busy_loop, METH_VARARGS,
      DOC_TIME_CLOCK_TICKBUSYLOOP},
+    {"get_frame_time_percentile", (PyCFunction)clock_get_frame_time_percentile,
+     METH_O, DOC_TIME_CLOCK_GETFRAMETIMEPERCENTILE},
+    {"get_max_frame_time", (PyCFunction)clock_get_max_frame_time, METH_NOARGS,
+     DOC_TIME_CLOCK_GETMAXFRAMETIME},
+    {"get_frame_times", (PyCFunction)clock_get_frame_times, METH_NOARGS,
+     DOC_TIME_CLOCK_GETFRAMETIMES},
+    {"section", (PyCFunction)clock_section, METH_O, DOC_TIME_CLOCK_SECTION},
+    {"get_sections", (PyCFunction)clock_get_sections, METH_NOARGS,
+     DOC_TIME_CLOCK_GETSECTIONS},
+    {"reset_profile", (PyCFunction)clock_reset_profile, METH_NOARGS,
+     DOC_TIME_CLOCK_RESETPROFILE},
     {NULL, NULL, 0, NULL}};
 
 static void
-clock_dealloc(PyObject *self)
+clock_dealloc(pgClockObject *self)
 {
-    Py_TYPE(self)->tp_free(self);
+    PyMem_Free(self->frame_times);
+    Py_XDECREF(self->sections);
+    Py_TYPE(self)->tp_free((PyObject *)self);
 }
 
 PyObject *
@@ -661,13 +913,14 @@ clock_str(pgClockObject *self)
 static PyObject *
 clock_new(PyTypeObject *type, PyObject *args, PyObject *kwargs)
 {
-    char *kwids[] = {NULL};
-    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "", kwids)) {
-        /* This function does not actually take in any arguments, but this
-         * argparse function is used to generate pythonic error messages if
-         * any args are passed */
+    Py_ssize_t history = CLOCK_DEFAULT_HISTORY;
+    char *kwids[] = {"history", NULL};
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "|$n", kwids, &history)) {
         return NULL;
     }
+    if (history < 1) {
+        return RAISE(PyExc_ValueError, "history must be at least 1");
+    }
 
 #if !SDL_VERSION_ATLEAST(3, 0, 0)
     if (!SDL_WasInit(SDL_INIT_TIMER)) {
@@ -678,6 +931,23 @@ clock_new(PyTypeObject *type, PyObject *args, PyObject *kwargs)
 #endif
 
     pgClockObject *self = (pgClockObject *)(type->tp_alloc(type, 0));
+    if (!self) {
+        return NULL;
+    }
+    self->frame_times = PyMem_New(double, history);
+    if (!self->frame_times) {
+        Py_DECREF(self);
+        return PyErr_NoMemory();
+    }
+    self->sections = PyDict_New();
+    if (!self->sections) {
+        Py_DECREF(self);
+        return NULL;
+    }
+    self->history = history;
+    self->frame_count = 0;
+    self->frame_next = 0;
+    self->last_counter = SDL_GetPerformanceCounter();
     self->fps_tick = 0;
     self->timepassed = 0;
     self->rawpassed = 0;
@@ -691,7 +961,7 @@ clock_new(PyTypeObject *type, PyObject *args, PyObject *kwargs)
 static PyTypeObject PyClock_Type = {
     PyVarObject_HEAD_INIT(NULL, 0).tp_name = "pygame.time.Clock",
     .tp_basicsize = sizeof(pgClockObject),
-    .tp_dealloc = clock_dealloc,
+    .tp_dealloc = (destructor)clock_dealloc,
     .tp_repr = (reprfunc)clock_str,
     .tp_str = (reprfunc)clock_str,
     .tp_doc = DOC_TIME_CLOCK,
@@ -743,6 +1013,10 @@ MODINIT_DEFINE(time)
         return NULL;
     }
 
+    if (PyType_Ready(&pgClockSection_Type) < 0) {
+        return NULL;
+    }
+
     /* create the module */
     module = PyModule_Create(&_module);
     if (!module) {
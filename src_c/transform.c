@@ -961,10 +961,6 @@ surf_rotozoom(PyObject *self, PyObject *args, PyObject *kwargs)
     Py_BEGIN_ALLOW_THREADS;
     newsurf = rotozoomSurface(surf32, angle, scale, 1);
     Py_END_ALLOW_THREADS;
-    if (newsurf == NULL) {
-        PyErr_SetString(pgExc_SDLError, SDL_GetError());
-        return NULL;
-    }
 
     if (surf32 == surf) {
         pgSurface_Unlock(surfobj);
@@ -972,6 +968,10 @@ surf_rotozoom(PyObject *self, PyObject *args, PyObject *kwargs)
     else {
         SDL_FreeSurface(surf32);
     }
+
+    if (newsurf == NULL) {
+        return RAISE(pgExc_SDLError, SDL_GetError());
+    }
     return (PyObject *)pgSurface_New(newsurf);
 }
 
@@ -2907,6 +2907,9 @@ laplacian(SDL_Surface *surf, PG_PixelFormat *format, SDL_Surface *destsurf,
                     SURF_GET_AT(sample[0], surf, x + -1, y + -1, pixels,
                                 format, pix);
                 }
+                else {
+                    sample[0] = LAPLACIAN_NUM;
+                }
 
                 SURF_GET_AT(sample[1], surf, x + 0, y + -1, pixels, format,
                             pix);
@@ -2915,6 +2918,9 @@ laplacian(SDL_Surface *surf, PG_PixelFormat *format, SDL_Surface *destsurf,
                     SURF_GET_AT(sample[2], surf, x + 1, y + -1, pixels, format,
                                 pix);
                 }
+                else {
+                    sample[2] = LAPLACIAN_NUM;
+                }
             }
             else {
                 sample[0] = LAPLACIAN_NUM;
@@ -2946,6 +2952,9 @@ laplacian(SDL_Surface *surf, PG_PixelFormat *format, SDL_Surface *destsurf,
                     SURF_GET_AT(sample[6], surf, x + -1, y + 1, pixels, format,
                                 pix);
                 }
+                else {
+                    sample[6] = LAPLACIAN_NUM;
+                }
 
                 SURF_GET_AT(sample[7], surf, x + 0, y + 1, pixels, format,
                             pix);
@@ -2954,6 +2963,9 @@ laplacian(SDL_Surface *surf, PG_PixelFormat *format, SDL_Surface *destsurf,
                     SURF_GET_AT(sample[8], surf, x + 1, y + 1, pixels, format,
                                 pix);
                 }
+                else {
+                    sample[8] = LAPLACIAN_NUM;
+                }
             }
             else {
                 sample[6] = LAPLACIAN_NUM;
@@ -1,5 +1,7 @@
 """Enhanced Pygame module for loading and rendering computer fonts"""
 
+from bisect import bisect_right
+
 from pygame._freetype import (
     STYLE_DEFAULT,
     STYLE_NORMAL,
@@ -19,10 +21,21 @@ from pygame._freetype import (
     set_default_resolution,
     was_init,
 )
+from pygame.color import Color
+from pygame.constants import (
+    BLEND_PREMULTIPLIED,
+    BLEND_RGBA_MAX,
+    BLEND_RGBA_MULT,
+    SRCALPHA,
+)
+from pygame.rect import Rect
+from pygame.surface import Surface
 from pygame.sysfont import SysFont as _SysFont, get_fonts, match_font
 
 __all__ = [
     "Font",
+    "GlyphAtlas",
+    "TextLayout",
     "STYLE_NORMAL",
     "STYLE_OBLIQUE",
     "STYLE_STRONG",
@@ -76,3 +89,506 @@ def SysFont(name, size, bold=False, italic=False, constructor=None):
             return font
 
     return _SysFont(name, size, bold, italic, constructor)
+
+
+class GlyphAtlas:
+    """GlyphAtlas(font, size=0, style=STYLE_DEFAULT, rotation=0, atlas_size=(512, 512), padding=1) -> GlyphAtlas
+    Render text from glyphs kept on a shared atlas Surface.
+
+    Each glyph is rasterized once, in white, onto the atlas. Strings are then
+    composed by blitting their glyphs from the atlas where
+    Font.get_glyph_layout() places them, so changing text only costs a few
+    blits. When the atlas is full, or the settings the glyphs were rendered
+    with change, all its glyphs are evicted at once.
+
+    Glyphs are blended where they overlap like Font.render() blends them,
+    a + b - a * b / 255, up to rounding.
+    """
+
+    _white = (255, 255, 255, 255)
+    _transparent = (0, 0, 0, 0)
+
+    def __init__(
+        self,
+        font,
+        size=0,
+        style=STYLE_DEFAULT,
+        rotation=0,
+        atlas_size=(512, 512),
+        padding=1,
+    ):
+        if padding < 0:
+            raise ValueError("padding must not be negative")
+        self.font = font
+        self.size = size
+        self.style = style
+        self.rotation = rotation
+        self.padding = padding
+        self.surface = Surface(atlas_size, SRCALPHA)
+        self._glyphs = {}
+        self._glyph_settings = None
+        self._shelves = []  # [y, height, next free x] of each row
+        self._used_area = 0
+        self._faded = None  # (alpha, atlas with the glyphs faded by alpha)
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._flushes = 0
+
+    def __len__(self):
+        return len(self._glyphs)
+
+    @property
+    def occupancy(self):
+        """Fraction of the atlas area covered by glyphs."""
+        width, height = self.surface.get_size()
+        return self._used_area / (width * height)
+
+    def get_stats(self):
+        """get_stats() -> dict
+        Get the glyph count, cache hits, misses, evictions and flushes."""
+        return {
+            "glyphs": len(self._glyphs),
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "flushes": self._flushes,
+        }
+
+    def clear(self):
+        """clear() -> None
+        Evict every glyph."""
+        self._evictions += len(self._glyphs)
+        self._glyphs.clear()
+        self._shelves.clear()
+        self._used_area = 0
+        self._faded = None
+        self.surface.fill(self._transparent)
+
+    def _settings(self):
+        """Returns the settings the glyph bitmaps depend on."""
+        font = self.font
+        return (
+            font,
+            self.size or font.size,
+            font.style if self.style == STYLE_DEFAULT else self.style,
+            self.rotation,
+            font.antialiased,
+            font.strength,
+            font.vertical,
+            font.use_bitmap_strikes,
+        )
+
+    def _layout(self, text):
+        style = self.font.style if self.style == STYLE_DEFAULT else self.style
+        if style & STYLE_UNDERLINE:
+            raise ValueError("GlyphAtlas cannot render underlined text")
+        return self.font.get_glyph_layout(text, style, self.rotation, self.size)
+
+    def _pack(self, width, height):
+        """Returns the atlas position for a glyph, None if the atlas is full."""
+        atlas_w, atlas_h = self.surface.get_size()
+        width += self.padding
+        height += self.padding
+        for shelf in self._shelves:
+            if height <= shelf[1] and shelf[2] + width <= atlas_w:
+                shelf[2] += width
+                return shelf[2] - width, shelf[0]
+        bottom = self._shelves[-1][0] + self._shelves[-1][1] if self._shelves else 0
+        if bottom + height > atlas_h or width > atlas_w:
+            return None
+        self._shelves.append([bottom, height, width])
+        return 0, bottom
+
+    def _add(self, text, index, width, height):
+        if width + self.padding > self.surface.get_width():
+            raise ValueError("glyph does not fit in the glyph atlas")
+        if height + self.padding > self.surface.get_height():
+            raise ValueError("glyph does not fit in the glyph atlas")
+        position = self._pack(width, height)
+        if position is None:
+            return None
+        # Rasterize the glyph alone and copy its bitmap onto the atlas
+        _, gx, gy, _, _ = self._layout(text[index])[1][0]
+        glyph, _ = self.font.render(
+            text[index],
+            self._white,
+            self._transparent,
+            self.style,
+            self.rotation,
+            self.size,
+        )
+        area = Rect(position, (width, height))
+        self.surface.blit(
+            glyph, position, (gx, gy, width, height), special_flags=BLEND_RGBA_MAX
+        )
+        self._used_area += width * height
+        self._faded = None
+        return area
+
+    def _blits(self, text, layout):
+        """Returns the blits composing the text, adding missing glyphs."""
+        glyphs = self._glyphs
+        atlas = self.surface
+        blits = []
+        append = blits.append
+        misses = 0
+        for index, (glyph_index, x, y, width, height) in enumerate(layout):
+            if not width or not height:
+                continue
+            area = glyphs.get(glyph_index)
+            if area is None:
+                misses += 1
+                area = self._add(text, index, width, height)
+                if area is None:
+                    return None
+                glyphs[glyph_index] = area
+            # white straight alpha saturates to white, and the alpha
+            # channel blends as a + b - a * b / 255 like Font.render()
+            append((atlas, (x, y), area, BLEND_PREMULTIPLIED))
+        self._misses += misses
+        self._hits += len(blits) - misses
+        return blits
+
+    def _faded_atlas(self, alpha):
+        """Returns a copy of the atlas with the coverage of every glyph scaled
+        by alpha, as Font.render() scales each glyph by the text alpha before
+        blending it."""
+        if self._faded is None or self._faded[0] != alpha:
+            faded = self.surface.copy()
+            faded.fill((255, 255, 255, alpha), special_flags=BLEND_RGBA_MULT)
+            self._faded = alpha, faded
+        return self._faded[1]
+
+    def render(self, text, fgcolor=None, bgcolor=None):
+        """render(text, fgcolor=None, bgcolor=None) -> (Surface, Rect)
+        Return rendered text as a surface, like Font.render()."""
+        if isinstance(text, bytes):
+            text = text.decode("latin1")
+        settings = self._settings()
+        if settings != self._glyph_settings:
+            # the glyphs on the atlas are keyed by index only
+            if self._glyphs:
+                self.clear()
+            self._glyph_settings = settings
+        rect, layout = self._layout(text)
+        blits = self._blits(text, layout)
+        if blits is None:
+            # The atlas is full, start over with only this text on it
+            self._flushes += 1
+            self.clear()
+            blits = self._blits(text, layout)
+            if blits is None:
+                raise ValueError("text does not fit in the glyph atlas")
+
+        color = Color(self.font.fgcolor if fgcolor is None else fgcolor)
+        if color.a != 255:
+            faded = self._faded_atlas(color.a)
+            blits = [(faded, pos, area, flags) for _, pos, area, flags in blits]
+            color.a = 255
+
+        surf = Surface(rect.size, SRCALPHA)
+        surf.blits(blits, doreturn=False)
+        surf.fill(color, special_flags=BLEND_RGBA_MULT)
+        if bgcolor is not None:
+            text_surf = surf
+            surf = Surface(rect.size, SRCALPHA)
+            surf.fill(bgcolor)
+            surf.blit(text_surf, (0, 0))
+        return surf, rect
+
+    def render_to(self, surf, dest, text, fgcolor=None, bgcolor=None):
+        """render_to(surf, dest, text, fgcolor=None, bgcolor=None) -> Rect
+        Render text onto a surface, with dest as the top left corner."""
+        text_surf, rect = self.render(text, fgcolor, bgcolor)
+        return surf.blit(text_surf, dest)
+
+
+class TextLayout:
+    """TextLayout(font, width, text="", size=0) -> TextLayout
+    Word wrapped multi-line text that can be edited incrementally.
+
+    The text is kept as paragraphs, split on newlines, each with the advance
+    of every character and the start of each wrapped line. Editing only
+    measures the inserted characters and wraps the paragraphs it touches,
+    and render_to() only draws the lines in view.
+    """
+
+    def __init__(self, font, width, text="", size=0):
+        if width <= 0:
+            raise ValueError("width must be positive")
+        self.font = font
+        self.size = size
+        self._width = width
+        self._notdef_advance = None
+        self.text = text
+
+    def __len__(self):
+        return self._first_char[-1] - 1
+
+    @property
+    def text(self):
+        """The whole text, newlines included."""
+        return "\n".join(paragraph[0] for paragraph in self._paragraphs)
+
+    @text.setter
+    def text(self, text):
+        text = self._decode(text)
+        self._paragraphs = [self._new_paragraph(part) for part in text.split("\n")]
+        self._update_offsets(0)
+
+    @property
+    def width(self):
+        """The width lines are wrapped to, setting it wraps the text again."""
+        return self._width
+
+    @width.setter
+    def width(self, width):
+        if width <= 0:
+            raise ValueError("width must be positive")
+        self._width = width
+        for paragraph in self._paragraphs:
+            paragraph[2] = self._wrap(paragraph[0], paragraph[1])
+        self._update_offsets(0)
+
+    @property
+    def line_height(self):
+        """Distance in pixels between consecutive lines."""
+        return self.font.get_sized_height(self.size)
+
+    @property
+    def line_count(self):
+        """The number of lines after wrapping."""
+        return self._first_line[-1]
+
+    @property
+    def height(self):
+        """The height in pixels of all the lines."""
+        return self.line_count * self.line_height
+
+    def get_line(self, line):
+        """get_line(line) -> str
+        Return the text of a line, without its trailing newline."""
+        if line < 0:
+            line += self.line_count
+        if not 0 <= line < self.line_count:
+            raise IndexError("line index out of range")
+        paragraph = bisect_right(self._first_line, line) - 1
+        text, _, starts = self._paragraphs[paragraph]
+        start, end = self._line_span(starts, line - self._first_line[paragraph], text)
+        return text[start:end]
+
+    def append(self, text):
+        """append(text) -> None
+        Add text at the end, only wrapping the last line again."""
+        text = self._decode(text)
+        if not text:
+            return
+        last = len(self._paragraphs) - 1
+        paragraph = self._paragraphs[last]
+        head, *parts = text.split("\n")
+        paragraph[0] += head
+        paragraph[1] += self._measure(head)
+        # Appending can only change how the last line wraps
+        start = paragraph[2].pop()
+        paragraph[2] += self._wrap(paragraph[0], paragraph[1], start)
+        self._paragraphs += [self._new_paragraph(part) for part in parts]
+        self._update_offsets(last)
+
+    def insert(self, index, text):
+        """insert(index, text) -> None
+        Insert text before the character at index."""
+        text = self._decode(text)
+        index = slice(index, None).indices(len(self))[0]
+        first = bisect_right(self._first_char, index) - 1
+        offset = index - self._first_char[first]
+        old_text, old_advances, _ = self._paragraphs[first]
+        parts = text.split("\n")
+        parts[0] = old_text[:offset] + parts[0]
+        parts[-1] += old_text[offset:]
+        advances = self._measure(text)
+        if len(parts) == 1:
+            advances = [old_advances[:offset] + advances + old_advances[offset:]]
+        else:
+            advances = self._split_advances(text, advances)
+            advances[0] = old_advances[:offset] + advances[0]
+            advances[-1] += old_advances[offset:]
+        self._paragraphs[first : first + 1] = [
+            [part, part_advances, self._wrap(part, part_advances)]
+            for part, part_advances in zip(parts, advances)
+        ]
+        self._update_offsets(first)
+
+    def delete(self, start, end):
+        """delete(start, end) -> None
+        Remove the characters from start up to, but not including, end."""
+        start, end, _ = slice(start, end).indices(len(self))
+        if start >= end:
+            return
+        first = bisect_right(self._first_char, start) - 1
+        last = bisect_right(self._first_char, end) - 1
+        head = start - self._first_char[first]
+        tail = end - self._first_char[last]
+        text = self._paragraphs[first][0][:head] + self._paragraphs[last][0][tail:]
+        advances = self._paragraphs[first][1][:head] + self._paragraphs[last][1][tail:]
+        self._paragraphs[first : last + 1] = [
+            [text, advances, self._wrap(text, advances)]
+        ]
+        self._update_offsets(first)
+
+    def get_position(self, index):
+        """get_position(index) -> (x, y)
+        Return the top left corner of the character at index."""
+        index = slice(index, None).indices(len(self))[0]
+        first = bisect_right(self._first_char, index) - 1
+        _, advances, starts = self._paragraphs[first]
+        offset = index - self._first_char[first]
+        line = bisect_right(starts, offset) - 1
+        x = sum(advances[starts[line] : offset])
+        return x, (self._first_line[first] + line) * self.line_height
+
+    def index_at(self, pos):
+        """index_at(pos) -> int
+        Return the index of the character boundary nearest to a position."""
+        x, y = pos
+        line = min(max(int(y // self.line_height), 0), self.line_count - 1)
+        first = bisect_right(self._first_line, line) - 1
+        text, advances, starts = self._paragraphs[first]
+        line -= self._first_line[first]
+        start, end = self._line_span(starts, line, text)
+        index = start
+        while index < end and x > advances[index] / 2:
+            x -= advances[index]
+            index += 1
+        if index == end and line + 1 < len(starts) and index > start:
+            # A wrapped line ends where the next one starts
+            index -= 1
+        return self._first_char[first] + index
+
+    def render_to(self, surf, dest, area=None, fgcolor=None, bgcolor=None):
+        """render_to(surf, dest, area=None, fgcolor=None, bgcolor=None) -> Rect
+        Draw the lines within area, in layout coordinates, onto a surface."""
+        if area is None:
+            area = Rect(0, 0, self._width, self.height)
+        else:
+            area = Rect(area)
+        dest_x, dest_y = dest[0], dest[1]
+        line_height = self.line_height
+        ascender = self.font.get_sized_ascender(self.size)
+        first_line = max(area.top // line_height, 0)
+        last_line = min((area.bottom - 1) // line_height + 1, self.line_count)
+
+        target = Rect(dest_x, dest_y, area.width, area.height).clip(surf.get_clip())
+        if not target:
+            return target
+        # Font.render_to() ignores the clip rect of a surface, but not its size
+        view = surf.subsurface(target)
+        x = dest_x - area.x - target.x
+        y = dest_y - area.y - target.y + ascender
+        origin = self.font.origin
+        self.font.origin = True
+        try:
+            for line in range(first_line, last_line):
+                paragraph = bisect_right(self._first_line, line) - 1
+                text, _, starts = self._paragraphs[paragraph]
+                start, end = self._line_span(
+                    starts, line - self._first_line[paragraph], text
+                )
+                if start == end:
+                    continue
+                self.font.render_to(
+                    view,
+                    (x, y + line * line_height),
+                    text[start:end],
+                    fgcolor,
+                    bgcolor,
+                    size=self.size,
+                )
+        finally:
+            self.font.origin = origin
+        return target
+
+    @staticmethod
+    def _line_span(starts, line, text):
+        start = starts[line]
+        end = starts[line + 1] if line + 1 < len(starts) else len(text)
+        return start, end
+
+    @staticmethod
+    def _decode(text):
+        return text.decode("latin1") if isinstance(text, bytes) else text
+
+    @staticmethod
+    def _split_advances(text, advances):
+        """Splits the advances of text at each newline, dropping newlines."""
+        parts = []
+        start = 0
+        for part in text.split("\n"):
+            parts.append(advances[start : start + len(part)])
+            start += len(part) + 1
+        return parts
+
+    def _measure(self, text):
+        """Returns the advance of each character of text."""
+        if not text:
+            return []
+        advances = []
+        for metrics in self.font.get_metrics(text, self.size):
+            if metrics is None:
+                # Characters missing from the font are drawn as the
+                # undefined glyph
+                if self._notdef_advance is None:
+                    single = self.font.get_rect("\0", size=self.size)
+                    double = self.font.get_rect("\0\0", size=self.size)
+                    self._notdef_advance = double.width - single.width
+                advances.append(self._notdef_advance)
+            else:
+                advances.append(metrics[4])
+        return advances
+
+    def _new_paragraph(self, text):
+        advances = self._measure(text)
+        return [text, advances, self._wrap(text, advances)]
+
+    def _wrap(self, text, advances, start=0):
+        """Returns the starts of the lines of a paragraph, from start on.
+
+        Lines break after spaces, which may hang past the width. Words
+        wider than a line are broken between characters.
+        """
+        width = self._width
+        starts = [start]
+        line_start = start
+        space_end = start
+        x = 0
+        for index in range(start, len(text)):
+            advance = advances[index]
+            if text[index] == " ":
+                x += advance
+                space_end = index + 1
+                continue
+            if x + advance > width and index > line_start:
+                line_start = space_end if space_end > line_start else index
+                x = sum(advances[line_start:index])
+                if x + advance > width and index > line_start:
+                    line_start = index
+                    x = 0
+                starts.append(line_start)
+            x += advance
+        return starts
+
+    def _update_offsets(self, first):
+        """Updates the first character and line of paragraphs from first on."""
+        if first == 0:
+            self._first_char = [0]
+            self._first_line = [0]
+        else:
+            del self._first_char[first + 1 :]
+            del self._first_line[first + 1 :]
+        char = self._first_char[first]
+        line = self._first_line[first]
+        for text, _, starts in self._paragraphs[first:]:
+            char += len(text) + 1
+            line += len(starts)
+            self._first_char.append(char)
+            self._first_line.append(line)
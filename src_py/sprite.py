@@ -84,14 +84,56 @@ Sprites are not thread safe, so lock them yourself if using threads.
 # specific ones that aren't quite so general but fit into common
 # specialized cases.
 
+import math
 import types
+from array import array
+from bisect import bisect_left, insort
+from itertools import chain
+from operator import attrgetter
 from warnings import warn
 
 import pygame
 from pygame.mask import from_surface
-from pygame.rect import Rect
+from pygame.rect import FRect, Rect
 from pygame.time import get_ticks
 
+try:
+    from pygame._sprite_accel import (
+        dirty_blits as _dirty_blits,
+        integrate as _integrate,
+        sync_rects as _sync_rects,
+    )
+except ImportError:
+    # LayeredDirty uses its own methods instead
+    _dirty_blits = None
+
+    # slower versions for platforms without the C helpers
+    def _integrate(positions, velocities, dt, bounds=None, wrap=False):
+        for i, velocity in enumerate(velocities):
+            positions[i] += velocity * dt
+        if bounds is None:
+            return
+        left, top, right, bottom = bounds
+        for i in range(0, len(positions), 2):
+            x, y = positions[i], positions[i + 1]
+            if wrap:
+                x = left + (x - left) % (right - left) if right > left else left
+                y = top + (y - top) % (bottom - top) if bottom > top else top
+            else:
+                x = min(max(x, left), right)
+                y = min(max(y, top), bottom)
+            positions[i], positions[i + 1] = x, y
+
+    def _sync_rects(rects, positions):
+        for i, rect in enumerate(rects):
+            if isinstance(rect, Rect):
+                rect.center = (
+                    math.floor(positions[2 * i]),
+                    math.floor(positions[2 * i + 1]),
+                )
+            elif rect is not None:
+                rect.center = (positions[2 * i], positions[2 * i + 1])
+
 
 class Sprite:
     """simple base class for visible game objects
@@ -358,6 +400,406 @@ class DirtySprite(Sprite):
         )
 
 
+class CompactSprite:
+    """a Sprite without an instance dictionary, for very large groups
+
+    pygame.sprite.CompactSprite(*groups): return CompactSprite
+
+    A lighter alternative to Sprite for games with many thousands of sprites.
+    Its attributes are stored in __slots__, and while it is in a CompactGroup
+    its image and rect are stored in lists owned by that group, so the group
+    can draw all of its sprites without looking up any sprite attribute.
+
+    A CompactSprite can be in at most one CompactGroup, but can also be in
+    any number of Groups that don't need layers. Subclasses should declare
+    __slots__ for their own attributes to stay compact.
+
+    """
+
+    __slots__ = ("_owner", "_index", "_image", "_rect", "_groups")
+
+    def __init__(self, *groups):
+        # the CompactGroup storing the image and rect, or None
+        self._owner = None
+        self._index = -1
+        self._image = None
+        self._rect = None
+        # the other groups, created on first use
+        self._groups = None
+        if groups:
+            self.add(*groups)
+
+    @property
+    def image(self):
+        owner = self._owner
+        if owner is None:
+            return self._image
+        return owner._images[self._index]
+
+    @image.setter
+    def image(self, value):
+        owner = self._owner
+        if owner is None:
+            self._image = value
+        else:
+            owner._images[self._index] = value
+
+    @property
+    def rect(self):
+        owner = self._owner
+        if owner is None:
+            return self._rect
+        return owner._rects[self._index]
+
+    @rect.setter
+    def rect(self, value):
+        owner = self._owner
+        if owner is None:
+            self._rect = value
+        else:
+            owner._rects[self._index] = value
+
+    def add(self, *groups):
+        """add the sprite to groups
+
+        CompactSprite.add(*groups): return None
+
+        Any number of Group instances can be passed as arguments. The
+        sprite will be added to the Groups it is not already a member of.
+
+        """
+        for group in groups:
+            if hasattr(group, "_spritegroup"):
+                if not group.has_internal(self):
+                    group.add_internal(self)
+                    self.add_internal(group)
+            else:
+                self.add(*group)
+
+    def remove(self, *groups):
+        """remove the sprite from groups
+
+        CompactSprite.remove(*groups): return None
+
+        Any number of Group instances can be passed as arguments. The sprite
+        will be removed from the Groups it is currently a member of.
+
+        """
+        for group in groups:
+            if hasattr(group, "_spritegroup"):
+                if group.has_internal(self):
+                    group.remove_internal(self)
+                    self.remove_internal(group)
+            else:
+                self.remove(*group)
+
+    def add_internal(self, group):
+        """
+        For adding this sprite to a group internally.
+
+        :param group: The group we are adding to.
+        """
+        # the owner keeps track of itself in _owner
+        if group is not self._owner:
+            if self._groups is None:
+                self._groups = {}
+            self._groups[group] = 0
+
+    def remove_internal(self, group):
+        """
+        For removing this sprite from a group internally.
+
+        :param group: The group we are removing from.
+        """
+        # the owner has already cleared _owner when it calls this
+        if self._groups:
+            self._groups.pop(group, None)
+
+    def update(self, *args, **kwargs):
+        """method to control sprite behavior
+
+        CompactSprite.update(*args, **kwargs):
+
+        The default implementation of this method does nothing, see
+        Sprite.update().
+
+        """
+
+    def kill(self):
+        """remove the sprite from all Groups
+
+        CompactSprite.kill(): return None
+
+        """
+        if self._owner is not None:
+            self._owner.remove_internal(self)
+        if self._groups:
+            for group in self._groups:
+                group.remove_internal(self)
+        self._groups = None
+
+    def groups(self):
+        """list of Groups that contain this sprite
+
+        CompactSprite.groups(): return group_list
+
+        """
+        groups = [] if self._owner is None else [self._owner]
+        if self._groups:
+            groups.extend(self._groups)
+        return groups
+
+    def alive(self):
+        """does the sprite belong to any groups
+
+        CompactSprite.alive(): return bool
+
+        """
+        return self._owner is not None or bool(self._groups)
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__} CompactSprite(in {len(self.groups())} groups)>"
+        )
+
+
+class KinematicSprite(CompactSprite):
+    """a CompactSprite that moves by itself in a KinematicGroup
+
+    pygame.sprite.KinematicSprite(*groups): return KinematicSprite
+
+    A CompactSprite with a position and a velocity. While it is in a
+    KinematicGroup, both are stored in buffers shared by the whole group,
+    and KinematicGroup.integrate() moves every sprite in one call.
+
+    The position is where the center of the rect is placed. It is given
+    as floats, so slow sprites still move, and the rect follows it when
+    the position is set, after KinematicGroup.integrate() and before
+    KinematicGroup.draw().
+
+    """
+
+    __slots__ = ("_kinematic", "_position", "_velocity")
+
+    def __init__(self, *groups):
+        # the KinematicGroup storing the position and velocity, or None
+        self._kinematic = None
+        self._position = None
+        self._velocity = (0.0, 0.0)
+        CompactSprite.__init__(self, *groups)
+
+    @property
+    def position(self):
+        group = self._kinematic
+        if group is None:
+            if self._position is None:
+                rect = self.rect
+                return (0.0, 0.0) if rect is None else tuple(map(float, rect.center))
+            return self._position
+        i = 2 * self._index
+        return (group._positions[i], group._positions[i + 1])
+
+    @position.setter
+    def position(self, value):
+        x, y = value
+        x, y = float(x), float(y)
+        group = self._kinematic
+        if group is None:
+            self._position = (x, y)
+        else:
+            i = 2 * self._index
+            group._positions[i] = x
+            group._positions[i + 1] = y
+        rect = self.rect
+        if rect is not None:
+            _sync_rects([rect], array("d", (x, y)))
+
+    @property
+    def velocity(self):
+        group = self._kinematic
+        if group is None:
+            return self._velocity
+        i = 2 * self._index
+        return (group._velocities[i], group._velocities[i + 1])
+
+    @velocity.setter
+    def velocity(self, value):
+        x, y = value
+        x, y = float(x), float(y)
+        group = self._kinematic
+        if group is None:
+            self._velocity = (x, y)
+        else:
+            i = 2 * self._index
+            group._velocities[i] = x
+            group._velocities[i + 1] = y
+
+
+class SpatialHash:
+    """uniform grid index of sprite rects for broadphase collision queries
+
+    pygame.sprite.SpatialHash(cell_size=64): return SpatialHash
+
+    Buckets sprites into square grid cells by their rect, so that the sprites
+    near a given area can be found without testing every sprite. Queries only
+    return candidates; the caller still has to run the exact (narrow phase)
+    test on them.
+
+    The index does not notice when a sprite moves. Call refresh() after
+    moving sprites; a group owning the index does this automatically at the
+    end of Group.update().
+
+    """
+
+    def __init__(self, cell_size=64):
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self._cell_size = cell_size
+        self._cells = {}
+        # sprite -> (insertion order, cell bounds or None)
+        self._entries = {}
+        self._counter = 0
+
+    @property
+    def cell_size(self):
+        """the width and height of one grid cell"""
+        return self._cell_size
+
+    def _bounds(self, rect):
+        if rect is None:
+            return None
+        size = self._cell_size
+        left, top, width, height = rect
+        right = left + width
+        bottom = top + height
+        if right < left:
+            left, right = right, left
+        if bottom < top:
+            top, bottom = bottom, top
+        return (
+            int(left // size),
+            int(top // size),
+            int(right // size),
+            int(bottom // size),
+        )
+
+    def _link(self, sprite, bounds):
+        cells = self._cells
+        for cx in range(bounds[0], bounds[2] + 1):
+            for cy in range(bounds[1], bounds[3] + 1):
+                try:
+                    cells[cx, cy][sprite] = None
+                except KeyError:
+                    cells[cx, cy] = {sprite: None}
+
+    def _unlink(self, sprite, bounds):
+        cells = self._cells
+        for cx in range(bounds[0], bounds[2] + 1):
+            for cy in range(bounds[1], bounds[3] + 1):
+                cell = cells[cx, cy]
+                del cell[sprite]
+                if not cell:
+                    del cells[cx, cy]
+
+    def add(self, sprite):
+        """add a sprite to the index
+
+        SpatialHash.add(sprite): return None
+
+        The sprite is bucketed by its current rect. A sprite whose rect is
+        None is tracked, and bucketed by the next refresh().
+
+        """
+        if sprite in self._entries:
+            return
+        bounds = self._bounds(getattr(sprite, "rect", None))
+        self._entries[sprite] = (self._counter, bounds)
+        self._counter += 1
+        if bounds is not None:
+            self._link(sprite, bounds)
+
+    def remove(self, sprite):
+        """remove a sprite from the index
+
+        SpatialHash.remove(sprite): return None
+
+        """
+        entry = self._entries.pop(sprite, None)
+        if entry is not None and entry[1] is not None:
+            self._unlink(sprite, entry[1])
+
+    def refresh(self, *sprites):
+        """re-bucket sprites whose rect has moved
+
+        SpatialHash.refresh(*sprites): return None
+
+        Only the given sprites are checked, or every indexed sprite when no
+        arguments are passed. Sprites that stayed in the same cells cost a
+        single comparison.
+
+        """
+        entries = self._entries
+        bounds_of = self._bounds
+        for sprite in sprites or list(entries):
+            try:
+                order, old_bounds = entries[sprite]
+            except KeyError:
+                continue
+            new_bounds = bounds_of(getattr(sprite, "rect", None))
+            if new_bounds != old_bounds:
+                if old_bounds is not None:
+                    self._unlink(sprite, old_bounds)
+                if new_bounds is not None:
+                    self._link(sprite, new_bounds)
+                entries[sprite] = (order, new_bounds)
+
+    def clear(self):
+        """remove all sprites from the index
+
+        SpatialHash.clear(): return None
+
+        """
+        self._cells.clear()
+        self._entries.clear()
+
+    def query(self, rect):
+        """return the sprites in the cells touched by a rect
+
+        SpatialHash.query(rect): return sprite_list
+
+        The sprites are returned in the order they were added to the index.
+        They are candidates only; a sprite is returned when it shares a grid
+        cell with the rect, not only when it overlaps it.
+
+        """
+        if not isinstance(rect, (Rect, FRect)):
+            rect = FRect(rect)
+        bounds = self._bounds(rect)
+        cells = self._cells
+        found = {}
+        for cx in range(bounds[0], bounds[2] + 1):
+            for cy in range(bounds[1], bounds[3] + 1):
+                cell = cells.get((cx, cy))
+                if cell:
+                    found.update(cell)
+        if len(found) > 1:
+            entries = self._entries
+            return sorted(found, key=lambda spr: entries[spr][0])
+        return list(found)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, sprite):
+        return sprite in self._entries
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__}(cell_size={self._cell_size}, "
+            f"{len(self._entries)} sprites)>"
+        )
+
+
 class AbstractGroup:
     """base class for containers of sprites
 
@@ -375,9 +817,38 @@ class AbstractGroup:
     # protected identifier value to identify sprite groups, and avoid infinite recursion
     _spritegroup = True
 
+    # class level defaults so subclasses not calling __init__ still work
+    _spatial_index = None
+    # the sprites drawn by the last draw() with a view, None if all were drawn
+    _in_view = None
+
+    # the drawn rect of a sprite not drawn yet
+    _init_rect = None
+
     def __init__(self):
         self.spritedict = {}
         self.lostsprites = []
+        self._spatial_index = None
+        self._in_view = None
+
+    @property
+    def spatial_index(self):
+        """
+        The SpatialHash used to speed up collision queries, or None.
+
+        Assigning a SpatialHash fills it with the sprites of the group; the
+        group then keeps it updated as sprites are added and removed, and
+        refreshes it at the end of update(). Assign None to stop indexing.
+        """
+        return self._spatial_index
+
+    @spatial_index.setter
+    def spatial_index(self, index):
+        if index is not None:
+            index.clear()
+            for sprite in self.sprites():
+                index.add(sprite)
+        self._spatial_index = index
 
     def sprites(self):
         """get a list of sprites in the group
@@ -403,7 +874,9 @@ class AbstractGroup:
         :param sprite: The sprite we are adding.
         :param layer: the layer to add to, if the group type supports layers
         """
-        self.spritedict[sprite] = None
+        self.spritedict[sprite] = self._init_rect
+        if self._spatial_index is not None:
+            self._spatial_index.add(sprite)
 
     def remove_internal(self, sprite):
         """
@@ -414,6 +887,8 @@ class AbstractGroup:
         if lost_rect := self.spritedict[sprite]:
             self.lostsprites.append(lost_rect)
         del self.spritedict[sprite]
+        if self._spatial_index is not None:
+            self._spatial_index.remove(sprite)
 
     def has_internal(self, sprite):
         """
@@ -454,7 +929,7 @@ class AbstractGroup:
             # It's possible that some sprite is also an iterator.
             # If this is the case, we should add the sprite itself,
             # and not the iterator object.
-            if isinstance(sprite, Sprite):
+            if isinstance(sprite, (Sprite, CompactSprite)):
                 if not self.has_internal(sprite):
                     self.add_internal(sprite)
                     sprite.add_internal(self)
@@ -492,7 +967,7 @@ class AbstractGroup:
         # old-style sprite group. Lastly, if that fails, it assumes that the
         # normal Sprite methods should be used.
         for sprite in sprites:
-            if isinstance(sprite, Sprite):
+            if isinstance(sprite, (Sprite, CompactSprite)):
                 if self.has_internal(sprite):
                     self.remove_internal(sprite)
                     sprite.remove_internal(self)
@@ -523,7 +998,7 @@ class AbstractGroup:
             return False  # return False if no sprites passed in
 
         for sprite in sprites:
-            if isinstance(sprite, Sprite):
+            if isinstance(sprite, (Sprite, CompactSprite)):
                 # Check for Sprite instance's membership in this group
                 if not self.has_internal(sprite):
                     return False
@@ -542,6 +1017,46 @@ class AbstractGroup:
 
         return True
 
+    def _draw_order_key(self):
+        """
+        A sort key putting sprites in drawing order, or None when the sprites
+        are drawn in the order they were added to the spatial index.
+        """
+        return None
+
+    def get_sprites_in(self, rect):
+        """return a list with all sprites overlapping a rect
+
+        Group.get_sprites_in(rect): return colliding_sprites
+
+        The sprites are listed in drawing order, so the top ones are listed
+        last. Uses the spatial index if the group has one.
+
+        """
+        if not isinstance(rect, (Rect, FRect)):
+            rect = Rect(rect)
+        index = self._spatial_index
+        if index is None:
+            sprites = self.sprites()
+            return [sprites[i] for i in rect.collidelistall(sprites)]
+
+        colliderect = rect.colliderect
+        found = [spr for spr in index.query(rect) if colliderect(spr.rect)]
+        key = self._draw_order_key()
+        if key is not None and len(found) > 1:
+            found.sort(key=key)
+        return found
+
+    def get_sprites_at(self, pos):
+        """return a list with all sprites at that position
+
+        Group.get_sprites_at(pos): return colliding_sprites
+
+        Bottom sprites are listed first; the top ones are listed last.
+
+        """
+        return self.get_sprites_in(Rect(pos, (1, 1)))
+
     def update(self, *args, **kwargs):
         """call the update method of every member sprite
 
@@ -553,30 +1068,61 @@ class AbstractGroup:
         """
         for sprite in self.sprites():
             sprite.update(*args, **kwargs)
+        if self._spatial_index is not None:
+            self._spatial_index.refresh()
 
-    def draw(self, surface, bgd=None, special_flags=0):  # noqa pylint: disable=unused-argument; bgd arg used in LayeredDirty
+    def _sprites_in_view(self, view):
+        """
+        Returns the sprites overlapping view in drawing order, the offset
+        moving them onto the surface and the drawn rects of the sprites that
+        left the view, which are forgotten.
+        """
+        if not isinstance(view, (Rect, FRect)):
+            view = Rect(view)
+        sprites = self.get_sprites_in(view)
+
+        spritedict = self.spritedict
+        init_rect = self._init_rect
+        visible = set(sprites)
+        lost = []
+        for spr in spritedict if self._in_view is None else self._in_view:
+            if spr not in visible and spr in spritedict:
+                if old_rect := spritedict[spr]:
+                    lost.append(old_rect)
+                spritedict[spr] = init_rect
+        self._in_view = sprites
+
+        return sprites, (-view.x, -view.y), lost
+
+    def draw(self, surface, bgd=None, special_flags=0, view=None):  # noqa pylint: disable=unused-argument; bgd arg used in LayeredDirty
         """draw all sprites onto the surface
 
-        Group.draw(surface, bgd=None, special_flags=0): return Rect_list
+        Group.draw(surface, bgd=None, special_flags=0, view=None): return Rect_list
 
         Draws all of the member sprites onto the given surface.
 
+        If view is given, only the sprites overlapping that rect are drawn,
+        moved so that its topleft corner is at the topleft of the surface.
+
         """
-        sprites = self.sprites()
-        if hasattr(surface, "blits"):
-            self.spritedict.update(
-                zip(
-                    sprites,
-                    surface.blits(
-                        (spr.image, spr.rect, None, special_flags) for spr in sprites
-                    ),
-                )
+        if view is None:
+            sprites = self.sprites()
+            self._in_view = None
+            blit_sequence = (
+                (spr.image, spr.rect, None, special_flags) for spr in sprites
             )
         else:
-            for spr in sprites:
-                self.spritedict[spr] = surface.blit(
-                    spr.image, spr.rect, None, special_flags
-                )
+            sprites, (dx, dy), _ = self._sprites_in_view(view)
+            blit_sequence = (
+                (spr.image, spr.rect.move(dx, dy), None, special_flags)
+                for spr in sprites
+            )
+
+        if hasattr(surface, "blits"):
+            self.spritedict.update(zip(sprites, surface.blits(blit_sequence)))
+        else:
+            for spr, blit in zip(sprites, blit_sequence):
+                self.spritedict[spr] = surface.blit(*blit)
         self.lostsprites = []
         dirty = self.lostsprites
 
@@ -661,6 +1207,355 @@ class Group(AbstractGroup):
         self.add(*sprites)
 
 
+class CompactGroup(AbstractGroup):
+    """container class for many CompactSprites
+
+    pygame.sprite.CompactGroup(*sprites): return CompactGroup
+
+    A Group for CompactSprites that stores their images and rects in flat
+    lists, one entry per sprite, instead of in the sprites themselves. Adding
+    and removing sprites takes constant time, and draw() blits all the sprites
+    with a single Surface.blits() call without touching the sprite objects.
+
+    As with Group, the sprites are not ordered. Removing a sprite moves the
+    last one in its place.
+
+    """
+
+    def __init__(self, *sprites):
+        AbstractGroup.__init__(self)
+        self._sprites = []
+        self._images = []
+        self._rects = []
+        # the area of each sprite at the last draw(), to clear it
+        self._drawn = []
+        self.add(*sprites)
+
+    def sprites(self):
+        """get a list of sprites in the group
+
+        CompactGroup.sprites(): return list
+
+        """
+        return self._sprites[:]
+
+    def add_internal(
+        self,
+        sprite,
+        layer=None,  # noqa pylint: disable=unused-argument; same signature as AbstractGroup
+    ):
+        """
+        For adding a sprite to this group internally.
+
+        :param sprite: The CompactSprite we are adding.
+        """
+        if not isinstance(sprite, CompactSprite):
+            raise TypeError("CompactGroup can only contain CompactSprites")
+        if sprite._owner is not None:
+            raise ValueError("the sprite is already in another CompactGroup")
+
+        sprite._index = len(self._sprites)
+        self._sprites.append(sprite)
+        self._images.append(sprite._image)
+        self._rects.append(sprite._rect)
+        self._drawn.append(None)
+        sprite._owner = self
+        sprite._image = sprite._rect = None
+        if self._spatial_index is not None:
+            self._spatial_index.add(sprite)
+
+    def remove_internal(self, sprite):
+        """
+        For removing a sprite from this group internally.
+
+        :param sprite: The CompactSprite we are removing.
+        """
+        index = sprite._index
+        if lost_rect := self._drawn[index]:
+            self.lostsprites.append(lost_rect)
+        sprite._image = self._images[index]
+        sprite._rect = self._rects[index]
+        sprite._owner = None
+        sprite._index = -1
+
+        # move the last sprite in the place of the removed one
+        last = self._sprites.pop()
+        image = self._images.pop()
+        rect = self._rects.pop()
+        drawn = self._drawn.pop()
+        if last is not sprite:
+            last._index = index
+            self._sprites[index] = last
+            self._images[index] = image
+            self._rects[index] = rect
+            self._drawn[index] = drawn
+
+        if self._spatial_index is not None:
+            self._spatial_index.remove(sprite)
+
+    def has_internal(self, sprite):
+        """
+        For checking if a sprite is in this group internally.
+
+        :param sprite: The sprite we are checking.
+        """
+        return getattr(sprite, "_owner", None) is self
+
+    def _draw_order_key(self):
+        return attrgetter("_index")
+
+    def get_sprites_in(self, rect):
+        """return a list with all sprites overlapping a rect
+
+        CompactGroup.get_sprites_in(rect): return colliding_sprites
+
+        """
+        if self._spatial_index is None:
+            # test the rect list without going through the sprites
+            if not isinstance(rect, (Rect, FRect)):
+                rect = Rect(rect)
+            _sprites = self._sprites
+            return [_sprites[i] for i in rect.collidelistall(self._rects)]
+        return AbstractGroup.get_sprites_in(self, rect)
+
+    def copy(self):
+        """copy a group with all the same sprites
+
+        CompactGroup.copy(): return CompactGroup
+
+        A CompactSprite can only be in one CompactGroup, so the copy is
+        empty.
+
+        """
+        return self.__class__()
+
+    def __iter__(self):
+        return iter(self._sprites[:])
+
+    def draw(self, surface, bgd=None, special_flags=0, view=None):  # noqa pylint: disable=unused-argument; same signature as AbstractGroup
+        """draw all sprites onto the surface
+
+        CompactGroup.draw(surface, bgd=None, special_flags=0, view=None): return Rect_list
+
+        Draws all of the member sprites onto the given surface, or only the
+        ones overlapping view if given. See Group.draw().
+
+        """
+        if view is not None:
+            self._draw_view(surface, special_flags, view)
+            self.lostsprites = []
+            return self.lostsprites
+
+        self._in_view = None
+        if special_flags:
+            blit_sequence = [
+                (image, rect, None, special_flags)
+                for image, rect in zip(self._images, self._rects)
+            ]
+        else:
+            blit_sequence = zip(self._images, self._rects)
+
+        if hasattr(surface, "blits"):
+            self._drawn = surface.blits(blit_sequence)
+        else:
+            self._drawn = [surface.blit(*blit) for blit in blit_sequence]
+        self.lostsprites = []
+        dirty = self.lostsprites
+
+        return dirty
+
+    def _draw_view(self, surface, special_flags, view):
+        """draw the sprites overlapping view, forgetting the ones that left it"""
+        if not isinstance(view, (Rect, FRect)):
+            view = Rect(view)
+        sprites = self.get_sprites_in(view)
+
+        drawn = self._drawn
+        visible = set(sprites)
+        for spr in self._sprites if self._in_view is None else self._in_view:
+            if spr._owner is self and spr not in visible:
+                drawn[spr._index] = None
+        self._in_view = sprites
+
+        images = self._images
+        rects = self._rects
+        dx, dy = -view.x, -view.y
+        indices = [spr._index for spr in sprites]
+        blit_sequence = [
+            (images[i], rects[i].move(dx, dy), None, special_flags) for i in indices
+        ]
+        if hasattr(surface, "blits"):
+            drawn_rects = surface.blits(blit_sequence)
+        else:
+            drawn_rects = [surface.blit(*blit) for blit in blit_sequence]
+        for i, drawn_rect in zip(indices, drawn_rects):
+            drawn[i] = drawn_rect
+
+    def clear(self, surface, bgd):
+        """erase the previous position of all sprites
+
+        CompactGroup.clear(surface, bgd): return None
+
+        See Group.clear().
+
+        """
+        if callable(bgd):
+            for lost_clear_rect in self.lostsprites:
+                bgd(surface, lost_clear_rect)
+            for clear_rect in self._drawn:
+                if clear_rect:
+                    bgd(surface, clear_rect)
+        else:
+            surface_blit = surface.blit
+            for lost_clear_rect in self.lostsprites:
+                surface_blit(bgd, lost_clear_rect, lost_clear_rect)
+            for clear_rect in self._drawn:
+                if clear_rect:
+                    surface_blit(bgd, clear_rect, clear_rect)
+
+    def __bool__(self):
+        return bool(self._sprites)
+
+    def __len__(self):
+        return len(self._sprites)
+
+
+class KinematicGroup(CompactGroup):
+    """container class for KinematicSprites that moves them all at once
+
+    pygame.sprite.KinematicGroup(*sprites): return KinematicGroup
+
+    A CompactGroup for KinematicSprites that also stores their positions
+    and velocities, as flat buffers of x and y pairs. integrate() moves
+    every sprite by its velocity without calling any Python code per
+    sprite, and the rects are placed on the positions before drawing.
+
+    """
+
+    def __init__(self, *sprites):
+        self._positions = array("d")
+        self._velocities = array("d")
+        CompactGroup.__init__(self, *sprites)
+
+    @property
+    def positions(self):
+        """the x, y pairs of the sprite positions, as a writable memoryview
+
+        The view can be wrapped in a NumPy array with
+        numpy.asarray(group.positions).reshape(-1, 2). It must be released
+        before sprites are added to or removed from the group.
+
+        """
+        return memoryview(self._positions)
+
+    @property
+    def velocities(self):
+        """the x, y pairs of the sprite velocities, as a writable memoryview
+
+        See positions.
+
+        """
+        return memoryview(self._velocities)
+
+    def add_internal(
+        self,
+        sprite,
+        layer=None,  # noqa pylint: disable=unused-argument; same signature as AbstractGroup
+    ):
+        """
+        For adding a sprite to this group internally.
+
+        :param sprite: The KinematicSprite we are adding.
+        """
+        if not isinstance(sprite, KinematicSprite):
+            raise TypeError("KinematicGroup can only contain KinematicSprites")
+        position, velocity = sprite.position, sprite.velocity
+        # resizing raises BufferError while a view of a buffer is alive,
+        # so the group is only changed once both buffers have grown
+        self._positions.extend(position)
+        try:
+            self._velocities.extend(velocity)
+        except BufferError:
+            del self._positions[-2:]
+            raise
+        try:
+            CompactGroup.add_internal(self, sprite)
+        except (TypeError, ValueError):
+            del self._positions[-2:]
+            del self._velocities[-2:]
+            raise
+        sprite._kinematic = self
+
+    def remove_internal(self, sprite):
+        """
+        For removing a sprite from this group internally.
+
+        :param sprite: The KinematicSprite we are removing.
+        """
+        position, velocity = sprite.position, sprite.velocity
+        positions, velocities = self._positions, self._velocities
+        # the same swap with the last sprite as CompactGroup.remove_internal,
+        # shrinking both buffers before anything else changes
+        last_position = positions[-2:]
+        del positions[-2:]
+        last_velocity = velocities[-2:]
+        try:
+            del velocities[-2:]
+        except BufferError:
+            positions.extend(last_position)
+            raise
+        i = 2 * sprite._index
+        if i < len(positions):
+            positions[i : i + 2] = last_position
+            velocities[i : i + 2] = last_velocity
+        sprite._kinematic = None
+        sprite._position = position
+        sprite._velocity = velocity
+        CompactGroup.remove_internal(self, sprite)
+
+    def integrate(self, dt, bounds=None, wrap=False):
+        """move every sprite by its velocity
+
+        KinematicGroup.integrate(dt, bounds=None, wrap=False): return None
+
+        Adds velocity * dt to the position of every sprite, then places the
+        rects on the new positions. If bounds is a rect, positions that leave
+        it are clamped to its edges, or wrapped around to the opposite edge
+        if wrap is True.
+
+        """
+        if bounds is not None:
+            bounds = FRect(bounds)
+            bounds = (bounds.left, bounds.top, bounds.right, bounds.bottom)
+        _integrate(self._positions, self._velocities, dt, bounds, wrap)
+        self.sync_rects()
+        if self._spatial_index is not None:
+            self._spatial_index.refresh()
+
+    def sync_rects(self):
+        """center the sprite rects on the sprite positions
+
+        KinematicGroup.sync_rects(): return None
+
+        Needed after writing to the positions buffer directly, before the
+        rects are used for collisions. draw() does this itself.
+
+        """
+        _sync_rects(self._rects, self._positions)
+
+    def draw(self, surface, bgd=None, special_flags=0, view=None):
+        """draw all sprites onto the surface
+
+        KinematicGroup.draw(surface, bgd=None, special_flags=0, view=None): return Rect_list
+
+        Places the rects on the sprite positions, then draws all of the
+        member sprites onto the given surface. See Group.draw().
+
+        """
+        self.sync_rects()
+        return CompactGroup.draw(self, surface, bgd, special_flags, view)
+
+
 class RenderPlain(Group):
     def __init__(self, *sprites):
         super().__init__(*sprites)
@@ -691,14 +1586,22 @@ class RenderUpdates(Group):
 
     """
 
-    def draw(self, surface, bgd=None, special_flags=0):
+    def draw(self, surface, bgd=None, special_flags=0, view=None):
         surface_blit = surface.blit
         dirty = self.lostsprites
         self.lostsprites = []
         dirty_append = dirty.append
-        for sprite in self.sprites():
+        if view is None:
+            sprites = self.sprites()
+            self._in_view = None
+            dx = dy = 0
+        else:
+            sprites, (dx, dy), lost = self._sprites_in_view(view)
+            dirty.extend(lost)
+        for sprite in sprites:
             old_rect = self.spritedict[sprite]
-            new_rect = surface_blit(sprite.image, sprite.rect, None, special_flags)
+            dest = sprite.rect.move(dx, dy) if view is not None else sprite.rect
+            new_rect = surface_blit(sprite.image, dest, None, special_flags)
             if old_rect:
                 if new_rect.colliderect(old_rect):
                     dirty_append(new_rect.union(old_rect))
@@ -723,6 +1626,150 @@ class OrderedUpdates(RenderUpdates):
         )
 
 
+class SortedGroup(AbstractGroup):
+    """Group class that draws its sprites sorted by a key
+
+    pygame.sprite.SortedGroup(*sprites, key=None): return SortedGroup
+
+    The sprites are drawn in the order of key(sprite), which defaults to
+    sprite.rect.bottom so that sprites lower on the screen are drawn over the
+    ones behind them, as in top-down and isometric games. The order is
+    updated every time the sprites are drawn or listed.
+
+    The order is kept from one frame to the next and sorted in place, which
+    takes about linear time when only a few sprites changed places. Sprites
+    with equal keys keep their previous order, so they don't flicker.
+
+    """
+
+    def __init__(self, *sprites, key=None):
+        AbstractGroup.__init__(self)
+        # the sprites in the last order, including removed ones when
+        # self._removed is set
+        self._order = []
+        self._removed = False
+        self.key = key
+        self.add(*sprites)
+
+    @property
+    def key(self):
+        """the function giving the sort key of a sprite"""
+        return self._key
+
+    @key.setter
+    def key(self, key):
+        self._key = attrgetter("rect.bottom") if key is None else key
+
+    def add_internal(
+        self,
+        sprite,
+        layer=None,  # noqa pylint: disable=unused-argument; same signature as AbstractGroup
+    ):
+        """
+        For adding a sprite to this group internally.
+
+        :param sprite: The sprite we are adding.
+        """
+        AbstractGroup.add_internal(self, sprite)
+        self._order.append(sprite)
+        if len(self._order) > 2 * len(self.spritedict):
+            self._compact()
+
+    def remove_internal(self, sprite):
+        """
+        For removing a sprite from this group internally.
+
+        :param sprite: The sprite we are removing.
+        """
+        AbstractGroup.remove_internal(self, sprite)
+        # dropped from the order at the next sort, or sooner if the removed
+        # sprites pile up without the group being drawn
+        self._removed = True
+        if len(self._order) > 2 * len(self.spritedict):
+            self._compact()
+
+    def _draw_order_key(self):
+        return self._key
+
+    def _compact(self):
+        """drop the removed sprites from the order list"""
+        if self._removed:
+            spritedict = self.spritedict
+            # a sprite removed and added again is in the list twice
+            self._order[:] = [
+                spr for spr in dict.fromkeys(self._order) if spr in spritedict
+            ]
+            self._removed = False
+
+    def _sort(self):
+        """sort the sprites in place and return the order list"""
+        self._compact()
+        order = self._order
+        order.sort(key=self._key)
+        return order
+
+    def sprites(self):
+        """get a list of the sprites in drawing order
+
+        SortedGroup.sprites(): return sprite_list
+
+        """
+        return self._sort().copy()
+
+    # counting or emptying the group doesn't need the sprites in order, nor
+    # a key for every sprite
+    def __bool__(self):
+        return bool(self.spritedict)
+
+    def __len__(self):
+        return len(self.spritedict)
+
+    def empty(self):
+        """remove all sprites
+
+        SortedGroup.empty(): return None
+
+        Removes all the sprites from the group.
+
+        """
+        for sprite in list(self.spritedict):
+            self.remove_internal(sprite)
+            sprite.remove_internal(self)
+
+    def draw(self, surface, bgd=None, special_flags=0, view=None):  # noqa pylint: disable=unused-argument; same signature as AbstractGroup
+        """draw all sprites onto the surface in order
+
+        SortedGroup.draw(surface, bgd=None, special_flags=0, view=None): return Rect_list
+
+        Sorts the sprites, then draws them onto the given surface. With a
+        view, only the visible sprites are sorted, see Group.draw().
+
+        """
+        if view is not None:
+            return AbstractGroup.draw(self, surface, bgd, special_flags, view)
+
+        self._in_view = None
+        sprites = self._sort()
+        if hasattr(surface, "blits"):
+            self.spritedict.update(
+                zip(
+                    sprites,
+                    surface.blits(
+                        (spr.image, spr.rect, None, special_flags) for spr in sprites
+                    ),
+                )
+            )
+        else:
+            for spr in sprites:
+                self.spritedict[spr] = surface.blit(
+                    spr.image, spr.rect, None, special_flags
+                )
+        self.lostsprites = []
+        dirty = self.lostsprites
+
+        return dirty
+
+
 class LayeredUpdates(AbstractGroup):
     """LayeredUpdates Group handles layers, which are drawn like RenderUpdates
 
@@ -749,7 +1796,14 @@ class LayeredUpdates(AbstractGroup):
 
         """
         self._spritelayers = {}
-        self._spritelist = []
+        # the sprites of each layer in the order they were added, with the
+        # layers in order, so that finding the place of a sprite is O(log n).
+        # Each sprite maps to a number growing in that order.
+        self._layer_sprites = {}
+        self._layer_order = []
+        self._layer_counter = 0
+        # all the sprites in draw order, rebuilt when needed
+        self._spritelist_cache = None
         AbstractGroup.__init__(self)
         self._default_layer = kwargs.get("default_layer", 0)
 
@@ -761,6 +1815,11 @@ class LayeredUpdates(AbstractGroup):
         It is used by the group to add a sprite internally.
 
         """
+        if isinstance(sprite, CompactSprite):
+            raise TypeError(
+                f"{self.__class__.__name__} cannot contain CompactSprites, "
+                "they have no layer"
+            )
         self.spritedict[sprite] = self._init_rect
 
         if layer is None:
@@ -772,25 +1831,39 @@ class LayeredUpdates(AbstractGroup):
         elif hasattr(sprite, "_layer"):
             setattr(sprite, "_layer", layer)
 
-        sprites = self._spritelist  # speedup
-        sprites_layers = self._spritelayers
-        sprites_layers[sprite] = layer
-
-        # add the sprite at the right position
-        # bisect algorithmus
-        leng = len(sprites)
-        low = mid = 0
-        high = leng - 1
-        while low <= high:
-            mid = low + (high - low) // 2
-            if sprites_layers[sprites[mid]] <= layer:
-                low = mid + 1
-            else:
-                high = mid - 1
-        # linear search to find final position
-        while mid < leng and sprites_layers[sprites[mid]] <= layer:
-            mid += 1
-        sprites.insert(mid, sprite)
+        self._spritelayers[sprite] = layer
+        self._add_to_layer(sprite, layer)
+        if self._spatial_index is not None:
+            self._spatial_index.add(sprite)
+
+    def _add_to_layer(self, sprite, layer):
+        """put the sprite last in its layer, creating the layer if needed"""
+        bucket = self._layer_sprites.get(layer)
+        if bucket is None:
+            bucket = self._layer_sprites[layer] = {}
+            insort(self._layer_order, layer)
+        bucket[sprite] = self._layer_counter
+        self._layer_counter += 1
+        self._spritelist_cache = None
+
+    def _remove_from_layer(self, sprite, layer):
+        """take the sprite out of its layer, dropping the layer if empty"""
+        bucket = self._layer_sprites[layer]
+        del bucket[sprite]
+        if not bucket:
+            del self._layer_sprites[layer]
+            del self._layer_order[bisect_left(self._layer_order, layer)]
+        self._spritelist_cache = None
+
+    @property
+    def _spritelist(self):
+        """all the sprites in draw order; do not modify this list"""
+        if self._spritelist_cache is None:
+            layer_sprites = self._layer_sprites
+            self._spritelist_cache = list(
+                chain.from_iterable(layer_sprites[layer] for layer in self._layer_order)
+            )
+        return self._spritelist_cache
 
     def add(self, *sprites, **kwargs):
         """add a sprite or sequence of sprites to a group
@@ -841,7 +1914,7 @@ class LayeredUpdates(AbstractGroup):
         The group uses it to add a sprite.
 
         """
-        self._spritelist.remove(sprite)
+        self._remove_from_layer(sprite, self._spritelayers[sprite])
         # these dirty rects are suboptimal for one frame
         old_rect = self.spritedict[sprite]
         if old_rect is not self._init_rect:
@@ -851,6 +1924,8 @@ class LayeredUpdates(AbstractGroup):
 
         del self.spritedict[sprite]
         del self._spritelayers[sprite]
+        if self._spatial_index is not None:
+            self._spatial_index.remove(sprite)
 
     def sprites(self):
         """return an ordered list of sprites (first back, last top).
@@ -860,10 +1935,10 @@ class LayeredUpdates(AbstractGroup):
         """
         return self._spritelist.copy()
 
-    def draw(self, surface, bgd=None, special_flags=0):
+    def draw(self, surface, bgd=None, special_flags=0, view=None):
         """draw all sprites in the right order onto the passed surface
 
-        LayeredUpdates.draw(surface, bgd=None, special_flags=0): return Rect_list
+        LayeredUpdates.draw(surface, bgd=None, special_flags=0, view=None): return Rect_list
 
         """
         spritedict = self.spritedict
@@ -872,9 +1947,17 @@ class LayeredUpdates(AbstractGroup):
         self.lostsprites = []
         dirty_append = dirty.append
         init_rect = self._init_rect
-        for spr in self.sprites():
+        if view is None:
+            sprites = self.sprites()
+            self._in_view = None
+            dx = dy = 0
+        else:
+            sprites, (dx, dy), lost = self._sprites_in_view(view)
+            dirty.extend(lost)
+        for spr in sprites:
             rec = spritedict[spr]
-            newrect = surface_blit(spr.image, spr.rect, None, special_flags)
+            dest = spr.rect.move(dx, dy) if view is not None else spr.rect
+            newrect = surface_blit(spr.image, dest, None, special_flags)
             if rec is init_rect:
                 dirty_append(newrect)
             else:
@@ -886,18 +1969,31 @@ class LayeredUpdates(AbstractGroup):
             spritedict[spr] = newrect
         return dirty
 
-    def get_sprites_at(self, pos):
-        """return a list with all sprites at that position
+    def _draw_order_key(self):
+        sprites_layers = self._spritelayers
+        layer_sprites = self._layer_sprites
 
-        LayeredUpdates.get_sprites_at(pos): return colliding_sprites
+        def key(sprite):
+            layer = sprites_layers[sprite]
+            return (layer, layer_sprites[layer][sprite])
+
+        return key
+
+    def get_sprites_in(self, rect):
+        """return a list with all sprites overlapping a rect
+
+        LayeredUpdates.get_sprites_in(rect): return colliding_sprites
 
         Bottom sprites are listed first; the top ones are listed last.
 
         """
-        _sprites = self._spritelist
-        rect = Rect(pos, (1, 1))
-        colliding_idx = rect.collidelistall(_sprites)
-        return [_sprites[i] for i in colliding_idx]
+        if self._spatial_index is None:
+            # the same without the copy of the sprite list
+            if not isinstance(rect, (Rect, FRect)):
+                rect = Rect(rect)
+            _sprites = self._spritelist
+            return [_sprites[i] for i in rect.collidelistall(_sprites)]
+        return AbstractGroup.get_sprites_in(self, rect)
 
     def get_sprite(self, idx):
         """return the sprite at the index idx from the groups sprites
@@ -926,7 +2022,7 @@ class LayeredUpdates(AbstractGroup):
         LayeredUpdates.layers(): return layers
 
         """
-        return sorted(set(self._spritelayers.values()))
+        return self._layer_order.copy()
 
     def change_layer(self, sprite, new_layer):
         """change the layer of the sprite
@@ -937,27 +2033,10 @@ class LayeredUpdates(AbstractGroup):
         checked.
 
         """
-        sprites = self._spritelist  # speedup
         sprites_layers = self._spritelayers  # speedup
 
-        sprites.remove(sprite)
-        sprites_layers.pop(sprite)
-
-        # add the sprite at the right position
-        # bisect algorithmus
-        leng = len(sprites)
-        low = mid = 0
-        high = leng - 1
-        while low <= high:
-            mid = low + (high - low) // 2
-            if sprites_layers[sprites[mid]] <= new_layer:
-                low = mid + 1
-            else:
-                high = mid - 1
-        # linear search to find final position
-        while mid < leng and sprites_layers[sprites[mid]] <= new_layer:
-            mid += 1
-        sprites.insert(mid, sprite)
+        self._remove_from_layer(sprite, sprites_layers.pop(sprite))
+        self._add_to_layer(sprite, new_layer)
         if hasattr(sprite, "_layer"):
             setattr(sprite, "_layer", new_layer)
 
@@ -978,7 +2057,7 @@ class LayeredUpdates(AbstractGroup):
         LayeredUpdates.get_top_layer(): return layer
 
         """
-        return self._spritelayers[self._spritelist[-1]]
+        return self._layer_order[-1]
 
     def get_bottom_layer(self):
         """return the bottom layer
@@ -986,7 +2065,7 @@ class LayeredUpdates(AbstractGroup):
         LayeredUpdates.get_bottom_layer(): return layer
 
         """
-        return self._spritelayers[self._spritelist[0]]
+        return self._layer_order[0]
 
     def move_to_front(self, sprite):
         """bring the sprite to front layer
@@ -1017,7 +2096,7 @@ class LayeredUpdates(AbstractGroup):
         LayeredUpdates.get_top_sprite(): return Sprite
 
         """
-        return self._spritelist[-1]
+        return next(reversed(self._layer_sprites[self._layer_order[-1]]))
 
     def get_sprites_from_layer(self, layer):
         """return all sprites from a layer ordered as they were added
@@ -1029,17 +2108,7 @@ class LayeredUpdates(AbstractGroup):
         layer).
 
         """
-        sprites = []
-        sprites_append = sprites.append
-        sprite_layers = self._spritelayers
-        for spr in self._spritelist:
-            if sprite_layers[spr] == layer:
-                sprites_append(spr)
-            elif sprite_layers[spr] > layer:
-                # break after because no other will
-                # follow with same layer
-                break
-        return sprites
+        return list(self._layer_sprites.get(layer, ()))
 
     def switch_layer(self, layer1_nr, layer2_nr):
         """switch the sprites from layer1_nr to layer2_nr
@@ -1117,6 +2186,8 @@ class LayeredDirty(LayeredUpdates):
         It is used by the group to add a sprite internally.
 
         """
+        if isinstance(sprite, CompactSprite):
+            raise TypeError("LayeredDirty can only contain DirtySprites")
         # check if all needed attributes are set
         if not hasattr(sprite, "dirty"):
             raise AttributeError()
@@ -1168,15 +2239,26 @@ class LayeredDirty(LayeredUpdates):
         if self._use_update:  # dirty rects mode
             # 1. find dirty area on screen and put the rects into
             # self.lostsprites still not happy with that part
-            self._find_dirty_area(
-                latest_clip,
-                local_old_rect,
-                rect_type,
-                local_sprites,
-                local_update,
-                local_update.append,
-                self._init_rect,
-            )
+            if _dirty_blits is not None:
+                # the C helper also lists the blits of step 2
+                blits, owners = _dirty_blits(
+                    local_sprites,
+                    local_old_rect,
+                    local_update,
+                    latest_clip,
+                    self._init_rect,
+                    special_flags,
+                )
+            else:
+                self._find_dirty_area(
+                    latest_clip,
+                    local_old_rect,
+                    rect_type,
+                    local_sprites,
+                    local_update,
+                    local_update.append,
+                    self._init_rect,
+                )
             # can it be done better? because that is an O(n**2) algorithm in
             # worst case
 
@@ -1187,14 +2269,19 @@ class LayeredDirty(LayeredUpdates):
                     surf_blit_func(local_bgd, rec, rec, flags)
 
             # 2. draw
-            self._draw_dirty_internal(
-                local_old_rect,
-                rect_type,
-                local_sprites,
-                surf_blit_func,
-                local_update,
-                special_flags,
-            )
+            if _dirty_blits is not None:
+                for spr, rec in zip(owners, surface.blits(blits)):
+                    if spr is not None:
+                        local_old_rect[spr] = rec
+            else:
+                self._draw_dirty_internal(
+                    local_old_rect,
+                    rect_type,
+                    local_sprites,
+                    surf_blit_func,
+                    local_update,
+                    special_flags,
+                )
             local_ret = list(local_update)
         else:  # flip, full screen mode
             if local_bgd is not None:
@@ -1425,6 +2512,8 @@ class GroupSingle(AbstractGroup):
             self.__sprite.remove_internal(self)
             self.remove_internal(self.__sprite)
         self.__sprite = sprite
+        if self._spatial_index is not None:
+            self._spatial_index.add(sprite)
 
     def __bool__(self):
         return self.__sprite is not None
@@ -1455,6 +2544,8 @@ class GroupSingle(AbstractGroup):
             self.__sprite = None
         if sprite in self.spritedict:
             AbstractGroup.remove_internal(self, sprite)
+        elif self._spatial_index is not None:
+            self._spatial_index.remove(sprite)
 
     def has_internal(self, sprite):
         return self.__sprite is sprite
@@ -1686,6 +2777,83 @@ def collide_mask(left, right):
     return leftmask.overlap(rightmask, (xoffset, yoffset))
 
 
+def _get_mask(sprite):
+    """the mask of sprite, as collide_mask uses it"""
+    try:
+        return sprite.mask
+    except AttributeError:
+        return from_surface(sprite.image)
+
+
+def _mask_size(sprite):
+    """the size of the mask of sprite, without making one from its image"""
+    # getattr, as raising AttributeError for every sprite without a mask is
+    # slow on large groups
+    mask = getattr(sprite, "mask", None)
+    return sprite.image.get_size() if mask is None else mask.get_size()
+
+
+def collide_mask_indices(sprite, sprites, fit_rects=False):
+    """indices of the sprites colliding with a sprite, using masks
+
+    pygame.sprite.collide_mask_indices(sprite, sprites, fit_rects=False):
+        return list
+
+    Returns the indices in sprites of the sprites whose mask overlaps the
+    mask of sprite, as collide_mask would find them. The sprites are first
+    filtered with Rect.collidelistall() by the area their mask covers, which
+    starts at the topleft of their rect and may reach outside of it, so that
+    only the masks of the remaining ones are made and looked at. Those are
+    all tested in one Mask.overlap_many() call. If fit_rects is true, the
+    masks are assumed to fit in their sprite's rect and the rects are used
+    for filtering instead. Sprites must have a "rect" and an optional "mask"
+    attribute.
+
+    """
+    if not isinstance(sprites, (list, tuple)):
+        sprites = list(sprites)
+    x, y = sprite.rect[0], sprite.rect[1]
+    if fit_rects:
+        candidates = sprite.rect.collidelistall([other.rect for other in sprites])
+    else:
+        # the areas are relative to sprite, like the mask offsets below, so
+        # that float positions are rounded the same way
+        candidates = Rect((0, 0), _mask_size(sprite)).collidelistall(
+            [
+                ((other.rect[0] - x, other.rect[1] - y), _mask_size(other))
+                for other in sprites
+            ]
+        )
+    if not candidates:
+        return []
+
+    mask = _get_mask(sprite)
+    pairs = [
+        (_get_mask(sprites[i]), (sprites[i].rect[0] - x, sprites[i].rect[1] - y))
+        for i in candidates
+    ]
+    return [candidates[i] for i in mask.overlap_many(pairs)]
+
+
+# collision callbacks whose hits always lie within the sprite rects, so a
+# spatial index lookup by rect cannot miss any of them. Not collide_mask, as a
+# mask may be larger than the rect of its sprite.
+_RECT_BOUNDED_CALLBACKS = (None, collide_rect)
+
+
+def _broadphase(sprite, group, collided):
+    """return the sprites of group that may collide with sprite, in group order"""
+    index = getattr(group, "_spatial_index", None)
+    if index is None or collided not in _RECT_BOUNDED_CALLBACKS:
+        return group
+    candidates = index.query(sprite.rect)
+    # the index order is the group order unless the group sorts its sprites
+    key = group._draw_order_key()
+    if key is not None and len(candidates) > 1:
+        candidates.sort(key=key)
+    return candidates
+
+
 def spritecollide(sprite, group, dokill, collided=None):
     """find Sprites in a Group that intersect another Sprite
 
@@ -1705,16 +2873,29 @@ def spritecollide(sprite, group, dokill, collided=None):
     sprites must have a "rect" value, which is a rectangle of the sprite area,
     which will be used to calculate the collision.
 
+    If the group has a spatial_index and collided is None or collide_rect,
+    only the sprites sharing a grid cell with sprite.rect are tested, in the
+    order of the group. With collide_mask, the masks of the sprites whose
+    mask areas overlap are tested at once, see collide_mask_indices().
+
     """
-    if collided is not None:
+    group_sprites = _broadphase(sprite, group, collided)
+    if collided is collide_mask:
+        group_sprites = list(group_sprites)
         collided_sprites = [
-            group_sprite for group_sprite in group if collided(sprite, group_sprite)
+            group_sprites[i] for i in collide_mask_indices(sprite, group_sprites)
+        ]
+    elif collided is not None:
+        collided_sprites = [
+            group_sprite
+            for group_sprite in group_sprites
+            if collided(sprite, group_sprite)
         ]
     else:
         sprite_rect_collide = sprite.rect.colliderect
         collided_sprites = [
             group_sprite
-            for group_sprite in group
+            for group_sprite in group_sprites
             if sprite_rect_collide(group_sprite.rect)
         ]
     if dokill:
@@ -1723,6 +2904,47 @@ def spritecollide(sprite, group, dokill, collided=None):
     return collided_sprites
 
 
+def _groupcollide_rects(groupa, groupb, dokillb):
+    """groupcollide by rect, with a single Rect.collide_pairs() call
+
+    Returns None unless the rects of groupa are all Rects or all FRects, as
+    colliderect would not round the coordinates the same way for every sprite
+    otherwise.
+
+    """
+    sprites_a = list(groupa)
+    rects_a = [spr.rect for spr in sprites_a]
+    rect_class = type(rects_a[0]) if rects_a else Rect
+    if rect_class not in (Rect, FRect) or not all(
+        type(rect) is rect_class for rect in rects_a
+    ):
+        return None
+    sprites_b = list(groupb)
+
+    collided_sprites = {}
+    for i, j in rect_class.collide_pairs(rects_a, [spr.rect for spr in sprites_b]):
+        collided_sprites.setdefault(sprites_a[i], []).append(sprites_b[j])
+
+    if dokillb:
+        killed = {}
+        if isinstance(groupb, AbstractGroup):
+            # as in spritecollide, a killed sprite is not in groupb any more
+            # for the next sprites of groupa
+            for group_a_sprite, collisions in list(collided_sprites.items()):
+                collisions = [spr for spr in collisions if spr not in killed]
+                if collisions:
+                    collided_sprites[group_a_sprite] = collisions
+                    killed.update(dict.fromkeys(collisions))
+                else:
+                    del collided_sprites[group_a_sprite]
+        else:
+            for collisions in collided_sprites.values():
+                killed.update(dict.fromkeys(collisions))
+        for group_b_sprite in killed:
+            group_b_sprite.kill()
+    return collided_sprites
+
+
 def groupcollide(groupa, groupb, dokilla, dokillb, collided=None):
     """detect collision between a group and another group
 
@@ -1740,7 +2962,21 @@ def groupcollide(groupa, groupb, dokilla, dokillb, collided=None):
     sprites must have a "rect" value, which is a rectangle of the sprite area
     that will be used to calculate the collision.
 
+    Giving groupb a spatial_index turns the search into a grid lookup per
+    sprite of groupa, see spritecollide(). Otherwise, when collided is None or
+    collide_rect, all the pairs are found at once with Rect.collide_pairs().
+
     """
+    if collided in _RECT_BOUNDED_CALLBACKS and (
+        getattr(groupb, "_spatial_index", None) is None
+    ):
+        collided_sprites = _groupcollide_rects(groupa, groupb, dokillb)
+        if collided_sprites is not None:
+            if dokilla:
+                for group_a_sprite in collided_sprites:
+                    group_a_sprite.kill()
+            return collided_sprites
+
     collided_sprites = {}
     # pull the collision function in as a local variable outside
     # the loop as this makes the loop run faster
@@ -1774,15 +3010,28 @@ def spritecollideany(sprite, group, collided=None):
     which will be used to calculate the collision.
 
     """
+    group_sprites = _broadphase(sprite, group, collided)
+    if collided is collide_mask:
+        # one sprite at a time, so that no masks are made past the first hit
+        x, y = sprite.rect[0], sprite.rect[1]
+        mask = _get_mask(sprite)
+        area_collide = Rect((0, 0), mask.get_size()).colliderect
+        for group_sprite in group_sprites:
+            offset = (group_sprite.rect[0] - x, group_sprite.rect[1] - y)
+            if area_collide(offset, _mask_size(group_sprite)) and mask.overlap(
+                _get_mask(group_sprite), offset
+            ):
+                return group_sprite
+        return None
     if collided is not None:
-        for group_sprite in group:
+        for group_sprite in group_sprites:
             if collided(sprite, group_sprite):
                 return group_sprite
     else:
         # pull the default collision function in as a local variable outside
         # the loop as this makes the loop run faster
         sprite_rect_collide = sprite.rect.colliderect
-        for group_sprite in group:
+        for group_sprite in group_sprites:
             if sprite_rect_collide(group_sprite.rect):
                 return group_sprite
     return None
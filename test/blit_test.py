@@ -1,3 +1,4 @@
+import threading
 import unittest
 
 import pygame
@@ -249,5 +250,273 @@ class BlitTest(unittest.TestCase):
         )
 
 
+class BlitBatchTest(unittest.TestCase):
+    def make_blit_list(self, num_surfs):
+        return [
+            (pygame.Surface((10, 10), SRCALPHA, 32), (i * 10, 0))
+            for i in range(num_surfs)
+        ]
+
+    def test_fblits_batch(self):
+        dst = pygame.Surface((100, 10), SRCALPHA, 32)
+        blit_list = self.make_blit_list(10)
+        for i, (surf, _) in enumerate(blit_list):
+            surf.fill((i * 20, i * 20, i * 20))
+
+        dst.fill((230, 230, 230))
+        dst.fblits(pygame.surface.BlitBatch(blit_list))
+        expected = dst.copy()
+
+        dst.fill((230, 230, 230))
+        dst.fblits(blit_list)
+        for i in range(10):
+            self.assertEqual(
+                dst.get_at((i * 10 + 5, 5)), expected.get_at((i * 10 + 5, 5))
+            )
+
+        # the flags are applied to every item
+        dst.fill((10, 10, 10))
+        dst.fblits(pygame.surface.BlitBatch(blit_list), BLEND_ADD)
+        self.assertEqual(dst.get_at((25, 5)), (50, 50, 50, 255))
+
+    def test_init(self):
+        surf = pygame.Surface((10, 10))
+
+        self.assertEqual(len(pygame.surface.BlitBatch()), 0)
+        self.assertEqual(len(pygame.surface.BlitBatch([])), 0)
+        self.assertEqual(len(pygame.surface.BlitBatch(self.make_blit_list(5))), 5)
+
+        batch = pygame.surface.BlitBatch(
+            (surf, dest) for dest in [(1, 2), pygame.Rect(3, 4, 5, 6), (7.5, 8.5)]
+        )
+        self.assertEqual(
+            [batch.get_position(i) for i in range(len(batch))],
+            [(1, 2), (3, 4), (7, 8)],
+        )
+
+        # calling __init__ again replaces the content
+        batch.__init__([(surf, (0, 0))])
+        self.assertEqual(len(batch), 1)
+
+    def test_init_bad_args(self):
+        surf = pygame.Surface((10, 10))
+
+        self.assertRaises(TypeError, pygame.surface.BlitBatch, 1)
+        self.assertRaises(ValueError, pygame.surface.BlitBatch, [surf])
+        self.assertRaises(ValueError, pygame.surface.BlitBatch, [(surf, (0, 0), 0)])
+        self.assertRaises(TypeError, pygame.surface.BlitBatch, [(None, (0, 0))])
+        self.assertRaises(TypeError, pygame.surface.BlitBatch, [(surf, None)])
+
+    def test_append_and_clear(self):
+        surf = pygame.Surface((10, 10))
+        batch = pygame.surface.BlitBatch()
+
+        for i in range(100):
+            batch.append(surf, (i, -i))
+        self.assertEqual(len(batch), 100)
+        self.assertEqual(batch.get_position(99), (99, -99))
+
+        self.assertRaises(TypeError, batch.append, surf)
+        self.assertRaises(TypeError, batch.append, "surf", (0, 0))
+        self.assertRaises(TypeError, batch.append, surf, "dest")
+        self.assertEqual(len(batch), 100)
+
+        batch.clear()
+        self.assertEqual(len(batch), 0)
+
+        dst = pygame.Surface((10, 10))
+        self.assertIsNone(dst.fblits(batch))
+
+    def test_get_set_position(self):
+        batch = pygame.surface.BlitBatch(self.make_blit_list(3))
+
+        batch.set_position(1, (-5, 7))
+        self.assertEqual(batch.get_position(1), (-5, 7))
+        batch.set_position(-1, pygame.Rect(1, 2, 3, 4))
+        self.assertEqual(batch.get_position(2), (1, 2))
+        self.assertEqual(batch.get_position(-3), (0, 0))
+
+        self.assertRaises(IndexError, batch.get_position, 3)
+        self.assertRaises(IndexError, batch.get_position, -4)
+        self.assertRaises(IndexError, batch.set_position, 3, (0, 0))
+        self.assertRaises(TypeError, batch.get_position, "0")
+        self.assertRaises(TypeError, batch.set_position, 0, None)
+
+    def test_set_positions(self):
+        import array
+
+        batch = pygame.surface.BlitBatch(self.make_blit_list(3))
+
+        def positions():
+            return [batch.get_position(i) for i in range(3)]
+
+        batch.set_positions([(1, 2), (3, 4), pygame.Rect(5, 6, 1, 1)])
+        self.assertEqual(positions(), [(1, 2), (3, 4), (5, 6)])
+
+        for typecode in "bhilqBHILQ":
+            batch.set_positions(array.array(typecode, [6, 5, 4, 3, 2, 1]))
+            self.assertEqual(positions(), [(6, 5), (4, 3), (2, 1)])
+        batch.set_positions(array.array("i", [-1, -2, -3, -4, -5, -6]))
+        self.assertEqual(positions(), [(-1, -2), (-3, -4), (-5, -6)])
+
+        # a bad item leaves the positions untouched
+        self.assertRaises(TypeError, batch.set_positions, [(0, 0), (0, 0), None])
+        self.assertEqual(positions(), [(-1, -2), (-3, -4), (-5, -6)])
+
+        self.assertRaises(ValueError, batch.set_positions, [(0, 0)])
+        self.assertRaises(ValueError, batch.set_positions, array.array("i", [0] * 5))
+        self.assertRaises(TypeError, batch.set_positions, array.array("d", [0] * 6))
+        self.assertRaises(TypeError, batch.set_positions, 1)
+
+    def test_move(self):
+        batch = pygame.surface.BlitBatch(self.make_blit_list(2))
+
+        batch.move(5, -5)
+        self.assertEqual(batch.get_position(1), (15, -5))
+        batch.move((-5, 5))
+        self.assertEqual(batch.get_position(1), (10, 0))
+
+        self.assertRaises(TypeError, batch.move)
+        self.assertRaises(TypeError, batch.move, 1)
+        self.assertRaises(TypeError, batch.move, "a", "b")
+
+    def test_positions_are_used(self):
+        dst = pygame.Surface((30, 30))
+        src = pygame.Surface((10, 10))
+        src.fill("red")
+        batch = pygame.surface.BlitBatch([(src, (0, 0))])
+
+        dst.fblits(batch)
+        self.assertEqual(dst.get_at((5, 5)), (255, 0, 0, 255))
+
+        dst.fill("black")
+        batch.set_position(0, (20, 20))
+        dst.fblits(batch)
+        self.assertEqual(dst.get_at((5, 5)), (0, 0, 0, 255))
+        self.assertEqual(dst.get_at((25, 25)), (255, 0, 0, 255))
+
+    def test_repr(self):
+        batch = pygame.surface.BlitBatch(self.make_blit_list(3))
+        self.assertEqual(repr(batch), "<BlitBatch(3 blits)>")
+
+    def test_gc(self):
+        import gc
+        import weakref
+
+        class SurfaceSubclass(pygame.Surface):
+            pass
+
+        # a reference cycle between a batch and one of its sources
+        surf = SurfaceSubclass((1, 1))
+        surf.batch = pygame.surface.BlitBatch([(surf, (0, 0))])
+        ref = weakref.ref(surf)
+        del surf
+        gc.collect()
+        self.assertIsNone(ref())
+
+
+class BlitThreadsTest(unittest.TestCase):
+    def tearDown(self):
+        pygame.surface.set_blit_threads(1)
+
+    def make_surface(self, size, seed, flags=SRCALPHA):
+        surf = pygame.Surface(size, flags, 32)
+        w, h = size
+        for i in range(200):
+            color = ((seed + i * 37) % 256, (i * 91) % 256, (i * 53) % 256, i % 256)
+            rect = ((i * 71 + seed) % w, (i * 43) % h, 10 + i % 90, 10 + i % 70)
+            surf.fill(color, rect)
+        return surf
+
+    def test_get_set_blit_threads(self):
+        self.assertEqual(pygame.surface.get_blit_threads(), 1)
+
+        pygame.surface.set_blit_threads(3)
+        self.assertEqual(pygame.surface.get_blit_threads(), 3)
+        pygame.surface.set_blit_threads(2)
+        self.assertEqual(pygame.surface.get_blit_threads(), 2)
+        pygame.surface.set_blit_threads(1000)
+        self.assertEqual(pygame.surface.get_blit_threads(), 64)
+        pygame.surface.set_blit_threads(0)
+        self.assertGreaterEqual(pygame.surface.get_blit_threads(), 1)
+        pygame.surface.set_blit_threads(1)
+        self.assertEqual(pygame.surface.get_blit_threads(), 1)
+
+        self.assertRaises(ValueError, pygame.surface.set_blit_threads, -1)
+        self.assertRaises(TypeError, pygame.surface.set_blit_threads, "2")
+        self.assertRaises(TypeError, pygame.surface.set_blit_threads)
+
+    def test_threaded_blits_match(self):
+        """Threaded blits give the same pixels and rect as regular ones"""
+        src = self.make_surface((600, 400), 1)
+        src.set_alpha(200)
+        opaque = self.make_surface((600, 400), 2, 0)
+        dst = self.make_surface((640, 480), 3)
+        flags_list = (
+            0,
+            BLEND_ALPHA_SDL2,
+            BLEND_PREMULTIPLIED,
+            BLEND_RGBA_MULT,
+            BLEND_ADD,
+            BLEND_RGB_SUB,
+        )
+
+        for source in (src, opaque):
+            for flags in flags_list:
+                for dest in ((0, 0), (100, -50), (-30, 200)):
+                    results = []
+                    for count in (1, 3, 4):
+                        pygame.surface.set_blit_threads(count)
+                        target = dst.copy()
+                        target.set_clip((5, 5, 620, 460))
+                        rect = target.blit(source, dest, special_flags=flags)
+                        results.append((rect, pygame.image.tobytes(target, "RGBA")))
+                    self.assertEqual(results[0], results[1], (flags, dest))
+                    self.assertEqual(results[0], results[2], (flags, dest))
+
+    def test_threaded_self_blit(self):
+        """Blits between overlapping pixels of the same Surface still work"""
+        base = self.make_surface((600, 600), 4)
+        results = []
+        for count in (1, 4):
+            pygame.surface.set_blit_threads(count)
+            surf = base.copy()
+            surf.blit(surf, (20, 30))
+            surf.blit(surf, (-40, 10), special_flags=BLEND_PREMULTIPLIED)
+            surf.blit(surf, (10, -40), special_flags=BLEND_ALPHA_SDL2)
+            surf.blit(surf, (5, 5), special_flags=BLEND_ADD)
+            results.append(pygame.image.tobytes(surf, "RGBA"))
+        self.assertEqual(results[0], results[1])
+
+    def test_threaded_fblits_cleared_meanwhile(self):
+        """Clearing the blit list or batch during threaded blits is safe"""
+        pygame.surface.set_blit_threads(4)
+        dst = pygame.Surface((1024, 768), SRCALPHA, 32)
+
+        for make in (list, pygame.surface.BlitBatch):
+            for _ in range(5):
+                # the sources are only referenced by the list or the batch,
+                # so clearing it frees them
+                blits = make(
+                    [
+                        (pygame.Surface((1024, 768), SRCALPHA, 32), (0, 0))
+                        for _ in range(20)
+                    ]
+                )
+                started = threading.Event()
+
+                def clear():
+                    started.wait()
+                    blits.clear()
+
+                thread = threading.Thread(target=clear)
+                thread.start()
+                started.set()
+                dst.fblits(blits, BLEND_ALPHA_SDL2)
+                thread.join()
+
+                self.assertEqual(len(blits), 0)
+
+
 if __name__ == "__main__":
     unittest.main()
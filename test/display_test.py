@@ -1,4 +1,5 @@
 import os
+import random
 import sys
 import time
 import unittest
@@ -719,6 +720,7 @@ class DisplayUpdateTest(unittest.TestCase):
         pygame.event.pump()  # so mac updates
 
     def tearDown(self):
+        pygame.display.set_update_merging(False)
         display.quit()
 
     def test_update_negative(self):
@@ -851,6 +853,111 @@ class DisplayUpdateTest(unittest.TestCase):
         with self.assertRaises(ValueError):
             pygame.display.update([100, "asdf", 100, 100])
 
+    def test_update_stats(self):
+        """counts what update() and flip() push to the screen."""
+        pygame.display.get_update_stats(reset=True)
+        pygame.display.update(pygame.Rect(0, 0, 10, 20))
+        pygame.display.update([(0, 0, 10, 10), None, (600, 600, 10, 10)])
+        pygame.display.update(None)
+        pygame.display.flip()
+
+        stats = pygame.display.get_update_stats(reset=True)
+        self.assertEqual(
+            stats,
+            {
+                "calls": 3,
+                "rects_requested": 2,
+                "rects_pushed": 3,
+                "pixels_pushed": 200 + 100 + 500 * 500,
+                "full_updates": 1,
+            },
+        )
+        self.assertEqual(set(pygame.display.get_update_stats().values()), {0})
+
+    def test_update_merging(self):
+        """overlapping and touching rects are pushed once."""
+        self.screen.fill("green")
+        rects = [
+            pygame.Rect(0, 0, 100, 100),
+            pygame.Rect(100, 0, 100, 100),
+            pygame.Rect(50, 50, 50, 50),
+            pygame.Rect(300, 300, 100, 100),
+            pygame.Rect(0, 100, 200, 100),
+        ]
+        self.assertIsNone(pygame.display.get_update_merging())
+        pygame.display.set_update_merging(True)
+        self.assertEqual(pygame.display.get_update_merging(), 0.75)
+
+        pygame.display.get_update_stats(reset=True)
+        pygame.display.update(rects)
+        pygame.event.pump()  # so mac updates
+        stats = pygame.display.get_update_stats()
+        self.assertEqual(stats["rects_requested"], 5)
+        self.assertEqual(stats["rects_pushed"], 2)
+        self.assertEqual(stats["pixels_pushed"], 200 * 200 + 100 * 100)
+        self.assertEqual(stats["full_updates"], 0)
+
+        for point in ((50, 50), (150, 50), (150, 150), (350, 350)):
+            self.assertEqual(self.screen.get_at(point), (0, 255, 0))
+
+        self.question(f"Is the screen green in {rects}?")
+
+    def test_update_merging_keeps_apart(self):
+        """rects are not merged when the union would push more pixels."""
+        pygame.display.set_update_merging(True)
+        pygame.display.get_update_stats(reset=True)
+        pygame.display.update([(0, 0, 100, 10), (90, 0, 10, 100)])
+
+        stats = pygame.display.get_update_stats()
+        self.assertEqual(stats["rects_pushed"], 2)
+        self.assertEqual(stats["pixels_pushed"], 2000)
+
+    def test_update_merging_many_rects(self):
+        """long rect lists are merged too."""
+        pygame.display.set_update_merging(True, flip_threshold=1)
+        rng = random.Random(0)
+
+        # 10x5 tiles touching each other, which all merge into the screen
+        tiles = [(x, y, 10, 5) for x in range(0, 500, 10) for y in range(0, 500, 5)]
+        rng.shuffle(tiles)
+        pygame.display.get_update_stats(reset=True)
+        pygame.display.update(tiles)
+        stats = pygame.display.get_update_stats()
+        self.assertEqual(stats["rects_requested"], 5000)
+        self.assertEqual(stats["rects_pushed"], 1)
+        self.assertEqual(stats["pixels_pushed"], 500 * 500)
+
+        # 2x2 rects with gaps between them, which all stay apart
+        dots = [(x, y, 2, 2) for x in range(0, 500, 4) for y in range(0, 500, 4)]
+        rng.shuffle(dots)
+        pygame.display.get_update_stats(reset=True)
+        pygame.display.update(dots)
+        stats = pygame.display.get_update_stats()
+        self.assertEqual(stats["rects_pushed"], len(dots))
+        self.assertEqual(stats["pixels_pushed"], 4 * len(dots))
+
+    def test_update_merging_flip_threshold(self):
+        """large updates turn into a full display update."""
+        pygame.display.set_update_merging(True, flip_threshold=0.5)
+        self.assertEqual(pygame.display.get_update_merging(), 0.5)
+        pygame.display.get_update_stats(reset=True)
+
+        pygame.display.update([(0, 0, 500, 100), (0, 300, 500, 100)])
+        self.assertEqual(pygame.display.get_update_stats()["full_updates"], 0)
+
+        pygame.display.update([(0, 0, 500, 200), (0, 300, 500, 200)])
+        stats = pygame.display.get_update_stats()
+        self.assertEqual(stats["full_updates"], 1)
+        self.assertEqual(stats["rects_requested"], 4)
+        self.assertEqual(stats["pixels_pushed"], 100000 + 250000)
+
+    def test_update_merging_incorrect_args(self):
+        """raises on a negative threshold."""
+        with self.assertRaises(ValueError):
+            pygame.display.set_update_merging(True, -0.5)
+        with self.assertRaises(TypeError):
+            pygame.display.set_update_merging(True, "all")
+
     def test_update_no_init(self):
         """raises a pygame.error."""
 
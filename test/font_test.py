@@ -337,6 +337,90 @@ class FontTest(unittest.TestCase):
         self.assertEqual(one_newline.get_height() * 2, two_newlines.get_height())
         self.assertEqual(one_newline.get_height() * 3, three_newlines.get_height())
 
+    def test_render_cache(self):
+        if pygame_font.__name__ == "pygame.ftfont":
+            return
+
+        f = pygame_font.Font(None, 20)
+        self.assertEqual(
+            f.get_render_cache_stats(),
+            {"hits": 0, "misses": 0, "entries": 0, "bytes": 0, "max_bytes": 0},
+        )
+        # caching is off by default
+        self.assertIsNot(f.render("a", True, "red"), f.render("a", True, "red"))
+
+        f.set_render_cache(1 << 20)
+        s1 = f.render("score: 10", True, "red")
+        self.assertIs(f.render("score: 10", True, "red"), s1)
+        self.assertIs(f.render("score: 10", True, (255, 0, 0)), s1)
+        for args in (
+            ("score: 11", True, "red"),
+            ("score: 10", False, "red"),
+            ("score: 10", True, "blue"),
+            ("score: 10", True, "red", "white"),
+            ("score: 10", True, "red", None, 50),
+        ):
+            self.assertIsNot(f.render(*args), s1)
+
+        stats = f.get_render_cache_stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (2, 6))
+        self.assertEqual(stats["entries"], 6)
+        self.assertEqual(stats["max_bytes"], 1 << 20)
+        self.assertGreaterEqual(stats["bytes"], s1.get_pitch() * s1.get_height())
+
+        # style flags are part of the key
+        f.bold = True
+        bold = f.render("score: 10", True, "red")
+        self.assertIsNot(bold, s1)
+        f.bold = False
+        self.assertIs(f.render("score: 10", True, "red"), s1)
+
+        # other changes to the font empty the cache
+        f.outline = 1
+        self.assertEqual(f.get_render_cache_stats()["entries"], 0)
+        self.assertIsNot(f.render("score: 10", True, "red"), s1)
+
+        f.clear_render_cache()
+        stats = f.get_render_cache_stats(reset=True)
+        self.assertEqual((stats["entries"], stats["bytes"]), (0, 0))
+        self.assertEqual(f.get_render_cache_stats()["hits"], 0)
+
+        f.set_render_cache(0)
+        self.assertEqual(f.get_render_cache_stats()["max_bytes"], 0)
+        self.assertRaises(ValueError, f.set_render_cache, -1)
+        self.assertRaises(TypeError, f.set_render_cache, "1")
+
+    def test_render_cache_eviction(self):
+        if pygame_font.__name__ == "pygame.ftfont":
+            return
+
+        f = pygame_font.Font(None, 20)
+        first = f.render("0", True, "white")
+        size = first.get_pitch() * first.get_height()
+        f.set_render_cache(size * 3)
+
+        first = f.render("0", True, "white")
+        f.render("1", True, "white")
+        f.render("2", True, "white")
+        # using "0" again makes "1" the least recently used text
+        self.assertIs(f.render("0", True, "white"), first)
+        f.render("3", True, "white")
+
+        stats = f.get_render_cache_stats()
+        self.assertLessEqual(stats["bytes"], size * 3)
+        self.assertIs(f.render("0", True, "white"), first)
+        misses = f.get_render_cache_stats()["misses"]
+        f.render("1", True, "white")
+        self.assertEqual(f.get_render_cache_stats()["misses"], misses + 1)
+
+        # texts bigger than the whole budget are not cached
+        f.render("a much longer text", True, "white")
+        self.assertLessEqual(f.get_render_cache_stats()["bytes"], size * 3)
+
+        # shrinking the budget evicts right away
+        f.set_render_cache(size)
+        self.assertLessEqual(f.get_render_cache_stats()["entries"], 1)
+
 
 @unittest.skipIf(IS_PYPY, "pypy skip known failure")  # TODO
 class FontTypeTest(unittest.TestCase):
@@ -917,6 +1001,10 @@ class FontTypeTest(unittest.TestCase):
                     ),
                 ),  # surf
                 ("render_raw", ("any text",)),
+                ("get_glyph_layout", ("any text",)),
+                ("get_cache_stats", ()),
+                ("set_cache_size", (64,)),
+                ("preload_glyphs", ("any text",)),
                 (
                     "render_raw_to",
                     (
@@ -958,6 +1046,9 @@ class FontTypeTest(unittest.TestCase):
                 ("size", ("any text",)),
                 ("set_script", ("is it other text",)),
                 ("set_direction", ("is it text",)),
+                ("set_render_cache", (1024,)),
+                ("clear_render_cache", ()),
+                ("get_render_cache_stats", ()),
             ]
             skip_methods = set()
             version = pygame.font.get_sdl_ttf_version()
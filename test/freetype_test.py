@@ -469,6 +469,33 @@ class FreeTypeFontTest(unittest.TestCase):
         # raises exception when uninitialized
         self.assertRaises(RuntimeError, nullfont().get_metrics, "a", size=24)
 
+    def test_freetype_Font_get_glyph_layout(self):
+        font = self._TEST_FONTS["sans"]
+
+        rect, glyphs = font.get_glyph_layout("AV a", size=24)
+        self.assertEqual(rect, font.get_rect("AV a", size=24))
+        self.assertEqual(len(glyphs), 4)
+        for glyph in glyphs:
+            self.assertIsInstance(glyph, tuple)
+            self.assertEqual(len(glyph), 5)
+            for value in glyph:
+                self.assertIsInstance(value, int)
+        # the glyph bitmaps are inside the rendered surface
+        for _, x, y, w, h in glyphs:
+            self.assertTrue(rect.w >= x + w >= w >= 0)
+            self.assertTrue(rect.h >= y + h >= h >= 0)
+        # a space has nothing to draw, equal characters share a glyph
+        self.assertEqual(glyphs[2][3:], (0, 0))
+        _, glyphs = font.get_glyph_layout("aa", size=24)
+        self.assertEqual(glyphs[0][0], glyphs[1][0])
+        self.assertLess(glyphs[0][1], glyphs[1][1])
+
+        rect, glyphs = font.get_glyph_layout("", size=24)
+        self.assertEqual(glyphs, [])
+
+        self.assertRaises(TypeError, font.get_glyph_layout, 24)
+        self.assertRaises(RuntimeError, nullfont().get_glyph_layout, "a")
+
     def test_freetype_Font_get_rect(self):
         font = self._TEST_FONTS["sans"]
 
@@ -1469,6 +1496,84 @@ class FreeTypeFontTest(unittest.TestCase):
     except AttributeError:
         del test_freetype_Font_cache
 
+    def test_freetype_Font_get_cache_stats(self):
+        f = ft.Font(None, size=24)
+        keys = {"glyphs", "bytes", "hits", "misses", "evictions", "size"}
+
+        stats = f.get_cache_stats()
+        self.assertEqual(set(stats), keys)
+        self.assertEqual(stats["glyphs"], 0)
+        self.assertEqual(stats["bytes"], 0)
+        self.assertEqual(stats["size"], ft.get_cache_size())
+
+        f.render_raw("abcde")
+        stats = f.get_cache_stats()
+        self.assertEqual(stats["glyphs"], 5)
+        self.assertGreater(stats["bytes"], 0)
+        self.assertEqual((stats["hits"], stats["misses"]), (0, 5))
+
+        # Same glyphs are hits, new ones misses
+        f.render_raw("abc123")
+        stats = f.get_cache_stats(reset=True)
+        self.assertEqual(stats["glyphs"], 8)
+        self.assertEqual((stats["hits"], stats["misses"]), (3, 8))
+
+        stats = f.get_cache_stats()
+        self.assertEqual(stats["glyphs"], 8)
+        self.assertEqual((stats["hits"], stats["misses"]), (0, 0))
+        self.assertEqual(stats["evictions"], 0)
+
+        # Overfilling the cache evicts glyphs
+        many_glyphs = "".join(chr(i) for i in range(32, 127))
+        f.get_metrics(many_glyphs, size=8)
+        f.get_metrics(many_glyphs, size=10)
+        stats = f.get_cache_stats()
+        self.assertGreater(stats["evictions"], 0)
+        self.assertEqual(stats["glyphs"] + stats["evictions"], 8 + 2 * len(many_glyphs))
+
+    def test_freetype_Font_set_cache_size(self):
+        f = ft.Font(None, size=24)
+        f.render_raw("abcde")
+
+        for size, expected in ((1, 32), (100, 128), (128, 128), (1000, 1024)):
+            f.set_cache_size(size)
+            stats = f.get_cache_stats()
+            self.assertEqual(stats["size"], expected)
+            # Resizing keeps the cached glyphs
+            self.assertEqual(stats["glyphs"], 5)
+
+        f.render_raw("abcde")
+        self.assertEqual(f.get_cache_stats()["hits"], 5)
+
+        self.assertRaises(ValueError, f.set_cache_size, 0)
+        self.assertRaises(ValueError, f.set_cache_size, -1)
+        self.assertRaises(TypeError, f.set_cache_size, "64")
+
+    def test_freetype_Font_preload_glyphs(self):
+        f = ft.Font(None, size=24)
+        charset = "".join(chr(i) for i in range(32, 127))
+
+        self.assertEqual(f.preload_glyphs(charset), len(charset))
+        stats = f.get_cache_stats(reset=True)
+        self.assertEqual(stats["glyphs"], len(charset))
+        self.assertGreaterEqual(stats["size"], len(charset))
+
+        # Preloaded glyphs are neither loaded again nor evicted by rendering
+        self.assertEqual(f.preload_glyphs(charset), 0)
+        surf, rect = f.render(charset)
+        surf, rect = f.render(charset[::-1], size=24)
+        stats = f.get_cache_stats()
+        self.assertEqual(stats["misses"], 0)
+        self.assertEqual(stats["evictions"], 0)
+        self.assertEqual(stats["hits"], 3 * len(charset))
+
+        # Other sizes and styles are separate glyphs
+        self.assertEqual(f.preload_glyphs("abc", size=12), 3)
+        self.assertEqual(f.preload_glyphs("abc", style=ft.STYLE_OBLIQUE), 3)
+        self.assertEqual(f.preload_glyphs("abc", rotation=90), 3)
+        self.assertEqual(f.preload_glyphs(b"abc", size=12), 0)
+        self.assertEqual(f.preload_glyphs(""), 0)
+
     def test_undefined_character_code(self):
         # To be consistent with pygame.font.Font, undefined codes
         # are rendered as the undefined character, and has metrics
@@ -1711,6 +1816,328 @@ class FreeTypeFontTest(unittest.TestCase):
         f = ft.Font(pathlib.Path(self._fixed_path), 20)
 
 
+class GlyphAtlasTest(unittest.TestCase):
+    _sans_path = os.path.join(FONTDIR, "test_sans.ttf")
+
+    def setUp(self):
+        ft.init()
+        self.font = ft.Font(self._sans_path, 24)
+        self.font.kerning = True
+
+    def tearDown(self):
+        ft.quit()
+
+    def test_render_matches_font(self):
+        atlas = ft.GlyphAtlas(self.font)
+        for text, fgcolor, bgcolor in (
+            ("AVA Wave", "red", None),
+            ("Hello, world!", (10, 200, 30, 128), None),
+            (b"bytes 123", "white", "blue"),
+        ):
+            surf, rect = atlas.render(text, fgcolor, bgcolor)
+            expected_surf, expected_rect = self.font.render(text, fgcolor, bgcolor)
+            self.assertEqual(rect, expected_rect)
+            for x in range(rect.w):
+                for y in range(rect.h):
+                    # tinting translucent text may round alpha differently
+                    color = surf.get_at((x, y))
+                    expected = expected_surf.get_at((x, y))
+                    self.assertAlmostEqual(color.a, expected.a, delta=1)
+                    if color.a and expected.a:
+                        self.assertEqual(color.rgb, expected.rgb, (text, x, y))
+
+        surf, rect = atlas.render("")
+        self.assertEqual(surf.get_size(), rect.size)
+        self.assertEqual(rect.w, 0)
+
+    def test_render_overlapping_glyphs(self):
+        text = "WWMMww ffi"
+        style = ft.STYLE_STRONG
+        atlas = ft.GlyphAtlas(self.font, style=style, rotation=30)
+
+        # the glyph boxes overlap, so the glyphs are blended together
+        _, layout = self.font.get_glyph_layout(text, style, 30)
+        boxes = [pygame.Rect(x, y, w, h) for _, x, y, w, h in layout if w and h]
+        self.assertTrue(
+            any(box.colliderect(other) for box, other in zip(boxes, boxes[1:]))
+        )
+
+        for fgcolor, bgcolor in (
+            ("white", None),
+            ((10, 200, 30, 128), None),
+            ((250, 120, 0, 200), "blue"),
+        ):
+            surf, rect = atlas.render(text, fgcolor, bgcolor)
+            expected_surf, expected_rect = self.font.render(
+                text, fgcolor, bgcolor, style, 30
+            )
+            self.assertEqual(rect, expected_rect)
+            for x in range(rect.w):
+                for y in range(rect.h):
+                    # blends of overlapping glyphs are rounded differently
+                    color = surf.get_at((x, y))
+                    expected = expected_surf.get_at((x, y))
+                    self.assertAlmostEqual(color.a, expected.a, delta=2)
+                    if color.a and expected.a:
+                        for channel, expected_channel in zip(color, expected):
+                            self.assertAlmostEqual(
+                                channel, expected_channel, delta=2, msg=(x, y)
+                            )
+
+    def test_render_to(self):
+        atlas = ft.GlyphAtlas(self.font)
+        target = pygame.Surface((200, 50), pygame.SRCALPHA)
+        text_surf, text_rect = atlas.render("Wave", "green")
+
+        rect = atlas.render_to(target, (10, 5), "Wave", "green")
+        self.assertEqual(rect, pygame.Rect((10, 5), text_rect.size))
+        for x in range(text_rect.w):
+            for y in range(text_rect.h):
+                self.assertEqual(
+                    target.get_at((10 + x, 5 + y)), text_surf.get_at((x, y))
+                )
+
+    def test_stats(self):
+        atlas = ft.GlyphAtlas(self.font)
+        self.assertEqual(
+            atlas.get_stats(),
+            {"glyphs": 0, "hits": 0, "misses": 0, "evictions": 0, "flushes": 0},
+        )
+        self.assertEqual(atlas.occupancy, 0)
+
+        atlas.render("abca b")
+        stats = atlas.get_stats()
+        self.assertEqual(len(atlas), 3)
+        self.assertEqual((stats["hits"], stats["misses"]), (2, 3))
+        self.assertGreater(atlas.occupancy, 0)
+
+        atlas.render("cab")
+        self.assertEqual(atlas.get_stats()["hits"], 5)
+
+        atlas.clear()
+        self.assertEqual(len(atlas), 0)
+        self.assertEqual(atlas.get_stats()["evictions"], 3)
+        self.assertEqual(atlas.occupancy, 0)
+
+    def test_flush_when_full(self):
+        atlas = ft.GlyphAtlas(self.font, atlas_size=(64, 64))
+        for text in ("abcd", "efgh", "ijkl", "mnop"):
+            surf, rect = atlas.render(text, "white")
+            expected_surf, expected_rect = self.font.render(text, "white")
+            self.assertEqual(rect, expected_rect)
+            self.assertEqual(
+                pygame.image.tobytes(surf, "RGBA"),
+                pygame.image.tobytes(expected_surf, "RGBA"),
+            )
+        stats = atlas.get_stats()
+        self.assertGreater(stats["flushes"], 0)
+        self.assertGreater(stats["evictions"], 0)
+        self.assertLessEqual(atlas.occupancy, 1)
+
+        self.assertRaises(ValueError, atlas.render, "abcdefghijklmnopqrstuvwxyz")
+        self.assertRaises(
+            ValueError, ft.GlyphAtlas(self.font, atlas_size=(8, 8)).render, "W"
+        )
+
+    def test_font_settings_change(self):
+        atlas = ft.GlyphAtlas(self.font)
+
+        def check(text):
+            surf, rect = atlas.render(text, "white")
+            expected_surf, expected_rect = self.font.render(text, "white")
+            self.assertEqual(rect, expected_rect)
+            self.assertEqual(
+                pygame.image.tobytes(surf, "RGBA"),
+                pygame.image.tobytes(expected_surf, "RGBA"),
+            )
+
+        check("Wave")
+        self.font.size = 40
+        check("Wave")
+        self.font.antialiased = False
+        check("Wave")
+        self.font.style = ft.STYLE_STRONG
+        check("Wave")
+        self.font.strength = 0.1
+        check("Wave")
+        self.assertEqual(atlas.get_stats()["evictions"], 4 * 4)
+
+        # unchanged settings keep the glyphs
+        check("Wave")
+        self.assertEqual(len(atlas), 4)
+        self.assertEqual(atlas.get_stats()["evictions"], 4 * 4)
+
+        atlas.size = 12
+        surf, rect = atlas.render("Wave", "white")
+        self.assertEqual(rect, self.font.get_rect("Wave", size=12))
+
+    def test_invalid_args(self):
+        self.assertRaises(ValueError, ft.GlyphAtlas, self.font, padding=-1)
+        atlas = ft.GlyphAtlas(self.font, style=ft.STYLE_UNDERLINE)
+        self.assertRaises(ValueError, atlas.render, "a")
+
+
+class TextLayoutTest(unittest.TestCase):
+    _sans_path = os.path.join(FONTDIR, "test_sans.ttf")
+
+    def setUp(self):
+        ft.init()
+        self.font = ft.Font(self._sans_path, 16)
+
+    def tearDown(self):
+        ft.quit()
+
+    def assertSameLayout(self, layout):
+        """Check an edited layout against one laid out from scratch."""
+        expected = ft.TextLayout(self.font, layout.width, layout.text)
+        self.assertEqual(len(layout), len(expected.text))
+        self.assertEqual(layout.line_count, expected.line_count)
+        for line in range(layout.line_count):
+            self.assertEqual(layout.get_line(line), expected.get_line(line))
+
+    def test_wrap(self):
+        text = "The quick brown fox jumps over the lazy dog. " * 4
+        layout = ft.TextLayout(self.font, 150, text + "\n\nend")
+        self.assertEqual(layout.text, text + "\n\nend")
+        self.assertGreater(layout.line_count, 4)
+        self.assertEqual(layout.line_height, self.font.get_sized_height(16))
+        self.assertEqual(layout.height, layout.line_count * layout.line_height)
+        self.assertEqual(layout.get_line(-2), "")
+        self.assertEqual(layout.get_line(-1), "end")
+
+        lines = [layout.get_line(i) for i in range(layout.line_count)]
+        self.assertEqual("".join(lines[:-2]), text)
+        for line in lines:
+            self.assertLessEqual(self.font.get_rect(line.rstrip(" ")).width, 150)
+            self.assertFalse(line.startswith(" "))
+
+        # A word wider than a line is broken between characters
+        layout = ft.TextLayout(self.font, 40, "WWWWWWWWWW")
+        self.assertGreater(layout.line_count, 1)
+        self.assertEqual(
+            "".join(layout.get_line(i) for i in range(layout.line_count)),
+            "WWWWWWWWWW",
+        )
+
+        layout.width = 1000
+        self.assertEqual(layout.line_count, 1)
+        self.assertRaises(IndexError, layout.get_line, 1)
+        self.assertRaises(ValueError, setattr, layout, "width", 0)
+        self.assertRaises(ValueError, ft.TextLayout, self.font, -5)
+
+    def test_edit(self):
+        layout = ft.TextLayout(self.font, 120)
+        self.assertEqual((len(layout), layout.line_count), (0, 1))
+
+        layout.append("hello world, this is a chat log")
+        layout.append(" that keeps growing")
+        self.assertSameLayout(layout)
+        layout.append("\nsecond message\nthird")
+        self.assertSameLayout(layout)
+        layout.append(b"\nbytes \xe9")
+        self.assertTrue(layout.text.endswith("bytes \xe9"))
+
+        layout.insert(0, "first ")
+        self.assertTrue(layout.text.startswith("first hello"))
+        self.assertSameLayout(layout)
+        layout.insert(11, "\nsplit\n")
+        self.assertSameLayout(layout)
+        layout.insert(-1, "X")
+        self.assertEqual(layout.text[-2:], "X\xe9")
+        layout.insert(1000, "!")
+        self.assertEqual(layout.text[-1], "!")
+
+        text = layout.text
+        layout.delete(3, 30)
+        self.assertEqual(layout.text, text[:3] + text[30:])
+        self.assertSameLayout(layout)
+        layout.delete(-5, None)
+        self.assertEqual(layout.text, text[:3] + text[30:-5])
+        layout.delete(10, 5)
+        self.assertEqual(layout.text, text[:3] + text[30:-5])
+        layout.delete(0, len(layout))
+        self.assertEqual((layout.text, layout.line_count), ("", 1))
+
+        layout.text = "a\nb"
+        self.assertEqual(layout.line_count, 2)
+
+    def test_hit_testing(self):
+        layout = ft.TextLayout(self.font, 150, "abc def ghi jkl mno pqr stu\nvwx")
+        line_height = layout.line_height
+        self.assertEqual(layout.get_position(0), (0, 0))
+        self.assertEqual(layout.index_at((-10, -10)), 0)
+        self.assertEqual(layout.index_at((1000, 1000)), len(layout))
+
+        x, y = layout.get_position(2)
+        self.assertEqual(y, 0)
+        self.assertEqual(x, sum(m[4] for m in self.font.get_metrics("ab")))
+        self.assertEqual(
+            layout.get_position(len(layout)),
+            (
+                sum(m[4] for m in self.font.get_metrics("vwx")),
+                layout.height - line_height,
+            ),
+        )
+
+        for index in range(len(layout)):
+            x, y = layout.get_position(index)
+            self.assertEqual(layout.index_at((x + 0.5, y + 1)), index)
+
+        # The end of a wrapped line is before its trailing space
+        first_line = layout.get_line(0)
+        self.assertTrue(first_line.endswith(" "))
+        self.assertEqual(layout.index_at((1000, 1)), len(first_line) - 1)
+        # and the end of a paragraph at its newline
+        self.assertEqual(layout.get_line(1), "pqr stu")
+        self.assertEqual(
+            layout.index_at((1000, line_height + 1)), layout.text.index("\n")
+        )
+
+    def test_render_to(self):
+        layout = ft.TextLayout(self.font, 100, "line\n" * 19 + "line")
+        line_height = layout.line_height
+        self.assertEqual(layout.line_count, 20)
+
+        surf = pygame.Surface((100, 5 * line_height))
+        rect = layout.render_to(surf, (0, 0), (0, 0, 100, 5 * line_height), "white")
+        self.assertEqual(rect, surf.get_rect())
+
+        # Only the lines in area are drawn, each line as render_to would
+        expected = pygame.Surface(surf.get_size())
+        self.font.origin = True
+        for line in range(5):
+            self.font.render_to(
+                expected,
+                (0, line * line_height + self.font.get_sized_ascender()),
+                "line",
+                "white",
+            )
+        self.font.origin = False
+        self.assertEqual(surf.get_view("2").raw, expected.get_view("2").raw)
+
+        # Scrolling to the end draws the same lines
+        scrolled = pygame.Surface(surf.get_size())
+        area = (0, layout.height - 5 * line_height, 100, 5 * line_height)
+        layout.render_to(scrolled, (0, 0), area, "white")
+        self.assertEqual(scrolled.get_view("2").raw, expected.get_view("2").raw)
+        self.assertFalse(self.font.origin)
+
+        # Drawing is clipped to the area and the surface
+        surf.fill("black")
+        rect = layout.render_to(surf, (10, 10), (0, 0, 20, 20), "white")
+        self.assertEqual(rect, (10, 10, 20, 20))
+        surf.set_colorkey("black")
+        self.assertTrue(rect.contains(surf.get_bounding_rect()))
+        surf.fill("black")
+        surf.set_clip((0, 0, 15, 15))
+        rect = layout.render_to(surf, (10, 10), (0, 0, 20, 20), "white")
+        self.assertEqual(rect, (10, 10, 5, 5))
+        self.assertTrue(rect.contains(surf.get_bounding_rect()))
+        surf.set_clip(None)
+        rect = layout.render_to(surf, (90, 0))
+        self.assertEqual(rect, (90, 0, 10, surf.get_height()))
+
+
 class FreeTypeTest(unittest.TestCase):
     def setUp(self):
         ft.init()
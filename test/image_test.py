@@ -1487,6 +1487,88 @@ class ImageModuleTest(unittest.TestCase):
     def test_load_gif_threads(self):
         self.threads_load(glob.glob(example_path("data/*.gif")))
 
+    def test_load_many(self):
+        """load_many returns the same surfaces as load, in input order."""
+        paths = sorted(
+            glob.glob(example_path("data/*.png"))
+            + glob.glob(example_path("data/*.bmp"))
+        )
+        if not pygame.image.get_extended():
+            paths = [path for path in paths if path.endswith(".bmp")]
+        files = paths * 3
+
+        for threads in (0, 1, 2, 7):
+            surfs = pygame.image.load_many(files, threads=threads)
+            self.assertEqual(len(surfs), len(files))
+            for path, surf in zip(files, surfs):
+                expected = pygame.image.load(path)
+                self.assertIsInstance(surf, pygame.Surface)
+                self.assertEqual(surf.get_size(), expected.get_size())
+                self.assertEqual(
+                    pygame.image.tobytes(surf, "RGBA"),
+                    pygame.image.tobytes(expected, "RGBA"),
+                )
+
+    def test_load_many__sources(self):
+        """load_many accepts paths, pathlib objects and file objects."""
+        path = example_path("data/asprite.bmp")
+        with open(path, "rb") as f:
+            fileobj = io.BytesIO(f.read())
+
+        surfs = pygame.image.load_many((path, pathlib.Path(path), fileobj))
+        expected = pygame.image.tobytes(pygame.image.load(path), "RGBA")
+        for surf in surfs:
+            self.assertEqual(pygame.image.tobytes(surf, "RGBA"), expected)
+
+        self.assertEqual(pygame.image.load_many([]), [])
+
+    def test_load_many__errors(self):
+        """A failing file is reported in its slot without stopping the rest."""
+        good = example_path("data/asprite.bmp")
+        missing = example_path("data/does_not_exist.bmp")
+        corrupt = io.BytesIO(b"this is not an image")
+
+        surfs = pygame.image.load_many([good, missing, corrupt, good], threads=2)
+
+        self.assertIsInstance(surfs[0], pygame.Surface)
+        self.assertIsInstance(surfs[1], FileNotFoundError)
+        self.assertIsInstance(surfs[2], pygame.error)
+        self.assertIsInstance(surfs[3], pygame.Surface)
+
+    def test_load_many__invalid_args(self):
+        path = example_path("data/asprite.bmp")
+        with self.assertRaises(TypeError):
+            pygame.image.load_many(5)
+        with self.assertRaises(ValueError):
+            pygame.image.load_many([path], threads=-1)
+
+    def test_load_many__convert(self):
+        paths = [example_path("data/asprite.bmp")]
+        if pygame.image.get_extended():
+            paths.append(example_path("data/alien1.png"))
+
+        with self.assertRaises(pygame.error):
+            pygame.image.load_many(paths, convert=True)
+
+        pygame.display.init()
+        try:
+            screen = pygame.display.set_mode((1, 1))
+            surfs = pygame.image.load_many(paths, convert=True)
+            for path, surf in zip(paths, surfs):
+                loaded = pygame.image.load(path)
+                if loaded.get_flags() & pygame.SRCALPHA:
+                    expected = loaded.convert_alpha()
+                else:
+                    expected = loaded.convert()
+                self.assertEqual(surf.get_bitsize(), expected.get_bitsize())
+                self.assertEqual(surf.get_masks(), expected.get_masks())
+                self.assertEqual(
+                    pygame.image.tobytes(surf, "RGBA"),
+                    pygame.image.tobytes(expected, "RGBA"),
+                )
+        finally:
+            pygame.display.quit()
+
     def test_from_to_bytes_exists(self):
         getattr(pygame.image, "frombytes")
         getattr(pygame.image, "tobytes")
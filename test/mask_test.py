@@ -907,6 +907,74 @@ class MaskTypeTest(unittest.TestCase):
         with self.assertRaises(TypeError):
             overlap_count = mask1.overlap_area(mask2, offset)
 
+    def test_overlap_many(self):
+        """Ensures overlap_many returns the indices of the overlapping masks."""
+        mask = pygame.mask.Mask((10, 10), fill=True)
+        other = pygame.mask.Mask((3, 3), fill=True)
+        empty = pygame.mask.Mask((30, 30))
+        pairs = [
+            (other, (9, 9)),
+            (other, (10, 0)),
+            (empty, (-5, -5)),
+            [other, pygame.Vector2(-2, 5)],
+            (mask, (0, -10)),
+            (mask, (-9, -9)),
+        ]
+        expected = [i for i, (m, offset) in enumerate(pairs) if mask.overlap(m, offset)]
+
+        self.assertEqual(mask.overlap_many(pairs), expected)
+        self.assertEqual(mask.overlap_many(masks=iter(pairs)), [0, 3, 5])
+        self.assertEqual(mask.overlap_many([]), [])
+
+        mask.set_overlap_index()
+
+        self.assertEqual(mask.overlap_many(pairs), expected)
+
+        mask.set_overlap_index(False)
+        other.set_overlap_index()
+
+        self.assertEqual(mask.overlap_many(pairs), expected)
+
+    def test_overlap_many__invalid_args(self):
+        """Ensures overlap_many handles invalid arguments correctly."""
+        mask = pygame.mask.Mask((10, 10), fill=True)
+
+        for masks in (
+            [mask],
+            [(mask,)],
+            [(mask, (0, 0), (0, 0))],
+            [(pygame.Surface((10, 10)), (0, 0))],
+        ):
+            with self.assertRaises(TypeError):
+                mask.overlap_many(masks)
+
+        with self.assertRaises(TypeError):
+            mask.overlap_many([(mask, (0, 0)), (mask, "(0, 0)")])
+
+        with self.assertRaises(TypeError):
+            mask.overlap_many(5)
+
+    def test_overlap_many__item_errors_propagate(self):
+        """Ensures overlap_many passes on errors raised by the items."""
+        mask = pygame.mask.Mask((10, 10), fill=True)
+
+        class BrokenPair:
+            def __len__(self):
+                return 2
+
+            def __getitem__(self, index):
+                raise ValueError("broken item")
+
+        class NoLengthPair:
+            def __getitem__(self, index):
+                return (mask, (0, 0))[index]
+
+        with self.assertRaisesRegex(ValueError, "broken item"):
+            mask.overlap_many([(mask, (0, 0)), BrokenPair()])
+
+        with self.assertRaisesRegex(TypeError, "masks must contain"):
+            mask.overlap_many([NoLengthPair()])
+
     def test_overlap_mask(self):
         """Ensure overlap_mask's mask has correct bits set.
 
@@ -1720,6 +1788,341 @@ class MaskTypeTest(unittest.TestCase):
         with self.assertRaises(TypeError):
             mask1.erase(mask2, offset)
 
+    def test_fill_rect(self):
+        """Ensures fill_rect sets and clears the bits of a clipped rect."""
+        for width in (1, 31, 32, 33, 63, 64, 65, 130):
+            mask_size = (width, 6)
+            mask = pygame.mask.Mask(mask_size)
+            expected_mask = pygame.mask.Mask(mask_size)
+            rects = (
+                (0, 0, width, 6, 1),
+                (1, 1, width - 2, 3, 0),
+                (-10, 2, width // 2 + 10, 2, 1),
+                (width // 3, -1, 40, 20, 0),
+                (width - 1, 5, 100, 100, 1),
+                (width, 0, 5, 5, 0),
+                (3, 3, -2, 2, 1),
+            )
+
+            for *rect, value in rects:
+                msg = f"size={mask_size}, rect={rect}, value={value}"
+                mask.fill_rect(rect, value)
+                clipped = pygame.Rect(rect).clip(mask.get_rect())
+                for x in range(clipped.left, clipped.right):
+                    for y in range(clipped.top, clipped.bottom):
+                        expected_mask.set_at((x, y), value)
+
+                assertMaskEqual(self, mask, expected_mask, msg)
+
+    def test_fill_rect__value_keyword(self):
+        """Ensures fill_rect clears bits when value is 0."""
+        mask = pygame.mask.Mask((10, 10), fill=True)
+
+        self.assertIsNone(mask.fill_rect(rect=pygame.Rect(2, 2, 5, 5), value=0))
+        self.assertEqual(mask.count(), 75)
+
+        mask.fill_rect((2, 2, 2, 2))
+
+        self.assertEqual(mask.count(), 79)
+
+    def test_fill_rect__invalid_rect_arg(self):
+        """Ensures fill_rect handles invalid rect arguments correctly."""
+        mask = pygame.mask.Mask((5, 5))
+
+        with self.assertRaises(TypeError):
+            mask.fill_rect("(0, 0, 1, 1)")
+
+    def test_fill_circle(self):
+        """Ensures fill_circle sets the bits with a pixel center inside the
+        circle.
+        """
+        mask_size = (70, 40)
+        circles = (
+            ((35, 20), 10),
+            ((35.5, 20.5), 10),
+            ((3.25, 7.75), 6.5),
+            ((60, 38), 15),
+            ((-2, -2), 4),
+            ((10, 10), 0.5),
+            ((10, 10), 0),
+        )
+
+        for center, radius in circles:
+            msg = f"center={center}, radius={radius}"
+            mask = pygame.mask.Mask(mask_size)
+            expected_mask = pygame.mask.Mask(mask_size)
+            cx, cy = center
+            for x in range(mask_size[0]):
+                for y in range(mask_size[1]):
+                    if (x + 0.5 - cx) ** 2 + (y + 0.5 - cy) ** 2 <= radius**2:
+                        expected_mask.set_at((x, y))
+
+            mask.fill_circle(center, radius)
+
+            assertMaskEqual(self, mask, expected_mask, msg)
+
+            mask.fill()
+            expected_mask.invert()
+            mask.fill_circle(pygame.Vector2(center), radius, 0)
+
+            assertMaskEqual(self, mask, expected_mask, msg)
+
+    def test_fill_circle__outside(self):
+        """Ensures fill_circle ignores negative radii and circles outside of
+        the mask.
+        """
+        mask = pygame.mask.Mask((20, 20))
+
+        mask.fill_circle((10, 10), -5)
+        mask.fill_circle((100, 10), 50)
+        mask.fill_circle((10, -30), 20)
+
+        self.assertEqual(mask.count(), 0)
+
+        mask.fill_circle((10, 10), 1e300)
+
+        self.assertEqual(mask.count(), 400)
+
+    def test_fill_circle__invalid_args(self):
+        """Ensures fill_circle handles invalid arguments correctly."""
+        mask = pygame.mask.Mask((5, 5))
+
+        with self.assertRaises(TypeError):
+            mask.fill_circle("(1, 1)", 2)
+
+        with self.assertRaises(TypeError):
+            mask.fill_circle((1, 1), "2")
+
+    def test_fill_polygon(self):
+        """Ensures fill_polygon sets the bits with a pixel center inside the
+        polygon.
+        """
+        mask_size = (70, 40)
+        polygons = (
+            [(0, 0), (4, 0), (4, 2), (0, 2)],
+            [(5, 3), (65, 10), (30, 38)],
+            [(10.5, 5.25), (60.75, 5), (60, 35.5), (35, 20), (10, 35)],
+            [(-10, -10), (80, 20), (-10, 50)],
+            # self-intersecting, even-odd rule
+            [(5, 5), (60, 35), (60, 5), (5, 35)],
+        )
+
+        for points in polygons:
+            msg = f"points={points}"
+            mask = pygame.mask.Mask(mask_size)
+            expected_mask = pygame.mask.Mask(mask_size)
+            for x in range(mask_size[0]):
+                for y in range(mask_size[1]):
+                    if self._point_in_polygon(x + 0.5, y + 0.5, points):
+                        expected_mask.set_at((x, y))
+
+            mask.fill_polygon(points)
+
+            assertMaskEqual(self, mask, expected_mask, msg)
+
+            mask.fill()
+            expected_mask.invert()
+            mask.fill_polygon(points, value=0)
+
+            assertMaskEqual(self, mask, expected_mask, msg)
+
+    @staticmethod
+    def _point_in_polygon(px, py, points):
+        inside = False
+        for (x0, y0), (x1, y1) in zip(points[-1:] + points[:-1], points):
+            if (y0 <= py) != (y1 <= py):
+                if px < x0 + (py - y0) * (x1 - x0) / (y1 - y0):
+                    inside = not inside
+        return inside
+
+    def test_fill_polygon__rect(self):
+        """Ensures a rectangular polygon sets the same bits as fill_rect."""
+        mask = pygame.mask.Mask((100, 10))
+        expected_mask = pygame.mask.Mask((100, 10))
+
+        mask.fill_polygon([(3, 2), (97, 2), (97, 7), (3, 7)])
+        expected_mask.fill_rect((3, 2, 94, 5))
+
+        assertMaskEqual(self, mask, expected_mask)
+
+    def test_fill_polygon__invalid_points(self):
+        """Ensures fill_polygon handles invalid points correctly."""
+        mask = pygame.mask.Mask((5, 5))
+
+        with self.assertRaises(ValueError):
+            mask.fill_polygon([(0, 0), (3, 3)])
+
+        with self.assertRaises(TypeError):
+            mask.fill_polygon([(0, 0), (3, 3), "(0, 3)"])
+
+        with self.assertRaises(TypeError):
+            mask.fill_polygon(5)
+
+    def test_update_from_surface(self):
+        """Ensures update_from_surface only changes the given area, setting it
+        as from_surface would.
+        """
+        size = (97, 41)
+        rect = pygame.Rect(20, 5, 50, 30)
+
+        for flags, depth, colorkey in (
+            (SRCALPHA, 32, None),
+            (SRCALPHA, 16, None),
+            (0, 32, (20, 30, 40)),
+            (0, 24, None),
+        ):
+            msg = f"depth={depth}, colorkey={colorkey}"
+            surface = pygame.Surface(size, flags, depth)
+            for x in range(0, size[0], 3):
+                surface.fill((x, 30, 40, x * 2 % 256), (x, 0, 2, size[1]))
+            if colorkey is not None:
+                surface.set_colorkey(colorkey)
+            mask = pygame.mask.Mask(size, fill=True)
+
+            mask.update_from_surface(surface, rect, 100)
+
+            expected_mask = pygame.mask.Mask(size, fill=True)
+            expected_mask.erase(pygame.mask.Mask(rect.size, fill=True), rect.topleft)
+            expected_mask.draw(
+                pygame.mask.from_surface(surface.subsurface(rect), 100), rect.topleft
+            )
+
+            assertMaskEqual(self, mask, expected_mask, msg)
+
+            mask.update_from_surface(surface=surface, threshold=100)
+
+            assertMaskEqual(self, mask, pygame.mask.from_surface(surface, 100), msg)
+
+    def test_update_from_surface__clipped_rect(self):
+        """Ensures update_from_surface ignores the area outside of the mask."""
+        surface = pygame.Surface((10, 10), SRCALPHA, 32)
+        surface.fill((0, 0, 0, 255), (0, 0, 5, 10))
+        mask = pygame.mask.Mask((10, 10))
+
+        mask.update_from_surface(surface, (-5, -5, 100, 8))
+
+        self.assertEqual(mask.get_bounding_rects(), [pygame.Rect(0, 0, 5, 3)])
+
+        mask.update_from_surface(surface, (20, 20, 5, 5))
+        mask.update_from_surface(surface, (2, 2, -1, 5))
+
+        # the negative width is normalized to the column at x = 1
+        self.assertEqual(mask.count(), 19)
+
+    def test_update_from_surface__invalid_args(self):
+        """Ensures update_from_surface handles invalid arguments correctly."""
+        mask = pygame.mask.Mask((10, 10))
+
+        with self.assertRaises(ValueError):
+            mask.update_from_surface(pygame.Surface((10, 11)))
+
+        with self.assertRaises(TypeError):
+            mask.update_from_surface(pygame.Surface((10, 10)), "rect")
+
+        with self.assertRaises(TypeError):
+            mask.update_from_surface(mask)
+
+    def test_set_overlap_index(self):
+        """Ensures the overlap index can be enabled and disabled."""
+        mask = pygame.mask.Mask((100, 100))
+
+        self.assertFalse(mask.get_overlap_index())
+
+        self.assertIsNone(mask.set_overlap_index())
+        self.assertTrue(mask.get_overlap_index())
+        self.assertTrue(mask.copy().get_overlap_index())
+
+        mask.set_overlap_index(enabled=False)
+        self.assertFalse(mask.get_overlap_index())
+
+        pygame.mask.Mask((0, 0)).set_overlap_index()
+
+    def test_overlap_index__same_results(self):
+        """Ensures overlap and overlap_area give the same results with and
+        without an overlap index, including after changing the masks.
+        """
+        rng = random.Random(17)
+        offsets = [(rng.randint(-80, 230), rng.randint(-80, 230)) for _ in range(30)]
+
+        for _ in range(10):
+            mask = random_mask((rng.randint(1, 200), rng.randint(1, 200)))
+            other = random_mask((rng.randint(1, 90), rng.randint(1, 90)))
+            indexed = mask.copy()
+            indexed.set_overlap_index()
+            other_indexed = other.copy()
+            other_indexed.set_overlap_index()
+
+            for changed in (mask, indexed):
+                changed.fill_rect((10, 20, 70, 5))
+                changed.fill_circle((50, 60), 12, 0)
+                changed.fill_polygon([(100, 0), (150, 90), (90, 70)])
+                changed.draw(other, (120, 40))
+                changed.erase(other, (-20, 5))
+                changed.set_at((3, 3))
+
+            for offset in offsets:
+                msg = f"offset={offset}"
+                area = mask.overlap_area(other, offset)
+
+                self.assertEqual(indexed.overlap_area(other, offset), area, msg)
+                self.assertEqual(mask.overlap_area(other_indexed, offset), area, msg)
+
+                for pos in (
+                    indexed.overlap(other, offset),
+                    mask.overlap(other_indexed, offset),
+                ):
+                    if area == 0:
+                        self.assertIsNone(pos, msg)
+                    else:
+                        x, y = pos
+                        self.assertEqual(mask.get_at(pos), 1, msg)
+                        self.assertEqual(
+                            other.get_at((x - offset[0], y - offset[1])), 1, msg
+                        )
+
+    def test_overlap_index__cleared_blocks(self):
+        """Ensures blocks that become empty are skipped and blocks that get
+        bits are searched.
+        """
+        mask = pygame.mask.Mask((300, 200))
+        mask.set_overlap_index()
+        other = pygame.mask.Mask((300, 200), fill=True)
+
+        mask.set_at((130, 70))
+        self.assertEqual(mask.overlap(other, (0, 0)), (130, 70))
+
+        mask.set_at((130, 70), 0)
+        self.assertIsNone(mask.overlap(other, (0, 0)))
+
+        mask.fill()
+        self.assertEqual(mask.overlap_area(other, (5, 5)), 295 * 195)
+
+        mask.invert()
+        self.assertEqual(mask.overlap_area(other, (5, 5)), 0)
+
+        mask.update_from_surface(pygame.Surface((300, 200)), (250, 190, 5, 5))
+        self.assertEqual(mask.overlap_area(other, (0, 0)), 25)
+
+        mask.clear()
+        self.assertEqual(mask.overlap_area(other, (0, 0)), 0)
+
+    def test_overlap_index__buffer(self):
+        """Ensures bits set through the buffer interface are found."""
+        mask = pygame.mask.Mask((200, 200))
+        mask.set_overlap_index()
+        other = pygame.mask.Mask((10, 10), fill=True)
+        view = memoryview(mask)
+        intwidth = 8 * view.strides[1]
+
+        view[1, 150] = 1
+
+        self.assertEqual(mask.overlap(other, (intwidth - 4, 145)), (intwidth, 150))
+
+        view.release()
+
+        self.assertEqual(mask.overlap(other, (intwidth - 4, 145)), (intwidth, 150))
+        self.assertEqual(mask.overlap_area(other, (intwidth - 4, 145)), 1)
+
     def test_count(self):
         """Ensure a mask's set bits are correctly counted."""
         side = 67
@@ -6623,6 +7026,96 @@ class MaskModuleTest(unittest.TestCase):
             surf = pygame.surface.Surface((10, 10))
             pygame.mask.from_threshold(surf, color, color)
 
+    def test_from_surface__odd_widths(self):
+        """Ensures from_surface sets the right bits for widths that are not
+        a multiple of the vectorized pixel count.
+        """
+        for width in (1, 15, 17, 65, 130):
+            surf = pygame.Surface((width, 7), SRCALPHA, 32)
+            for x in range(width):
+                for y in range(7):
+                    surf.set_at((x, y), (x, y, 0, (x * 37 + y * 11) % 256))
+
+            for threshold in (0, 127, 200):
+                mask = pygame.mask.from_surface(surf, threshold)
+                expected = maskFromSurface(surf, threshold)
+
+                assertMaskEqual(self, mask, expected, f"width={width}")
+
+            surf = pygame.Surface((width, 7), 0, 32)
+            surf.fill((20, 30, 40))
+            for x in range(0, width, 3):
+                surf.set_at((x, x % 7), (1, 2, 3))
+            surf.set_colorkey((20, 30, 40))
+
+            assertMaskEqual(
+                self,
+                pygame.mask.from_surface(surf),
+                maskFromSurface(surf),
+                f"width={width}",
+            )
+
+    def test_from_threshold__odd_widths(self):
+        """Ensures from_threshold sets the right bits for widths that are not
+        a multiple of the vectorized pixel count.
+        """
+        color = (100, 50, 200, 255)
+        threshold = (20, 20, 20, 255)
+
+        for width in (1, 15, 17, 65, 130):
+            surf = pygame.Surface((width, 5), 0, 32)
+            surf2 = pygame.Surface((width, 5), 0, 32)
+            expected = pygame.Mask((width, 5))
+            expected2 = pygame.Mask((width, 5))
+            for x in range(width):
+                for y in range(5):
+                    pixel = (100 + (x * 7 + y) % 50 - 25, 50, 200)
+                    surf.set_at((x, y), pixel)
+                    surf2.set_at((x, y), (100, 50, 200 - (x % 40)))
+                    if abs(pixel[0] - 100) < 20:
+                        expected.set_at((x, y))
+                        if x % 40 < 20:
+                            expected2.set_at((x, y))
+
+            mask = pygame.mask.from_threshold(surf, color, threshold)
+            mask2 = pygame.mask.from_threshold(
+                surf, (0, 0, 0, 0), threshold, othersurface=surf2
+            )
+
+            assertMaskEqual(self, mask, expected, f"width={width}")
+            assertMaskEqual(self, mask2, expected2, f"width={width}")
+
+    def test_from_surface__blit_threads(self):
+        """Ensures masks are the same when made on several threads."""
+        size = (301, 277)
+        surf = pygame.Surface(size, SRCALPHA, 32)
+        surf2 = pygame.Surface(size, 0, 32)
+        for x in range(0, size[0], 10):
+            surf.fill((x % 256, 128, 0, (x * 3) % 256), (x, 0, 5, size[1]))
+            surf2.fill((x % 256, 128, 0), (0, x, size[0], 5))
+
+        try:
+            results = []
+            for count in (1, 4):
+                pygame.surface.set_blit_threads(count)
+                results.append(
+                    (
+                        pygame.mask.from_surface(surf, 100),
+                        pygame.mask.from_threshold(
+                            surf, (100, 128, 0), (50, 10, 10, 255)
+                        ),
+                        pygame.mask.from_threshold(
+                            surf, (0, 0, 0), (30, 10, 10, 255), othersurface=surf2
+                        ),
+                    )
+                )
+        finally:
+            pygame.surface.set_blit_threads(1)
+
+        for serial, threaded in zip(*results):
+            self.assertNotEqual(serial.count(), 0)
+            assertMaskEqual(self, threaded, serial)
+
     def test_zero_size_from_surface(self):
         """Ensures from_surface can create masks from zero sized surfaces."""
         for size in ((100, 0), (0, 100), (0, 0)):
@@ -2878,6 +2878,95 @@ class RectTypeTest(unittest.TestCase):
         self.assertFalse(r.collideobjectsall(f, key=lambda o: o.rect2))
         self.assertFalse(r.collideobjectsall(f, key=lambda o: o.rect3))
 
+    def test_collide_pairs(self):
+        rects_a = [Rect(0, 0, 10, 10), Rect(20, 0, 10, 10), Rect(100, 100, 5, 5)]
+        rects_b = [Rect(5, 5, 10, 10), Rect(25, -5, 2, 30), Rect(9, 0, 10, 10)]
+
+        self.assertEqual(Rect.collide_pairs(rects_a, rects_b), [(0, 0), (0, 2), (1, 1)])
+        self.assertEqual(Rect.collide_pairs(rects_b, rects_a), [(0, 0), (1, 1), (2, 0)])
+        self.assertEqual(Rect.collide_pairs([], rects_b), [])
+        self.assertEqual(Rect.collide_pairs(rects_a, []), [])
+
+    def test_collide_pairs__single_set(self):
+        rects = [
+            Rect(0, 0, 10, 10),
+            Rect(5, 5, 10, 10),
+            Rect(9, -5, 2, 40),
+            Rect(50, 50, 1, 1),
+        ]
+
+        self.assertEqual(Rect.collide_pairs(rects), [(0, 1), (0, 2), (1, 2)])
+        self.assertEqual(Rect.collide_pairs(rects, None), Rect.collide_pairs(rects))
+        self.assertEqual(Rect.collide_pairs([]), [])
+        self.assertEqual(Rect.collide_pairs([Rect(0, 0, 4, 4)]), [])
+
+    def test_collide_pairs__rect_styles(self):
+        rects_a = [(0, 0, 10, 10), [(20, 0), (10, 10)]]
+        rects_b = [Rect(5, 5, 2, 2), ((25, 5), (1, 1))]
+
+        self.assertEqual(Rect.collide_pairs(rects_a, rects_b), [(0, 0), (1, 1)])
+        self.assertEqual(
+            Rect.collide_pairs(tuple(rects_a), tuple(rects_b)), [(0, 0), (1, 1)]
+        )
+
+    def test_collide_pairs__edges_and_empty(self):
+        """Touching edges and zero sized rects never collide, negative sizes
+        are normalized like in colliderect()."""
+        rects_a = [Rect(0, 0, 10, 10), Rect(5, 5, 0, 10), Rect(20, 20, -5, -5)]
+        rects_b = [Rect(10, 0, 5, 5), Rect(0, 10, 5, 5), Rect(14, 14, 2, 2)]
+
+        self.assertEqual(Rect.collide_pairs(rects_a, rects_b), [(2, 2)])
+
+    def test_collide_pairs__key(self):
+        things = [
+            self._ObjectWithRectAttribute(Rect(0, 0, 10, 10)),
+            self._ObjectWithRectAttribute(Rect(5, 5, 10, 10)),
+            self._ObjectWithRectAttribute(Rect(40, 40, 10, 10)),
+        ]
+        others = [self._ObjectWithRectAttribute(Rect(42, 42, 1, 1))]
+
+        self.assertEqual(Rect.collide_pairs(things, key=lambda o: o.rect), [(0, 1)])
+        self.assertEqual(
+            Rect.collide_pairs(things, others, key=lambda o: o.rect), [(2, 0)]
+        )
+
+    def test_collide_pairs__matches_brute_force(self):
+        rects_a = [
+            Rect((i * 37) % 211, (i * 53) % 197, 5 + i % 13, 3 + i % 17)
+            for i in range(150)
+        ]
+        rects_b = [
+            Rect((i * 41) % 203, (i * 29) % 191, 2 + i % 19, 4 + i % 11)
+            for i in range(120)
+        ]
+
+        expected = sorted(
+            (i, j) for i, a in enumerate(rects_a) for j in a.collidelistall(rects_b)
+        )
+        self.assertEqual(Rect.collide_pairs(rects_a, rects_b), expected)
+
+        expected_single = sorted(
+            (i, j)
+            for i, a in enumerate(rects_a)
+            for j in a.collidelistall(rects_a)
+            if i < j
+        )
+        self.assertEqual(Rect.collide_pairs(rects_a), expected_single)
+
+    def test_collide_pairs__invalid_args(self):
+        with self.assertRaises(TypeError):
+            Rect.collide_pairs()
+        with self.assertRaises(TypeError):
+            Rect.collide_pairs(1)
+        with self.assertRaises(TypeError):
+            Rect.collide_pairs([Rect(0, 0, 1, 1)], 1)
+        with self.assertRaises(TypeError):
+            Rect.collide_pairs([Rect(0, 0, 1, 1), "not a rect"])
+        with self.assertRaises(TypeError):
+            Rect.collide_pairs([Rect(0, 0, 1, 1)], key=1)
+        with self.assertRaises(TypeError):
+            Rect.collide_pairs([Rect(0, 0, 1, 1)], [], [])
+
     def test_fit(self):
         # __doc__ (as of 2008-08-02) for pygame.rect.Rect.fit:
 
@@ -1,4 +1,6 @@
+import array
 import gc
+import random
 import unittest
 import weakref
 
@@ -488,3 +490,345 @@ class TextureTest(unittest.TestCase):
         result = self.renderer.to_surface()
         for x in range(25, 75):
             self.assertEqual(pygame.Color(80, 120, 160, 255), result.get_at((x, 50)))
+
+    def test_draw_at_point(self):
+        texture2 = self.create_texture_from_surface()
+        texture2.draw(pygame.Rect(0, 0, 20, 10), (30, 40))
+        result = self.renderer.to_surface()
+        # the texture is drawn at its own size from the given position
+        self.assertEqual(pygame.Color(80, 120, 160, 255), result.get_at((30, 40)))
+        self.assertEqual(pygame.Color(80, 120, 160, 255), result.get_at((99, 99)))
+        self.assertEqual(pygame.Color(0, 0, 0, 255), result.get_at((29, 39)))
+
+    def test_draw_many(self):
+        texture2 = self.create_texture_from_surface()
+        quads = array.array(
+            "f",
+            [
+                # src rect, dst rect, angle, color
+                *(0, 0, 20, 20, 10, 10, 20, 20, 0, 255, 255, 255, 255),
+                *(0, 0, 20, 20, 50, 50, 30, 10, 0, 255, 0, 0, 255),
+            ],
+        )
+        texture2.draw_many(quads)
+        result = self.renderer.to_surface()
+        self.assertEqual(pygame.Color(80, 120, 160, 255), result.get_at((10, 10)))
+        self.assertEqual(pygame.Color(80, 120, 160, 255), result.get_at((29, 29)))
+        self.assertEqual(pygame.Color(0, 0, 0, 255), result.get_at((30, 30)))
+        self.assertEqual(pygame.Color(80, 0, 0, 255), result.get_at((50, 50)))
+        self.assertEqual(pygame.Color(80, 0, 0, 255), result.get_at((79, 59)))
+        self.assertEqual(pygame.Color(0, 0, 0, 255), result.get_at((79, 60)))
+
+    def test_draw_many__matches_draw(self):
+        surface = pygame.Surface((40, 40))
+        surface.fill("red")
+        surface.fill("blue", (20, 0, 20, 40))
+        texture2 = _render.Texture.from_surface(self.renderer, surface)
+
+        texture2.draw((20, 0, 20, 40), (30, 20, 40, 60))
+        expected = self.renderer.to_surface()
+        self.renderer.clear()
+        texture2.draw_many(
+            array.array("f", (20, 0, 20, 40, 30, 20, 40, 60, 0, *(255,) * 4))
+        )
+        result = self.renderer.to_surface()
+        self.assertEqual(
+            pygame.image.tobytes(expected, "RGB"), pygame.image.tobytes(result, "RGB")
+        )
+
+        # turned clockwise around the center, like draw()
+        self.renderer.clear()
+        texture2.draw_many(
+            array.array("f", (0, 0, 40, 40, 30, 30, 40, 40, 90, *(255,) * 4))
+        )
+        result = self.renderer.to_surface()
+        self.assertEqual(pygame.Color("red"), result.get_at((50, 35)))
+        self.assertEqual(pygame.Color("blue"), result.get_at((50, 65)))
+
+    def test_draw_many__color_mod(self):
+        texture2 = self.create_texture_from_surface()
+        texture2.color = (0, 255, 255)
+        texture2.draw_many(
+            array.array("f", (0, 0, 10, 10, 0, 0, 10, 10, 0, 255, 255, 128, 255))
+        )
+        result = self.renderer.to_surface()
+        self.assertEqual(pygame.Color(0, 120, 80, 255), result.get_at((5, 5)))
+
+    def test_draw_many__buffers(self):
+        texture2 = self.create_texture_from_surface()
+        values = array.array("f", (0, 0, 10, 10, 5, 5, 10, 10, 0, *(255,) * 4) * 3)
+
+        # any C contiguous float buffer works, flat or one row per quad
+        texture2.draw_many(values)
+        texture2.draw_many(memoryview(values).cast("B").cast("f", (3, 13)))
+        texture2.draw_many(array.array("f"))
+
+        with self.assertRaises(TypeError):
+            texture2.draw_many(array.array("d", values))
+        with self.assertRaises(TypeError):
+            texture2.draw_many(list(values))
+        with self.assertRaises(ValueError):
+            texture2.draw_many(values[:-1])
+        with self.assertRaises(BufferError):
+            texture2.draw_many(memoryview(values)[::2])
+
+
+class ImageTest(unittest.TestCase):
+    def setUp(self):
+        self.window = pygame.Window(size=(100, 100))
+        self.renderer = _render.Renderer(self.window)
+        self.renderer.draw_color = "BLACK"
+        self.renderer.clear()
+        surface = pygame.Surface((40, 20))
+        surface.fill("red", (0, 0, 20, 20))
+        surface.fill("blue", (20, 0, 20, 20))
+        self.texture = _render.Texture.from_surface(self.renderer, surface)
+
+    def test_init(self):
+        image = _render.Image(self.texture)
+        self.assertIs(image.texture, self.texture)
+        self.assertEqual(image.srcrect, pygame.Rect(0, 0, 40, 20))
+
+        image = _render.Image(self.texture, (20, 5, 10, 10))
+        self.assertEqual(image.srcrect, pygame.Rect(20, 5, 10, 10))
+
+        sub_image = _render.Image(image, (2, 3, 4, 5))
+        self.assertIs(sub_image.texture, self.texture)
+        self.assertEqual(sub_image.srcrect, pygame.Rect(22, 8, 4, 5))
+
+        with self.assertRaises(ValueError):
+            _render.Image(self.texture, (30, 0, 20, 20))
+        with self.assertRaises(TypeError):
+            _render.Image(self.texture, "not a rect")
+        with self.assertRaises(TypeError):
+            _render.Image(pygame.Surface((10, 10)))
+
+    def test_attributes(self):
+        image = _render.Image(self.texture)
+        self.assertEqual(image.angle, 0)
+        self.assertFalse(image.flip_x)
+        self.assertFalse(image.flip_y)
+        self.assertEqual(image.alpha, 255)
+        self.assertEqual(image.color, pygame.Color(255, 255, 255, 255))
+        self.assertIsNone(image.origin)
+
+        image.angle = 90
+        image.flip_x = True
+        image.flip_y = True
+        image.alpha = 128
+        image.color = (10, 20, 30, 40)
+        image.origin = (3, 4)
+        image.blend_mode = pygame.BLENDMODE_ADD
+        self.assertEqual(image.angle, 90)
+        self.assertTrue(image.flip_x)
+        self.assertTrue(image.flip_y)
+        self.assertEqual(image.alpha, 128)
+        self.assertEqual(image.color, pygame.Color(10, 20, 30, 255))
+        self.assertEqual(image.origin, (3, 4))
+        self.assertEqual(image.blend_mode, pygame.BLENDMODE_ADD)
+
+        image.origin = None
+        self.assertIsNone(image.origin)
+
+    def test_get_rect(self):
+        image = _render.Image(self.texture, (20, 5, 10, 10))
+        self.assertEqual(image.get_rect(), pygame.Rect(20, 5, 10, 10))
+        self.assertEqual(image.get_rect(topleft=(0, 0)), pygame.Rect(0, 0, 10, 10))
+
+    def test_draw(self):
+        image = _render.Image(self.texture, (20, 0, 20, 20))
+        image.draw(dstrect=(10, 10))
+        result = self.renderer.to_surface()
+        self.assertEqual(result.get_at((10, 10)), pygame.Color("blue"))
+        self.assertEqual(result.get_at((29, 29)), pygame.Color("blue"))
+        self.assertEqual(result.get_at((30, 30)), pygame.Color("black"))
+
+        # srcrect is relative to the Image
+        image.draw((0, 0, 5, 5), (50, 50, 10, 10))
+        result = self.renderer.to_surface()
+        self.assertEqual(result.get_at((55, 55)), pygame.Color("blue"))
+
+    def test_draw__srcrect_clipped_to_image(self):
+        image = _render.Image(self.texture, (20, 0, 20, 20))
+
+        # the red half of the texture is outside of the Image
+        image.draw((-10, 0, 20, 20), (50, 50))
+        result = self.renderer.to_surface()
+        self.assertEqual(result.get_at((50, 50)), pygame.Color("blue"))
+        self.assertEqual(result.get_at((59, 69)), pygame.Color("blue"))
+        self.assertEqual(result.get_at((60, 50)), pygame.Color("black"))
+
+        image.draw((20, 0, 5, 5), (0, 0))
+        result = self.renderer.to_surface()
+        self.assertEqual(result.get_at((0, 0)), pygame.Color("black"))
+
+    def test_draw__keeps_texture_modifiers(self):
+        self.texture.color = (10, 20, 30)
+        self.texture.alpha = 40
+        self.texture.blend_mode = pygame.BLENDMODE_ADD
+        image = _render.Image(self.texture)
+        image.color = (200, 100, 50)
+        image.alpha = 128
+        image.blend_mode = pygame.BLENDMODE_MOD
+
+        image.draw(dstrect=(0, 0))
+
+        self.assertEqual(self.texture.color, pygame.Color(10, 20, 30, 255))
+        self.assertEqual(self.texture.alpha, 40)
+        self.assertEqual(self.texture.blend_mode, pygame.BLENDMODE_ADD)
+
+    def test_renderer_blit(self):
+        image = _render.Image(self.texture, (0, 0, 20, 20))
+        self.renderer.blit(image, pygame.Rect(60, 60, 20, 20))
+        result = self.renderer.to_surface()
+        self.assertEqual(result.get_at((70, 70)), pygame.Color("red"))
+
+
+class TextureAtlasTest(unittest.TestCase):
+    def setUp(self):
+        self.window = pygame.Window(size=(100, 100))
+        self.renderer = _render.Renderer(self.window)
+        self.renderer.draw_color = "BLACK"
+        self.renderer.clear()
+
+    def make_surfaces(self, count, seed=0):
+        rng = random.Random(seed)
+        surfaces = []
+        for i in range(count):
+            surface = pygame.Surface((rng.randint(1, 40), rng.randint(1, 30)))
+            surface.fill((i % 256, 255 - i % 256, 128))
+            surfaces.append(surface)
+        return surfaces
+
+    def assert_packed(self, atlas, images, surfaces):
+        width, height = atlas.size
+        padding = atlas.padding
+        for image, surface in zip(images, surfaces):
+            self.assertIsInstance(image, _render.Image)
+            self.assertIn(image.texture, atlas.pages)
+            self.assertEqual(image.srcrect.size, surface.get_size())
+            self.assertTrue(pygame.Rect(0, 0, width, height).contains(image.srcrect))
+        for i, image in enumerate(images):
+            # the padding is only kept after a region, where it fits
+            padded = image.srcrect.inflate(padding, padding).move(
+                padding // 2, padding // 2
+            )
+            for other in images[i + 1 :]:
+                if other.texture is image.texture:
+                    self.assertFalse(padded.colliderect(other.srcrect))
+
+    def test_init(self):
+        atlas = _render.TextureAtlas(self.renderer)
+        self.assertIs(atlas.renderer, self.renderer)
+        self.assertEqual(atlas.size, (1024, 1024))
+        self.assertEqual(atlas.padding, 1)
+        self.assertEqual(atlas.pages, [])
+        self.assertEqual(len(atlas), 0)
+        self.assertEqual(atlas.efficiency, 0.0)
+
+        atlas = _render.TextureAtlas(self.renderer, (64, 32), padding=0)
+        self.assertEqual(atlas.size, (64, 32))
+        self.assertEqual(atlas.padding, 0)
+
+        with self.assertRaises(TypeError):
+            _render.TextureAtlas(self.window)
+        with self.assertRaises(ValueError):
+            _render.TextureAtlas(self.renderer, (0, 32))
+        with self.assertRaises(ValueError):
+            _render.TextureAtlas(self.renderer, padding=-1)
+
+    def test_add(self):
+        atlas = _render.TextureAtlas(self.renderer, (128, 128))
+        surfaces = self.make_surfaces(60)
+        images = [atlas.add(surface) for surface in surfaces]
+
+        self.assertEqual(len(atlas), 60)
+        self.assertGreater(len(atlas.pages), 1)
+        self.assert_packed(atlas, images, surfaces)
+        for page in atlas.pages:
+            self.assertEqual((page.width, page.height), (128, 128))
+
+    def test_add_many(self):
+        for padding in (0, 1, 3):
+            atlas = _render.TextureAtlas(self.renderer, (128, 96), padding=padding)
+            surfaces = self.make_surfaces(100, seed=padding)
+            images = atlas.add_many(surfaces)
+            self.assertEqual(len(images), 100)
+            self.assert_packed(atlas, images, surfaces)
+
+            # more can be added to the pages afterwards
+            more = self.make_surfaces(20, seed=10 + padding)
+            more_images = [atlas.add(surface) for surface in more]
+            self.assert_packed(atlas, images + more_images, surfaces + more)
+            self.assertEqual(len(atlas), 120)
+
+    def test_add_many__invalid(self):
+        atlas = _render.TextureAtlas(self.renderer, (32, 32))
+        with self.assertRaises(TypeError):
+            atlas.add_many([pygame.Surface((4, 4)), "not a surface"])
+        with self.assertRaises(ValueError):
+            atlas.add_many([pygame.Surface((4, 4)), pygame.Surface((33, 4))])
+        # nothing is packed when a surface is rejected
+        self.assertEqual(len(atlas), 0)
+        self.assertEqual(atlas.add_many([]), [])
+
+    def test_add__too_big(self):
+        atlas = _render.TextureAtlas(self.renderer, (32, 32))
+        with self.assertRaises(ValueError):
+            atlas.add(pygame.Surface((33, 1)))
+        with self.assertRaises(TypeError):
+            atlas.add("not a surface")
+        image = atlas.add(pygame.Surface((32, 32)))
+        self.assertEqual(image.srcrect, pygame.Rect(0, 0, 32, 32))
+
+    def test_efficiency(self):
+        atlas = _render.TextureAtlas(self.renderer, (64, 64), padding=0)
+        atlas.add_many([pygame.Surface((32, 32)) for _ in range(4)])
+        self.assertEqual(len(atlas.pages), 1)
+        self.assertEqual(atlas.efficiency, 1.0)
+
+        atlas.add(pygame.Surface((32, 32)))
+        self.assertEqual(len(atlas.pages), 2)
+        self.assertEqual(atlas.efficiency, 5 / 8)
+
+        atlas = _render.TextureAtlas(self.renderer, (256, 256))
+        surfaces = self.make_surfaces(400)
+        atlas.add_many(surfaces)
+        area = sum(surface.get_width() * surface.get_height() for surface in surfaces)
+        self.assertAlmostEqual(
+            atlas.efficiency, area / (len(atlas.pages) * 256 * 256), places=6
+        )
+        self.assertGreater(atlas.efficiency, 0.6)
+
+    def test_clear(self):
+        atlas = _render.TextureAtlas(self.renderer, (64, 64))
+        image = atlas.add(pygame.Surface((10, 10)))
+        atlas.clear()
+        self.assertEqual(len(atlas), 0)
+        self.assertEqual(atlas.pages, [])
+        self.assertEqual(atlas.efficiency, 0.0)
+        # the regions made before stay usable
+        image.draw(dstrect=(0, 0))
+
+    def test_draw(self):
+        atlas = _render.TextureAtlas(self.renderer, (64, 64))
+        red = pygame.Surface((10, 10))
+        red.fill("red")
+        sprite = pygame.Surface((10, 10), pygame.SRCALPHA)
+        sprite.fill((0, 0, 255, 255), (0, 0, 5, 10))
+        red_image, sprite_image = atlas.add_many([red, sprite])
+        self.assertIs(red_image.texture, sprite_image.texture)
+
+        self.renderer.blit(red_image, (10, 10))
+        sprite_image.draw(dstrect=(40, 40))
+        result = self.renderer.to_surface()
+        self.assertEqual(result.get_at((15, 15)), pygame.Color("red"))
+        self.assertEqual(result.get_at((42, 45)), pygame.Color("blue"))
+        # the transparent half of the sprite is blended
+        self.assertEqual(result.get_at((47, 45)), pygame.Color("black"))
+
+        # pages also work as plain textures
+        page = atlas.pages[0]
+        page.draw(red_image.srcrect, (70, 70))
+        result = self.renderer.to_surface()
+        self.assertEqual(result.get_at((75, 75)), pygame.Color("red"))
@@ -1,9 +1,12 @@
 #################################### IMPORTS ###################################
 
 
+import math
+import random
 import types
 import typing
 import unittest
+import unittest.mock
 
 import pygame
 from pygame import sprite
@@ -245,6 +248,108 @@ class SpriteCollideTest(unittest.TestCase):
             )
         )
 
+    def test_collide_mask_indices(self):
+        # only the sprites whose masks overlap are reported, by index
+        self.s1.image.fill((255, 255, 255, 255))
+        self.s2.image.fill((255, 255, 255, 255))
+        self.s3.image.fill((255, 255, 255, 255))
+        s4 = sprite.Sprite()
+        s4.image = pygame.Surface((10, 10), pygame.SRCALPHA, 32)
+        s4.rect = pygame.FRect(5.5, 0, 10, 10)
+        # a rect overlap without a mask overlap
+        s4.mask = pygame.mask.Mask((10, 10))
+        s5 = sprite.Sprite()
+        s5.rect = pygame.Rect(0, 5, 10, 10)
+        s5.mask = pygame.mask.Mask((10, 10), fill=True)
+        others = [self.s3, s4, self.s2, s5]
+
+        self.assertEqual(sprite.collide_mask_indices(self.s1, others), [2, 3])
+        self.assertEqual(sprite.collide_mask_indices(self.s1, iter(others)), [2, 3])
+        self.assertEqual(sprite.collide_mask_indices(self.s1, []), [])
+        self.assertEqual(
+            sprite.collide_mask_indices(self.s1, others, fit_rects=True), [2, 3]
+        )
+        self.assertEqual(
+            [bool(sprite.collide_mask(self.s1, other)) for other in others],
+            [False, False, True, True],
+        )
+
+    def test_collide_mask__mask_larger_than_rect(self):
+        hitbox = sprite.Sprite()
+        hitbox.rect = pygame.Rect(0, 0, 10, 10)
+        hitbox.mask = pygame.mask.Mask((50, 50), fill=True)
+        target = sprite.Sprite()
+        target.rect = pygame.Rect(20, 20, 10, 10)
+        target.mask = pygame.mask.Mask((10, 10), fill=True)
+        group = sprite.Group(target)
+
+        self.assertEqual(sprite.collide_mask(hitbox, target), (20, 20))
+        self.assertEqual(
+            sprite.spritecollide(hitbox, group, False, sprite.collide_mask), [target]
+        )
+        self.assertIs(
+            sprite.spritecollideany(hitbox, group, sprite.collide_mask), target
+        )
+        self.assertEqual(
+            sprite.groupcollide([hitbox], group, False, False, sprite.collide_mask),
+            {hitbox: [target]},
+        )
+        self.assertEqual(sprite.collide_mask_indices(hitbox, [target]), [0])
+        # unless the masks are declared to fit in their rects
+        self.assertEqual(
+            sprite.collide_mask_indices(hitbox, [target], fit_rects=True), []
+        )
+
+        group.spatial_index = sprite.SpatialHash(16)
+        self.assertEqual(
+            sprite.spritecollide(hitbox, group, False, sprite.collide_mask), [target]
+        )
+
+    def test_collide_mask__masks_made_when_needed(self):
+        def make_sprite(x, y):
+            spr = sprite.Sprite()
+            spr.image = pygame.Surface((10, 10), pygame.SRCALPHA, 32)
+            spr.image.fill((255, 255, 255, 255))
+            spr.rect = pygame.Rect(x, y, 10, 10)
+            return spr
+
+        player = make_sprite(0, 0)
+        first, last = make_sprite(5, 5), make_sprite(-5, 5)
+        group = sprite.Group(first, [make_sprite(100, i) for i in range(50)], last)
+
+        # only the masks of sprites whose areas overlap are made, and
+        # spritecollideany stops at the first hit
+        with unittest.mock.patch.object(
+            sprite, "from_surface", wraps=pygame.mask.from_surface
+        ) as from_surface:
+            self.assertIs(
+                sprite.spritecollideany(player, group, sprite.collide_mask), first
+            )
+            self.assertEqual(from_surface.call_count, 2)
+
+            from_surface.reset_mock()
+            self.assertEqual(
+                sprite.spritecollide(player, group, False, sprite.collide_mask),
+                [first, last],
+            )
+            self.assertEqual(from_surface.call_count, 3)
+
+    def test_collide_mask__spritecollideany(self):
+        self.s2.image.fill((255, 255, 255, 255))
+        self.s3.image.fill((255, 255, 255, 255))
+        self.s1.mask = pygame.mask.Mask((50, 10))
+        self.s1.mask.set_at((45, 3))
+
+        self.assertIs(
+            sprite.spritecollideany(self.s1, self.ag2, sprite.collide_mask), self.s2
+        )
+
+        self.s1.mask.clear()
+
+        self.assertIsNone(
+            sprite.spritecollideany(self.s1, self.ag2, sprite.collide_mask)
+        )
+
     def test_spritecollideany__without_collided_callback(self):
         # pygame.sprite.spritecollideany(sprite, group) -> sprite
         # finds any sprites that collide
@@ -492,6 +597,184 @@ class SpriteCollideTest(unittest.TestCase):
         self.assertFalse(pygame.sprite.collide_rect(self.s1, self.s3))
         self.assertFalse(pygame.sprite.collide_rect(self.s3, self.s1))
 
+    def test_spritecollide__spatial_index(self):
+        self.ag2.spatial_index = sprite.SpatialHash(16)
+
+        self.assertEqual(sprite.spritecollide(self.s1, self.ag2, False), [self.s2])
+        self.assertEqual(
+            sprite.spritecollide(self.s1, self.ag2, False, sprite.collide_mask), []
+        )
+        self.assertIs(sprite.spritecollideany(self.s1, self.ag2), self.s2)
+
+        # moved sprites are found again once the index is refreshed
+        self.s3.rect.topleft = (5, 0)
+        self.ag2.update()
+
+        self.assertEqual(
+            sprite.spritecollide(self.s1, self.ag2, False), [self.s2, self.s3]
+        )
+
+    def test_spritecollide__spatial_index_with_other_callback(self):
+        # callbacks that may reach outside the rects bypass the index
+        self.ag2.spatial_index = sprite.SpatialHash(16)
+
+        self.assertEqual(
+            sprite.spritecollide(
+                self.s1, self.ag2, False, sprite.collide_rect_ratio(20)
+            ),
+            [self.s2, self.s3],
+        )
+
+    def test_spritecollideany__spatial_index_group_order(self):
+        group = sprite.LayeredUpdates()
+        group.spatial_index = sprite.SpatialHash(16)
+        for layer in (2, 0, 1):
+            spr = sprite.Sprite()
+            spr.rect = pygame.Rect(0, 0, 10, 10)
+            group.add(spr, layer=layer)
+
+        # the index returns the sprites in the order they were added
+        self.assertNotEqual(group.spatial_index.query(self.s1.rect), group.sprites())
+        self.assertIs(sprite.spritecollideany(self.s1, group), group.sprites()[0])
+        self.assertEqual(sprite.spritecollide(self.s1, group, False), group.sprites())
+
+    def test_groupcollide__spatial_index(self):
+        self.ag2.spatial_index = sprite.SpatialHash(16)
+
+        crashed = pygame.sprite.groupcollide(self.ag, self.ag2, False, True)
+
+        self.assertDictEqual({self.s1: [self.s2]}, crashed)
+        self.assertNotIn(self.s2, self.ag2.spatial_index)
+        self.assertDictEqual(
+            {}, pygame.sprite.groupcollide(self.ag, self.ag2, False, False)
+        )
+
+    def test_groupcollide__collide_pairs(self):
+        def make_groups(rect_class, seed):
+            rng = random.Random(seed)
+            groups = []
+            for _ in range(2):
+                group = sprite.Group()
+                for _ in range(40):
+                    spr = sprite.Sprite()
+                    spr.rect = rect_class(
+                        rng.uniform(0, 100), rng.uniform(0, 100), 10.5, 10.5
+                    )
+                    group.add(spr)
+                groups.append(group)
+            return groups
+
+        def groupcollide_loop(groupa, groupb, dokillb, collided):
+            collisions = {}
+            for spr in groupa:
+                hits = sprite.spritecollide(spr, groupb, dokillb, collided)
+                if hits:
+                    collisions[spr] = hits
+            return collisions
+
+        for rect_class in (pygame.Rect, pygame.FRect):
+            for dokillb in (False, True):
+                for collided in (None, sprite.collide_rect):
+                    groupa, groupb = make_groups(rect_class, 1)
+                    expected = groupcollide_loop(groupa, groupb, dokillb, collided)
+                    expected_left = groupb.sprites()
+
+                    groupa, groupb = make_groups(rect_class, 1)
+                    with unittest.mock.patch.object(sprite, "spritecollide") as loop:
+                        collisions = sprite.groupcollide(
+                            groupa, groupb, False, dokillb, collided
+                        )
+                    loop.assert_not_called()
+
+                    # the same sprites, compared by rect as the groups differ
+                    self.assertEqual(
+                        [
+                            (tuple(a.rect), [tuple(b.rect) for b in hits])
+                            for a, hits in collisions.items()
+                        ],
+                        [
+                            (tuple(a.rect), [tuple(b.rect) for b in hits])
+                            for a, hits in expected.items()
+                        ],
+                    )
+                    self.assertEqual(
+                        [tuple(spr.rect) for spr in groupb],
+                        [tuple(spr.rect) for spr in expected_left],
+                    )
+
+
+class SpatialHashTest(unittest.TestCase):
+    def setUp(self):
+        self.index = sprite.SpatialHash(10)
+        self.sprites = []
+        for pos in ((0, 0), (15, 15), (100, 100)):
+            spr = sprite.Sprite()
+            spr.rect = pygame.Rect(pos, (10, 10))
+            self.sprites.append(spr)
+            self.index.add(spr)
+
+    def test_cell_size(self):
+        self.assertEqual(self.index.cell_size, 10)
+        self.assertRaises(ValueError, sprite.SpatialHash, 0)
+
+    def test_add_remove(self):
+        self.assertEqual(len(self.index), 3)
+        self.assertIn(self.sprites[0], self.index)
+
+        self.index.remove(self.sprites[0])
+        self.index.remove(self.sprites[0])
+
+        self.assertEqual(len(self.index), 2)
+        self.assertNotIn(self.sprites[0], self.index)
+        self.assertEqual(self.index.query(pygame.Rect(0, 0, 5, 5)), [])
+
+    def test_query(self):
+        s1, s2, s3 = self.sprites
+
+        self.assertEqual(self.index.query(pygame.Rect(0, 0, 30, 30)), [s1, s2])
+        self.assertEqual(self.index.query(pygame.FRect(99.5, 99.5, 2, 2)), [s3])
+        self.assertEqual(self.index.query((50, 50, 10, 10)), [])
+
+    def test_refresh(self):
+        s1 = self.sprites[0]
+        s1.rect.topleft = (200, 200)
+
+        # not moved in the index until refreshed
+        self.assertEqual(self.index.query(pygame.Rect(200, 200, 1, 1)), [])
+
+        self.index.refresh()
+
+        self.assertEqual(self.index.query(pygame.Rect(200, 200, 1, 1)), [s1])
+        self.assertEqual(self.index.query(pygame.Rect(0, 0, 5, 5)), [])
+
+    def test_sprite_without_rect(self):
+        spr = sprite.Sprite()
+        self.index.add(spr)
+
+        self.assertIn(spr, self.index)
+
+        spr.rect = pygame.Rect(300, 300, 5, 5)
+        self.index.refresh(spr)
+
+        self.assertEqual(self.index.query(pygame.Rect(300, 300, 1, 1)), [spr])
+
+    def test_group_keeps_index_updated(self):
+        group = sprite.Group(self.sprites[:2])
+        index = sprite.SpatialHash(10)
+        group.spatial_index = index
+
+        self.assertEqual(len(index), 2)
+
+        group.add(self.sprites[2])
+        self.sprites[0].kill()
+
+        self.assertEqual(index.query(pygame.Rect(0, 0, 200, 200)), self.sprites[1:])
+
+        group.spatial_index = None
+        group.empty()
+
+        self.assertEqual(len(index), 2)
+
 
 ################################################################################
 
@@ -585,6 +868,54 @@ class AbstractGroupTypeTest(unittest.TestCase):
         self.assertEqual(self.ag.spritedict[self.s1], pygame.Rect(0, 0, 10, 10))
         self.assertEqual(self.ag.spritedict[self.s2], pygame.Rect(10, 0, 10, 10))
 
+    def test_draw__view(self):
+        for index in (None, sprite.SpatialHash(cell_size=16)):
+            group = sprite.Group()
+            group.spatial_index = index
+            sprites = []
+            for i, color in enumerate(("red", "green", "blue")):
+                spr = sprite.Sprite()
+                spr.image = pygame.Surface((10, 10))
+                spr.image.fill(color)
+                spr.rect = pygame.Rect(100 + i * 10, 100, 10, 10)
+                group.add(spr)
+                sprites.append(spr)
+            scr = pygame.Surface((15, 10))
+
+            group.draw(scr, view=pygame.Rect(105, 100, 15, 10))
+
+            # the sprites are moved by the view, the last one is not drawn
+            self.assertEqual(scr.get_at((2, 5)), pygame.Color("red"))
+            self.assertEqual(scr.get_at((12, 5)), pygame.Color("green"))
+            self.assertEqual(group.spritedict[sprites[0]], pygame.Rect(0, 0, 5, 10))
+            self.assertEqual(group.spritedict[sprites[1]], pygame.Rect(5, 0, 10, 10))
+            self.assertIsNone(group.spritedict[sprites[2]])
+
+            # a sprite that left the view is no longer cleared
+            group.draw(scr, view=(110, 100, 15, 10))
+            self.assertIsNone(group.spritedict[sprites[0]])
+            self.assertEqual(scr.get_at((12, 5)), pygame.Color("blue"))
+
+            group.draw(scr)
+            self.assertEqual(group.spritedict[sprites[2]], pygame.Rect(120, 100, 0, 0))
+
+    def test_draw__view_dirty_rects(self):
+        group = sprite.RenderUpdates()
+        spr = sprite.Sprite(group)
+        spr.image = pygame.Surface((10, 10))
+        spr.rect = pygame.Rect(100, 100, 10, 10)
+        scr = pygame.Surface((50, 50))
+
+        self.assertEqual(
+            group.draw(scr, view=(90, 90, 50, 50)), [pygame.Rect(10, 10, 10, 10)]
+        )
+        # the area the sprite left must be updated
+        self.assertEqual(
+            group.draw(scr, view=(200, 90, 50, 50)), [pygame.Rect(10, 10, 10, 10)]
+        )
+        self.assertEqual(group.draw(scr, view=(200, 90, 50, 50)), [])
+        self.assertIsNone(group.spritedict[spr])
+
     def test_empty(self):
         self.ag.empty()
         self.assertFalse(self.s1 in self.ag)
@@ -661,6 +992,28 @@ class AbstractGroupTypeTest(unittest.TestCase):
         self.assertEqual(test_sprite.sink, [1, 2, 3])
         self.assertEqual(test_sprite.sink_kwargs, {"foo": 4, "bar": 5})
 
+    def test_get_sprites_in(self):
+        group = sprite.Group()
+        sprites = []
+        for i in range(5):
+            spr = sprite.Sprite(group)
+            spr.rect = pygame.Rect(i * 20, 0, 10, 10)
+            sprites.append(spr)
+
+        for index in (None, sprite.SpatialHash(cell_size=16)):
+            group.spatial_index = index
+
+            self.assertEqual(group.get_sprites_in((15, 5, 30, 2)), sprites[1:3])
+            self.assertEqual(group.get_sprites_in(pygame.FRect(10, 0, 10, 10)), [])
+            self.assertEqual(group.get_sprites_at((45, 9)), [sprites[2]])
+            self.assertEqual(group.get_sprites_at((50, 5)), [])
+
+        # moved sprites are found once the index is refreshed
+        sprites[0].rect.x = 200
+        group.spatial_index.refresh(sprites[0])
+        self.assertEqual(group.get_sprites_at((205, 5)), [sprites[0]])
+        self.assertEqual(group.get_sprites_at((5, 5)), [])
+
     def test_type_subscript(self):
         try:
             group_generic_alias = sprite.Group[sprite.Sprite]
@@ -933,6 +1286,27 @@ class LayeredGroupBase:
         result = self.LG.get_sprites_at((50, 50))
         self.assertEqual(result, expected_sprites)
 
+    def test_get_sprites_in__spatial_index(self):
+        self.LG.spatial_index = sprite.SpatialHash(cell_size=8)
+        sprites = []
+        for i, layer in enumerate((3, 1, 2, 1, 3)):
+            spr = self.sprite()
+            spr.rect = pygame.Rect(i * 10, i * 10, 50, 50)
+            self.LG.add(spr, layer=layer)
+            sprites.append(spr)
+        self.LG.change_layer(sprites[3], 2)
+        self.LG.move_to_back(sprites[4])
+
+        # the sprites are listed in drawing order, not in the index order
+        expected = self.LG.sprites()
+        self.assertNotEqual(self.LG.spatial_index.query((0, 0, 100, 100)), expected)
+        self.assertEqual(self.LG.get_sprites_in((0, 0, 100, 100)), expected)
+        self.assertEqual(
+            self.LG.get_sprites_at((55, 55)),
+            [spr for spr in expected if spr is not sprites[0]],
+        )
+        self.assertEqual(self.LG.get_sprites_at((5, 5)), [sprites[0]])
+
     def test_get_top_layer(self):
         layers = [1, 5, 2, 8, 4, 5, 3, 88, 23, 0]
         for i in layers:
@@ -1074,6 +1448,42 @@ class LayeredGroupBase:
         self.assertListEqual(sprites2, layer2_sprites)
         self.assertEqual(len(self.LG), len(sprites1) + len(sprites2))
 
+    def test_change_layer__draw_order(self):
+        # the sprites are ordered by layer, then by when they were last
+        # added to or moved into their layer
+        rng = random.Random(7)
+        order = []
+        for _ in range(60):
+            spr = self.sprite()
+            self.LG.add(spr, layer=rng.randrange(8))
+            order.append(spr)
+
+        for _ in range(200):
+            spr = rng.choice(order)
+            if rng.random() < 0.1:
+                self.LG.remove(spr)
+                self.LG.add(spr, layer=rng.randrange(-2, 10))
+            else:
+                self.LG.change_layer(spr, rng.randrange(-2, 10))
+            order.remove(spr)
+            order.append(spr)
+
+        expected = sorted(order, key=self.LG.get_layer_of_sprite)
+        self.assertListEqual(self.LG.sprites(), expected)
+        self.assertListEqual(
+            self.LG.layers(), sorted(set(map(self.LG.get_layer_of_sprite, order)))
+        )
+        self.assertEqual(self.LG.get_top_sprite(), expected[-1])
+        self.assertEqual(
+            self.LG.get_bottom_layer(), self.LG.get_layer_of_sprite(expected[0])
+        )
+        for layer in self.LG.layers():
+            self.assertListEqual(
+                self.LG.get_sprites_from_layer(layer),
+                [spr for spr in expected if self.LG.get_layer_of_sprite(spr) == layer],
+            )
+        self.assertListEqual(self.LG.get_sprites_from_layer(100), [])
+
     def test_copy(self):
         self.LG.add(self.sprite())
         spr = self.LG.sprites()[0]
@@ -1093,6 +1503,33 @@ class LayeredUpdatesTypeTest__SpriteTest(LayeredGroupBase, unittest.TestCase):
     def setUp(self):
         self.LG = sprite.LayeredUpdates()
 
+    def test_draw__view(self):
+        self.LG.spatial_index = sprite.SpatialHash(cell_size=32)
+        top = self.sprite()
+        top.image = pygame.Surface((10, 10))
+        top.image.fill("red")
+        top.rect = pygame.Rect(-20, -20, 10, 10)
+        self.LG.add(top, layer=2)
+        bottom = self.sprite()
+        bottom.image = pygame.Surface((20, 20))
+        bottom.image.fill("blue")
+        bottom.rect = pygame.Rect(-25, -25, 20, 20)
+        self.LG.add(bottom, layer=1)
+        far = self.sprite()
+        far.image = pygame.Surface((10, 10))
+        far.rect = pygame.Rect(500, 500, 10, 10)
+        self.LG.add(far)
+        surface = pygame.Surface((30, 30))
+
+        dirty = self.LG.draw(surface, view=pygame.FRect(-30, -30, 30, 30))
+
+        self.assertEqual(
+            dirty, [pygame.Rect(5, 5, 20, 20), pygame.Rect(10, 10, 10, 10)]
+        )
+        self.assertEqual(surface.get_at((15, 15)), pygame.Color("red"))
+        self.assertEqual(surface.get_at((7, 7)), pygame.Color("blue"))
+        self.assertIs(self.LG.spritedict[far], self.LG._init_rect)
+
 
 class LayeredUpdatesTypeTest__DirtySprite(LayeredGroupBase, unittest.TestCase):
     sprite = sprite.DirtySprite
@@ -1229,6 +1666,199 @@ class LayeredDirtyTypeTest__DirtySprite(LayeredGroupBase, unittest.TestCase):
         """
         self._nondirty_intersections_redrawn(True)
 
+    def _draw_random_frames(self, seed):
+        # Draws a few frames of moving, hiding and removed sprites in dirty
+        # rect mode, returning what each frame drew.
+        rng = random.Random(seed)
+        group = sprite.LayeredDirty(_use_update=True)
+        group.set_timing_threshold(float("inf"))
+        surface = pygame.Surface((120, 90))
+        bgd = pygame.Surface((120, 90))
+        bgd.fill((0, 0, 40))
+        image = pygame.Surface((30, 30))
+        for x in range(0, 30, 3):
+            image.fill((8 * x, 255 - 8 * x, 90), (x, 0, 3, 30))
+
+        sprites = []
+        for i in range(25):
+            spr = sprite.DirtySprite()
+            spr.image = image
+            spr.rect = pygame.Rect(rng.randrange(110), rng.randrange(80), 12, 9)
+            if i % 3 == 0:
+                spr.source_rect = pygame.Rect(rng.randrange(15), 5, 14, 10)
+            spr.dirty = rng.choice((0, 1, 2))
+            group.add(spr, layer=rng.randrange(3))
+            sprites.append(spr)
+
+        frames = []
+        for _ in range(12):
+            for spr in rng.sample(sprites, 6):
+                spr.rect.move_ip(rng.randint(-8, 8), rng.randint(-8, 8))
+                spr.visible = rng.random() > 0.2
+                spr.dirty = rng.choice((1, 1, 2))
+            if rng.random() > 0.7:
+                group.remove(rng.choice(sprites))
+            if rng.random() > 0.7:
+                group.repaint_rect(pygame.Rect(rng.randrange(100), 5, 20, 20))
+            group._use_update = True
+            rects = group.draw(surface, bgd)
+            frames.append(
+                (
+                    [pygame.Rect(rect) for rect in rects],
+                    surface.get_view("2").raw,
+                    [spr.dirty for spr in sprites],
+                    [group.spritedict.get(spr) for spr in sprites],
+                )
+            )
+        return frames
+
+    def test_draw__helper_matches_python(self):
+        """The C helper of draw() draws exactly like the Python fallback"""
+        if sprite._dirty_blits is None:
+            self.skipTest("pygame._sprite_accel is not available")
+
+        for seed in range(5):
+            expected = None
+            with unittest.mock.patch.object(sprite, "_dirty_blits", None):
+                expected = self._draw_random_frames(seed)
+            frames = self._draw_random_frames(seed)
+
+            for i, (frame, expected_frame) in enumerate(zip(frames, expected)):
+                self.assertEqual(frame, expected_frame, f"seed={seed} frame={i}")
+
+
+class SortedGroupTest(unittest.TestCase):
+    def setUp(self):
+        self.sprites = []
+        for bottom in (30, 10, 20, 10):
+            spr = sprite.Sprite()
+            spr.image = pygame.Surface((10, 10))
+            spr.rect = pygame.Rect(0, 0, 10, 10)
+            spr.rect.bottom = bottom
+            self.sprites.append(spr)
+        self.group = sprite.SortedGroup(self.sprites)
+
+    def test_sprites__sorted_by_bottom(self):
+        a, b, c, d = self.sprites
+
+        # equal keys stay in the order they were added
+        self.assertListEqual(self.group.sprites(), [b, d, c, a])
+        self.assertListEqual(list(self.group), [b, d, c, a])
+
+        a.rect.bottom = 15
+        d.rect.bottom = 40
+        self.assertListEqual(self.group.sprites(), [b, a, c, d])
+
+        # and then they keep their last order
+        a.rect.bottom = 10
+        self.assertListEqual(self.group.sprites(), [b, a, c, d])
+
+    def test_key(self):
+        a, b, c, d = self.sprites
+        self.group.key = lambda spr: -spr.rect.bottom
+        self.assertListEqual(self.group.sprites(), [a, c, b, d])
+
+        self.group.key = None
+        self.assertListEqual(self.group.sprites(), [b, d, c, a])
+
+        group = sprite.SortedGroup(a, b, key=lambda spr: spr is a)
+        self.assertListEqual(group.sprites(), [b, a])
+
+    def test_add_remove(self):
+        a, b, c, d = self.sprites
+        self.group.remove(c)
+        self.assertListEqual(self.group.sprites(), [b, d, a])
+
+        self.group.remove(a)
+        self.group.add(a, c)
+        self.assertEqual(len(self.group), 4)
+        self.assertListEqual(self.group.sprites(), [b, d, c, a])
+
+        self.group.empty()
+        self.assertListEqual(self.group.sprites(), [])
+
+    def test_draw(self):
+        a, b, c, d = self.sprites
+        surface = pygame.Surface((10, 40))
+        for spr, color in zip(self.sprites, ("red", "green", "blue", "white")):
+            spr.image.fill(color)
+            spr.rect.top = 0
+        a.rect.bottom = 12
+        b.rect.bottom = 14
+
+        self.assertEqual(self.group.draw(surface), [])
+        self.assertEqual(surface.get_at((0, 0)), pygame.Color("white"))
+        self.assertEqual(surface.get_at((0, 8)), pygame.Color("green"))
+        self.assertEqual(self.group.spritedict[b], b.rect)
+
+        # a is now in front of b
+        a.rect.bottom = 16
+        self.group.draw(surface)
+        self.assertEqual(surface.get_at((0, 8)), pygame.Color("red"))
+
+    def test_draw__view(self):
+        a, b, c, d = self.sprites
+        surface = pygame.Surface((10, 10))
+        a.image.fill("red")
+        c.image.fill("blue")
+        a.rect.topleft = (0, 17)
+        self.group.spatial_index = sprite.SpatialHash(cell_size=8)
+
+        self.group.draw(surface, view=(0, 15, 10, 10))
+
+        self.assertEqual(surface.get_at((0, 0)), pygame.Color("blue"))
+        self.assertEqual(surface.get_at((0, 6)), pygame.Color("red"))
+        self.assertIsNone(self.group.spritedict[b])
+
+    def test_remove__order_bounded(self):
+        a, b, c, d = self.sprites
+        spr = sprite.Sprite()
+        spr.rect = pygame.Rect(0, 0, 1, 1)
+        for _ in range(100):
+            self.group.add(spr)
+            spr.kill()
+            self.group.remove(a)
+            self.group.add(a)
+
+        # removed sprites don't pile up without a draw
+        self.assertLessEqual(len(self.group._order), 2 * len(self.group))
+        self.assertNotIn(spr, self.group._order)
+        self.assertListEqual(self.group.sprites(), [b, d, c, a])
+
+        self.group.empty()
+        self.assertListEqual(self.group._order, [])
+
+    def test_len_bool__not_sorted(self):
+        key = unittest.mock.Mock(side_effect=lambda spr: spr.rect.bottom)
+        group = sprite.SortedGroup(self.sprites, key=key)
+
+        self.assertEqual(len(group), 4)
+        self.assertTrue(group)
+        self.assertFalse(sprite.SortedGroup())
+        self.assertEqual(len(sprite.SortedGroup()), 0)
+        key.assert_not_called()
+
+    def test_len_bool__sprite_without_rect(self):
+        spr = sprite.Sprite()
+        group = sprite.SortedGroup(spr)
+
+        self.assertEqual(len(group), 1)
+        self.assertTrue(group)
+        self.assertIn(spr, group)
+
+        group.empty()
+        self.assertEqual(len(group), 0)
+        self.assertFalse(group)
+        self.assertFalse(spr.alive())
+
+    def test_get_sprites_in(self):
+        a, b, c, d = self.sprites
+        self.group.spatial_index = sprite.SpatialHash(cell_size=8)
+
+        self.assertEqual(self.group.get_sprites_in((0, 0, 5, 30)), [b, d, c, a])
+        self.assertEqual(self.group.get_sprites_in((0, 15, 5, 10)), [c, a])
+        self.assertEqual(self.group.get_sprites_at((5, 15)), [c])
+
 
 ############################### SPRITE BASE CLASS ##############################
 #
@@ -1365,6 +1995,337 @@ class DirtySpriteTypeTest(SpriteBase, unittest.TestCase):
     ]
 
 
+class CompactSpriteTypeTest(SpriteBase, unittest.TestCase):
+    Sprite = sprite.CompactSprite
+
+    Groups = [
+        sprite.Group,
+        sprite.RenderUpdates,
+        sprite.CompactGroup,
+    ]
+
+    def test_no_instance_dict(self):
+        self.assertFalse(hasattr(self.sprite, "__dict__"))
+
+    def test_image_and_rect_stored_in_group(self):
+        image = pygame.Surface((2, 2))
+        self.sprite.image = image
+        self.sprite.rect = pygame.Rect(1, 2, 2, 2)
+        group = sprite.CompactGroup(self.sprite)
+
+        self.assertIs(self.sprite.image, image)
+        self.assertEqual(self.sprite.rect, (1, 2, 2, 2))
+
+        self.sprite.rect = pygame.Rect(5, 6, 2, 2)
+        self.assertEqual(group._rects, [(5, 6, 2, 2)])
+
+        # the sprite keeps its image and rect when it leaves the group
+        self.sprite.kill()
+        self.assertIs(self.sprite.image, image)
+        self.assertEqual(self.sprite.rect, (5, 6, 2, 2))
+
+    def test_layered_groups_reject(self):
+        for group_type in (sprite.LayeredUpdates, sprite.LayeredDirty):
+            group = group_type()
+            with self.assertRaisesRegex(TypeError, "CompactSprite|DirtySprite"):
+                group.add(self.sprite)
+            with self.assertRaises(TypeError):
+                self.sprite.add(group)
+            with self.assertRaises(TypeError):
+                group_type(self.sprite)
+            self.assertEqual(len(group), 0)
+            self.assertFalse(self.sprite.alive())
+
+
+class CompactGroupTest(unittest.TestCase):
+    def setUp(self):
+        self.group = sprite.CompactGroup()
+        self.sprites = []
+        for i in range(5):
+            spr = sprite.CompactSprite()
+            spr.image = pygame.Surface((10, 10))
+            spr.image.fill((i + 1, 0, 0))
+            spr.rect = pygame.Rect(i * 10, 0, 10, 10)
+            self.sprites.append(spr)
+
+    def test_add_remove(self):
+        self.group.add(self.sprites)
+        self.assertEqual(len(self.group), 5)
+        self.assertTrue(self.group.has(self.sprites))
+
+        self.group.remove(self.sprites[1])
+        self.assertEqual(len(self.group), 4)
+        self.assertNotIn(self.sprites[1], self.group)
+        self.assertFalse(self.sprites[1].alive())
+
+        # the moved sprite still finds its own image and rect
+        for spr in self.group:
+            index = self.sprites.index(spr)
+            self.assertEqual(spr.rect, (index * 10, 0, 10, 10))
+            self.assertEqual(spr.image.get_at((0, 0)), (index + 1, 0, 0))
+
+        self.group.empty()
+        self.assertEqual(len(self.group), 0)
+        self.assertFalse(self.group)
+        for spr in self.sprites:
+            self.assertFalse(spr.alive())
+
+    def test_add__not_compact_sprite(self):
+        with self.assertRaises(TypeError):
+            self.group.add(sprite.Sprite())
+
+    def test_add__other_compact_group(self):
+        self.group.add(self.sprites[0])
+
+        with self.assertRaises(ValueError):
+            sprite.CompactGroup(self.sprites[0])
+
+    def test_also_in_group(self):
+        other = sprite.Group()
+        self.sprites[0].add(self.group, other)
+
+        self.assertIn(self.sprites[0], other)
+        self.assertEqual(len(self.sprites[0].groups()), 2)
+
+        self.sprites[0].kill()
+        self.assertFalse(self.sprites[0].alive())
+        self.assertEqual(len(self.group), 0)
+        self.assertEqual(len(other), 0)
+
+    def test_draw_and_clear(self):
+        surface = pygame.Surface((60, 10))
+        self.group.add(self.sprites)
+
+        self.group.draw(surface)
+        for i in range(5):
+            self.assertEqual(surface.get_at((i * 10 + 5, 5)), (i + 1, 0, 0))
+        self.assertEqual(surface.get_at((55, 5)), (0, 0, 0))
+
+        bgd = pygame.Surface((60, 10))
+        bgd.fill((0, 0, 9))
+        self.sprites[2].kill()
+        self.group.clear(surface, bgd)
+        for i in range(5):
+            self.assertEqual(surface.get_at((i * 10 + 5, 5)), (0, 0, 9))
+
+    def test_draw__view(self):
+        surface = pygame.Surface((20, 10))
+        self.group.add(self.sprites)
+
+        self.group.draw(surface, view=(15, 0, 20, 10))
+        self.assertEqual(surface.get_at((0, 5)), (2, 0, 0))
+        self.assertEqual(surface.get_at((10, 5)), (3, 0, 0))
+        self.assertEqual(surface.get_at((19, 5)), (4, 0, 0))
+
+        self.group.spatial_index = sprite.SpatialHash(cell_size=16)
+        self.group.draw(surface, view=(40, 0, 20, 10))
+        self.assertEqual(surface.get_at((0, 5)), (5, 0, 0))
+
+        # only the sprite still in view is cleared
+        bgd = pygame.Surface((20, 10))
+        bgd.fill((0, 0, 9))
+        surface.fill((0, 0, 0))
+        self.group.clear(surface, bgd)
+        self.assertEqual(surface.get_at((0, 5)), (0, 0, 9))
+        self.assertEqual(surface.get_at((10, 5)), (0, 0, 0))
+
+    def test_draw__special_flags(self):
+        surface = pygame.Surface((60, 10))
+        surface.fill((10, 0, 0))
+        self.group.add(self.sprites)
+
+        self.group.draw(surface, special_flags=pygame.BLEND_ADD)
+        for i in range(5):
+            self.assertEqual(surface.get_at((i * 10 + 5, 5)), (i + 11, 0, 0))
+
+    def test_update(self):
+        class MovingSprite(sprite.CompactSprite):
+            __slots__ = ("speed",)
+
+            def update(self, dx):
+                self.rect.x += dx * self.speed
+
+        spr = MovingSprite(self.group)
+        spr.speed = 2
+        spr.rect = pygame.Rect(0, 0, 1, 1)
+
+        self.group.update(3)
+        self.assertEqual(spr.rect.x, 6)
+
+    def test_spatial_index(self):
+        self.group.add(self.sprites)
+        self.group.spatial_index = sprite.SpatialHash(cell_size=16)
+
+        probe = sprite.Sprite()
+        probe.rect = pygame.Rect(12, 2, 2, 2)
+        self.assertEqual(
+            sprite.spritecollide(probe, self.group, False), [self.sprites[1]]
+        )
+
+    def test_get_sprites_in(self):
+        self.group.add(self.sprites)
+        self.group.spatial_index = sprite.SpatialHash(cell_size=16)
+        self.group.remove(self.sprites[0])
+        self.sprites[1].rect.x = 30
+        self.group.spatial_index.refresh(self.sprites[1])
+
+        # listed in drawing order, which the removal changed
+        found = self.group.get_sprites_in((0, 0, 50, 10))
+        self.assertEqual(found, self.group.sprites())
+        self.assertEqual(found, [self.sprites[i] for i in (4, 1, 2, 3)])
+        self.assertEqual(
+            self.group.get_sprites_at((35, 5)), [self.sprites[1], self.sprites[3]]
+        )
+
+    def test_copy(self):
+        self.group.add(self.sprites)
+        copy = self.group.copy()
+
+        self.assertIsInstance(copy, sprite.CompactGroup)
+        self.assertEqual(len(copy), 0)
+
+
+class KinematicSpriteTypeTest(SpriteBase, unittest.TestCase):
+    Sprite = sprite.KinematicSprite
+
+    Groups = [
+        sprite.Group,
+        sprite.RenderUpdates,
+        sprite.KinematicGroup,
+    ]
+
+    def test_position_and_velocity(self):
+        self.assertEqual(self.sprite.position, (0.0, 0.0))
+        self.assertEqual(self.sprite.velocity, (0.0, 0.0))
+
+        self.sprite.rect = pygame.Rect(0, 0, 4, 4)
+        self.assertEqual(self.sprite.position, (2.0, 2.0))
+
+        self.sprite.position = (10.5, 20)
+        self.sprite.velocity = pygame.Vector2(1, -1)
+        self.assertEqual(self.sprite.rect, (8, 18, 4, 4))
+
+        group = sprite.KinematicGroup(self.sprite)
+        self.assertEqual(self.sprite.position, (10.5, 20.0))
+        self.assertEqual(self.sprite.velocity, (1.0, -1.0))
+        self.assertEqual(list(group.positions), [10.5, 20.0])
+
+        self.sprite.position = (30, 40)
+        self.assertEqual(list(group.positions), [30.0, 40.0])
+        self.assertEqual(self.sprite.rect.center, (30, 40))
+
+        # the sprite keeps its position and velocity when it leaves the group
+        self.sprite.kill()
+        self.assertEqual(self.sprite.position, (30.0, 40.0))
+        self.assertEqual(self.sprite.velocity, (1.0, -1.0))
+
+
+class KinematicGroupTest(unittest.TestCase):
+    def setUp(self):
+        self.group = sprite.KinematicGroup()
+        self.sprites = []
+        for i in range(4):
+            spr = sprite.KinematicSprite(self.group)
+            spr.image = pygame.Surface((2, 2))
+            spr.rect = pygame.Rect(0, 0, 2, 2)
+            spr.position = (i * 10, 5)
+            spr.velocity = (i, -i)
+            self.sprites.append(spr)
+
+    def test_add__not_kinematic_sprite(self):
+        with self.assertRaises(TypeError):
+            self.group.add(sprite.CompactSprite())
+
+    def test_remove(self):
+        self.group.remove(self.sprites[1])
+
+        self.assertEqual(len(self.group.positions), 6)
+        for i, spr in enumerate(self.sprites):
+            self.assertEqual(spr.position, (i * 10, 5))
+            self.assertEqual(spr.velocity, (i, -i))
+
+    def test_integrate(self):
+        self.group.integrate(0.5)
+
+        for i, spr in enumerate(self.sprites):
+            self.assertEqual(spr.position, (i * 10 + i * 0.5, 5 - i * 0.5))
+            self.assertEqual(
+                spr.rect.center, (math.floor(i * 10.5), math.floor(5 - i * 0.5))
+            )
+
+    def test_integrate__bounds(self):
+        self.group.integrate(10, bounds=(0, 0, 30, 10))
+
+        self.assertEqual(
+            [spr.position for spr in self.sprites],
+            [(0, 5), (20, 0), (30, 0), (30, 0)],
+        )
+
+    def test_integrate__wrap(self):
+        self.group.integrate(10, bounds=pygame.Rect(0, 0, 30, 10), wrap=True)
+
+        self.assertEqual(
+            [spr.position for spr in self.sprites],
+            [(0, 5), (20, 5), (10, 5), (0, 5)],
+        )
+
+    def test_integrate__frect(self):
+        self.sprites[1].rect = pygame.FRect(0, 0, 1, 1)
+        self.sprites[1].position = (0.25, 0.25)
+        self.group.integrate(0.25)
+
+        self.assertEqual(self.sprites[1].rect, (0, -0.5, 1, 1))
+
+    def test_positions_buffer(self):
+        positions = self.group.positions
+        positions[0] = 7.0
+        positions[1] = 8.0
+        self.assertEqual(self.sprites[0].position, (7.0, 8.0))
+
+        self.group.sync_rects()
+        self.assertEqual(self.sprites[0].rect.center, (7, 8))
+
+        with self.assertRaises(BufferError):
+            self.group.add(sprite.KinematicSprite())
+        with self.assertRaises(BufferError):
+            self.sprites[0].kill()
+        self.assertEqual(len(self.group), 4)
+        self.assertEqual(len(self.group.velocities), 8)
+        positions.release()
+        self.group.add(sprite.KinematicSprite())
+        self.assertEqual(len(self.group), 5)
+
+    def test_draw__syncs_rects(self):
+        surface = pygame.Surface((40, 10))
+        velocities = self.group.velocities
+        velocities[0] = 3.0
+        velocities.release()
+        self.group.integrate(1)
+        self.group.positions[1] = 2.0
+
+        self.group.draw(surface)
+        self.assertEqual(self.sprites[0].rect.center, (3, 2))
+
+    def test_draw__view(self):
+        surface = pygame.Surface((10, 10))
+        self.sprites[2].image.fill("red")
+
+        self.group.draw(surface, view=(15, 0, 10, 10))
+        self.assertEqual(surface.get_at((4, 4)), pygame.Color("red"))
+        self.assertEqual(self.group._drawn, [None, None, pygame.Rect(4, 4, 2, 2), None])
+
+    def test_integrate__spatial_index(self):
+        self.group.spatial_index = sprite.SpatialHash(cell_size=8)
+        self.group.integrate(10)
+
+        probe = sprite.Sprite()
+        probe.rect = pygame.Rect(0, 0, 2, 2)
+        probe.rect.center = self.sprites[3].rect.center
+        self.assertEqual(
+            sprite.spritecollide(probe, self.group, False), [self.sprites[3]]
+        )
+
+
 ############################## BUG TESTS #######################################
 
 
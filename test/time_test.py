@@ -240,6 +240,86 @@ class ClockTypeTest(unittest.TestCase):
             c.tick_busy_loop(bool_fps), (second_length / bool_fps) - shortfall_tolerance
         )
 
+    def test_history(self):
+        """Test that only the last history frames are kept."""
+        self.assertRaises(ValueError, Clock, history=0)
+        self.assertRaises(TypeError, Clock, 10)
+
+        c = Clock(history=3)
+        self.assertEqual(c.get_frame_times(), [])
+        self.assertEqual(c.get_max_frame_time(), 0.0)
+        self.assertEqual(c.get_frame_time_percentile(50), 0.0)
+
+        for delay in (30, 1, 1, 1):
+            pygame.time.delay(delay)
+            c.tick()
+        times = c.get_frame_times()
+        self.assertEqual(len(times), 3)
+        self.assertTrue(all(isinstance(t, float) for t in times))
+        # the 30 ms frame fell out of the history
+        self.assertLess(c.get_max_frame_time(), 30)
+
+        c.reset_profile()
+        self.assertEqual(c.get_frame_times(), [])
+
+    def test_get_frame_time_percentile(self):
+        """Test percentiles of the recorded frame times."""
+        c = Clock()
+        for delay in (20, 1, 1, 1, 1):
+            pygame.time.delay(delay)
+            c.tick()
+
+        times = c.get_frame_times()
+        self.assertEqual(len(times), 5)
+        self.assertGreaterEqual(times[0], 19)
+        self.assertEqual(c.get_max_frame_time(), max(times))
+        self.assertEqual(c.get_frame_time_percentile(100), max(times))
+        self.assertEqual(c.get_frame_time_percentile(0), min(times))
+        self.assertEqual(c.get_frame_time_percentile(50), sorted(times)[2])
+        # interpolates between the two longest frames
+        p95 = c.get_frame_time_percentile(95)
+        self.assertLess(sorted(times)[3], p95)
+        self.assertLess(p95, max(times))
+
+        for percent in (-1, 100.5, float("nan")):
+            with self.assertRaises(ValueError):
+                c.get_frame_time_percentile(percent)
+        with self.assertRaises(TypeError):
+            c.get_frame_time_percentile("95")
+
+    def test_section(self):
+        """Test timing named sections of a frame."""
+        c = Clock()
+        self.assertEqual(c.get_sections(), {})
+
+        for _ in range(3):
+            with c.section("update"):
+                pygame.time.delay(5)
+            with c.section("draw"):
+                with c.section("draw"):
+                    pass
+
+        self.assertIs(c.section("update"), c.section("update"))
+        sections = c.get_sections()
+        self.assertEqual(set(sections), {"update", "draw"})
+        total, count, longest = sections["update"]
+        self.assertEqual(count, 3)
+        self.assertGreaterEqual(total, 14)
+        self.assertLessEqual(longest, total)
+        self.assertGreaterEqual(longest, total / 3)
+        # nested blocks of the same section are counted once
+        self.assertEqual(sections["draw"][1], 3)
+
+        with self.assertRaises(KeyError):
+            with c.section("update"):
+                raise KeyError
+        self.assertEqual(c.get_sections()["update"][1], 4)
+
+        c.reset_profile()
+        self.assertEqual(c.get_sections()["update"], (0.0, 0, 0.0))
+        with self.assertRaises(TypeError):
+            c.section(1)
+
 
 class TimeModuleTest(unittest.TestCase):
     __tags__ = ["timing"]
@@ -1,7 +1,10 @@
 import itertools
 import os
 import platform
+import threading
+import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
 import pygame
 import pygame.transform
@@ -1996,6 +1999,85 @@ class TransformModuleTest(unittest.TestCase):
             with self.assertRaises(TypeError, msg=f"Running with pixel_size = {arg}"):
                 pygame.transform.pixelate(image, arg)
 
+    def _threaded_transforms(self):
+        """Returns (name, function) pairs of transforms that release the GIL."""
+        return (
+            ("smoothscale", lambda s: pygame.transform.smoothscale(s, (301, 187))),
+            ("rotozoom", lambda s: pygame.transform.rotozoom(s, 33, 1.5)),
+            ("gaussian_blur", lambda s: pygame.transform.gaussian_blur(s, 5)),
+            ("box_blur", lambda s: pygame.transform.box_blur(s, 5)),
+            ("laplacian", pygame.transform.laplacian),
+            (
+                "average_surfaces",
+                lambda s: pygame.transform.average_surfaces([s, s.copy()]),
+            ),
+        )
+
+    def _make_threaded_surfaces(self, count, size=(200, 150)):
+        surfaces = []
+        for i in range(count):
+            surf = pygame.Surface(size, pygame.SRCALPHA)
+            for y in range(0, size[1], 10):
+                for x in range(0, size[0], 10):
+                    surf.fill(
+                        ((x * 3 + i) % 256, (y * 5) % 256, (x + y) % 256, 255),
+                        (x, y, 10, 10),
+                    )
+            surfaces.append(surf)
+        return surfaces
+
+    def test_transforms_in_threads(self):
+        """Concurrent transforms of distinct surfaces match serial results."""
+        surfaces = self._make_threaded_surfaces(8)
+
+        for name, func in self._threaded_transforms():
+            expected = [func(surf) for surf in surfaces]
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                results = list(executor.map(func, surfaces))
+            for exp, res in zip(expected, results):
+                self.assertEqual(
+                    pygame.image.tobytes(exp, "RGBA"),
+                    pygame.image.tobytes(res, "RGBA"),
+                    msg=name,
+                )
+
+    def test_transforms_release_gil(self):
+        """Python code keeps running while a transform works in a thread."""
+        (surf,) = self._make_threaded_surfaces(1, (1000, 800))
+
+        for name, func in self._threaded_transforms():
+            self.assertTrue(self._runs_concurrently(func, surf), msg=name)
+
+    def _runs_concurrently(self, func, surf, attempts=3):
+        """Returns True if this thread ran during the first half of a call of
+        func(surf) in another thread."""
+        for _ in range(attempts):
+            running = threading.Event()
+            call_times = []
+
+            def work():
+                running.set()
+                start = time.perf_counter()
+                func(surf)
+                call_times.append((start, time.perf_counter()))
+                running.clear()
+
+            ticks = []
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                future = executor.submit(work)
+                running.wait()
+                while running.is_set():
+                    ticks.append(time.perf_counter())
+                future.result()
+
+            # If the GIL was held during the whole call, this thread could
+            # only run once the call returned. The ticks taken then are at
+            # its very end, not in its first half.
+            start, end = call_times[0]
+            if any(start <= tick < (start + end) / 2 for tick in ticks):
+                return True
+        return False
+
 
 class TransformDisplayModuleTest(unittest.TestCase):
     def setUp(self):